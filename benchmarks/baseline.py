@@ -0,0 +1,231 @@
+"""
+Benchmark baseline module.
+
+Run `python -m benchmarks.baseline save baseline.json` to run the benchmark suite and store its results as a baseline,
+and `python -m benchmarks.baseline compare baseline.json` to run it again and compare the throughput of every benchmark
+against the baseline. The comparison exits with a non-zero code if any benchmark is slower than the baseline by more
+than its tolerance, so it can gate the upgrades of the package, e.g.
+
+```bash
+python -m benchmarks.baseline compare baseline.json 'convert.*' --tolerance 0.10 --tolerance 'convert.url.*=0.25'
+```
+"""
+
+import json
+import sys
+from argparse import ArgumentParser, ArgumentTypeError
+from collections.abc import Mapping, Sequence
+from fnmatch import fnmatch
+from glob import escape
+from typing import Any
+
+from benchmarks.suite import MIN_TIME, run
+
+DEFAULT_TOLERANCE = 0.1
+EXIT_REGRESSION = 1
+
+
+def parse_tolerance(value: str) -> tuple[str, float]:
+    """
+    Parse a tolerance argument, either `TOLERANCE` for every benchmark or `PATTERN=TOLERANCE` for the benchmarks
+    matching the shell-style pattern.
+
+    Args:
+        value (str): Tolerance argument.
+
+    Raises:
+        ArgumentTypeError: If the tolerance is not a number between 0 and 1.
+
+    Returns:
+        tuple[str, float]: Benchmark name pattern and tolerance.
+    """
+    pattern, _, tolerance = value.rpartition('=')
+    try:
+        parsed = float(tolerance)
+
+    except ValueError as exception:
+        raise ArgumentTypeError(f'tolerance <<<{value}>>> must be TOLERANCE or PATTERN=TOLERANCE.') from exception
+
+    if not 0 <= parsed < 1:
+        raise ArgumentTypeError(f'tolerance <<<{tolerance}>>> must be a number between 0 and 1.')
+
+    return pattern or '*', parsed
+
+
+def tolerance_for(*, name: str, tolerances: Sequence[tuple[str, float]]) -> float:
+    """
+    Get the tolerance of a benchmark, the last matching pattern wins.
+
+    Args:
+        name (str): Benchmark name.
+        tolerances (Sequence[tuple[str, float]]): Benchmark name patterns and tolerances.
+
+    Returns:
+        float: Tolerance of the benchmark, DEFAULT_TOLERANCE if no pattern matches.
+    """
+    tolerance = DEFAULT_TOLERANCE
+    for pattern, value in tolerances:
+        if fnmatch(name, pattern):
+            tolerance = value
+
+    return tolerance
+
+
+def matches(*, name: str, patterns: Sequence[str]) -> bool:
+    """
+    Check whether a benchmark name matches any of the shell-style patterns, every name matches if there is none.
+
+    Args:
+        name (str): Benchmark name.
+        patterns (Sequence[str]): Benchmark name patterns.
+
+    Returns:
+        bool: True if the benchmark is selected, False otherwise.
+    """
+    return not patterns or any(fnmatch(name, pattern) for pattern in patterns)
+
+
+def compare(
+    *,
+    baseline: Mapping[str, Mapping[str, float]],
+    results: Mapping[str, Mapping[str, float]],
+    tolerances: Sequence[tuple[str, float]] = (),
+) -> list[str]:
+    """
+    Compare the throughput of the benchmarks present in both the baseline and the results, and print the comparison.
+    New and missing benchmarks are printed but never count as regressions.
+
+    Args:
+        baseline (Mapping[str, Mapping[str, float]]): Baseline results keyed by benchmark name.
+        results (Mapping[str, Mapping[str, float]]): New results keyed by benchmark name.
+        tolerances (Sequence[tuple[str, float]], optional): Benchmark name patterns and allowed relative slowdowns.
+        Defaults to ().
+
+    Returns:
+        list[str]: Names of the benchmarks that regressed.
+    """
+    regressions: list[str] = []
+
+    print(f'{"benchmark":<40}{"baseline":>14}{"current":>14}{"change":>10}{"tolerance":>11}  status')
+    for name, result in results.items():
+        if name not in baseline:
+            print(f'{name:<40}{"":>14}{result["ops_per_second"]:>14,.1f}{"":>10}{"":>11}  new')
+            continue
+
+        expected = baseline[name]['ops_per_second']
+        current = result['ops_per_second']
+        change = current / expected - 1
+        tolerance = tolerance_for(name=name, tolerances=tolerances)
+
+        status = 'ok'
+        if change < -tolerance:
+            status = 'REGRESSION'
+            regressions.append(name)
+
+        print(f'{name:<40}{expected:>14,.1f}{current:>14,.1f}{change:>+10.1%}{tolerance:>11.0%}  {status}')
+
+    for name in baseline:
+        if name not in results:
+            print(f'{name:<40}{baseline[name]["ops_per_second"]:>14,.1f}{"":>14}{"":>10}{"":>11}  missing')
+
+    return regressions
+
+
+def load(*, path: str) -> dict[str, Any]:
+    """
+    Load benchmark suite results from a JSON file.
+
+    Args:
+        path (str): Path of the JSON file.
+
+    Returns:
+        dict[str, Any]: Environment and results of the run.
+    """
+    with open(path, encoding='utf-8') as file:
+        results: dict[str, Any] = json.load(file)
+
+    return results
+
+
+def save(*, path: str, results: Mapping[str, Any]) -> None:
+    """
+    Save benchmark suite results to a JSON file.
+
+    Args:
+        path (str): Path of the JSON file.
+        results (Mapping[str, Any]): Environment and results of the run.
+    """
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Save or compare a benchmark baseline from the command line.
+
+    Args:
+        argv (Sequence[str] | None, optional): Command line arguments. Defaults to sys.argv.
+
+    Returns:
+        int: Exit code, EXIT_REGRESSION if any benchmark regressed.
+    """
+    parser = ArgumentParser(prog='python -m benchmarks.baseline', description='Save or compare a benchmark baseline.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    save_parser = commands.add_parser('save', help='run the benchmark suite and save its results as a baseline')
+    compare_parser = commands.add_parser('compare', help='run the benchmark suite and compare it against a baseline')
+    for command_parser in (save_parser, compare_parser):
+        command_parser.add_argument('baseline', help='path of the baseline JSON file')
+        command_parser.add_argument('patterns', nargs='*', help="benchmark name patterns, e.g. 'convert.postgresql.*'")
+        command_parser.add_argument('--min-time', type=float, default=MIN_TIME, help='minimum time of each run')
+
+    compare_parser.add_argument(
+        '--tolerance',
+        action='append',
+        default=[],
+        type=parse_tolerance,
+        help=f'allowed relative slowdown, TOLERANCE or PATTERN=TOLERANCE, the last match wins (default {DEFAULT_TOLERANCE})',  # noqa: E501
+    )  # fmt: skip
+    compare_parser.add_argument('--results', help='path of the JSON file to compare instead of running the suite')
+    compare_parser.add_argument('--output', help='path of the JSON file to write the new results to')
+    arguments = parser.parse_args(argv)
+
+    if arguments.command == 'save':
+        save(path=arguments.baseline, results=run(patterns=arguments.patterns, min_time=arguments.min_time))
+        return 0
+
+    baseline = load(path=arguments.baseline)
+    if arguments.results is not None:
+        results = load(path=arguments.results)
+
+    else:
+        results = run(
+            patterns=arguments.patterns or [escape(name) for name in baseline['benchmarks']],
+            min_time=arguments.min_time,
+        )
+        print()
+
+    if arguments.output is not None:
+        save(path=arguments.output, results=results)
+
+    selected = {
+        name: result
+        for name, result in results['benchmarks'].items()
+        if matches(name=name, patterns=arguments.patterns)
+    }  # noqa: E501
+    expected = {
+        name: result
+        for name, result in baseline['benchmarks'].items()
+        if matches(name=name, patterns=arguments.patterns)
+    }  # noqa: E501
+    regressions = compare(baseline=expected, results=selected, tolerances=arguments.tolerance)
+    if regressions:
+        print(f'\n{len(regressions)} benchmark(s) regressed: {", ".join(regressions)}')
+        return EXIT_REGRESSION
+
+    print('\nNo benchmark regressed.')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
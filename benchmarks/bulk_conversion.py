@@ -0,0 +1,68 @@
+"""
+Bulk conversion benchmark module.
+
+Run it with `python -m benchmarks.bulk_conversion`. It converts the same criteria with a single `convert_many` call in
+this process and with `BulkConverter` for several chunk sizes and numbers of workers, and prints the throughput of each
+run, so the chunk size can be picked for the machine.
+"""
+
+from collections import deque
+from os import cpu_count
+from time import perf_counter
+
+from criteria_pattern import Criteria, Direction, Filter, Operator, Order
+from criteria_pattern.converters import BulkConversionStats, BulkConverter, CriteriaToPostgresqlConverter
+
+CRITERIA = 50000
+CHUNK_SIZES = (100, 1000, 10000)
+
+
+def build(*, index: int) -> Criteria:
+    """
+    Build a criteria with a few filters, an order and pagination.
+
+    Args:
+        index (int): Index of the criteria.
+
+    Returns:
+        Criteria: Built criteria.
+    """
+    return Criteria(
+        filters=[
+            Filter(field='id', operator=Operator.IN, value=[index, index + 1, index + 2]),
+            Filter(field='name', operator=Operator.STARTS_WITH, value=f'name_{index}'),
+        ],
+        orders=[Order(field='id', direction=Direction.ASC)],
+        page_size=10,
+        page_number=index % 100 + 1,
+    )
+
+
+def main() -> None:
+    """
+    Run the benchmark and print the results.
+    """
+    criteria = [build(index=index) for index in range(CRITERIA)]
+
+    print(f'{"conversion":<32}{"criteria/s":>14}')
+    start = perf_counter()
+    deque(CriteriaToPostgresqlConverter.convert_many(criteria=criteria, table='user'), maxlen=0)
+    print(f'{"convert_many":<32}{CRITERIA / (perf_counter() - start):>14,.0f}')
+
+    for workers in sorted({1, cpu_count() or 1}):
+        for chunk_size in CHUNK_SIZES:
+            stats = BulkConversionStats()
+            queries = BulkConverter.convert(
+                criteria=criteria,
+                converter=CriteriaToPostgresqlConverter,
+                table='user',
+                chunk_size=chunk_size,
+                max_workers=workers,
+                stats=stats,
+            )
+            deque(queries, maxlen=0)
+            print(f'{f"bulk[workers={workers}, chunk={chunk_size}]":<32}{stats.criteria_per_second:>14,.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+Filter compilation benchmark module.
+
+Run it with `python -m benchmarks.filter_compilation`. It times the SQL converters on machine-generated OR trees, both
+as a left-deep chain built with the `|` operator and as a flat n-ary node built with `Criteria.any_of`, and prints the
+time per leaf, which stays constant when the compilation scales linearly.
+"""
+
+from collections.abc import Callable
+from time import perf_counter
+from typing import Any
+
+from criteria_pattern import Criteria, Filter, Operator
+from criteria_pattern.converters import (
+    CriteriaToMysqlConverter,
+    CriteriaToPostgresqlConverter,
+    CriteriaToSqliteConverter,
+)
+
+LEAVES = (1000, 10000, 100000)
+REPEATS = 3
+CONVERTERS: dict[str, Callable[..., tuple[str, Any]]] = {
+    'postgresql': CriteriaToPostgresqlConverter.convert,
+    'sqlite': CriteriaToSqliteConverter.convert,
+    'mysql': CriteriaToMysqlConverter.convert,
+}
+
+
+def build_chain(*, leaves: int) -> Criteria:
+    """
+    Build a left-deep OR chain with the `|` operator.
+
+    Args:
+        leaves (int): Number of leaves of the tree.
+
+    Returns:
+        Criteria: Built criteria.
+    """
+    criteria = Criteria(filters=[Filter(field='id', operator=Operator.EQUAL, value=0)])
+    for value in range(1, leaves):
+        criteria |= Criteria(filters=[Filter(field='id', operator=Operator.EQUAL, value=value)])
+
+    return criteria
+
+
+def build_flat(*, leaves: int) -> Criteria:
+    """
+    Build a flat n-ary OR node with `Criteria.any_of`.
+
+    Args:
+        leaves (int): Number of leaves of the tree.
+
+    Returns:
+        Criteria: Built criteria.
+    """
+    return Criteria.any_of(
+        criteria=[
+            Criteria(filters=[Filter(field='id', operator=Operator.EQUAL, value=value)]) for value in range(leaves)
+        ]
+    )
+
+
+def measure(*, convert: Callable[..., tuple[str, Any]], criteria: Criteria) -> float:
+    """
+    Measure the best conversion time of a criteria.
+
+    Args:
+        convert (Callable[..., tuple[str, Any]]): Converter convert method.
+        criteria (Criteria): Criteria to convert.
+
+    Returns:
+        float: Best time in seconds.
+    """
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = perf_counter()
+        convert(criteria=criteria, table='user')
+        best = min(best, perf_counter() - start)
+
+    return best
+
+
+def main() -> None:
+    """
+    Run the benchmark and print the results.
+    """
+    print(f'{"shape":<8}{"converter":<12}{"leaves":>10}{"total (ms)":>14}{"per leaf (us)":>16}')
+    for shape, build in (('chain', build_chain), ('flat', build_flat)):
+        for leaves in LEAVES:
+            criteria = build(leaves=leaves)
+            for name, convert in CONVERTERS.items():
+                elapsed = measure(convert=convert, criteria=criteria)
+                print(f'{shape:<8}{name:<12}{leaves:>10}{elapsed * 1e3:>14.2f}{elapsed / leaves * 1e6:>16.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Import time benchmark module.
+
+Run it with `python -m benchmarks.import_time`. It runs every import statement in a fresh interpreter with
+`-X importtime`, sums the cumulative time of the modules the statement imported on top of the interpreter start up, and
+prints the best time and the number of modules imported.
+"""
+
+import sys
+from subprocess import run
+
+STATEMENTS = (
+    'import criteria_pattern',
+    'from criteria_pattern import Criteria',
+    'import criteria_pattern.errors',
+    'import criteria_pattern.converters',
+    'from criteria_pattern.converters import CriteriaToPostgresqlConverter',
+    'from criteria_pattern.converters import UrlToCriteriaConverter',
+)
+REPEATS = 5
+
+
+def import_times(*, statement: str) -> dict[str, int | None]:
+    """
+    Run a statement in a fresh interpreter and get the cumulative import time of the imported modules.
+
+    Args:
+        statement (str): Python statement to run.
+
+    Returns:
+        dict[str, int | None]: Cumulative import time in microseconds of each top level imported module, None for the
+        nested ones as their time is already included in their top level module.
+    """
+    process = run([sys.executable, '-X', 'importtime', '-c', statement], capture_output=True, text=True, check=True)  # noqa: S603
+
+    times: dict[str, int | None] = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or line.endswith('| imported package'):
+            continue
+
+        _, cumulative, name = line.split('|')
+        times[name.strip()] = None if name.startswith('  ') else int(cumulative)
+
+    return times
+
+
+def measure(*, statement: str) -> tuple[float, int]:
+    """
+    Measure the best import time of a statement, discounting the interpreter start up.
+
+    Args:
+        statement (str): Python statement to run.
+
+    Returns:
+        tuple[float, int]: Best time in seconds and number of modules imported.
+    """
+    start_up = import_times(statement='pass')
+
+    best = float('inf')
+    modules = 0
+    for _ in range(REPEATS):
+        times = {name: time for name, time in import_times(statement=statement).items() if name not in start_up}
+        best = min(best, sum(time for time in times.values() if time is not None) / 1e6)
+        modules = len(times)
+
+    return best, modules
+
+
+def main() -> None:
+    """
+    Run the benchmark and print the results.
+    """
+    print(f'{"statement":<72}{"time (ms)":>12}{"modules":>10}')
+    for statement in STATEMENTS:
+        elapsed, modules = measure(statement=statement)
+        print(f'{statement:<72}{elapsed * 1e3:>12.2f}{modules:>10}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+"""
+Memory layout benchmark module.
+
+Run it with `python -m benchmarks.memory_layout`. It measures with tracemalloc the bytes allocated per filter when every
+filter owns its field and operator value objects, as they did before they were shared, and when they are shared
+between the filters, which is what the `Filter` constructor does. It also measures the bytes allocated per filter value
+with a per-instance `__dict__`, as before `FilterValue` declared `__slots__`, and with the slots layout.
+"""
+
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from criteria_pattern import Criteria, Filter, Operator
+from criteria_pattern.models.filter import FilterField, FilterOperator, FilterValue
+
+FILTERS = 100000
+FIELDS = ('id', 'name', 'email', 'age', 'country')
+
+
+class DictFilterValue(FilterValue[Any]):
+    """
+    FilterValue with a per-instance `__dict__`, as it was before it declared `__slots__`.
+    """
+
+
+def build_owned(*, index: int) -> Filter[Any]:
+    """
+    Build a filter that owns its field, operator and value objects.
+
+    Args:
+        index (int): Index of the filter.
+
+    Returns:
+        Filter[Any]: Built filter.
+    """
+    filter: Filter[Any] = Filter.__new__(Filter)
+    filter._field = FilterField(value=FIELDS[index % len(FIELDS)], title='Filter', parameter='field')
+    filter._operator = FilterOperator(value=Operator.EQUAL, title='Filter', parameter='operator')
+    filter._value = FilterValue(value=index, title='Filter', parameter='value')
+
+    return filter
+
+
+def build_shared(*, index: int) -> Filter[Any]:
+    """
+    Build a filter with the constructor, that shares its field and operator objects.
+
+    Args:
+        index (int): Index of the filter.
+
+    Returns:
+        Filter[Any]: Built filter.
+    """
+    return Filter(field=FIELDS[index % len(FIELDS)], operator=Operator.EQUAL, value=index)
+
+
+def measure(*, build: Callable[..., Filter[Any]], wrap: bool) -> float:
+    """
+    Measure the bytes allocated per filter.
+
+    Args:
+        build (Callable[..., Filter[Any]]): Filter builder.
+        wrap (bool): Whether to wrap every filter in its own criteria.
+
+    Returns:
+        float: Allocated bytes per filter.
+    """
+    build(index=0)  # warm up the shared objects
+    tracemalloc.start()
+    if wrap:
+        objects: list[Any] = [Criteria(filters=[build(index=index)]) for index in range(FILTERS)]
+    else:
+        objects = [build(index=index) for index in range(FILTERS)]
+
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+
+    return allocated / FILTERS
+
+
+def measure_value(*, cls: type[FilterValue[Any]]) -> float:
+    """
+    Measure the bytes allocated per filter value.
+
+    Args:
+        cls (type[FilterValue[Any]]): Filter value class.
+
+    Returns:
+        float: Allocated bytes per filter value.
+    """
+    cls(value=0, title='Filter', parameter='value')  # warm up the class caches
+    tracemalloc.start()
+    values = [cls(value=index, title='Filter', parameter='value') for index in range(FILTERS)]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del values
+
+    return allocated / FILTERS
+
+
+def main() -> None:
+    """
+    Run the benchmark and print the results.
+    """
+    print(f'{"object":<12}{"owned (B)":>12}{"shared (B)":>12}{"saved":>8}')
+    for name, wrap in (('filter', False), ('criteria', True)):
+        owned = measure(build=build_owned, wrap=wrap)
+        shared = measure(build=build_shared, wrap=wrap)
+        print(f'{name:<12}{owned:>12.1f}{shared:>12.1f}{1 - shared / owned:>8.0%}')
+
+    print()
+    print(f'{"object":<12}{"dict (B)":>12}{"slots (B)":>12}{"saved":>8}')
+    with_dict = measure_value(cls=DictFilterValue)
+    with_slots = measure_value(cls=FilterValue)
+    print(f'{"value":<12}{with_dict:>12.1f}{with_slots:>12.1f}{1 - with_slots / with_dict:>8.0%}')
+
+
+if __name__ == '__main__':
+    main()
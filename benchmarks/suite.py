@@ -0,0 +1,293 @@
+"""
+Benchmark suite module.
+
+Run it with `python -m benchmarks.suite`. It measures the throughput (operations per second) and the allocated memory
+(tracemalloc peak bytes per operation) of the criteria construction, the criteria optimizer, the SQL converters, the URL
+converter and the criteria mother, prints a table and, with `--output`, writes the results as JSON. It runs offline and
+only depends on the package itself.
+"""
+
+import json
+import platform
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+from fnmatch import fnmatch
+from functools import partial
+from timeit import Timer
+from typing import Any
+
+import criteria_pattern
+from criteria_pattern import Criteria, Filter, Operator
+from criteria_pattern.converters import (
+    CriteriaOptimizer,
+    CriteriaToMariadbConverter,
+    CriteriaToMysqlConverter,
+    CriteriaToPostgresqlConverter,
+    CriteriaToSqliteConverter,
+    QueryCache,
+    UrlToCriteriaConverter,
+)
+from criteria_pattern.models.testing.mothers import CriteriaMother
+
+SIZES = (10, 100, 1000)
+URL_FILTERS = (1, 10, 99)
+REPEATS = 5
+MIN_TIME = 0.2
+CONVERTERS: dict[str, Callable[..., tuple[str, Any]]] = {
+    'postgresql': CriteriaToPostgresqlConverter.convert,
+    'sqlite': CriteriaToSqliteConverter.convert,
+    'mysql': CriteriaToMysqlConverter.convert,
+    'mariadb': CriteriaToMariadbConverter.convert,
+}
+BATCH_CONVERTERS: dict[str, Callable[..., Iterator[tuple[str, Any]]]] = {
+    'postgresql': CriteriaToPostgresqlConverter.convert_many,
+    'sqlite': CriteriaToSqliteConverter.convert_many,
+    'mysql': CriteriaToMysqlConverter.convert_many,
+    'mariadb': CriteriaToMariadbConverter.convert_many,
+}
+BATCH_SIZE = 1000
+
+Benchmark = tuple[str, Callable[[], Any]]
+
+
+def build_flat(*, size: int) -> Criteria:
+    """
+    Build a criteria with `size` filters.
+
+    Args:
+        size (int): Number of filters.
+
+    Returns:
+        Criteria: Built criteria.
+    """
+    return Criteria(filters=[Filter(field='id', operator=Operator.EQUAL, value=value) for value in range(size)])
+
+
+def build_deep(*, size: int) -> Criteria:
+    """
+    Build a left-deep AND chain of `size` criteria with the `&` operator.
+
+    Args:
+        size (int): Number of leaves.
+
+    Returns:
+        Criteria: Built criteria.
+    """
+    criteria = Criteria(filters=[Filter(field='id', operator=Operator.EQUAL, value=0)])
+    for value in range(1, size):
+        criteria &= Criteria(filters=[Filter(field='id', operator=Operator.EQUAL, value=value)])
+
+    return criteria
+
+
+def build_wide(*, size: int) -> Criteria:
+    """
+    Build a flat n-ary OR node of `size` criteria with `Criteria.any_of`.
+
+    Args:
+        size (int): Number of children.
+
+    Returns:
+        Criteria: Built criteria.
+    """
+    return Criteria.any_of(
+        criteria=[Criteria(filters=[Filter(field='id', operator=Operator.EQUAL, value=value)]) for value in range(size)]
+    )
+
+
+def build_in_list(*, size: int) -> Criteria:
+    """
+    Build a criteria with an IN filter of `size` values.
+
+    Args:
+        size (int): Number of values of the IN list.
+
+    Returns:
+        Criteria: Built criteria.
+    """
+    return Criteria(filters=[Filter(field='id', operator=Operator.IN, value=list(range(size)))])
+
+
+def build_url(*, filters: int) -> str:
+    """
+    Build a URL with `filters` filters, each of them is three query parameters.
+
+    Args:
+        filters (int): Number of filters.
+
+    Returns:
+        str: Built URL.
+    """
+    parameters = '&'.join(
+        f'filters[{index}][field]=id&filters[{index}][operator]=EQUAL&filters[{index}][value]={index}'
+        for index in range(filters)
+    )
+
+    return f'https://api.example.com/users?{parameters}&orders[0][field]=id&orders[0][direction]=ASC'
+
+
+def convert_loop(*, convert: Callable[..., tuple[str, Any]], criteria: Sequence[Criteria]) -> None:
+    """
+    Convert every criteria with one `convert` call each, without keeping the queries.
+
+    Args:
+        convert (Callable[..., tuple[str, Any]]): Converter convert method.
+        criteria (Sequence[Criteria]): Criteria to convert.
+    """
+    for single_criteria in criteria:
+        convert(criteria=single_criteria, table='user', columns=['id', 'name'])
+
+
+def convert_batch(*, convert_many: Callable[..., Iterator[tuple[str, Any]]], criteria: Sequence[Criteria]) -> None:
+    """
+    Convert every criteria with a single `convert_many` call, without keeping the queries.
+
+    Args:
+        convert_many (Callable[..., Iterator[tuple[str, Any]]]): Converter convert_many method.
+        criteria (Sequence[Criteria]): Criteria to convert.
+    """
+    deque(convert_many(criteria=criteria, table='user', columns=['id', 'name']), maxlen=0)
+
+
+def benchmarks() -> list[Benchmark]:
+    """
+    Get every benchmark of the suite, each of them is a name and a zero argument operation.
+
+    Returns:
+        list[Benchmark]: Benchmarks of the suite.
+    """
+    cases: list[Benchmark] = []
+    for shape, build in (('flat', build_flat), ('deep', build_deep), ('wide', build_wide)):
+        cases.extend((f'construction.{shape}[{size}]', partial(build, size=size)) for size in SIZES)
+
+    for shape, build in (('deep', build_deep), ('wide', build_wide)):
+        cases.extend(
+            (f'optimize.{shape}[{size}]', partial(CriteriaOptimizer.optimize, criteria=build(size=size)))
+            for size in SIZES
+        )
+
+    push_down_negations = CriteriaOptimizer.push_down_negations
+    cases.extend(
+        (f'push_down_negations.wide[{size}]', partial(push_down_negations, criteria=~build_wide(size=size)))
+        for size in SIZES
+    )
+
+    for name, convert in CONVERTERS.items():
+        for shape, build in (('tree', build_wide), ('in_list', build_in_list)):
+            cases.extend(
+                (f'convert.{name}.{shape}[{size}]', partial(convert, criteria=build(size=size), table='user'))
+                for size in SIZES
+            )
+
+    batch = [
+        Criteria(filters=[Filter(field='id', operator=Operator.EQUAL, value=value)]) for value in range(BATCH_SIZE)
+    ]
+    for name, convert in CONVERTERS.items():
+        cases.append((f'convert.{name}.loop[{BATCH_SIZE}]', partial(convert_loop, convert=convert, criteria=batch)))
+        cases.append(
+            (
+                f'convert.{name}.batch[{BATCH_SIZE}]',
+                partial(convert_batch, convert_many=BATCH_CONVERTERS[name], criteria=batch),
+            )
+        )  # noqa: E501
+
+    cases.extend(
+        (f'convert.url.parameters[{filters * 3 + 2}]', partial(UrlToCriteriaConverter.convert, url=build_url(filters=filters)))  # noqa: E501
+        for filters in URL_FILTERS
+    )  # fmt: skip
+    cases.extend(
+        (f'convert.url.cached[{filters * 3 + 2}]', partial(UrlToCriteriaConverter.convert, url=build_url(filters=filters), cache=QueryCache()))  # noqa: E501
+        for filters in URL_FILTERS
+    )  # fmt: skip
+
+    cases.append(('mother.criteria', CriteriaMother.create))
+
+    return cases
+
+
+def measure(*, operation: Callable[[], Any], min_time: float) -> dict[str, float]:
+    """
+    Measure the best throughput of an operation over `REPEATS` runs of at least `min_time` seconds, and its allocated
+    memory.
+
+    Args:
+        operation (Callable[[], Any]): Operation to measure.
+        min_time (float): Minimum time in seconds of each run.
+
+    Returns:
+        dict[str, float]: Operations per second and tracemalloc peak bytes per operation.
+    """
+    timer = Timer(stmt=operation)
+    number = 1
+    while (elapsed := timer.timeit(number=number)) < min_time:
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9)))
+
+    best = min(timer.repeat(repeat=REPEATS, number=number)) / number
+
+    tracemalloc.start()
+    operation()
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {'ops_per_second': 1 / best, 'peak_bytes': peak_bytes}
+
+
+def run(*, patterns: Sequence[str] = (), min_time: float = MIN_TIME) -> dict[str, Any]:
+    """
+    Run the benchmarks matching any of the shell-style `patterns`, or all of them if no pattern is given.
+
+    Args:
+        patterns (Sequence[str], optional): Benchmark name patterns, e.g. 'convert.postgresql.*'. Defaults to ().
+        min_time (float, optional): Minimum time in seconds of each run. Defaults to MIN_TIME.
+
+    Returns:
+        dict[str, Any]: Environment and results of the run, the results are keyed by benchmark name.
+    """
+    results: dict[str, dict[str, float]] = {}
+    for name, operation in benchmarks():
+        if patterns and not any(fnmatch(name, pattern) for pattern in patterns):
+            continue
+
+        results[name] = measure(operation=operation, min_time=min_time)
+        print(f'{name:<40}{results[name]["ops_per_second"]:>16,.1f}{results[name]["peak_bytes"]:>16,.0f}', flush=True)
+
+    return {
+        'criteria_pattern': criteria_pattern.__version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'benchmarks': results,
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Run the benchmark suite from the command line.
+
+    Args:
+        argv (Sequence[str] | None, optional): Command line arguments. Defaults to sys.argv.
+
+    Returns:
+        int: Exit code.
+    """
+    parser = ArgumentParser(prog='python -m benchmarks.suite', description='Run the criteria_pattern benchmark suite.')
+    parser.add_argument('patterns', nargs='*', help="benchmark name patterns to run, e.g. 'convert.postgresql.*'")
+    parser.add_argument('--output', help='path of the JSON file to write the results to')
+    parser.add_argument('--min-time', type=float, default=MIN_TIME, help='minimum time in seconds of each run')
+    arguments = parser.parse_args(argv)
+
+    print(f'{"benchmark":<40}{"ops/sec":>16}{"peak bytes":>16}')
+    results = run(patterns=arguments.patterns, min_time=arguments.min_time)
+
+    if arguments.output is not None:
+        with open(arguments.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""
+Trusted construction benchmark module.
+
+Run it with `python -m benchmarks.trusted_construction`. It times building criteria from already validated data
+through the validating constructors and through the trusted constructors, and prints the time per filter.
+"""
+
+from collections.abc import Callable
+from time import perf_counter
+
+from criteria_pattern import Criteria, Direction, Filter, Operator, Order
+
+FILTERS = (10, 100, 1000)
+REPEATS = 5
+
+
+def build_validated(*, filters: int) -> Criteria:
+    """
+    Build a criteria with the validating constructors.
+
+    Args:
+        filters (int): Number of filters of the criteria.
+
+    Returns:
+        Criteria: Built criteria.
+    """
+    return Criteria(
+        filters=[Filter(field='id', operator=Operator.EQUAL, value=value) for value in range(filters)],
+        orders=[Order(field='id', direction=Direction.ASC)],
+        page_size=10,
+        page_number=1,
+    )
+
+
+def build_trusted(*, filters: int) -> Criteria:
+    """
+    Build a criteria with the trusted constructors.
+
+    Args:
+        filters (int): Number of filters of the criteria.
+
+    Returns:
+        Criteria: Built criteria.
+    """
+    return Criteria.from_trusted(
+        filters=[Filter.trusted(field='id', operator=Operator.EQUAL, value=value) for value in range(filters)],
+        orders=[Order.trusted(field='id', direction=Direction.ASC)],
+        page_size=10,
+        page_number=1,
+    )
+
+
+def measure(*, build: Callable[..., Criteria], filters: int) -> float:
+    """
+    Measure the best construction time of a criteria.
+
+    Args:
+        build (Callable[..., Criteria]): Criteria builder.
+        filters (int): Number of filters of the criteria.
+
+    Returns:
+        float: Best time in seconds.
+    """
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = perf_counter()
+        build(filters=filters)
+        best = min(best, perf_counter() - start)
+
+    return best
+
+
+def main() -> None:
+    """
+    Run the benchmark and print the results.
+    """
+    print(f'{"filters":>10}{"validated (us)":>18}{"trusted (us)":>16}{"speedup":>10}')
+    for filters in FILTERS:
+        validated = measure(build=build_validated, filters=filters) / filters
+        trusted = measure(build=build_trusted, filters=filters) / filters
+        print(f'{filters:>10}{validated * 1e6:>18.3f}{trusted * 1e6:>16.3f}{validated / trusted:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,20 @@
 __version__ = '3.8.0'
 
-from .models import Criteria, Direction, Filter, Operator, Order, PageNumber, PageSize
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .models import Criteria, Direction, Filter, Operator, Order, PageNumber, PageSize
+
+_LAZY_ATTRIBUTES = {
+    'Criteria': '.models',
+    'Direction': '.models',
+    'Filter': '.models',
+    'Operator': '.models',
+    'Order': '.models',
+    'PageNumber': '.models',
+    'PageSize': '.models',
+}
 
 __all__ = (
     'Criteria',
@@ -11,3 +25,37 @@ __all__ = (
     'PageNumber',
     'PageSize',
 )
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the models on first access, so importing the package does not import value_object_pattern until a model
+    is used.
+
+    Args:
+        name (str): Attribute name.
+
+    Raises:
+        AttributeError: If the attribute does not exist.
+
+    Returns:
+        Any: Attribute value.
+    """
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    """
+    List the package attributes, including the ones not imported yet.
+
+    Returns:
+        list[str]: Attribute names.
+    """
+    return sorted({*globals(), *__all__})
@@ -1,13 +1,84 @@
-from .criteria_to_mariadb_converter import CriteriaToMariadbConverter
-from .criteria_to_mysql_converter import CriteriaToMysqlConverter
-from .criteria_to_postgresql_converter import CriteriaToPostgresqlConverter
-from .criteria_to_sqlite_converter import CriteriaToSqliteConverter
-from .url_to_criteria_converter import UrlToCriteriaConverter
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .bulk_converter import BulkConversionStats, BulkConverter
+    from .converter_policy import ConverterPolicy
+    from .criteria_optimizer import CriteriaOptimizer
+    from .criteria_to_mariadb_converter import CriteriaToMariadbConverter
+    from .criteria_to_mysql_converter import CriteriaToMysqlConverter
+    from .criteria_to_numpy_converter import CriteriaToNumpyConverter
+    from .criteria_to_postgresql_converter import CriteriaToPostgresqlConverter
+    from .criteria_to_python_converter import CriteriaToPythonConverter
+    from .criteria_to_sqlite_converter import CriteriaToSqliteConverter
+    from .prepared_statement import PreparedStatement, PreparedStatementRegistry
+    from .query_cache import QueryCache
+    from .url_to_criteria_converter import UrlToCriteriaConverter
+
+_LAZY_ATTRIBUTES = {
+    'BulkConversionStats': '.bulk_converter',
+    'BulkConverter': '.bulk_converter',
+    'ConverterPolicy': '.converter_policy',
+    'CriteriaOptimizer': '.criteria_optimizer',
+    'CriteriaToMariadbConverter': '.criteria_to_mariadb_converter',
+    'CriteriaToMysqlConverter': '.criteria_to_mysql_converter',
+    'CriteriaToNumpyConverter': '.criteria_to_numpy_converter',
+    'CriteriaToPostgresqlConverter': '.criteria_to_postgresql_converter',
+    'CriteriaToPythonConverter': '.criteria_to_python_converter',
+    'CriteriaToSqliteConverter': '.criteria_to_sqlite_converter',
+    'PreparedStatement': '.prepared_statement',
+    'PreparedStatementRegistry': '.prepared_statement',
+    'QueryCache': '.query_cache',
+    'UrlToCriteriaConverter': '.url_to_criteria_converter',
+}
 
 __all__ = (
+    'BulkConversionStats',
+    'BulkConverter',
+    'ConverterPolicy',
+    'CriteriaOptimizer',
     'CriteriaToMariadbConverter',
     'CriteriaToMysqlConverter',
+    'CriteriaToNumpyConverter',
     'CriteriaToPostgresqlConverter',
+    'CriteriaToPythonConverter',
     'CriteriaToSqliteConverter',
+    'PreparedStatement',
+    'PreparedStatementRegistry',
+    'QueryCache',
     'UrlToCriteriaConverter',
 )
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the converters on first access, so importing the package does not import every converter and its
+    dependencies, e.g. numpy or urllib, when only one of them is used.
+
+    Args:
+        name (str): Attribute name.
+
+    Raises:
+        AttributeError: If the attribute does not exist.
+
+    Returns:
+        Any: Attribute value.
+    """
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    """
+    List the package attributes, including the ones not imported yet.
+
+    Returns:
+        list[str]: Attribute names.
+    """
+    return sorted({*globals(), *__all__})
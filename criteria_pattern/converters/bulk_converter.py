@@ -0,0 +1,281 @@
+"""
+Bulk converter module.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from os import cpu_count
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from criteria_pattern.errors import IntegrityError
+
+if TYPE_CHECKING:
+    from criteria_pattern import Criteria
+
+    from .criteria_to_mysql_converter import CriteriaToMysqlConverter
+    from .criteria_to_postgresql_converter import CriteriaToPostgresqlConverter
+    from .criteria_to_sqlite_converter import CriteriaToSqliteConverter
+
+
+class BulkConversionStats:
+    """
+    Throughput of a bulk conversion, updated every time a chunk is converted, so the chunk size and the number of
+    workers can be tuned.
+
+    Example:
+    ```python
+    from criteria_pattern import Criteria, Filter, Operator
+    from criteria_pattern.converters import BulkConversionStats, BulkConverter, CriteriaToPostgresqlConverter
+
+    if __name__ == '__main__':
+        stats = BulkConversionStats()
+        criteria = (Criteria(filters=[Filter(field='id', operator=Operator.EQUAL, value=value)]) for value in range(10000))
+
+        for query, parameters in BulkConverter.convert(criteria=criteria, converter=CriteriaToPostgresqlConverter, table='user', stats=stats):
+            pass
+
+        print(stats.criteria, stats.chunks)
+        # >>> 10000 10
+    ```
+    """  # noqa: E501  # fmt: skip
+
+    _criteria: int
+    _chunks: int
+    _elapsed: float
+
+    def __init__(self) -> None:
+        """
+        BulkConversionStats constructor.
+        """
+        self._criteria = 0
+        self._chunks = 0
+        self._elapsed = 0.0
+
+    def record_chunk(self, *, size: int, elapsed: float) -> None:
+        """
+        Record a converted chunk.
+
+        Args:
+            size (int): Number of criteria of the chunk.
+            elapsed (float): Seconds elapsed since the conversion started.
+        """
+        self._criteria += size
+        self._chunks += 1
+        self._elapsed = elapsed
+
+    @property
+    def criteria(self) -> int:
+        """
+        Get the number of criteria converted.
+
+        Returns:
+            int: Number of criteria converted.
+        """
+        return self._criteria
+
+    @property
+    def chunks(self) -> int:
+        """
+        Get the number of chunks converted.
+
+        Returns:
+            int: Number of chunks converted.
+        """
+        return self._chunks
+
+    @property
+    def elapsed(self) -> float:
+        """
+        Get the seconds elapsed since the conversion started until the last chunk was converted.
+
+        Returns:
+            float: Elapsed seconds.
+        """
+        return self._elapsed
+
+    @property
+    def criteria_per_second(self) -> float:
+        """
+        Get the throughput of the conversion.
+
+        Returns:
+            float: Criteria converted per second, 0.0 if nothing was converted yet.
+        """
+        if self._elapsed == 0:
+            return 0.0
+
+        return self._criteria / self._elapsed
+
+
+class BulkConverter:
+    """
+    Bulk converter, it distributes the criteria across a process pool in chunks, so the conversion of millions of
+    criteria is not bound to a single core.
+
+    Example:
+    ```python
+    from criteria_pattern import Criteria, Filter, Operator
+    from criteria_pattern.converters import BulkConverter, CriteriaToPostgresqlConverter
+
+    if __name__ == '__main__':
+        criteria = (Criteria(filters=[Filter(field='id', operator=Operator.EQUAL, value=value)]) for value in range(2))
+
+        for query, parameters in BulkConverter.convert(criteria=criteria, converter=CriteriaToPostgresqlConverter, table='user'):
+            print(query, parameters)
+        # >>> SELECT * FROM "user" WHERE "id" = %(parameter_0)s; {'parameter_0': 0}
+        # >>> SELECT * FROM "user" WHERE "id" = %(parameter_0)s; {'parameter_0': 1}
+    ```
+    """  # noqa: E501  # fmt: skip
+
+    @classmethod
+    def convert(
+        cls,
+        criteria: Iterable[Criteria],
+        converter: type[CriteriaToPostgresqlConverter | CriteriaToMysqlConverter | CriteriaToSqliteConverter],
+        table: str,
+        chunk_size: int = 1000,
+        max_workers: int | None = None,
+        stats: BulkConversionStats | None = None,
+        **options: Any,
+    ) -> Iterator[tuple[str, Any]]:
+        """
+        Convert the Criteria objects to queries in a process pool, yielding the queries in the same order as the
+        criteria. The criteria are read and sent to the workers in chunks of `chunk_size`, and at most two chunks per
+        worker are in flight at any time, so the memory stays bounded for any number of criteria. Each chunk is
+        converted with the converter `convert_many` method. If a criteria is not valid its error is raised instead of
+        the queries of its chunk and the pending chunks are cancelled.
+
+        Args:
+            criteria (Iterable[Criteria]): Criteria objects to convert.
+            converter (type[CriteriaToPostgresqlConverter | CriteriaToMysqlConverter | CriteriaToSqliteConverter]): SQL
+            converter to use.
+            table (str): Name of the table to query.
+            chunk_size (int, optional): Number of criteria sent to a worker at once, must be >= 1. Default to 1000.
+            max_workers (int | None, optional): Number of worker processes, must be >= 1. Default to None (the number
+            of CPUs).
+            stats (BulkConversionStats | None, optional): Statistics updated every time a chunk is converted. Default to
+            None (no statistics).
+            **options (Any): Keyword arguments of the converter `convert_many` method, e.g. columns or policy. They are
+            pickled and sent to every worker, so a cache is not supported.
+
+        Raises:
+            IntegrityError: If `chunk_size` is not a positive integer.
+            IntegrityError: If `max_workers` is not a positive integer.
+            IntegrityError: If `options` includes a cache.
+
+        Returns:
+            Iterator[tuple[str, Any]]: The query string and the query parameters of each criteria, in order.
+
+        Example:
+        ```python
+        from criteria_pattern import Criteria, Filter, Operator
+        from criteria_pattern.converters import BulkConverter, CriteriaToPostgresqlConverter
+
+        if __name__ == '__main__':
+            criteria = (Criteria(filters=[Filter(field='id', operator=Operator.EQUAL, value=value)]) for value in range(2))
+
+            for query, parameters in BulkConverter.convert(criteria=criteria, converter=CriteriaToPostgresqlConverter, table='user'):
+                print(query, parameters)
+            # >>> SELECT * FROM "user" WHERE "id" = %(parameter_0)s; {'parameter_0': 0}
+            # >>> SELECT * FROM "user" WHERE "id" = %(parameter_0)s; {'parameter_0': 1}
+        ```
+        """  # noqa: E501  # fmt: skip
+        if type(chunk_size) is not int or chunk_size < 1:
+            raise IntegrityError(message=f'BulkConverter chunk_size <<<{chunk_size}>>> must be a positive integer.')
+
+        if max_workers is not None and (type(max_workers) is not int or max_workers < 1):
+            raise IntegrityError(message=f'BulkConverter max_workers <<<{max_workers}>>> must be a positive integer.')
+
+        if options.get('cache') is not None:
+            raise IntegrityError(message='BulkConverter does not support a cache, it cannot be shared between worker processes.')  # noqa: E501  # fmt: skip
+
+        return cls._convert(
+            criteria=criteria,
+            converter=converter,
+            table=table,
+            chunk_size=chunk_size,
+            workers=max_workers if max_workers is not None else cpu_count() or 1,
+            stats=stats,
+            options=options,
+        )
+
+    @classmethod
+    def _convert(
+        cls,
+        *,
+        criteria: Iterable[Criteria],
+        converter: type[CriteriaToPostgresqlConverter | CriteriaToMysqlConverter | CriteriaToSqliteConverter],
+        table: str,
+        chunk_size: int,
+        workers: int,
+        stats: BulkConversionStats | None,
+        options: Mapping[str, Any],
+    ) -> Iterator[tuple[str, Any]]:
+        """
+        Convert the Criteria objects to queries in a process pool of `workers` processes.
+
+        Args:
+            criteria (Iterable[Criteria]): Criteria objects to convert.
+            converter (type[CriteriaToPostgresqlConverter | CriteriaToMysqlConverter | CriteriaToSqliteConverter]): SQL
+            converter to use.
+            table (str): Name of the table to query.
+            chunk_size (int): Number of criteria sent to a worker at once.
+            workers (int): Number of worker processes.
+            stats (BulkConversionStats | None): Statistics updated every time a chunk is converted.
+            options (Mapping[str, Any]): Keyword arguments of the converter `convert_many` method.
+
+        Yields:
+            tuple[str, Any]: The query string and the query parameters of each criteria, in order.
+        """
+        convert_chunk = partial(_convert_chunk, converter=converter, table=table, options=options)
+        iterator = iter(criteria)
+        pending: deque[tuple[int, Future[list[tuple[str, Any]]]]] = deque()
+
+        start = perf_counter()
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            while True:
+                while len(pending) < 2 * workers and (chunk := list(islice(iterator, chunk_size))):
+                    pending.append((len(chunk), executor.submit(convert_chunk, chunk=chunk)))
+
+                if not pending:
+                    break
+
+                size, future = pending.popleft()
+                queries = future.result()
+                if stats is not None:
+                    stats.record_chunk(size=size, elapsed=perf_counter() - start)
+
+                yield from queries
+
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+
+def _convert_chunk(
+    *,
+    converter: type[CriteriaToPostgresqlConverter | CriteriaToMysqlConverter | CriteriaToSqliteConverter],
+    table: str,
+    options: Mapping[str, Any],
+    chunk: list[Criteria],
+) -> list[tuple[str, Any]]:
+    """
+    Convert a chunk of Criteria objects in a worker process.
+
+    Args:
+        converter (type[CriteriaToPostgresqlConverter | CriteriaToMysqlConverter | CriteriaToSqliteConverter]): SQL
+        converter to use.
+        table (str): Name of the table to query.
+        options (Mapping[str, Any]): Keyword arguments of the converter `convert_many` method.
+        chunk (list[Criteria]): Criteria objects to convert.
+
+    Returns:
+        list[tuple[str, Any]]: The query string and the query parameters of each criteria, in order.
+    """
+    return list(converter.convert_many(criteria=chunk, table=table, **options))
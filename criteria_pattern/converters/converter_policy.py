@@ -0,0 +1,249 @@
+"""
+Converter policy module.
+"""
+
+from collections.abc import Iterable, Mapping, Sequence
+
+from criteria_pattern import Criteria, Direction, Operator
+from criteria_pattern.errors import (
+    IntegrityError,
+    InvalidColumnError,
+    InvalidDirectionError,
+    InvalidOperatorError,
+    InvalidTableError,
+    PaginationBoundsError,
+)
+
+
+class ConverterPolicy:
+    """
+    Reusable validation policy for the converters. The allow-lists are compiled once into frozensets, so each check is
+    a constant time membership test and validating a criteria costs one pass over its filters and orders. A check is
+    only performed when its allow-list or bound is given.
+
+    Example:
+    ```python
+    from criteria_pattern import Criteria, Direction, Filter, Operator
+    from criteria_pattern.converters import ConverterPolicy, CriteriaToPostgresqlConverter
+
+    policy = ConverterPolicy(
+        valid_tables=['user'],
+        valid_columns=['id', 'age'],
+        valid_operators=[Operator.EQUAL, Operator.GREATER_OR_EQUAL],
+        valid_directions=[Direction.ASC, Direction.DESC],
+        max_page_size=100,
+    )
+    criteria = Criteria(filters=[Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18)])
+
+    query, parameters = CriteriaToPostgresqlConverter.convert(criteria=criteria, table='user', policy=policy)
+    print(query)
+    # >>> SELECT * FROM "user" WHERE "age" >= %(parameter_0)s;
+    ```
+    """
+
+    _valid_tables: tuple[str, ...]
+    _valid_tables_set: frozenset[str] | None
+    _valid_columns: tuple[str, ...]
+    _valid_columns_set: frozenset[str] | None
+    _valid_operators: tuple[Operator, ...]
+    _valid_operators_set: frozenset[str] | None
+    _valid_directions: tuple[Direction, ...]
+    _valid_directions_set: frozenset[str] | None
+    _max_page_size: int | None
+    _max_page_number: int | None
+
+    def __init__(
+        self,
+        *,
+        valid_tables: Iterable[str] | None = None,
+        valid_columns: Iterable[str] | None = None,
+        valid_operators: Iterable[Operator] | None = None,
+        valid_directions: Iterable[Direction] | None = None,
+        max_page_size: int | None = None,
+        max_page_number: int | None = None,
+    ) -> None:
+        """
+        ConverterPolicy constructor.
+
+        Args:
+            valid_tables (Iterable[str] | None, optional): Valid tables to query. Default to None (not checked).
+            valid_columns (Iterable[str] | None, optional): Valid columns to select, filter and order by. Default to
+            None (not checked).
+            valid_operators (Iterable[Operator] | None, optional): Valid operators to use. Default to None (not
+            checked).
+            valid_directions (Iterable[Direction] | None, optional): Valid directions to use. Default to None (not
+            checked).
+            max_page_size (int | None, optional): Maximum allowed page_size. Default to None (not checked).
+            max_page_number (int | None, optional): Maximum allowed page_number. Default to None (not checked).
+
+        Raises:
+            IntegrityError: If `max_page_size` is not a positive integer.
+            IntegrityError: If `max_page_number` is not a positive integer.
+
+        Example:
+        ```python
+        from criteria_pattern.converters import ConverterPolicy
+
+        policy = ConverterPolicy(valid_tables=['user'], valid_columns=['id', 'name'])
+        print(policy.valid_columns)
+        # >>> frozenset({'id', 'name'})
+        ```
+        """
+        if max_page_size is not None and (type(max_page_size) is not int or max_page_size < 1):
+            raise IntegrityError(message=f'ConverterPolicy max_page_size <<<{max_page_size}>>> must be a positive integer.')  # noqa: E501  # fmt: skip
+
+        if max_page_number is not None and (type(max_page_number) is not int or max_page_number < 1):
+            raise IntegrityError(message=f'ConverterPolicy max_page_number <<<{max_page_number}>>> must be a positive integer.')  # noqa: E501  # fmt: skip
+
+        self._valid_tables = () if valid_tables is None else tuple(dict.fromkeys(valid_tables))
+        self._valid_tables_set = None if valid_tables is None else frozenset(self._valid_tables)
+        self._valid_columns = () if valid_columns is None else tuple(dict.fromkeys(valid_columns))
+        self._valid_columns_set = None if valid_columns is None else frozenset(self._valid_columns)
+        self._valid_operators = () if valid_operators is None else tuple(dict.fromkeys(valid_operators))
+        self._valid_operators_set = None if valid_operators is None else frozenset(self._valid_operators)
+        self._valid_directions = () if valid_directions is None else tuple(dict.fromkeys(valid_directions))
+        self._valid_directions_set = None if valid_directions is None else frozenset(self._valid_directions)
+        self._max_page_size = max_page_size
+        self._max_page_number = max_page_number
+
+    def validate_table(self, *, table: str) -> None:
+        """
+        Validate the table name to prevent SQL injection.
+
+        Args:
+            table (str): Name of the table to query.
+
+        Raises:
+            InvalidTableError: If the table is not in the valid tables.
+        """
+        if self._valid_tables_set is not None and table not in self._valid_tables_set:
+            raise InvalidTableError(table=table, valid_tables=self._valid_tables)
+
+    def validate_columns(self, *, columns: Sequence[str], columns_mapping: Mapping[str, str]) -> None:
+        """
+        Validate the column names to prevent SQL injection.
+
+        Args:
+            columns (Sequence[str]): Columns of the table to select.
+            columns_mapping (Mapping[str, str]): Mapping of column names to aliases.
+
+        Raises:
+            InvalidColumnError: If a column is not in the valid columns.
+        """
+        if self._valid_columns_set is None:
+            return
+
+        for column in columns:
+            if column not in self._valid_columns_set:
+                raise InvalidColumnError(column=column, valid_columns=self._valid_columns)
+
+        for column in columns_mapping.values():
+            if column not in self._valid_columns_set:
+                raise InvalidColumnError(column=column, valid_columns=self._valid_columns)
+
+    def validate_criteria(self, *, criteria: Criteria) -> None:  # noqa: C901
+        """
+        Validate the Criteria object fields, operators, directions and pagination in a single pass.
+
+        Args:
+            criteria (Criteria): Criteria to validate.
+
+        Raises:
+            InvalidColumnError: If a filter or order field is not in the valid columns.
+            InvalidOperatorError: If a filter operator is not in the valid operators.
+            InvalidDirectionError: If an order direction is not in the valid directions.
+            PaginationBoundsError: If the pagination parameters exceed the maximum bounds.
+        """
+        valid_columns = self._valid_columns_set
+        valid_operators = self._valid_operators_set
+        valid_directions = self._valid_directions_set
+
+        if valid_columns is not None or valid_operators is not None:
+            for filter in criteria.filters:
+                if valid_columns is not None and filter.field not in valid_columns:
+                    raise InvalidColumnError(column=filter.field, valid_columns=self._valid_columns)
+
+                if valid_operators is not None and filter.operator not in valid_operators:
+                    raise InvalidOperatorError(
+                        operator=Operator(value=filter.operator),
+                        valid_operators=self._valid_operators,
+                    )
+
+        if valid_columns is not None or valid_directions is not None:
+            for order in criteria.orders:
+                if valid_columns is not None and order.field not in valid_columns:
+                    raise InvalidColumnError(column=order.field, valid_columns=self._valid_columns)
+
+                if valid_directions is not None and order.direction not in valid_directions:
+                    raise InvalidDirectionError(
+                        direction=Direction(value=order.direction),
+                        valid_directions=self._valid_directions,
+                    )
+
+        page_size = criteria.page_size
+        if self._max_page_size is not None and page_size is not None and page_size > self._max_page_size:
+            raise PaginationBoundsError(parameter='page_size', value=page_size, max_value=self._max_page_size)
+
+        page_number = criteria.page_number
+        if self._max_page_number is not None and page_number is not None and page_number > self._max_page_number:
+            raise PaginationBoundsError(parameter='page_number', value=page_number, max_value=self._max_page_number)
+
+    @property
+    def valid_tables(self) -> frozenset[str] | None:
+        """
+        Get the valid tables.
+
+        Returns:
+            frozenset[str] | None: Valid tables, or None if the table is not checked.
+        """
+        return self._valid_tables_set
+
+    @property
+    def valid_columns(self) -> frozenset[str] | None:
+        """
+        Get the valid columns.
+
+        Returns:
+            frozenset[str] | None: Valid columns, or None if the columns are not checked.
+        """
+        return self._valid_columns_set
+
+    @property
+    def valid_operators(self) -> frozenset[str] | None:
+        """
+        Get the valid operators.
+
+        Returns:
+            frozenset[str] | None: Valid operators, or None if the operators are not checked.
+        """
+        return self._valid_operators_set
+
+    @property
+    def valid_directions(self) -> frozenset[str] | None:
+        """
+        Get the valid directions.
+
+        Returns:
+            frozenset[str] | None: Valid directions, or None if the directions are not checked.
+        """
+        return self._valid_directions_set
+
+    @property
+    def max_page_size(self) -> int | None:
+        """
+        Get the maximum allowed page_size.
+
+        Returns:
+            int | None: Maximum allowed page_size, or None if it is not checked.
+        """
+        return self._max_page_size
+
+    @property
+    def max_page_number(self) -> int | None:
+        """
+        Get the maximum allowed page_number.
+
+        Returns:
+            int | None: Maximum allowed page_number, or None if it is not checked.
+        """
+        return self._max_page_number
@@ -0,0 +1,931 @@
+"""
+Criteria optimizer module.
+"""
+
+from collections.abc import Callable, Hashable, Sequence
+from datetime import date, time
+from decimal import Decimal
+from typing import Any
+
+from criteria_pattern import Criteria, Filter, Operator
+from criteria_pattern.models.canonical import canonical_value
+from criteria_pattern.models.criteria import AndCriteria, NotCriteria, OrCriteria
+
+_LOWER_BOUNDS: dict[str, bool] = {Operator.GREATER: True, Operator.GREATER_OR_EQUAL: False}
+_UPPER_BOUNDS: dict[str, bool] = {Operator.LESS: True, Operator.LESS_OR_EQUAL: False}
+_RANGE_OPERATORS = frozenset({*_LOWER_BOUNDS, *_UPPER_BOUNDS, Operator.BETWEEN})
+_ORDERABLE_TYPES = (int, float, Decimal, date, time)
+_COMPLEMENT_PAIRS = (
+    (Operator.EQUAL, Operator.NOT_EQUAL),
+    (Operator.GREATER, Operator.LESS_OR_EQUAL),
+    (Operator.GREATER_OR_EQUAL, Operator.LESS),
+    (Operator.LIKE, Operator.NOT_LIKE),
+    (Operator.CONTAINS, Operator.NOT_CONTAINS),
+    (Operator.STARTS_WITH, Operator.NOT_STARTS_WITH),
+    (Operator.ENDS_WITH, Operator.NOT_ENDS_WITH),
+    (Operator.BETWEEN, Operator.NOT_BETWEEN),
+    (Operator.IS_NULL, Operator.IS_NOT_NULL),
+    (Operator.IN, Operator.NOT_IN),
+)
+_COMPLEMENTS: dict[str, Operator] = {**dict(_COMPLEMENT_PAIRS), **{last: first for first, last in _COMPLEMENT_PAIRS}}
+
+Bound = tuple[Any, bool]
+
+
+class CriteriaOptimizer:
+    """
+    Criteria optimizer, it simplifies the logical tree of a criteria before it is converted, so the database receives
+    smaller and index-friendlier predicates. The optimized criteria matches the same rows, including the rows with
+    null fields, and keeps the orders and the pagination of the original one, which is not modified.
+
+    - Empty children are dropped, like the converters do.
+    - Nested AND and OR nodes are flattened, and repeated filters and children are removed.
+    - Double negations are removed.
+    - The plain children of an AND node are merged, and the range filters of each field are merged into the tightest
+    bounds, a BETWEEN if both of them are inclusive.
+    - The EQUAL and IN children of an OR node on the same field are folded into a single IN filter.
+
+    Example:
+    ```python
+    from criteria_pattern import Criteria, Filter, Operator
+    from criteria_pattern.converters import CriteriaOptimizer, CriteriaToPostgresqlConverter
+
+    is_adult = Criteria(filters=[Filter(field='age', operator=Operator.GREATER, value=5), Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18)])
+    is_not_retired = Criteria(filters=[Filter(field='age', operator=Operator.LESS_OR_EQUAL, value=65)])
+    is_spanish = Criteria(filters=[Filter(field='country', operator=Operator.EQUAL, value='ES')])
+    is_french = Criteria(filters=[Filter(field='country', operator=Operator.EQUAL, value='FR')])
+
+    criteria = CriteriaOptimizer.optimize(criteria=~~(is_adult & is_not_retired & (is_spanish | is_french)))
+    query, parameters = CriteriaToPostgresqlConverter.convert(criteria=criteria, table='user')
+    print(query)
+    # >>> SELECT * FROM "user" WHERE "age" BETWEEN %(parameter_0)s AND %(parameter_1)s AND "country" IN (%(parameter_2)s, %(parameter_3)s);
+    ```
+    """  # noqa: E501  # fmt: skip
+
+    @classmethod
+    def optimize(cls, criteria: Criteria) -> Criteria:
+        """
+        Optimize the Criteria object. The logical tree is walked bottom-up with an explicit stack, so the depth of the
+        criteria is not limited by the recursion limit.
+
+        Args:
+            criteria (Criteria): Criteria to optimize.
+
+        Returns:
+            Criteria: Optimized criteria, with the same orders and pagination.
+
+        Example:
+        ```python
+        from criteria_pattern import Criteria, Filter, Operator
+        from criteria_pattern.converters import CriteriaOptimizer
+
+        criteria = Criteria(filters=[Filter(field='age', operator=Operator.GREATER, value=5), Filter(field='age', operator=Operator.GREATER, value=10)])
+        print(CriteriaOptimizer.optimize(criteria=criteria).filters)
+        # >>> [Filter(field=FilterField(value='age'), operator=FilterOperator(value=<Operator.GREATER: 'GREATER'>), value=FilterValue(value=10))]
+        ```
+        """  # noqa: E501  # fmt: skip
+        nodes: list[Criteria] = []
+        children: dict[int, list[Criteria]] = {}
+        stack: list[Criteria] = [criteria]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+
+            if isinstance(node, AndCriteria | OrCriteria):
+                children[id(node)] = cls._chain_children(criteria=node)
+                stack.extend(children[id(node)])
+
+            elif isinstance(node, NotCriteria):
+                stack.append(node.criteria)
+
+        optimized: dict[int, Criteria | None] = {}
+        for node in reversed(nodes):  # children are always visited before their parents
+            if isinstance(node, AndCriteria):
+                optimized[id(node)] = cls._optimize_and(children=[optimized[id(child)] for child in children[id(node)]])
+
+            elif isinstance(node, OrCriteria):
+                optimized[id(node)] = cls._optimize_or(children=[optimized[id(child)] for child in children[id(node)]])
+
+            elif isinstance(node, NotCriteria):
+                optimized[id(node)] = cls._optimize_not(child=optimized[id(node.criteria)])
+
+            else:
+                optimized[id(node)] = cls._optimize_leaf(filters=node.filters)
+
+        return cls._restore_orders_and_pagination(optimized=optimized[id(criteria)], criteria=criteria)
+
+    @classmethod
+    def is_unsatisfiable(cls, criteria: Criteria) -> bool:
+        """
+        Check whether the Criteria object is provably unsatisfiable, so no row can match it and the query can be
+        skipped or replaced by a constant-false one. The analysis follows the SQL semantics, a condition on a null field
+        is never true, and it is conservative: False means the criteria may match rows, not that it does. The filters of
+        the plain children of each AND node are checked together, field by field.
+
+        - A comparison with a null value, or an IN filter without values, never matches.
+        - IS_NULL together with any other filter on the same field never matches.
+        - Numbers and dates must fit in the tightest bounds of their EQUAL, range and BETWEEN filters, and in the values
+        of their IN filters not excluded by NOT_EQUAL and NOT_IN filters.
+        - A value both required by EQUAL and excluded by NOT_EQUAL or NOT_IN never matches.
+        - An OR node is unsatisfiable if all its non-empty children are, NOT nodes are never considered unsatisfiable.
+
+        Args:
+            criteria (Criteria): Criteria to check.
+
+        Returns:
+            bool: True if no row can match the criteria, False otherwise.
+
+        Example:
+        ```python
+        from criteria_pattern import Criteria, Filter, Operator
+        from criteria_pattern.converters import CriteriaOptimizer
+
+        criteria = Criteria(filters=[Filter(field='age', operator=Operator.GREATER, value=30), Filter(field='age', operator=Operator.LESS, value=10)])
+        print(CriteriaOptimizer.is_unsatisfiable(criteria=criteria))
+        # >>> True
+        ```
+        """  # noqa: E501  # fmt: skip
+        nodes: list[Criteria] = []
+        children: dict[int, list[Criteria]] = {}
+        stack: list[Criteria] = [criteria]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+
+            if isinstance(node, AndCriteria | OrCriteria):
+                children[id(node)] = cls._chain_children(criteria=node)
+                stack.extend(children[id(node)])
+
+        # each node is either unsatisfiable (True), satisfiable (False) or empty (None), the converters skip empty nodes
+        unsatisfiable: dict[int, bool | None] = {}
+        for node in reversed(nodes):  # children are always visited before their parents
+            if isinstance(node, AndCriteria):
+                node_children = children[id(node)]
+                leaves = [child for child in node_children if cls._is_leaf(criteria=child)]
+                filters = [filter for leaf in leaves for filter in leaf.filters]
+                states = [unsatisfiable[id(child)] for child in node_children]
+                if all(state is None for state in states):
+                    unsatisfiable[id(node)] = None
+
+                else:
+                    unsatisfiable[id(node)] = any(states) or cls._is_unsatisfiable_conjunction(filters=filters)
+
+            elif isinstance(node, OrCriteria):
+                states = [unsatisfiable[id(child)] for child in children[id(node)]]
+                non_empty = [state for state in states if state is not None]
+                unsatisfiable[id(node)] = all(non_empty) if non_empty else None
+
+            elif isinstance(node, NotCriteria):
+                unsatisfiable[id(node)] = False if node.has_filters() else None
+
+            else:
+                unsatisfiable[id(node)] = cls._is_unsatisfiable_conjunction(filters=node.filters) if node.filters else None  # noqa: E501  # fmt: skip
+
+        return bool(unsatisfiable[id(criteria)])
+
+    @classmethod
+    def push_down_negations(cls, criteria: Criteria) -> Criteria:
+        """
+        Push the negations of the Criteria object down to its filters, so the databases can use their indexes instead
+        of evaluating a `NOT (...)` around a whole sub-expression. AND and OR nodes are swapped following De Morgan's
+        laws and each negated filter is replaced by its complement, e.g. GREATER by LESS_OR_EQUAL or IN by NOT_IN.
+
+        The complements keep the SQL semantics, a condition on a null field is unknown and so is its negation, so the
+        rewritten criteria matches the same rows in the SQL converters. They do not hold for the in-memory converters,
+        where a condition on a missing value is false and its negation is true.
+
+        Args:
+            criteria (Criteria): Criteria to rewrite.
+
+        Returns:
+            Criteria: Criteria without NOT nodes, with the same orders and pagination.
+
+        Example:
+        ```python
+        from criteria_pattern import Criteria, Filter, Operator
+        from criteria_pattern.converters import CriteriaOptimizer, CriteriaToPostgresqlConverter
+
+        is_adult = Criteria(filters=[Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18)])
+        is_spanish = Criteria(filters=[Filter(field='country', operator=Operator.EQUAL, value='ES')])
+
+        criteria = CriteriaOptimizer.push_down_negations(criteria=~(is_adult & is_spanish))
+        query, parameters = CriteriaToPostgresqlConverter.convert(criteria=criteria, table='user')
+        print(query)
+        # >>> SELECT * FROM "user" WHERE ("age" < %(parameter_0)s OR "country" != %(parameter_1)s);
+        ```
+        """  # noqa: E501  # fmt: skip
+        nodes: list[tuple[Criteria, bool]] = [(criteria, False)]
+        children: dict[int, list[int]] = {}
+        stack: list[int] = [0]
+        while stack:
+            index = stack.pop()
+            node, negated = nodes[index]
+
+            node_children: list[Criteria] = []
+            if isinstance(node, AndCriteria | OrCriteria):
+                node_children = cls._chain_children(criteria=node)
+
+            elif isinstance(node, NotCriteria):
+                node_children = [node.criteria]
+                negated = not negated
+
+            children[index] = list(range(len(nodes), len(nodes) + len(node_children)))
+            nodes.extend((child, negated) for child in node_children)
+            stack.extend(children[index])
+
+        # the same criteria can appear with both polarities, so the nodes are identified by their position
+        rewritten: list[Criteria | None] = [None] * len(nodes)
+        for index in reversed(range(len(nodes))):  # children are always after their parents
+            node, negated = nodes[index]
+            node_children = [child for child in (rewritten[child_index] for child_index in children[index]) if child is not None]  # noqa: E501  # fmt: skip
+            if isinstance(node, NotCriteria):
+                rewritten[index] = node_children[0] if node_children else None
+
+            elif isinstance(node, AndCriteria | OrCriteria):
+                is_conjunction = isinstance(node, AndCriteria) != negated
+                combine = Criteria.all_of if is_conjunction else Criteria.any_of
+                rewritten[index] = cls._combine(children=node_children, combine=combine)
+
+            else:
+                rewritten[index] = cls._push_down_leaf(filters=node.filters, negated=negated)
+
+        return cls._restore_orders_and_pagination(optimized=rewritten[0], criteria=criteria)
+
+    @classmethod
+    def _chain_children(cls, *, criteria: AndCriteria | OrCriteria) -> list[Criteria]:
+        """
+        Get the children of a chain of nested nodes of the same type, e.g. the left-deep AND chains built with the `&`
+        operator, so the chain is optimized as a single n-ary node in linear time.
+
+        Args:
+            criteria (AndCriteria | OrCriteria): Node at the top of the chain.
+
+        Returns:
+            list[Criteria]: Children of the chain, in order.
+        """
+        chain_children: list[Criteria] = []
+        stack = list(reversed(criteria.children))
+        while stack:
+            child = stack.pop()
+            if type(child) is type(criteria):
+                stack.extend(reversed(child.children))
+                continue
+
+            chain_children.append(child)
+
+        return chain_children
+
+    @classmethod
+    def _optimize_and(cls, *, children: Sequence[Criteria | None]) -> Criteria | None:
+        """
+        Optimize an AND node whose children are already optimized, merging its plain children into a single one.
+
+        Args:
+            children (Sequence[Criteria | None]): Optimized children, None if the child is empty.
+
+        Returns:
+            Criteria | None: Optimized node, None if it is empty.
+        """
+        filters: list[Filter[Any]] = []
+        leaf_index: int | None = None
+        optimized: list[Criteria] = []
+        for child in cls._flatten(children=children, node_type=AndCriteria):
+            if cls._is_leaf(criteria=child):
+                if leaf_index is None:
+                    leaf_index = len(optimized)
+
+                filters.extend(child.filters)
+                continue
+
+            optimized.append(child)
+
+        leaf = cls._optimize_leaf(filters=filters)
+        if leaf is not None and leaf_index is not None:
+            optimized.insert(leaf_index, leaf)
+
+        return cls._combine(children=cls._deduplicate(children=optimized), combine=Criteria.all_of)
+
+    @classmethod
+    def _optimize_or(cls, *, children: Sequence[Criteria | None]) -> Criteria | None:
+        """
+        Optimize an OR node whose children are already optimized, folding its EQUAL and IN children on the same field
+        into a single IN filter.
+
+        Args:
+            children (Sequence[Criteria | None]): Optimized children, None if the child is empty.
+
+        Returns:
+            Criteria | None: Optimized node, None if it is empty.
+        """
+        unique = cls._deduplicate(children=list(cls._flatten(children=children, node_type=OrCriteria)))
+
+        groups: dict[str, list[Criteria]] = {}
+        slots: list[Criteria | str] = []
+        for child in unique:
+            field = cls._foldable_field(criteria=child)
+            if field is None:
+                slots.append(child)
+                continue
+
+            if field not in groups:
+                groups[field] = []
+                slots.append(field)
+
+            groups[field].append(child)
+
+        folded: list[Criteria] = []
+        for slot in slots:
+            if not isinstance(slot, str):
+                folded.append(slot)
+                continue
+
+            group = groups[slot]
+            if len(group) == 1:
+                folded.append(group[0])
+                continue
+
+            values = [value for child in group for value in cls._foldable_values(filter=child.filters[0])]
+            folded.append(
+                Criteria.from_trusted(
+                    filters=[Filter.trusted(field=slot, operator=Operator.IN, value=cls._unique_values(values=values))]
+                )
+            )
+
+        return cls._combine(children=folded, combine=Criteria.any_of)
+
+    @classmethod
+    def _optimize_not(cls, *, child: Criteria | None) -> Criteria | None:
+        """
+        Optimize a NOT node whose child is already optimized, removing double negations.
+
+        Args:
+            child (Criteria | None): Optimized child, None if the child is empty.
+
+        Returns:
+            Criteria | None: Optimized node, None if it is empty.
+        """
+        if child is None:
+            return None
+
+        if isinstance(child, NotCriteria):
+            return child.criteria
+
+        return ~child
+
+    @classmethod
+    def _push_down_leaf(cls, *, filters: Sequence[Filter[Any]], negated: bool) -> Criteria | None:
+        """
+        Rewrite the filters of a plain criteria, replacing them by an OR of their complements if they are negated.
+
+        Args:
+            filters (Sequence[Filter[Any]]): Filters of the plain criteria, combined with AND.
+            negated (bool): Whether the plain criteria is negated.
+
+        Returns:
+            Criteria | None: Rewritten criteria, None if it has no filters.
+        """
+        if not filters:
+            return None
+
+        if not negated:
+            return Criteria.from_trusted(filters=list(filters))
+
+        complements = [
+            Criteria.from_trusted(
+                filters=[Filter(field=filter.field, operator=_COMPLEMENTS[filter.operator], value=filter.value)],
+            )
+            for filter in filters
+        ]
+
+        return cls._combine(children=complements, combine=Criteria.any_of)
+
+    @classmethod
+    def _optimize_leaf(cls, *, filters: Sequence[Filter[Any]]) -> Criteria | None:
+        """
+        Optimize the filters of a plain criteria, removing repeated filters and merging the range filters of each
+        field. The orders and the pagination are restored at the end of the optimization.
+
+        Args:
+            filters (Sequence[Filter[Any]]): Filters of the plain criteria, they are combined with AND.
+
+        Returns:
+            Criteria | None: Optimized plain criteria, None if it has no filters.
+        """
+        unique: list[Filter[Any]] = []
+        seen: set[Hashable] = set()
+        for filter in filters:
+            key = cls._filter_key(filter=filter)
+            if key is not None:
+                if key in seen:
+                    continue
+
+                seen.add(key)
+
+            unique.append(filter)
+
+        if not unique:
+            return None
+
+        return Criteria.from_trusted(filters=cls._merge_ranges(filters=unique))
+
+    @classmethod
+    def _merge_ranges(cls, *, filters: list[Filter[Any]]) -> list[Filter[Any]]:
+        """
+        Merge the range filters of each field into its tightest lower and upper bounds, the fields with a single range
+        filter or with values of different types are kept as they are, as the databases coerce different types, e.g.
+        `1` and `Decimal('0.5')`, differently than Python.
+
+        Args:
+            filters (list[Filter[Any]]): Filters combined with AND, without repeated filters.
+
+        Returns:
+            list[Filter[Any]]: Filters with the range filters merged, in the position of the first range filter of each
+            field.
+        """
+        ranges: dict[str, list[Filter[Any]]] = {}
+        for filter in filters:
+            if filter.operator in _RANGE_OPERATORS and cls._is_orderable_range(filter=filter):
+                ranges.setdefault(filter.field, []).append(filter)
+
+        range_filters_ids = {id(filter) for range_filters in ranges.values() for filter in range_filters}
+
+        merged: dict[str, list[Filter[Any]]] = {}
+        for field, range_filters in ranges.items():
+            if len(range_filters) < 2 or not cls._is_single_type(filters=range_filters):
+                continue
+
+            try:
+                merged[field] = cls._merge_field_ranges(field=field, filters=range_filters)
+
+            except TypeError:  # values that cannot be compared, e.g. a naive and an aware datetime
+                continue
+
+        if not merged:
+            return filters
+
+        result: list[Filter[Any]] = []
+        for filter in filters:
+            if filter.field not in merged or id(filter) not in range_filters_ids:
+                result.append(filter)
+                continue
+
+            result.extend(merged[filter.field])
+            merged[filter.field] = []  # the merged filters replace the first range filter of the field
+
+        return result
+
+    @classmethod
+    def _merge_field_ranges(cls, *, field: str, filters: list[Filter[Any]]) -> list[Filter[Any]]:
+        """
+        Merge the range filters of a field into its tightest lower and upper bounds.
+
+        Args:
+            field (str): Field of the range filters.
+            filters (list[Filter[Any]]): Range filters of the field.
+
+        Raises:
+            TypeError: If the values of the range filters cannot be compared.
+
+        Returns:
+            list[Filter[Any]]: A BETWEEN filter if both bounds are inclusive, the bounds filters otherwise.
+        """
+        lower: Bound | None = None
+        upper: Bound | None = None
+        for filter in filters:
+            if filter.operator == Operator.BETWEEN:
+                lower = cls._tightest(bound=lower, candidate=(filter.value[0], False), is_lower=True)
+                upper = cls._tightest(bound=upper, candidate=(filter.value[1], False), is_lower=False)
+
+            elif filter.operator in _LOWER_BOUNDS:
+                lower = cls._tightest(bound=lower, candidate=(filter.value, _LOWER_BOUNDS[filter.operator]), is_lower=True)  # noqa: E501  # fmt: skip
+
+            else:
+                upper = cls._tightest(bound=upper, candidate=(filter.value, _UPPER_BOUNDS[filter.operator]), is_lower=False)  # noqa: E501  # fmt: skip
+
+        if lower is not None and upper is not None and not lower[1] and not upper[1]:
+            return [Filter.trusted(field=field, operator=Operator.BETWEEN, value=[lower[0], upper[0]])]
+
+        bounds: list[Filter[Any]] = []
+        if lower is not None:
+            bounds.append(Filter.trusted(field=field, operator=Operator.GREATER if lower[1] else Operator.GREATER_OR_EQUAL, value=lower[0]))  # noqa: E501  # fmt: skip
+
+        if upper is not None:
+            bounds.append(Filter.trusted(field=field, operator=Operator.LESS if upper[1] else Operator.LESS_OR_EQUAL, value=upper[0]))  # noqa: E501  # fmt: skip
+
+        return bounds
+
+    @classmethod
+    def _tightest(cls, *, bound: Bound | None, candidate: Bound, is_lower: bool) -> Bound:
+        """
+        Get the tightest of two bounds, a strict bound is tighter than an inclusive one with the same value.
+
+        Args:
+            bound (Bound | None): Current bound, its value and whether it is strict, None if there is none yet.
+            candidate (Bound): Candidate bound, its value and whether it is strict.
+            is_lower (bool): Whether the bounds are lower bounds.
+
+        Raises:
+            TypeError: If the values of the bounds cannot be compared.
+
+        Returns:
+            Bound: Tightest bound.
+        """
+        if bound is None:
+            return candidate
+
+        if bound[0] == candidate[0]:
+            return bound if bound[1] else candidate
+
+        is_greater = candidate[0] > bound[0]
+
+        return candidate if is_greater == is_lower else bound
+
+    @classmethod
+    def _is_unsatisfiable_conjunction(cls, *, filters: Sequence[Filter[Any]]) -> bool:
+        """
+        Check whether the filters combined with AND are provably unsatisfiable, field by field.
+
+        Args:
+            filters (Sequence[Filter[Any]]): Filters combined with AND.
+
+        Returns:
+            bool: True if no row can match the filters, False otherwise.
+        """
+        fields: dict[str, list[Filter[Any]]] = {}
+        for filter in filters:
+            fields.setdefault(filter.field, []).append(filter)
+
+        return any(cls._is_unsatisfiable_field(filters=field_filters) for field_filters in fields.values())
+
+    @classmethod
+    def _is_unsatisfiable_field(cls, *, filters: list[Filter[Any]]) -> bool:  # noqa: C901
+        """
+        Check whether the filters of a single field combined with AND are provably unsatisfiable. The values are only
+        ordered and compared if the numbers and dates of the field share the same type, as the databases coerce
+        different types, e.g. `0.1` and `Decimal('0.1')`, differently than Python.
+
+        Args:
+            filters (list[Filter[Any]]): Filters of the field.
+
+        Returns:
+            bool: True if no value of the field can match the filters, False otherwise.
+        """
+        operators = {filter.operator for filter in filters}
+        if Operator.IS_NULL in operators and len(operators) > 1:
+            return True
+
+        is_ordered = cls._is_single_type(filters=filters)
+
+        lower: Bound | None = None
+        upper: Bound | None = None
+        allowed: set[Any] | None = None
+        required: set[Hashable] = set()
+        excluded: set[Hashable] = set()
+        excluded_orderable: list[Any] = []
+        try:
+            for filter in filters:
+                operator, value = filter.operator, filter.value
+                if operator in (Operator.IS_NULL, Operator.IS_NOT_NULL):
+                    continue
+
+                if value is None:
+                    return True
+
+                if operator in (Operator.IN, Operator.NOT_IN):
+                    if not isinstance(value, list | tuple):
+                        continue
+
+                    values = [item for item in value if item is not None]
+                    if operator == Operator.IN and not values:
+                        return True
+
+                    if operator == Operator.NOT_IN:
+                        excluded.update(cls._value_keys(values=values))
+                        excluded_orderable.extend(item for item in values if cls._is_orderable(value=item))
+
+                    elif is_ordered and all(cls._is_orderable(value=item) for item in values):
+                        allowed = set(values) if allowed is None else {item for item in allowed if item in values}
+
+                elif operator == Operator.EQUAL:
+                    required.update(cls._value_keys(values=[value]))
+                    if is_ordered and cls._is_orderable(value=value):
+                        lower = cls._tightest(bound=lower, candidate=(value, False), is_lower=True)
+                        upper = cls._tightest(bound=upper, candidate=(value, False), is_lower=False)
+
+                elif operator == Operator.NOT_EQUAL:
+                    excluded.update(cls._value_keys(values=[value]))
+                    if cls._is_orderable(value=value):
+                        excluded_orderable.append(value)
+
+                elif operator in _RANGE_OPERATORS and is_ordered and cls._is_orderable_range(filter=filter):
+                    if operator == Operator.BETWEEN:
+                        lower = cls._tightest(bound=lower, candidate=(value[0], False), is_lower=True)
+                        upper = cls._tightest(bound=upper, candidate=(value[1], False), is_lower=False)
+
+                    elif operator in _LOWER_BOUNDS:
+                        lower = cls._tightest(bound=lower, candidate=(value, _LOWER_BOUNDS[operator]), is_lower=True)
+
+                    else:
+                        upper = cls._tightest(bound=upper, candidate=(value, _UPPER_BOUNDS[operator]), is_lower=False)
+
+            if required & excluded:
+                return True
+
+            if lower is not None and upper is not None and (lower[0] > upper[0] or (lower[0] == upper[0] and (lower[1] or upper[1]))):  # noqa: E501  # fmt: skip
+                return True
+
+            if allowed is not None:
+                return not any(
+                    cls._fits(value=value, lower=lower, upper=upper) and value not in excluded_orderable
+                    for value in allowed
+                )
+
+        except TypeError:  # values of different types, e.g. a date and a datetime
+            return False
+
+        if lower is not None and upper is not None and lower[0] == upper[0]:
+            return lower[0] in excluded_orderable
+
+        return False
+
+    @classmethod
+    def _fits(cls, *, value: Any, lower: Bound | None, upper: Bound | None) -> bool:
+        """
+        Check whether a value fits in the bounds.
+
+        Args:
+            value (Any): Value.
+            lower (Bound | None): Lower bound, None if there is none.
+            upper (Bound | None): Upper bound, None if there is none.
+
+        Raises:
+            TypeError: If the value and the bounds cannot be compared.
+
+        Returns:
+            bool: True if the value fits in the bounds, False otherwise.
+        """
+        if lower is not None and (value < lower[0] or (lower[1] and value == lower[0])):
+            return False
+
+        return upper is None or not (value > upper[0] or (upper[1] and value == upper[0]))
+
+    @classmethod
+    def _value_keys(cls, *, values: Sequence[Any]) -> set[Hashable]:
+        """
+        Get the keys that identify the hashable values, values of different types never have the same key.
+
+        Args:
+            values (Sequence[Any]): Values.
+
+        Returns:
+            set[Hashable]: Keys of the hashable values.
+        """
+        keys: set[Hashable] = set()
+        for value in values:
+            key = canonical_value(value=value)
+            try:
+                hash(key)
+
+            except TypeError:
+                continue
+
+            keys.add(key)
+
+        return keys
+
+    @classmethod
+    def _restore_orders_and_pagination(cls, *, optimized: Criteria | None, criteria: Criteria) -> Criteria:
+        """
+        Add the orders and the pagination of the original criteria to the optimized one, in a plain criteria combined
+        with AND if the optimized criteria is not a plain one.
+
+        Args:
+            optimized (Criteria | None): Optimized criteria without orders nor pagination, None if it is empty.
+            criteria (Criteria): Original criteria.
+
+        Returns:
+            Criteria: Optimized criteria with the orders and the pagination of the original one.
+        """
+        orders = criteria.orders
+        page_size = criteria.page_size
+        page_number = criteria.page_number
+
+        if optimized is None or cls._is_leaf(criteria=optimized):
+            filters = optimized.filters if optimized is not None else []
+            return Criteria.from_trusted(filters=filters, orders=orders, page_size=page_size, page_number=page_number)
+
+        if not orders and page_size is None and page_number is None:
+            return optimized
+
+        carrier = Criteria.from_trusted(orders=orders, page_size=page_size, page_number=page_number)
+
+        return Criteria.all_of(criteria=[optimized, carrier])
+
+    @classmethod
+    def _flatten(cls, *, children: Sequence[Criteria | None], node_type: type[AndCriteria | OrCriteria]) -> list[Criteria]:  # noqa: E501  # fmt: skip
+        """
+        Flatten the children of the same type as their parent and drop the empty ones.
+
+        Args:
+            children (Sequence[Criteria | None]): Optimized children, None if the child is empty.
+            node_type (type[AndCriteria | OrCriteria]): Type of the parent node.
+
+        Returns:
+            list[Criteria]: Flattened children.
+        """
+        flattened: list[Criteria] = []
+        for child in children:
+            if child is None:
+                continue
+
+            if type(child) is node_type:
+                flattened.extend(child.children)
+                continue
+
+            flattened.append(child)
+
+        return flattened
+
+    @classmethod
+    def _deduplicate(cls, *, children: list[Criteria]) -> list[Criteria]:
+        """
+        Remove the repeated children, keeping the first one.
+
+        Args:
+            children (list[Criteria]): Children.
+
+        Returns:
+            list[Criteria]: Children without repetitions.
+        """
+        unique: list[Criteria] = []
+        seen: set[str] = set()
+        for child in children:
+            fingerprint = child.fingerprint()
+            if fingerprint in seen:
+                continue
+
+            seen.add(fingerprint)
+            unique.append(child)
+
+        return unique
+
+    @classmethod
+    def _combine(cls, *, children: list[Criteria], combine: Callable[..., Criteria]) -> Criteria | None:
+        """
+        Combine the optimized children of a node.
+
+        Args:
+            children (list[Criteria]): Optimized children.
+            combine (Callable[..., Criteria]): Criteria.all_of or Criteria.any_of.
+
+        Returns:
+            Criteria | None: Combined node, the only child if there is one, None if there is none.
+        """
+        if not children:
+            return None
+
+        return combine(criteria=children)
+
+    @classmethod
+    def _is_leaf(cls, *, criteria: Criteria) -> bool:
+        """
+        Check whether the criteria is a plain criteria, not a logical node.
+
+        Args:
+            criteria (Criteria): Criteria to check.
+
+        Returns:
+            bool: True if the criteria is a plain criteria, False otherwise.
+        """
+        return not isinstance(criteria, AndCriteria | OrCriteria | NotCriteria)
+
+    @classmethod
+    def _foldable_field(cls, *, criteria: Criteria) -> str | None:
+        """
+        Get the field of a plain criteria with a single EQUAL or IN filter whose values can be folded into an IN filter.
+
+        Args:
+            criteria (Criteria): Optimized child of an OR node.
+
+        Returns:
+            str | None: Field of the filter, None if the criteria cannot be folded.
+        """
+        if not cls._is_leaf(criteria=criteria) or len(criteria.filters) != 1:
+            return None
+
+        filter = criteria.filters[0]
+        values = cls._foldable_values(filter=filter)
+        if not values or any(value is None or isinstance(value, list | tuple | set | frozenset | dict) for value in values):  # noqa: E501  # fmt: skip
+            return None
+
+        return filter.field
+
+    @classmethod
+    def _foldable_values(cls, *, filter: Filter[Any]) -> list[Any]:
+        """
+        Get the values of an EQUAL or IN filter.
+
+        Args:
+            filter (Filter[Any]): Filter.
+
+        Returns:
+            list[Any]: Values of the filter, empty if it is not an EQUAL or IN filter.
+        """
+        if filter.operator == Operator.EQUAL:
+            return [filter.value]
+
+        if filter.operator == Operator.IN and isinstance(filter.value, list | tuple):
+            return list(filter.value)
+
+        return []
+
+    @classmethod
+    def _unique_values(cls, *, values: list[Any]) -> list[Any]:
+        """
+        Remove the repeated values, keeping the first one, values of different types are never repeated.
+
+        Args:
+            values (list[Any]): Values.
+
+        Returns:
+            list[Any]: Values without repetitions.
+        """
+        unique: list[Any] = []
+        seen: set[Hashable] = set()
+        for value in values:
+            key = canonical_value(value=value)
+            if key in seen:
+                continue
+
+            seen.add(key)
+            unique.append(value)
+
+        return unique
+
+    @classmethod
+    def _filter_key(cls, *, filter: Filter[Any]) -> Hashable | None:
+        """
+        Get the key that identifies a filter, two filters with the same key are equal.
+
+        Args:
+            filter (Filter[Any]): Filter.
+
+        Returns:
+            Hashable | None: Key of the filter, None if its value is not hashable.
+        """
+        key = (filter.field, filter.operator, canonical_value(value=filter.value))
+        try:
+            hash(key)
+
+        except TypeError:
+            return None
+
+        return key
+
+    @classmethod
+    def _is_orderable_range(cls, *, filter: Filter[Any]) -> bool:
+        """
+        Check whether the values of a range filter are numbers or dates, which are ordered the same way by Python and
+        the databases, unlike strings, whose order depends on the database collation.
+
+        Args:
+            filter (Filter[Any]): Range filter.
+
+        Returns:
+            bool: True if the values of the filter can be merged, False otherwise.
+        """
+        values = filter.value if filter.operator == Operator.BETWEEN else [filter.value]
+        if filter.operator == Operator.BETWEEN and (not isinstance(values, list | tuple) or len(values) != 2):
+            return False
+
+        return all(cls._is_orderable(value=value) for value in values)
+
+    @classmethod
+    def _is_single_type(cls, *, filters: Sequence[Filter[Any]]) -> bool:
+        """
+        Check whether the numbers and dates of the filters values share the same type, so they can be ordered and
+        compared the same way by Python and the databases.
+
+        Args:
+            filters (Sequence[Filter[Any]]): Filters of a single field.
+
+        Returns:
+            bool: True if the orderable values have at most one type, False otherwise.
+        """
+        values = [item for filter in filters for item in (filter.value if isinstance(filter.value, list | tuple) else [filter.value])]  # noqa: E501  # fmt: skip
+
+        return len({type(item) for item in values if cls._is_orderable(value=item)}) <= 1
+
+    @classmethod
+    def _is_orderable(cls, *, value: Any) -> bool:
+        """
+        Check whether a value is a number or a date, which are ordered the same way by Python and the databases.
+
+        Args:
+            value (Any): Value.
+
+        Returns:
+            bool: True if the value is orderable, False otherwise.
+        """
+        # NaN is not equal to itself and it is not ordered
+        return isinstance(value, _ORDERABLE_TYPES) and not isinstance(value, bool) and value == value
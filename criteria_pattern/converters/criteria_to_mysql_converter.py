@@ -2,11 +2,12 @@
 Criteria to MySQL converter module.
 """
 
-from collections.abc import Mapping, Sequence
-from typing import Any, assert_never
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Any, Unpack, assert_never
 
-from criteria_pattern import Criteria, Direction, Operator
+from criteria_pattern import Criteria, Direction, Filter, Operator
 from criteria_pattern.errors import (
+    IntegrityError,
     InvalidColumnError,
     InvalidDirectionError,
     InvalidOperatorError,
@@ -15,6 +16,31 @@ from criteria_pattern.errors import (
 )
 from criteria_pattern.models.criteria import AndCriteria, NotCriteria, OrCriteria
 
+from .converter_policy import ConverterPolicy
+from .criteria_optimizer import CriteriaOptimizer
+from .prepared_statement import PreparedStatement
+from .sql_converter_options import SqlFilterOptions, SqlQueryOptions, SqlSelectOptions, validate_options
+
+
+class MysqlFilterOptions(SqlFilterOptions, total=False):
+    """
+    Keyword arguments of the CriteriaToMysqlConverter methods that only use the criteria filters, e.g. `convert_count`.
+    """
+
+    in_list_bucketing: bool
+
+
+class MysqlSelectOptions(SqlSelectOptions, MysqlFilterOptions, total=False):
+    """
+    Keyword arguments of the CriteriaToMysqlConverter methods that select columns and paginate, e.g. `convert_many`.
+    """
+
+
+class MysqlQueryOptions(SqlQueryOptions, MysqlSelectOptions, total=False):
+    """
+    Keyword arguments of the CriteriaToMysqlConverter methods that convert a single page, e.g. `convert_prepared`.
+    """
+
 
 class CriteriaToMysqlConverter:
     """
@@ -38,7 +64,7 @@ class CriteriaToMysqlConverter:
     """  # noqa: E501  # fmt: skip
 
     @classmethod
-    def convert(  # noqa: C901
+    def convert(
         cls,
         criteria: Criteria,
         table: str,
@@ -56,6 +82,12 @@ class CriteriaToMysqlConverter:
         valid_directions: Sequence[Direction] | None = None,
         max_page_size: int = 10000,
         max_page_number: int = 1000000,
+        policy: ConverterPolicy | None = None,
+        keyset: Sequence[Any] | None = None,
+        in_list_bucketing: bool = False,
+        detect_contradictions: bool = False,
+        push_down_negations: bool = False,
+        optimize: bool = False,
     ) -> tuple[str, list[Any]]:
         """
         Convert the Criteria object to a MySQL query.
@@ -83,6 +115,21 @@ class CriteriaToMysqlConverter:
             valid_directions (Sequence[Direction], optional): List of valid directions to use. Default to empty list.
             max_page_size (int, optional): Maximum allowed page_size to prevent integer overflow. Default to 10000.
             max_page_number (int, optional): Maximum allowed page_number to prevent integer overflow. Default to 1000000.
+            policy (ConverterPolicy | None, optional): Precompiled policy to validate the table, columns and criteria
+            against, independently of the check flags. Default to None (no policy).
+            keyset (Sequence[Any] | None, optional): Last seen values of the criteria order fields, in the same order. When
+            given, the page starts after these values using a keyset predicate over the ORDER BY columns instead of an
+            OFFSET, so the page_number is ignored. Default to None (offset pagination).
+            in_list_bucketing (bool, optional): Pad the IN and NOT IN values up to the next power of two by repeating the
+            last value, bounding the number of distinct query texts. Default to False.
+            detect_contradictions (bool, optional): Check whether the criteria is provably unsatisfiable, e.g. `age > 30 AND
+            age < 10`, and return a constant-false query without parameters instead, see
+            `CriteriaOptimizer.is_unsatisfiable`. Default to False.
+            push_down_negations (bool, optional): Push the negations down to the filters using De Morgan's laws and the
+            operators complements, e.g. `NOT (age > 18)` becomes `age <= 18`, so the indexes can be used. It keeps the SQL
+            null semantics, see `CriteriaOptimizer.push_down_negations`. Default to False.
+            optimize (bool, optional): Simplify the logical tree of the criteria before it is converted, e.g. merging the
+            range filters of a field into their tightest bounds, see `CriteriaOptimizer.optimize`. Default to False.
 
         Raises:
             InvalidTableError: If the table is not in the list of valid tables (only if check_table_injection=True).
@@ -90,6 +137,12 @@ class CriteriaToMysqlConverter:
             InvalidOperatorError: If the operator is not in the list of valid operators (only if check_operator_injection=True).
             InvalidDirectionError: If the direction is not in the list of valid directions (only if check_direction_injection=True).
             PaginationBoundsError: If pagination parameters exceed maximum bounds (only if check_pagination_bounds=True).
+            InvalidTableError: If the table is not in the policy valid tables (only if policy is given).
+            InvalidColumnError: If a column or criteria field is not in the policy valid columns (only if policy is given).
+            InvalidOperatorError: If an operator is not in the policy valid operators (only if policy is given).
+            InvalidDirectionError: If a direction is not in the policy valid directions (only if policy is given).
+            PaginationBoundsError: If pagination parameters exceed the policy bounds (only if policy is given).
+            IntegrityError: If the keyset values do not match the criteria orders (only if keyset is given).
 
         Returns:
             tuple[str, list[Any]]: The MySQL query string and the query parameters as a list.
@@ -110,43 +163,506 @@ class CriteriaToMysqlConverter:
         # >>> [18, '@gmail.com', '@yahoo.com']
         ```
         """  # noqa: E501  # fmt: skip
-        columns = columns or ['*']
-        columns_mapping = columns_mapping or {}
-        valid_tables = valid_tables or []
-        valid_columns = valid_columns or []
-        valid_operators = valid_operators or []
-        valid_directions = valid_directions or []
+        options: MysqlQueryOptions = {
+            'columns': columns,
+            'columns_mapping': columns_mapping,
+            'check_table_injection': check_table_injection,
+            'check_column_injection': check_column_injection,
+            'check_criteria_injection': check_criteria_injection,
+            'check_operator_injection': check_operator_injection,
+            'check_direction_injection': check_direction_injection,
+            'check_pagination_bounds': check_pagination_bounds,
+            'valid_tables': valid_tables,
+            'valid_columns': valid_columns,
+            'valid_operators': valid_operators,
+            'valid_directions': valid_directions,
+            'max_page_size': max_page_size,
+            'max_page_number': max_page_number,
+            'policy': policy,
+            'keyset': keyset,
+            'in_list_bucketing': in_list_bucketing,
+            'detect_contradictions': detect_contradictions,
+            'push_down_negations': push_down_negations,
+            'optimize': optimize,
+        }
+        columns, columns_mapping = cls._prepare_table(table=table, select=True, **options)
+        select = cls._build_select(table=table, columns=columns)
+
+        prepared = cls._prepare_criteria(criteria=criteria, **options)
+        if prepared is None:
+            return f'{select} WHERE 1 = 0;', []
+
+        return cls._build_query(
+            criteria=prepared,
+            select=select,
+            columns_mapping=columns_mapping,
+            keyset=keyset,
+            in_list_bucketing=in_list_bucketing,
+        )
 
-        if check_table_injection:
-            cls._validate_table(table=table, valid_tables=valid_tables)
+    @classmethod
+    def convert_prepared(
+        cls,
+        criteria: Criteria,
+        table: str,
+        **options: Unpack[MysqlQueryOptions],
+    ) -> PreparedStatement:
+        """
+        Convert the Criteria object to a named MySQL prepared statement. The statement is prepared from the query with
+        question mark placeholders and executed binding the query parameters to user variables, and its name is
+        derived from the statement text, so a connection can prepare each criteria shape once and execute it many
+        times, e.g. tracking it with a `PreparedStatementRegistry`. Use `in_list_bucketing` to bound the number of
+        statements of the IN lists.
 
-        if check_column_injection:
-            cls._validate_columns(columns=columns, columns_mapping=columns_mapping, valid_columns=valid_columns)
+        Args:
+            criteria (Criteria): Criteria to convert.
+            table (str): Name of the table to query.
+            **options (Unpack[MysqlQueryOptions]): Options of the conversion, e.g. the columns, the injection checks or
+            the policy, with the same meaning and defaults as the `convert` arguments.
 
-        if check_criteria_injection:
-            cls._validate_criteria(criteria=criteria, valid_columns=valid_columns)
+        Raises:
+            InvalidTableError: If the table is not in the list of valid tables (only if check_table_injection=True).
+            InvalidColumnError: If the column is not in the list of valid columns (only if check_column_injection=True).
+            InvalidOperatorError: If the operator is not in the list of valid operators (only if check_operator_injection=True).
+            InvalidDirectionError: If the direction is not in the list of valid directions (only if check_direction_injection=True).
+            PaginationBoundsError: If pagination parameters exceed maximum bounds (only if check_pagination_bounds=True).
+            InvalidTableError: If the table is not in the policy valid tables (only if policy is given).
+            InvalidColumnError: If a column or criteria field is not in the policy valid columns (only if policy is given).
+            InvalidOperatorError: If an operator is not in the policy valid operators (only if policy is given).
+            InvalidDirectionError: If a direction is not in the policy valid directions (only if policy is given).
+            PaginationBoundsError: If pagination parameters exceed the policy bounds (only if policy is given).
+            IntegrityError: If the keyset values do not match the criteria orders (only if keyset is given).
 
-        if check_operator_injection:
-            cls._validate_operators(criteria=criteria, valid_operators=valid_operators)
+        Returns:
+            PreparedStatement: Prepared statement with its PREPARE, EXECUTE and DEALLOCATE statements.
 
-        if check_direction_injection:
-            cls._validate_directions(criteria=criteria, valid_directions=valid_directions)
+        Example:
+        ```python
+        from criteria_pattern import Criteria, Filter, Operator
+        from criteria_pattern.converters import CriteriaToMysqlConverter
 
-        if check_pagination_bounds:
-            cls._validate_pagination_bounds(
-                criteria=criteria,
-                max_page_size=max_page_size,
-                max_page_number=max_page_number,
+        criteria = Criteria(filters=[Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18)])
+
+        statement = CriteriaToMysqlConverter.convert_prepared(criteria=criteria, table='user')
+        print(statement.prepare)
+        print(statement.execute)
+        # >>> PREPARE criteria_cf59cee4d6f11122 FROM 'SELECT * FROM user WHERE age >= ?';
+        # >>> [('SET @parameter_0 = %s;', [18]), ('EXECUTE criteria_cf59cee4d6f11122 USING @parameter_0;', [])]
+        ```
+        """  # noqa: E501  # fmt: skip
+        validate_options(method='convert_prepared', options=options, valid_options=MysqlQueryOptions.__optional_keys__)
+        query, parameters = cls.convert(criteria=criteria, table=table, **options)
+
+        statement = query.removesuffix(';').replace('%s', '?')
+        name = PreparedStatement.name_of(statement=statement)
+        literal = statement.replace('\\', '\\\\').replace("'", "''")
+        variables = [f'@parameter_{index}' for index in range(len(parameters))]
+
+        execute: list[tuple[str, Any]] = [(f'EXECUTE {name};', [])]
+        if parameters:
+            assignments = ', '.join(f'{variable} = %s' for variable in variables)
+            execute = [(f'SET {assignments};', parameters), (f'EXECUTE {name} USING {", ".join(variables)};', [])]
+
+        return PreparedStatement(
+            name=name,
+            prepare=f"PREPARE {name} FROM '{literal}';",
+            execute=execute,
+            deallocate=f'DEALLOCATE PREPARE {name};',
+        )
+
+    @classmethod
+    def convert_count(
+        cls,
+        criteria: Criteria,
+        table: str,
+        **options: Unpack[MysqlFilterOptions],
+    ) -> tuple[str, list[Any]]:
+        """
+        Convert the Criteria object to a MySQL query that counts the rows matching its filters, e.g. the total of a
+        paginated listing. The orders, the pagination and the selected columns are ignored, and the criteria is not
+        modified.
+
+        Args:
+            criteria (Criteria): Criteria to convert.
+            table (str): Name of the table to query.
+            **options (Unpack[MysqlFilterOptions]): Options of the conversion, e.g. the injection checks or the policy,
+            with the same meaning and defaults as the `convert` arguments.
+
+        Raises:
+            InvalidTableError: If the table is not in the list of valid tables (only if check_table_injection=True).
+            InvalidColumnError: If the column is not in the list of valid columns (only if check_criteria_injection=True).
+            InvalidOperatorError: If the operator is not in the list of valid operators (only if check_operator_injection=True).
+            InvalidTableError: If the table is not in the policy valid tables (only if policy is given).
+            InvalidColumnError: If a criteria field is not in the policy valid columns (only if policy is given).
+            InvalidOperatorError: If an operator is not in the policy valid operators (only if policy is given).
+            InvalidDirectionError: If a direction is not in the policy valid directions (only if policy is given).
+            PaginationBoundsError: If pagination parameters exceed the policy bounds (only if policy is given).
+
+        Returns:
+            tuple[str, list[Any]]: The MySQL query string and the query parameters.
+
+        Example:
+        ```python
+        from criteria_pattern import Criteria, Filter, Operator
+        from criteria_pattern.converters import CriteriaToMysqlConverter
+
+        criteria = Criteria(filters=[Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18)], page_size=20, page_number=2)
+
+        query, parameters = CriteriaToMysqlConverter.convert_count(criteria=criteria, table='user')
+        print(query)
+        print(parameters)
+        # >>> SELECT COUNT(*) FROM user WHERE age >= %s;
+        # >>> [18]
+        ```
+        """  # noqa: E501  # fmt: skip
+        validate_options(method='convert_count', options=options, valid_options=MysqlFilterOptions.__optional_keys__)
+        _, columns_mapping = cls._prepare_table(table=table, select=False, **options)
+        prepared = cls._prepare_criteria(criteria=criteria, **options)
+        if prepared is None:
+            return f'SELECT COUNT(*) FROM {table} WHERE 1 = 0;', []  # noqa: S608  # nosec
+
+        parameters: list[Any] = []
+        where_clause = cls._build_where(
+            criteria=prepared,
+            columns_mapping=columns_mapping,
+            parameters=parameters,
+            in_list_bucketing=options.get('in_list_bucketing', False),
+        )
+
+        return f'SELECT COUNT(*) FROM {table}{where_clause};', parameters  # noqa: S608  # nosec
+
+    @classmethod
+    def convert_exists(
+        cls,
+        criteria: Criteria,
+        table: str,
+        **options: Unpack[MysqlFilterOptions],
+    ) -> tuple[str, list[Any]]:
+        """
+        Convert the Criteria object to a MySQL query that returns a single row if any row matches its filters, so the
+        database can stop at the first match. The orders, the pagination and the selected columns are ignored, and the
+        criteria is not modified.
+
+        Args:
+            criteria (Criteria): Criteria to convert.
+            table (str): Name of the table to query.
+            **options (Unpack[MysqlFilterOptions]): Options of the conversion, e.g. the injection checks or the policy,
+            with the same meaning and defaults as the `convert` arguments.
+
+        Raises:
+            InvalidTableError: If the table is not in the list of valid tables (only if check_table_injection=True).
+            InvalidColumnError: If the column is not in the list of valid columns (only if check_criteria_injection=True).
+            InvalidOperatorError: If the operator is not in the list of valid operators (only if check_operator_injection=True).
+            InvalidTableError: If the table is not in the policy valid tables (only if policy is given).
+            InvalidColumnError: If a criteria field is not in the policy valid columns (only if policy is given).
+            InvalidOperatorError: If an operator is not in the policy valid operators (only if policy is given).
+            InvalidDirectionError: If a direction is not in the policy valid directions (only if policy is given).
+            PaginationBoundsError: If pagination parameters exceed the policy bounds (only if policy is given).
+
+        Returns:
+            tuple[str, list[Any]]: The MySQL query string and the query parameters.
+
+        Example:
+        ```python
+        from criteria_pattern import Criteria, Filter, Operator
+        from criteria_pattern.converters import CriteriaToMysqlConverter
+
+        criteria = Criteria(filters=[Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18)])
+
+        query, parameters = CriteriaToMysqlConverter.convert_exists(criteria=criteria, table='user')
+        print(query)
+        print(parameters)
+        # >>> SELECT 1 FROM user WHERE age >= %s LIMIT 1;
+        # >>> [18]
+        ```
+        """  # noqa: E501  # fmt: skip
+        validate_options(method='convert_exists', options=options, valid_options=MysqlFilterOptions.__optional_keys__)
+        _, columns_mapping = cls._prepare_table(table=table, select=False, **options)
+        prepared = cls._prepare_criteria(criteria=criteria, **options)
+        if prepared is None:
+            return f'SELECT 1 FROM {table} WHERE 1 = 0 LIMIT 1;', []  # noqa: S608  # nosec
+
+        parameters: list[Any] = []
+        where_clause = cls._build_where(
+            criteria=prepared,
+            columns_mapping=columns_mapping,
+            parameters=parameters,
+            in_list_bucketing=options.get('in_list_bucketing', False),
+        )
+
+        return f'SELECT 1 FROM {table}{where_clause} LIMIT 1;', parameters  # noqa: S608  # nosec
+
+    @classmethod
+    def convert_page_with_total(
+        cls,
+        criteria: Criteria,
+        table: str,
+        **options: Unpack[MysqlQueryOptions],
+    ) -> tuple[tuple[str, list[Any]], tuple[str, list[Any]]]:
+        """
+        Convert the Criteria object to a MySQL page query and the MySQL query that counts the total rows of every
+        page. The WHERE clause is compiled once and shared by both queries, the count query has no ORDER BY, keyset nor
+        pagination, and the criteria is not modified.
+
+        Args:
+            criteria (Criteria): Criteria to convert.
+            table (str): Name of the table to query.
+            **options (Unpack[MysqlQueryOptions]): Options of the conversion, e.g. the columns, the injection checks or
+            the policy, with the same meaning and defaults as the `convert` arguments.
+
+        Raises:
+            InvalidTableError: If the table is not in the list of valid tables (only if check_table_injection=True).
+            InvalidColumnError: If the column is not in the list of valid columns (only if check_column_injection=True).
+            InvalidOperatorError: If the operator is not in the list of valid operators (only if check_operator_injection=True).
+            InvalidDirectionError: If the direction is not in the list of valid directions (only if check_direction_injection=True).
+            PaginationBoundsError: If pagination parameters exceed maximum bounds (only if check_pagination_bounds=True).
+            InvalidTableError: If the table is not in the policy valid tables (only if policy is given).
+            InvalidColumnError: If a column or criteria field is not in the policy valid columns (only if policy is given).
+            InvalidOperatorError: If an operator is not in the policy valid operators (only if policy is given).
+            InvalidDirectionError: If a direction is not in the policy valid directions (only if policy is given).
+            PaginationBoundsError: If pagination parameters exceed the policy bounds (only if policy is given).
+            IntegrityError: If the keyset values do not match the criteria orders (only if keyset is given).
+
+        Returns:
+            tuple[tuple[str, list[Any]], tuple[str, list[Any]]]: The page query string and parameters, and the count
+            query string and parameters.
+
+        Example:
+        ```python
+        from criteria_pattern import Criteria, Direction, Filter, Operator, Order
+        from criteria_pattern.converters import CriteriaToMysqlConverter
+
+        criteria = Criteria(
+            filters=[Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18)],
+            orders=[Order(field='age', direction=Direction.ASC)],
+            page_size=20,
+            page_number=2,
+        )
+
+        (query, parameters), (count_query, count_parameters) = CriteriaToMysqlConverter.convert_page_with_total(criteria=criteria, table='user')
+        print(query)
+        print(parameters)
+        print(count_query)
+        print(count_parameters)
+        # >>> SELECT * FROM user WHERE age >= %s ORDER BY age ASC LIMIT %s OFFSET %s;
+        # >>> [18, 20, 20]
+        # >>> SELECT COUNT(*) FROM user WHERE age >= %s;
+        # >>> [18]
+        ```
+        """  # noqa: E501  # fmt: skip
+        validate_options(
+            method='convert_page_with_total',
+            options=options,
+            valid_options=MysqlQueryOptions.__optional_keys__,
+        )
+        columns, columns_mapping = cls._prepare_table(table=table, select=True, **options)
+        select = cls._build_select(table=table, columns=columns)
+
+        prepared = cls._prepare_criteria(criteria=criteria, **options)
+        if prepared is None:
+            return (f'{select} WHERE 1 = 0;', []), (f'SELECT COUNT(*) FROM {table} WHERE 1 = 0;', [])  # noqa: S608  # nosec
+
+        parameters: list[Any] = []
+        where_clause = cls._build_where(
+            criteria=prepared,
+            columns_mapping=columns_mapping,
+            parameters=parameters,
+            in_list_bucketing=options.get('in_list_bucketing', False),
+        )
+        count_query = f'SELECT COUNT(*) FROM {table}{where_clause};'  # noqa: S608  # nosec
+        count_parameters = list(parameters)
+
+        page = cls._build_page(
+            criteria=prepared,
+            query=f'{select}{where_clause}',
+            parameters=parameters,
+            columns_mapping=columns_mapping,
+            keyset=options.get('keyset'),
+        )
+
+        return page, (count_query, count_parameters)
+
+    @classmethod
+    def convert_many(
+        cls,
+        criteria: Iterable[Criteria],
+        table: str,
+        **options: Unpack[MysqlSelectOptions],
+    ) -> Iterator[tuple[str, list[Any]]]:
+        """
+        Convert the Criteria objects to MySQL queries lazily, yielding each query as it is built. The defaults are
+        normalized, the table and columns are validated and formatted only once, so it is faster than calling `convert`
+        for each criteria and the memory stays flat for any number of criteria. Keyset pagination is not supported, as
+        the keyset belongs to a single page.
+
+        Args:
+            criteria (Iterable[Criteria]): Criteria objects to convert.
+            table (str): Name of the table to query.
+            **options (Unpack[MysqlSelectOptions]): Options of the conversion, e.g. the columns, the injection checks or
+            the policy, with the same meaning and defaults as the `convert` arguments.
+
+        Raises:
+            InvalidTableError: If the table is not in the list of valid tables (only if check_table_injection=True).
+            InvalidColumnError: If the column is not in the list of valid columns (only if check_column_injection=True).
+            InvalidOperatorError: If the operator is not in the list of valid operators (only if check_operator_injection=True).
+            InvalidDirectionError: If the direction is not in the list of valid directions (only if check_direction_injection=True).
+            PaginationBoundsError: If pagination parameters exceed maximum bounds (only if check_pagination_bounds=True).
+            InvalidTableError: If the table is not in the policy valid tables (only if policy is given).
+            InvalidColumnError: If a column or criteria field is not in the policy valid columns (only if policy is given).
+            InvalidOperatorError: If an operator is not in the policy valid operators (only if policy is given).
+            InvalidDirectionError: If a direction is not in the policy valid directions (only if policy is given).
+            PaginationBoundsError: If pagination parameters exceed the policy bounds (only if policy is given).
+
+        Yields:
+            tuple[str, list[Any]]: The MySQL query string and the query parameters of each criteria, in order.
+
+        Example:
+        ```python
+        from criteria_pattern import Criteria, Filter, Operator
+        from criteria_pattern.converters import CriteriaToMysqlConverter
+
+        criteria = (Criteria(filters=[Filter(field='age', operator=Operator.EQUAL, value=age)]) for age in range(18, 20))
+
+        for query, parameters in CriteriaToMysqlConverter.convert_many(criteria=criteria, table='user'):
+            print(query, parameters)
+        # >>> SELECT * FROM user WHERE age = %s; [18]
+        # >>> SELECT * FROM user WHERE age = %s; [19]
+        ```
+        """  # noqa: E501  # fmt: skip
+        validate_options(method='convert_many', options=options, valid_options=MysqlSelectOptions.__optional_keys__)
+        columns, columns_mapping = cls._prepare_table(table=table, select=True, **options)
+        select = cls._build_select(table=table, columns=columns)
+
+        for single_criteria in criteria:
+            prepared = cls._prepare_criteria(criteria=single_criteria, **options)
+            if prepared is None:
+                yield f'{select} WHERE 1 = 0;', []
+                continue
+
+            yield cls._build_query(
+                criteria=prepared,
+                select=select,
+                columns_mapping=columns_mapping,
+                keyset=None,
+                in_list_bucketing=options.get('in_list_bucketing', False),
             )
 
-        query = f'SELECT {", ".join(columns)} FROM {table}'  # noqa: S608  # nosec
+    @classmethod
+    def _build_select(cls, *, table: str, columns: Sequence[str]) -> str:
+        """
+        Build the SELECT clause of the MySQL query.
+
+        Args:
+            table (str): Name of the table to query.
+            columns (Sequence[str]): Columns of the table to select.
+
+        Returns:
+            str: The SELECT clause.
+        """
+        return f'SELECT {", ".join(columns)} FROM {table}'  # noqa: S608  # nosec
+
+    @classmethod
+    def _build_query(
+        cls,
+        *,
+        criteria: Criteria,
+        select: str,
+        columns_mapping: Mapping[str, str],
+        keyset: Sequence[Any] | None,
+        in_list_bucketing: bool,
+    ) -> tuple[str, list[Any]]:
+        """
+        Build the MySQL query for the Criteria object.
+
+        Args:
+            criteria (Criteria): Criteria to convert.
+            select (str): SELECT clause of the query.
+            columns_mapping (Mapping[str, str]): Mapping of column names to aliases.
+            keyset (Sequence[Any] | None): Last seen values of the criteria order fields, or None for offset pagination.
+            in_list_bucketing (bool): Pad the IN and NOT IN values up to the next power of two.
+        Returns:
+            tuple[str, list[Any]]: The MySQL query string and the query parameters.
+        """
         parameters: list[Any] = []
-        parameters_counter = 0
+        where_clause = cls._build_where(
+            criteria=criteria,
+            columns_mapping=columns_mapping,
+            parameters=parameters,
+            in_list_bucketing=in_list_bucketing,
+        )
+
+        return cls._build_page(
+            criteria=criteria,
+            query=f'{select}{where_clause}',
+            parameters=parameters,
+            columns_mapping=columns_mapping,
+            keyset=keyset,
+        )
 
-        if criteria.has_filters():
-            where_clause, parameters = cls._process_filters(criteria=criteria, columns_mapping=columns_mapping)
-            query += f' WHERE {where_clause}'
-            parameters_counter = len(parameters)
+    @classmethod
+    def _build_where(
+        cls,
+        *,
+        criteria: Criteria,
+        columns_mapping: Mapping[str, str],
+        parameters: list[Any],
+        in_list_bucketing: bool,
+    ) -> str:
+        """
+        Build the WHERE clause of the MySQL query for the Criteria object filters, adding their values to the
+        parameters.
+
+        Args:
+            criteria (Criteria): Criteria to convert.
+            columns_mapping (Mapping[str, str]): Mapping of column names to aliases.
+            parameters (list[Any]): Query parameters.
+            in_list_bucketing (bool): Pad the IN and NOT IN values up to the next power of two.
+        Returns:
+            str: The WHERE clause with a leading space, or an empty string if the criteria has no filters.
+        """
+        if not criteria.has_filters():
+            return ''
+
+        where_clause = cls._process_filters(
+            criteria=criteria,
+            columns_mapping=columns_mapping,
+            parameters=parameters,
+            in_list_bucketing=in_list_bucketing,
+        )
+
+        return f' WHERE {where_clause}'
+
+    @classmethod
+    def _build_page(
+        cls,
+        *,
+        criteria: Criteria,
+        query: str,
+        parameters: list[Any],
+        columns_mapping: Mapping[str, str],
+        keyset: Sequence[Any] | None,
+    ) -> tuple[str, list[Any]]:
+        """
+        Complete the MySQL query of the Criteria object with its keyset predicate, ORDER BY and pagination.
+
+        Args:
+            criteria (Criteria): Criteria to convert.
+            query (str): SELECT and WHERE clauses of the query.
+            parameters (list[Any]): Parameters of the WHERE clause.
+            columns_mapping (Mapping[str, str]): Mapping of column names to aliases.
+            keyset (Sequence[Any] | None): Last seen values of the criteria order fields, or None for offset pagination.
+
+        Returns:
+            tuple[str, list[Any]]: The MySQL query string and the query parameters.
+        """
+        if keyset is not None:
+            keyset_clause = cls._process_keyset(
+                criteria=criteria,
+                keyset=keyset,
+                columns_mapping=columns_mapping,
+                parameters=parameters,
+            )
+            query += f' AND {keyset_clause}' if criteria.has_filters() else f' WHERE {keyset_clause}'
 
         if criteria.has_orders():
             order_clause = cls._process_orders(criteria=criteria, columns_mapping=columns_mapping)
@@ -155,16 +671,120 @@ class CriteriaToMysqlConverter:
         if criteria.has_page_size():
             parameters.append(criteria.page_size)
             query += ' LIMIT %s'
-            parameters_counter += 1
 
-        if criteria.has_pagination():
+        if criteria.has_pagination() and keyset is None:
             offset_value = criteria.page_size * (criteria.page_number - 1)  # type: ignore[operator]
             parameters.append(offset_value)
             query += ' OFFSET %s'
-            parameters_counter += 1
 
         return f'{query};', parameters
 
+    @classmethod
+    def _prepare_table(
+        cls,
+        *,
+        table: str,
+        select: bool,
+        **options: Unpack[MysqlQueryOptions],
+    ) -> tuple[Sequence[str], Mapping[str, str]]:
+        """
+        Normalize the columns defaults and validate the table and the columns of a query, shared by every conversion
+        method.
+
+        Args:
+            table (str): Name of the table to query.
+            select (bool): Whether the query selects the columns, otherwise only the table is validated.
+            **options (Unpack[MysqlQueryOptions]): Options of the conversion.
+
+        Raises:
+            InvalidTableError: If the table is not in the list of valid tables (only if check_table_injection=True).
+            InvalidColumnError: If the column is not in the list of valid columns (only if check_column_injection=True).
+            InvalidTableError: If the table is not in the policy valid tables (only if policy is given).
+            InvalidColumnError: If a column is not in the policy valid columns (only if policy is given).
+
+        Returns:
+            tuple[Sequence[str], Mapping[str, str]]: The columns to select and the mapping of column names to aliases.
+        """  # noqa: E501  # fmt: skip
+        columns = options.get('columns') or ['*']
+        columns_mapping = options.get('columns_mapping') or {}
+        policy = options.get('policy')
+
+        if options.get('check_table_injection', False):
+            cls._validate_table(table=table, valid_tables=options.get('valid_tables') or [])
+
+        if select and options.get('check_column_injection', False):
+            cls._validate_columns(
+                columns=columns,
+                columns_mapping=columns_mapping,
+                valid_columns=options.get('valid_columns') or [],
+            )
+
+        if policy is not None:
+            policy.validate_table(table=table)
+            if select:
+                policy.validate_columns(columns=columns, columns_mapping=columns_mapping)
+
+        return columns, columns_mapping
+
+    @classmethod
+    def _prepare_criteria(cls, *, criteria: Criteria, **options: Unpack[MysqlQueryOptions]) -> Criteria | None:
+        """
+        Validate the Criteria object and apply the optimizations of the options, shared by every conversion method.
+
+        Args:
+            criteria (Criteria): Criteria to convert.
+            **options (Unpack[MysqlQueryOptions]): Options of the conversion.
+
+        Raises:
+            InvalidColumnError: If the column is not in the list of valid columns (only if check_criteria_injection=True).
+            InvalidOperatorError: If the operator is not in the list of valid operators (only if check_operator_injection=True).
+            InvalidDirectionError: If the direction is not in the list of valid directions (only if check_direction_injection=True).
+            PaginationBoundsError: If pagination parameters exceed maximum bounds (only if check_pagination_bounds=True).
+            InvalidColumnError: If a criteria field is not in the policy valid columns (only if policy is given).
+            InvalidOperatorError: If an operator is not in the policy valid operators (only if policy is given).
+            InvalidDirectionError: If a direction is not in the policy valid directions (only if policy is given).
+            PaginationBoundsError: If pagination parameters exceed the policy bounds (only if policy is given).
+            IntegrityError: If the keyset values do not match the criteria orders (only if keyset is given).
+
+        Returns:
+            Criteria | None: The criteria to convert, or None if it is provably unsatisfiable.
+        """  # noqa: E501  # fmt: skip
+        policy = options.get('policy')
+        keyset = options.get('keyset')
+
+        if options.get('check_criteria_injection', False):
+            cls._validate_criteria(criteria=criteria, valid_columns=options.get('valid_columns') or [])
+
+        if options.get('check_operator_injection', False):
+            cls._validate_operators(criteria=criteria, valid_operators=options.get('valid_operators') or [])
+
+        if options.get('check_direction_injection', False):
+            cls._validate_directions(criteria=criteria, valid_directions=options.get('valid_directions') or [])
+
+        if options.get('check_pagination_bounds', False):
+            cls._validate_pagination_bounds(
+                criteria=criteria,
+                max_page_size=options.get('max_page_size', 10000),
+                max_page_number=options.get('max_page_number', 1000000),
+            )
+
+        if policy is not None:
+            policy.validate_criteria(criteria=criteria)
+
+        if keyset is not None:
+            cls._validate_keyset(criteria=criteria, keyset=keyset)
+
+        if options.get('push_down_negations', False):
+            criteria = CriteriaOptimizer.push_down_negations(criteria=criteria)
+
+        if options.get('optimize', False):
+            criteria = CriteriaOptimizer.optimize(criteria=criteria)
+
+        if options.get('detect_contradictions', False) and CriteriaOptimizer.is_unsatisfiable(criteria=criteria):
+            return None
+
+        return criteria
+
     @classmethod
     def _validate_table(cls, *, table: str, valid_tables: Sequence[str]) -> None:
         """
@@ -282,221 +902,341 @@ class CriteriaToMysqlConverter:
             raise PaginationBoundsError(parameter='page_number', value=criteria.page_number, max_value=max_page_number)
 
     @classmethod
-    def _process_filters(cls, *, criteria: Criteria, columns_mapping: Mapping[str, str]) -> tuple[str, list[Any]]:
+    def _validate_keyset(cls, *, criteria: Criteria, keyset: Sequence[Any]) -> None:
         """
-        Process the Criteria object to return an SQL WHERE clause.
+        Validate the keyset values against the Criteria object orders.
+
+        Args:
+            criteria (Criteria): Criteria to validate.
+            keyset (Sequence[Any]): Last seen values of the criteria order fields.
+
+        Raises:
+            IntegrityError: If the criteria has no orders or the keyset length does not match the number of orders.
+        """
+        if not criteria.has_orders():
+            raise IntegrityError(message='Keyset pagination requires the criteria to have orders.')
+
+        if len(keyset) != len(criteria.orders):
+            raise IntegrityError(message=f'Keyset <<<{list(keyset)}>>> must have one value for each criteria order <<<{len(criteria.orders)}>>>.')  # noqa: E501  # fmt: skip
+
+    @classmethod
+    def _process_filters(
+        cls,
+        *,
+        criteria: Criteria,
+        columns_mapping: Mapping[str, str],
+        parameters: list[Any],
+        in_list_bucketing: bool = False,
+    ) -> str:
+        """
+        Process the Criteria object to return an SQL WHERE clause. The logical tree is walked with an explicit stack,
+        so the depth of the criteria is not limited by the recursion limit, the conditions are appended to a single
+        buffer and the values to the given parameters.
 
         Args:
             criteria (Criteria): Criteria to process.
             columns_mapping (Mapping[str, str]): Mapping of column names to aliases.
+            parameters (list[Any]): Parameters for the SQL query, filled with the filter values.
+            in_list_bucketing (bool, optional): Pad the IN and NOT IN values up to the next power of two. Default to
+            False.
+
+        Returns:
+            str: Processed filter string for SQL WHERE clause.
+        """
+        non_empty_nodes = cls._process_non_empty_nodes(criteria=criteria)
+        buffer: list[str] = []
+        stack: list[Criteria | str] = [criteria]
+
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                buffer.append(item)
+                continue
+
+            if isinstance(item, AndCriteria | OrCriteria):
+                separator = ' AND ' if isinstance(item, AndCriteria) else ' OR '
+                children = [child for child in item.children if id(child) in non_empty_nodes]
+                if len(children) == 1:
+                    stack.append(children[0])
+                    continue
+
+                stack.append(')')
+                for child in reversed(children[1:]):
+                    stack.append(child)
+                    stack.append(separator)
+
+                stack.append(children[0])
+                stack.append('(')
+                continue
+
+            if isinstance(item, NotCriteria):
+                stack.append(')')
+                stack.append(item.criteria)
+                stack.append('NOT (')
+                continue
+
+            for index, filter in enumerate(item.filters):
+                if index > 0:
+                    buffer.append(' AND ')
+
+                condition = cls._process_filter(
+                    filter=filter,
+                    columns_mapping=columns_mapping,
+                    parameters=parameters,
+                    in_list_bucketing=in_list_bucketing,
+                )
+                buffer.append(condition)
+
+        return ''.join(buffer)
+
+    @classmethod
+    def _process_non_empty_nodes(cls, *, criteria: Criteria) -> set[int]:
+        """
+        Process the Criteria object to return the identifiers of the nodes of the logical tree that have filters, the
+        nodes without filters are skipped when building the SQL WHERE clause.
+
+        Args:
+            criteria (Criteria): Criteria to process.
 
         Returns:
-            tuple[str, list[Any]]: Processed filter string for SQL WHERE clause and parameters for the SQL query.
+            set[int]: Identifiers of the nodes with filters.
         """
-        return cls._process_filters_recursive(criteria=criteria, columns_mapping=columns_mapping)
+        nodes: list[Criteria] = []
+        stack: list[Criteria] = [criteria]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+
+            if isinstance(node, AndCriteria | OrCriteria):
+                stack.extend(node.children)
+
+            elif isinstance(node, NotCriteria):
+                stack.append(node.criteria)
+
+        non_empty_nodes: set[int] = set()
+        for node in reversed(nodes):  # children are always visited before their parents
+            if isinstance(node, AndCriteria | OrCriteria):
+                has_filters = any(id(child) in non_empty_nodes for child in node.children)
+
+            elif isinstance(node, NotCriteria):
+                has_filters = id(node.criteria) in non_empty_nodes
+
+            else:
+                has_filters = bool(node.filters)
+
+            if has_filters:
+                non_empty_nodes.add(id(node))
+
+        return non_empty_nodes
 
     @classmethod
-    def _process_filters_recursive(  # noqa: C901
+    def _process_filter(  # noqa: C901
         cls,
         *,
-        criteria: Criteria,
+        filter: Filter[Any],
         columns_mapping: Mapping[str, str],
-        parameters: list[Any] | None = None,
-    ) -> tuple[str, list[Any]]:
+        parameters: list[Any],
+        in_list_bucketing: bool = False,
+    ) -> str:
         """
-        Process the Criteria object to return an SQL WHERE clause.
+        Process a Filter object to return an SQL condition.
 
         Args:
-            criteria (Criteria): Criteria to process.
+            filter (Filter[Any]): Filter to process.
             columns_mapping (Mapping[str, str]): Mapping of column names to aliases.
-            parameters (list[Any], optional): List to collect parameters. Default to empty list.
+            parameters (list[Any]): Parameters for the SQL query, filled with the filter values.
+            in_list_bucketing (bool, optional): Pad the IN and NOT IN values up to the next power of two. Default to
+            False.
 
         Returns:
-            tuple[str, list[Any]]: Processed filter string for SQL WHERE clause and parameters for the SQL query.
+            str: Processed SQL condition.
         """
-        if parameters is None:
-            parameters = []
+        filter_field = columns_mapping.get(filter.field, filter.field)
 
-        filters = ''
+        operator = Operator(value=filter.operator)
+        match operator:
+            case Operator.EQUAL:
+                return f'{filter_field} = {cls._add_parameter(value=filter.value, parameters=parameters)}'
 
-        if isinstance(criteria, AndCriteria):
-            left_parameters: list[Any] = []
-            left_conditions, left_parameters = cls._process_filters_recursive(
-                criteria=criteria.left,
-                columns_mapping=columns_mapping,
-                parameters=left_parameters,
-            )
+            case Operator.NOT_EQUAL:
+                return f'{filter_field} != {cls._add_parameter(value=filter.value, parameters=parameters)}'
 
-            right_parameters: list[Any] = []
-            right_conditions, right_parameters = cls._process_filters_recursive(
-                criteria=criteria.right,
-                columns_mapping=columns_mapping,
-                parameters=right_parameters,
-            )
+            case Operator.GREATER:
+                return f'{filter_field} > {cls._add_parameter(value=filter.value, parameters=parameters)}'
 
-            parameters.extend(left_parameters)
-            parameters.extend(right_parameters)
+            case Operator.GREATER_OR_EQUAL:
+                return f'{filter_field} >= {cls._add_parameter(value=filter.value, parameters=parameters)}'
 
-            if left_conditions and right_conditions:
-                filters += f'({left_conditions} AND {right_conditions})'
+            case Operator.LESS:
+                return f'{filter_field} < {cls._add_parameter(value=filter.value, parameters=parameters)}'
 
-            elif left_conditions:
-                filters += left_conditions
+            case Operator.LESS_OR_EQUAL:
+                return f'{filter_field} <= {cls._add_parameter(value=filter.value, parameters=parameters)}'
 
-            elif right_conditions:
-                filters += right_conditions
+            case Operator.LIKE:
+                return f'{filter_field} LIKE {cls._add_parameter(value=filter.value, parameters=parameters)}'
 
-            return filters, parameters
+            case Operator.NOT_LIKE:
+                return f'{filter_field} NOT LIKE {cls._add_parameter(value=filter.value, parameters=parameters)}'
 
-        if isinstance(criteria, OrCriteria):
-            left_parameters = []
-            left_conditions, left_parameters = cls._process_filters_recursive(
-                criteria=criteria.left,
-                columns_mapping=columns_mapping,
-                parameters=left_parameters,
-            )
+            case Operator.CONTAINS:
+                placeholder = cls._add_parameter(value=filter.value, parameters=parameters)
+                return f"{filter_field} LIKE CONCAT('%', {placeholder}, '%')"
 
-            right_parameters = []
-            right_conditions, right_parameters = cls._process_filters_recursive(
-                criteria=criteria.right,
-                columns_mapping=columns_mapping,
-                parameters=right_parameters,
-            )
+            case Operator.NOT_CONTAINS:
+                placeholder = cls._add_parameter(value=filter.value, parameters=parameters)
+                return f"{filter_field} NOT LIKE CONCAT('%', {placeholder}, '%')"
 
-            parameters.extend(left_parameters)
-            parameters.extend(right_parameters)
+            case Operator.STARTS_WITH:
+                placeholder = cls._add_parameter(value=filter.value, parameters=parameters)
+                return f"{filter_field} LIKE CONCAT({placeholder}, '%')"
 
-            if left_conditions and right_conditions:
-                filters += f'({left_conditions} OR {right_conditions})'
+            case Operator.NOT_STARTS_WITH:
+                placeholder = cls._add_parameter(value=filter.value, parameters=parameters)
+                return f"{filter_field} NOT LIKE CONCAT({placeholder}, '%')"
 
-            elif left_conditions:
-                filters += left_conditions
+            case Operator.ENDS_WITH:
+                placeholder = cls._add_parameter(value=filter.value, parameters=parameters)
+                return f"{filter_field} LIKE CONCAT('%', {placeholder})"
 
-            elif right_conditions:
-                filters += right_conditions
+            case Operator.NOT_ENDS_WITH:
+                placeholder = cls._add_parameter(value=filter.value, parameters=parameters)
+                return f"{filter_field} NOT LIKE CONCAT('%', {placeholder})"
 
-            return filters, parameters
+            case Operator.BETWEEN:
+                start_placeholder = cls._add_parameter(value=filter.value[0], parameters=parameters)
+                end_placeholder = cls._add_parameter(value=filter.value[1], parameters=parameters)
+                return f'{filter_field} BETWEEN {start_placeholder} AND {end_placeholder}'
 
-        if isinstance(criteria, NotCriteria):
-            not_parameters: list[Any] = []
-            not_conditions, not_parameters = cls._process_filters_recursive(
-                criteria=criteria.criteria,
-                columns_mapping=columns_mapping,
-                parameters=not_parameters,
-            )
+            case Operator.NOT_BETWEEN:
+                start_placeholder = cls._add_parameter(value=filter.value[0], parameters=parameters)
+                end_placeholder = cls._add_parameter(value=filter.value[1], parameters=parameters)
+                return f'{filter_field} NOT BETWEEN {start_placeholder} AND {end_placeholder}'
 
-            parameters.extend(not_parameters)
+            case Operator.IS_NULL:
+                return f'{filter_field} IS NULL'
 
-            if not_conditions:
-                filters += f'NOT ({not_conditions})'
+            case Operator.IS_NOT_NULL:
+                return f'{filter_field} IS NOT NULL'
 
-            return filters, parameters
+            case Operator.IN:
+                values = cls._bucket_values(values=filter.value) if in_list_bucketing else filter.value
+                placeholders = [cls._add_parameter(value=value, parameters=parameters) for value in values]
+                return f'{filter_field} IN ({", ".join(placeholders)})'
 
-        filter_conditions = []
-        for filter in criteria.filters:
-            filter_field = columns_mapping.get(filter.field, filter.field)
-            placeholder = '%s'
-
-            operator = Operator(value=filter.operator)
-            match operator:
-                case Operator.EQUAL:
-                    filter_conditions.append(f'{filter_field} = {placeholder}')
-                    parameters.append(filter.value)
-
-                case Operator.NOT_EQUAL:
-                    filter_conditions.append(f'{filter_field} != {placeholder}')
-                    parameters.append(filter.value)
-
-                case Operator.GREATER:
-                    filter_conditions.append(f'{filter_field} > {placeholder}')
-                    parameters.append(filter.value)
-
-                case Operator.GREATER_OR_EQUAL:
-                    filter_conditions.append(f'{filter_field} >= {placeholder}')
-                    parameters.append(filter.value)
-
-                case Operator.LESS:
-                    filter_conditions.append(f'{filter_field} < {placeholder}')
-                    parameters.append(filter.value)
-
-                case Operator.LESS_OR_EQUAL:
-                    filter_conditions.append(f'{filter_field} <= {placeholder}')
-                    parameters.append(filter.value)
-
-                case Operator.LIKE:
-                    filter_conditions.append(f'{filter_field} LIKE {placeholder}')
-                    parameters.append(filter.value)
-
-                case Operator.NOT_LIKE:
-                    filter_conditions.append(f'{filter_field} NOT LIKE {placeholder}')
-                    parameters.append(filter.value)
-
-                case Operator.CONTAINS:
-                    filter_conditions.append(f"{filter_field} LIKE CONCAT('%', {placeholder}, '%')")
-                    parameters.append(filter.value)
-
-                case Operator.NOT_CONTAINS:
-                    filter_conditions.append(f"{filter_field} NOT LIKE CONCAT('%', {placeholder}, '%')")
-                    parameters.append(filter.value)
-
-                case Operator.STARTS_WITH:
-                    filter_conditions.append(f"{filter_field} LIKE CONCAT({placeholder}, '%')")
-                    parameters.append(filter.value)
-
-                case Operator.NOT_STARTS_WITH:
-                    filter_conditions.append(f"{filter_field} NOT LIKE CONCAT({placeholder}, '%')")
-                    parameters.append(filter.value)
-
-                case Operator.ENDS_WITH:
-                    filter_conditions.append(f"{filter_field} LIKE CONCAT('%', {placeholder})")
-                    parameters.append(filter.value)
-
-                case Operator.NOT_ENDS_WITH:
-                    filter_conditions.append(f"{filter_field} NOT LIKE CONCAT('%', {placeholder})")
-                    parameters.append(filter.value)
-
-                case Operator.BETWEEN:
-                    start_placeholder = '%s'
-                    end_placeholder = '%s'
-                    parameters.append(filter.value[0])
-                    parameters.append(filter.value[1])
-                    filter_conditions.append(f'{filter_field} BETWEEN {start_placeholder} AND {end_placeholder}')
-
-                case Operator.NOT_BETWEEN:
-                    start_placeholder = '%s'
-                    end_placeholder = '%s'
-                    parameters.append(filter.value[0])
-                    parameters.append(filter.value[1])
-                    filter_conditions.append(f'{filter_field} NOT BETWEEN {start_placeholder} AND {end_placeholder}')
-
-                case Operator.IS_NULL:
-                    filter_conditions.append(f'{filter_field} IS NULL')
-
-                case Operator.IS_NOT_NULL:
-                    filter_conditions.append(f'{filter_field} IS NOT NULL')
-
-                case Operator.IN:
-                    values = filter.value
-                    placeholders: list[str] = []
-                    for value in values:
-                        parameters.append(value)
-                        placeholders.append('%s')
-                    filter_conditions.append(f'{filter_field} IN ({", ".join(placeholders)})')
-
-                case Operator.NOT_IN:
-                    values = filter.value
-                    placeholders_not_in: list[str] = []
-                    for value in values:
-                        parameters.append(value)
-                        placeholders_not_in.append('%s')
-                    filter_conditions.append(f'{filter_field} NOT IN ({", ".join(placeholders_not_in)})')
+            case Operator.NOT_IN:
+                values = cls._bucket_values(values=filter.value) if in_list_bucketing else filter.value
+                placeholders = [cls._add_parameter(value=value, parameters=parameters) for value in values]
+                return f'{filter_field} NOT IN ({", ".join(placeholders)})'
 
-                case _:  # pragma: no cover
-                    assert_never(operator)
+            case _:  # pragma: no cover
+                assert_never(operator)
+
+    @classmethod
+    def _bucket_values(cls, *, values: Sequence[Any]) -> list[Any]:
+        """
+        Pad the values up to the next power of two by repeating the last value, repeated values do not change the
+        result of an IN or NOT IN condition.
+
+        Args:
+            values (Sequence[Any]): Values to pad.
+
+        Returns:
+            list[Any]: Padded values.
+        """
+        bucketed_values = list(values)
+        if not bucketed_values:
+            return bucketed_values
+
+        bucket_size = 1 << (len(bucketed_values) - 1).bit_length()
+        bucketed_values.extend([bucketed_values[-1]] * (bucket_size - len(bucketed_values)))
+
+        return bucketed_values
+
+    @classmethod
+    def _add_parameter(cls, *, value: Any, parameters: list[Any]) -> str:
+        """
+        Add a value to the query parameters.
+
+        Args:
+            value (Any): Value to add.
+            parameters (list[Any]): Parameters for the SQL query.
+
+        Returns:
+            str: Placeholder of the parameter.
+        """
+        parameters.append(value)
+
+        return '%s'
+
+    @classmethod
+    def _process_keyset(
+        cls,
+        *,
+        criteria: Criteria,
+        keyset: Sequence[Any],
+        columns_mapping: Mapping[str, str],
+        parameters: list[Any],
+    ) -> str:
+        """
+        Process the keyset values to return an SQL condition that selects the rows after them in the ORDER BY order.
+        When all the orders share a direction a single row value comparison is used, otherwise it is expanded into
+        one comparison for each order column.
+
+        Args:
+            criteria (Criteria): Criteria to process.
+            keyset (Sequence[Any]): Last seen values of the criteria order fields.
+            columns_mapping (Mapping[str, str]): Mapping of column names to aliases.
+            parameters (list[Any]): Parameters for the SQL query, filled with the keyset values.
+
+        Returns:
+            str: Processed keyset condition.
+        """
+        fields = [f'{columns_mapping.get(order.field, order.field)}' for order in criteria.orders]
+        comparators = ['>' if Direction(value=order.direction) == Direction.ASC else '<' for order in criteria.orders]
+        values = cls._process_keyset_values(criteria=criteria, keyset=keyset)
+
+        placeholders: list[str] = []
+        for value in values:
+            parameters.append(value)
+            placeholders.append('%s')
+
+        if len(set(comparators)) == 1:
+            if len(fields) == 1:
+                return f'{fields[0]} {comparators[0]} {placeholders[0]}'
+
+            return f'({", ".join(fields)}) {comparators[0]} ({", ".join(placeholders)})'
+
+        conditions: list[str] = []
+        offset = 0
+        for index, comparator in enumerate(comparators):
+            equalities = [f'{fields[column]} = {placeholders[offset + column]}' for column in range(index)]
+            comparison = f'{fields[index]} {comparator} {placeholders[offset + index]}'
+            conditions.append(f'({" AND ".join([*equalities, comparison])})' if equalities else comparison)
+            offset += index + 1
+
+        return f'({" OR ".join(conditions)})'
+
+    @classmethod
+    def _process_keyset_values(cls, *, criteria: Criteria, keyset: Sequence[Any]) -> list[Any]:
+        """
+        Process the keyset values to return them in the same order as they are bound by the keyset condition.
+
+        Args:
+            criteria (Criteria): Criteria to process.
+            keyset (Sequence[Any]): Last seen values of the criteria order fields.
+
+        Returns:
+            list[Any]: Keyset values of the query.
+        """
+        if len({order.direction for order in criteria.orders}) == 1:
+            return list(keyset)
 
-        filters = ' AND '.join(filter_conditions)
+        values: list[Any] = []
+        for index in range(len(keyset)):
+            values.extend(keyset[: index + 1])
 
-        return filters, parameters
+        return values
 
     @classmethod
     def _process_orders(cls, *, criteria: Criteria, columns_mapping: Mapping[str, str]) -> str:
@@ -0,0 +1,516 @@
+"""
+Criteria to NumPy converter module.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from re import DOTALL, compile as re_compile, escape
+from typing import Any, assert_never
+
+from criteria_pattern import Criteria, Direction, Filter, Operator
+from criteria_pattern.errors import InvalidColumnError
+from criteria_pattern.models.criteria import AndCriteria, NotCriteria, OrCriteria
+
+from .converter_policy import ConverterPolicy
+
+try:
+    import numpy
+    from numpy.typing import NDArray
+
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore[assignment]
+
+
+class CriteriaToNumpyConverter:
+    """
+    Criteria to NumPy converter. It evaluates the criteria over columnar data, a mapping of column names to NumPy
+    arrays of the same length, with vectorized boolean masks instead of row by row. It requires the optional `numpy`
+    dependency, install it with `pip install criteria-pattern[numpy]`.
+
+    Null values are None in object arrays and NaN in floating point arrays. Comparisons with a null value never match,
+    like in SQL, but NOT negates the inner mask, so null values match a negated comparison. Null values are sorted last
+    in ascending orders and first in descending orders.
+
+    Example:
+    ```python
+    import numpy
+
+    from criteria_pattern import Criteria, Direction, Filter, Operator, Order
+    from criteria_pattern.converters import CriteriaToNumpyConverter
+
+    columns = {'name': numpy.array(['John', 'Jane', 'Mark']), 'age': numpy.array([30, 17, 45])}
+    criteria = Criteria(
+        filters=[Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18)],
+        orders=[Order(field='age', direction=Direction.DESC)],
+    )
+
+    indices = CriteriaToNumpyConverter.convert(criteria=criteria, columns=columns)
+    print(columns['name'][indices])
+    # >>> ['Mark' 'John']
+    ```
+    """
+
+    @classmethod
+    def convert(
+        cls,
+        *,
+        criteria: Criteria,
+        columns: Mapping[str, NDArray[Any]],
+        columns_mapping: Mapping[str, str] | None = None,
+        policy: ConverterPolicy | None = None,
+    ) -> NDArray[numpy.intp]:
+        """
+        Convert the Criteria object to the indices of the matching rows, sorted and paginated.
+
+        Args:
+            criteria (Criteria): Criteria to convert.
+            columns (Mapping[str, NDArray[Any]]): Mapping of column names to arrays of the same length.
+            columns_mapping (Mapping[str, str], optional): Mapping of field names to column names. Default to empty
+            dict.
+            policy (ConverterPolicy | None, optional): Precompiled policy to validate the criteria against. Default to
+            None (no policy).
+
+        Raises:
+            ImportError: If numpy is not installed.
+            InvalidColumnError: If a criteria field is not one of the columns.
+            InvalidColumnError: If a field is not in the policy valid columns (only if policy is given).
+            InvalidOperatorError: If an operator is not in the policy valid operators (only if policy is given).
+            InvalidDirectionError: If a direction is not in the policy valid directions (only if policy is given).
+            PaginationBoundsError: If pagination parameters exceed the policy bounds (only if policy is given).
+
+        Returns:
+            NDArray[numpy.intp]: Indices of the matching rows, in the criteria order and paginated.
+
+        Example:
+        ```python
+        import numpy
+
+        from criteria_pattern import Criteria, Filter, Operator
+        from criteria_pattern.converters import CriteriaToNumpyConverter
+
+        columns = {'email': numpy.array(['john@gmail.com', 'jane@yahoo.com'])}
+        criteria = Criteria(filters=[Filter(field='email', operator=Operator.ENDS_WITH, value='@gmail.com')])
+
+        print(CriteriaToNumpyConverter.convert(criteria=criteria, columns=columns))
+        # >>> [0]
+        ```
+        """
+        columns_mapping = columns_mapping or {}
+
+        if policy is not None:
+            policy.validate_criteria(criteria=criteria)
+
+        mask = cls.convert_mask(criteria=criteria, columns=columns, columns_mapping=columns_mapping)
+        indices = numpy.flatnonzero(mask)
+
+        start = 0
+        stop = None
+        if criteria.has_page_size():
+            start = criteria.page_size * (criteria.page_number - 1) if criteria.has_pagination() else 0  # type: ignore[operator]  # noqa: E501
+            stop = start + criteria.page_size  # type: ignore[operator]
+
+        if not criteria.has_orders() or indices.size == 0:
+            return indices[start:stop]
+
+        key = cls._process_orders(criteria=criteria, columns=columns, columns_mapping=columns_mapping, indices=indices)
+        if stop is not None and stop < key.size:
+            candidates = numpy.argpartition(key, stop - 1)[:stop]
+            order = candidates[numpy.argsort(key[candidates])]
+
+        else:
+            order = numpy.argsort(key)
+
+        return indices[order][start:stop]
+
+    @classmethod
+    def convert_mask(
+        cls,
+        *,
+        criteria: Criteria,
+        columns: Mapping[str, NDArray[Any]],
+        columns_mapping: Mapping[str, str] | None = None,
+    ) -> NDArray[numpy.bool_]:
+        """
+        Convert the Criteria object filters to a boolean mask of the matching rows, the orders and pagination are
+        ignored.
+
+        Args:
+            criteria (Criteria): Criteria to convert.
+            columns (Mapping[str, NDArray[Any]]): Mapping of column names to arrays of the same length.
+            columns_mapping (Mapping[str, str], optional): Mapping of field names to column names. Default to empty
+            dict.
+
+        Raises:
+            ImportError: If numpy is not installed.
+            InvalidColumnError: If a criteria field is not one of the columns.
+
+        Returns:
+            NDArray[numpy.bool_]: Mask of the rows that match the criteria filters.
+
+        Example:
+        ```python
+        import numpy
+
+        from criteria_pattern import Criteria, Filter, Operator
+        from criteria_pattern.converters import CriteriaToNumpyConverter
+
+        columns = {'age': numpy.array([30, 17, 45])}
+        criteria = Criteria(filters=[Filter(field='age', operator=Operator.BETWEEN, value=[18, 40])])
+
+        print(CriteriaToNumpyConverter.convert_mask(criteria=criteria, columns=columns))
+        # >>> [ True False False]
+        ```
+        """
+        if numpy is None:  # pragma: no cover
+            raise ImportError("CriteriaToNumpyConverter requires numpy, install it with 'pip install criteria-pattern[numpy]'.")  # noqa: E501  # fmt: skip
+
+        columns_mapping = columns_mapping or {}
+        size = len(next(iter(columns.values()))) if columns else 0
+
+        mask = cls._process_filters(criteria=criteria, columns=columns, columns_mapping=columns_mapping)
+        if mask is None:
+            return numpy.ones(size, dtype=numpy.bool_)
+
+        return mask
+
+    @classmethod
+    def _process_filters(  # noqa: C901
+        cls,
+        *,
+        criteria: Criteria,
+        columns: Mapping[str, NDArray[Any]],
+        columns_mapping: Mapping[str, str],
+    ) -> NDArray[numpy.bool_] | None:
+        """
+        Process the Criteria object to return the mask of the matching rows. The logical tree is evaluated bottom-up
+        with an explicit stack, each mask is released as soon as all its parents have consumed it.
+
+        Args:
+            criteria (Criteria): Criteria to process.
+            columns (Mapping[str, NDArray[Any]]): Mapping of column names to arrays of the same length.
+            columns_mapping (Mapping[str, str]): Mapping of field names to column names.
+
+        Returns:
+            NDArray[numpy.bool_] | None: Mask of the matching rows, or None if the criteria has no filters.
+        """
+        nodes: list[Criteria] = []  # each node once, after all its children
+        references: dict[int, int] = {}
+        seen: set[int] = set()
+        stack: list[tuple[Criteria, bool]] = [(criteria, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                nodes.append(node)
+                continue
+
+            if id(node) in seen:
+                continue
+
+            seen.add(id(node))
+            stack.append((node, True))
+
+            children: tuple[Criteria, ...] = ()
+            if isinstance(node, AndCriteria | OrCriteria):
+                children = node.children
+
+            elif isinstance(node, NotCriteria):
+                children = (node.criteria,)
+
+            for child in children:
+                references[id(child)] = references.get(id(child), 0) + 1
+                stack.append((child, False))
+
+        masks: dict[int, NDArray[numpy.bool_] | None] = {}
+
+        def consume(child: Criteria) -> NDArray[numpy.bool_] | None:
+            references[id(child)] -= 1
+            return masks.pop(id(child)) if references[id(child)] == 0 else masks[id(child)]
+
+        for node in nodes:
+            mask: NDArray[numpy.bool_] | None = None
+
+            if isinstance(node, AndCriteria | OrCriteria):
+                combine = numpy.logical_and if isinstance(node, AndCriteria) else numpy.logical_or
+                for child in node.children:
+                    child_mask = consume(child)
+                    if child_mask is not None:
+                        mask = child_mask.copy() if mask is None else combine(mask, child_mask, out=mask)
+
+            elif isinstance(node, NotCriteria):
+                inner_mask = consume(node.criteria)
+                mask = None if inner_mask is None else numpy.logical_not(inner_mask)
+
+            else:
+                for filter in node.filters:
+                    filter_mask = cls._process_filter(filter=filter, columns=columns, columns_mapping=columns_mapping)
+                    mask = filter_mask if mask is None else numpy.logical_and(mask, filter_mask, out=mask)
+
+            masks[id(node)] = mask
+
+        return masks[id(criteria)]
+
+    @classmethod
+    def _process_filter(  # noqa: C901
+        cls,
+        *,
+        filter: Filter[Any],
+        columns: Mapping[str, NDArray[Any]],
+        columns_mapping: Mapping[str, str],
+    ) -> NDArray[numpy.bool_]:
+        """
+        Process a Filter object to return the mask of the rows that match it.
+
+        Args:
+            filter (Filter[Any]): Filter to process.
+            columns (Mapping[str, NDArray[Any]]): Mapping of column names to arrays of the same length.
+            columns_mapping (Mapping[str, str]): Mapping of field names to column names.
+
+        Returns:
+            NDArray[numpy.bool_]: Mask of the rows that match the filter.
+        """
+        column = cls._process_column(field=filter.field, columns=columns, columns_mapping=columns_mapping)
+        value = filter.value
+
+        operator = Operator(value=filter.operator)
+        match operator:
+            case Operator.EQUAL:
+                return _compare(column=column, function=lambda values: values == value)
+
+            case Operator.NOT_EQUAL:
+                return _compare(column=column, function=lambda values: values != value)
+
+            case Operator.GREATER:
+                return _compare(column=column, function=lambda values: values > value)
+
+            case Operator.GREATER_OR_EQUAL:
+                return _compare(column=column, function=lambda values: values >= value)
+
+            case Operator.LESS:
+                return _compare(column=column, function=lambda values: values < value)
+
+            case Operator.LESS_OR_EQUAL:
+                return _compare(column=column, function=lambda values: values <= value)
+
+            case Operator.LIKE:
+                return _compare_strings(column=column, function=lambda values: _like(values=values, pattern=value))
+
+            case Operator.NOT_LIKE:
+                return _compare_strings(column=column, function=lambda values: ~_like(values=values, pattern=value))
+
+            case Operator.CONTAINS:
+                return _compare_strings(column=column, function=lambda values: numpy.char.find(values, value) >= 0)
+
+            case Operator.NOT_CONTAINS:
+                return _compare_strings(column=column, function=lambda values: numpy.char.find(values, value) < 0)
+
+            case Operator.STARTS_WITH:
+                return _compare_strings(column=column, function=lambda values: numpy.char.startswith(values, value))
+
+            case Operator.NOT_STARTS_WITH:
+                return _compare_strings(column=column, function=lambda values: ~numpy.char.startswith(values, value))
+
+            case Operator.ENDS_WITH:
+                return _compare_strings(column=column, function=lambda values: numpy.char.endswith(values, value))
+
+            case Operator.NOT_ENDS_WITH:
+                return _compare_strings(column=column, function=lambda values: ~numpy.char.endswith(values, value))
+
+            case Operator.BETWEEN:
+                start, end = value[0], value[1]
+                return _compare(column=column, function=lambda values: (values >= start) & (values <= end))
+
+            case Operator.NOT_BETWEEN:
+                start, end = value[0], value[1]
+                return _compare(column=column, function=lambda values: (values < start) | (values > end))
+
+            case Operator.IS_NULL:
+                return _null_mask(column=column)
+
+            case Operator.IS_NOT_NULL:
+                return ~_null_mask(column=column)
+
+            case Operator.IN:
+                return _compare(column=column, function=lambda values: numpy.isin(values, list(value)))
+
+            case Operator.NOT_IN:
+                return _compare(column=column, function=lambda values: ~numpy.isin(values, list(value)))
+
+            case _:  # pragma: no cover
+                assert_never(operator)
+
+    @classmethod
+    def _process_orders(
+        cls,
+        *,
+        criteria: Criteria,
+        columns: Mapping[str, NDArray[Any]],
+        columns_mapping: Mapping[str, str],
+        indices: NDArray[numpy.intp],
+    ) -> NDArray[numpy.int64]:
+        """
+        Process the Criteria object orders to return a unique sort key for each selected row. The orders are combined
+        into dense ranks, from the most to the least significant order, and ties are broken by the row position, so
+        sorting by the key is stable and a partial sort returns the same rows as a full one.
+
+        Args:
+            criteria (Criteria): Criteria to process.
+            columns (Mapping[str, NDArray[Any]]): Mapping of column names to arrays of the same length.
+            columns_mapping (Mapping[str, str]): Mapping of field names to column names.
+            indices (NDArray[numpy.intp]): Indices of the selected rows.
+
+        Returns:
+            NDArray[numpy.int64]: Sort key of each selected row.
+        """
+        size = indices.size
+        key = numpy.zeros(size, dtype=numpy.int64)
+
+        for order in criteria.orders:
+            column = cls._process_column(field=order.field, columns=columns, columns_mapping=columns_mapping)
+            ranks = _ranks(column=column[indices])
+
+            direction = Direction(value=order.direction)
+            match direction:
+                case Direction.ASC:
+                    pass
+
+                case Direction.DESC:
+                    ranks = ranks.max(initial=0) - ranks
+
+                case _:  # pragma: no cover
+                    assert_never(direction)
+
+            _, key = numpy.unique(key * (ranks.max(initial=0) + 1) + ranks, return_inverse=True)
+            key = key.astype(numpy.int64)
+
+        return key * size + numpy.arange(size, dtype=numpy.int64)
+
+    @classmethod
+    def _process_column(
+        cls,
+        *,
+        field: str,
+        columns: Mapping[str, NDArray[Any]],
+        columns_mapping: Mapping[str, str],
+    ) -> NDArray[Any]:
+        """
+        Process a field to return its column.
+
+        Args:
+            field (str): Name of the field.
+            columns (Mapping[str, NDArray[Any]]): Mapping of column names to arrays of the same length.
+            columns_mapping (Mapping[str, str]): Mapping of field names to column names.
+
+        Raises:
+            InvalidColumnError: If the field is not one of the columns.
+
+        Returns:
+            NDArray[Any]: Column of the field.
+        """
+        column = columns.get(columns_mapping.get(field, field))
+        if column is None:
+            raise InvalidColumnError(column=field, valid_columns=list(columns))
+
+        return column
+
+
+def _null_mask(*, column: NDArray[Any]) -> NDArray[numpy.bool_]:
+    """
+    Get the mask of the null values of a column, None in object arrays and NaN in floating point arrays.
+
+    Args:
+        column (NDArray[Any]): Column to check.
+
+    Returns:
+        NDArray[numpy.bool_]: Mask of the null values.
+    """
+    if column.dtype.kind == 'O':
+        return numpy.fromiter((value is None for value in column), dtype=numpy.bool_, count=column.size)
+
+    if column.dtype.kind in 'fc':
+        return numpy.asarray(numpy.isnan(column), dtype=numpy.bool_)
+
+    return numpy.zeros(column.size, dtype=numpy.bool_)
+
+
+def _compare(*, column: NDArray[Any], function: Callable[[NDArray[Any]], Any]) -> NDArray[numpy.bool_]:
+    """
+    Apply a vectorized comparison to the non null values of a column, null values never match.
+
+    Args:
+        column (NDArray[Any]): Column to compare.
+        function (Callable[[NDArray[Any]], Any]): Vectorized comparison.
+
+    Returns:
+        NDArray[numpy.bool_]: Mask of the matching values.
+    """
+    if column.dtype.kind not in 'Ofc':
+        return numpy.asarray(function(column), dtype=numpy.bool_)
+
+    null_mask = _null_mask(column=column)
+    mask = numpy.zeros(column.size, dtype=numpy.bool_)
+    mask[~null_mask] = function(column[~null_mask])
+
+    return mask
+
+
+def _compare_strings(*, column: NDArray[Any], function: Callable[[NDArray[Any]], Any]) -> NDArray[numpy.bool_]:
+    """
+    Apply a vectorized string comparison to the string values of a column, other values never match.
+
+    Args:
+        column (NDArray[Any]): Column to compare.
+        function (Callable[[NDArray[Any]], Any]): Vectorized string comparison.
+
+    Returns:
+        NDArray[numpy.bool_]: Mask of the matching values.
+    """
+    if column.dtype.kind == 'U':
+        return numpy.asarray(function(column), dtype=numpy.bool_)
+
+    string_mask = numpy.fromiter((isinstance(value, str) for value in column), dtype=numpy.bool_, count=column.size)
+    mask = numpy.zeros(column.size, dtype=numpy.bool_)
+    if string_mask.any():
+        mask[string_mask] = function(column[string_mask].astype(str))
+
+    return mask
+
+
+def _like(*, values: NDArray[Any], pattern: str) -> NDArray[numpy.bool_]:
+    """
+    Match the values against an SQL LIKE pattern, where % matches any sequence of characters and _ matches one
+    character. NumPy has no vectorized regular expressions, so the pattern is compiled once and applied to each value.
+
+    Args:
+        values (NDArray[Any]): String values to match.
+        pattern (str): SQL LIKE pattern.
+
+    Returns:
+        NDArray[numpy.bool_]: Mask of the matching values.
+    """
+    translated = ''.join('.*' if character == '%' else '.' if character == '_' else escape(character) for character in pattern)  # noqa: E501  # fmt: skip
+    fullmatch = re_compile(pattern=translated, flags=DOTALL).fullmatch
+
+    return numpy.fromiter((fullmatch(value) is not None for value in values), dtype=numpy.bool_, count=values.size)
+
+
+def _ranks(*, column: NDArray[Any]) -> NDArray[numpy.int64]:
+    """
+    Get the dense ascending rank of each value of a column, null values are ranked after the rest.
+
+    Args:
+        column (NDArray[Any]): Column to rank.
+
+    Returns:
+        NDArray[numpy.int64]: Rank of each value.
+    """
+    null_mask = _null_mask(column=column)
+    ranks = numpy.zeros(column.size, dtype=numpy.int64)
+    if null_mask.all():
+        return ranks
+
+    _, inverse = numpy.unique(column[~null_mask], return_inverse=True)
+    ranks[~null_mask] = inverse
+    ranks[null_mask] = inverse.max(initial=0) + 1
+
+    return ranks
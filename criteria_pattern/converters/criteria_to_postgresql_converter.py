@@ -2,11 +2,14 @@
 Criteria to Postgresql converter module.
 """
 
-from collections.abc import Mapping, Sequence
-from typing import Any, assert_never
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from functools import lru_cache
+from re import Match, compile as re_compile
+from typing import Any, Unpack, assert_never
 
-from criteria_pattern import Criteria, Direction, Operator
+from criteria_pattern import Criteria, Direction, Filter, Operator
 from criteria_pattern.errors import (
+    IntegrityError,
     InvalidColumnError,
     InvalidDirectionError,
     InvalidOperatorError,
@@ -15,6 +18,78 @@ from criteria_pattern.errors import (
 )
 from criteria_pattern.models.criteria import AndCriteria, NotCriteria, OrCriteria
 
+from .converter_policy import ConverterPolicy
+from .criteria_optimizer import CriteriaOptimizer
+from .prepared_statement import PreparedStatement
+from .query_cache import QueryCache
+from .sql_converter_options import SqlFilterOptions, SqlQueryOptions, SqlSelectOptions, validate_options
+
+NUMERIC_QUERIES_CACHE_SIZE = 4096
+
+_PYFORMAT_PLACEHOLDER_REGEX = re_compile(pattern=r'%\((?:parameter|keyset|limit|offset)_(\d+)\)s|%%')
+
+
+def _numeric_placeholder(match: Match[str]) -> str:
+    """
+    Get the numeric placeholder of a pyformat placeholder, or the unescaped percent sign of an escaped one.
+
+    Args:
+        match (Match[str]): Pyformat placeholder or escaped percent sign match.
+
+    Returns:
+        str: Numeric placeholder, the parameters are named after their position so `parameter_0` is `$1`.
+    """
+    index = match[1]
+    if index is None:
+        return '%'
+
+    return f'${int(index) + 1}'
+
+
+@lru_cache(maxsize=NUMERIC_QUERIES_CACHE_SIZE)
+def _numeric_query(query: str) -> str:
+    """
+    Translate a pyformat query into a query with numeric placeholders, translated queries are cached by their text.
+
+    Args:
+        query (str): Query with pyformat placeholders.
+
+    Returns:
+        str: Query with numeric placeholders.
+    """
+    return _PYFORMAT_PLACEHOLDER_REGEX.sub(_numeric_placeholder, query)
+
+
+class PostgresqlFilterOptions(SqlFilterOptions, total=False):
+    """
+    Keyword arguments of the CriteriaToPostgresqlConverter methods that only use the criteria filters, e.g.
+    `convert_count`.
+    """
+
+    array_binding: bool
+
+
+class PostgresqlSelectOptions(SqlSelectOptions, PostgresqlFilterOptions, total=False):
+    """
+    Keyword arguments of the CriteriaToPostgresqlConverter methods that select columns and paginate, e.g.
+    `convert_many`.
+    """
+
+    cache: QueryCache | None
+
+
+class PostgresqlPageOptions(SqlQueryOptions, PostgresqlFilterOptions, total=False):
+    """
+    Keyword arguments of the CriteriaToPostgresqlConverter methods that convert a single page without a cache, e.g.
+    `convert_page_with_total`.
+    """
+
+
+class PostgresqlQueryOptions(PostgresqlPageOptions, PostgresqlSelectOptions, total=False):
+    """
+    Keyword arguments of the CriteriaToPostgresqlConverter methods that convert a single page, e.g. `convert_prepared`.
+    """
+
 
 class CriteriaToPostgresqlConverter:
     """
@@ -38,7 +113,7 @@ class CriteriaToPostgresqlConverter:
     """  # noqa: E501  # fmt: skip
 
     @classmethod
-    def convert(  # noqa: C901
+    def convert(
         cls,
         criteria: Criteria,
         table: str,
@@ -56,6 +131,13 @@ class CriteriaToPostgresqlConverter:
         valid_directions: Sequence[Direction] | None = None,
         max_page_size: int = 10000,
         max_page_number: int = 1000000,
+        policy: ConverterPolicy | None = None,
+        keyset: Sequence[Any] | None = None,
+        array_binding: bool = False,
+        cache: QueryCache | None = None,
+        detect_contradictions: bool = False,
+        push_down_negations: bool = False,
+        optimize: bool = False,
     ) -> tuple[str, dict[str, Any]]:
         """
         Convert the Criteria object to a Postgresql query.
@@ -83,6 +165,23 @@ class CriteriaToPostgresqlConverter:
             valid_directions (Sequence[Direction], optional): List of valid directions to use. Default to empty list.
             max_page_size (int, optional): Maximum allowed page_size to prevent integer overflow. Default to 10000.
             max_page_number (int, optional): Maximum allowed page_number to prevent integer overflow. Default to 1000000.
+            policy (ConverterPolicy | None, optional): Precompiled policy to validate the table, columns and criteria
+            against, independently of the check flags. Default to None (no policy).
+            keyset (Sequence[Any] | None, optional): Last seen values of the criteria order fields, in the same order. When
+            given, the page starts after these values using a keyset predicate over the ORDER BY columns instead of an
+            OFFSET, so the page_number is ignored. Default to None (offset pagination).
+            array_binding (bool, optional): Bind the IN and NOT IN values as a single array parameter with = ANY and <> ALL,
+            so the query text does not depend on the list lengths. Default to False (one parameter for each value).
+            cache (QueryCache | None, optional): Cache of compiled queries keyed by the criteria shape fingerprint,
+            table, columns and columns mapping. On a hit only the parameter values are extracted. Default to None (no cache).
+            detect_contradictions (bool, optional): Check whether the criteria is provably unsatisfiable, e.g. `age > 30 AND
+            age < 10`, and return a constant-false query without parameters instead, see
+            `CriteriaOptimizer.is_unsatisfiable`. Default to False.
+            push_down_negations (bool, optional): Push the negations down to the filters using De Morgan's laws and the
+            operators complements, e.g. `NOT (age > 18)` becomes `age <= 18`, so the indexes can be used. It keeps the SQL
+            null semantics, see `CriteriaOptimizer.push_down_negations`. Default to False.
+            optimize (bool, optional): Simplify the logical tree of the criteria before it is converted, e.g. merging the
+            range filters of a field into their tightest bounds, see `CriteriaOptimizer.optimize`. Default to False.
 
         Raises:
             InvalidTableError: If the table is not in the list of valid tables (only if check_table_injection=True).
@@ -90,6 +189,12 @@ class CriteriaToPostgresqlConverter:
             InvalidOperatorError: If the operator is not in the list of valid operators (only if check_operator_injection=True).
             InvalidDirectionError: If the direction is not in the list of valid directions (only if check_direction_injection=True).
             PaginationBoundsError: If pagination parameters exceed maximum bounds (only if check_pagination_bounds=True).
+            InvalidTableError: If the table is not in the policy valid tables (only if policy is given).
+            InvalidColumnError: If a column or criteria field is not in the policy valid columns (only if policy is given).
+            InvalidOperatorError: If an operator is not in the policy valid operators (only if policy is given).
+            InvalidDirectionError: If a direction is not in the policy valid directions (only if policy is given).
+            PaginationBoundsError: If pagination parameters exceed the policy bounds (only if policy is given).
+            IntegrityError: If the keyset values do not match the criteria orders (only if keyset is given).
 
         Returns:
             tuple[str, dict[str, Any]]: The Postgresql query string and the query parameters.
@@ -110,65 +215,766 @@ class CriteriaToPostgresqlConverter:
         # >>> {'parameter_0': 18, 'parameter_1': '@gmail.com', 'parameter_2': '@yahoo.com'}
         ```
         """  # noqa: E501  # fmt: skip
-        columns = columns or ['*']
-        columns_mapping = columns_mapping or {}
-        valid_tables = valid_tables or []
-        valid_columns = valid_columns or []
-        valid_operators = valid_operators or []
-        valid_directions = valid_directions or []
+        options: PostgresqlQueryOptions = {
+            'columns': columns,
+            'columns_mapping': columns_mapping,
+            'check_table_injection': check_table_injection,
+            'check_column_injection': check_column_injection,
+            'check_criteria_injection': check_criteria_injection,
+            'check_operator_injection': check_operator_injection,
+            'check_direction_injection': check_direction_injection,
+            'check_pagination_bounds': check_pagination_bounds,
+            'valid_tables': valid_tables,
+            'valid_columns': valid_columns,
+            'valid_operators': valid_operators,
+            'valid_directions': valid_directions,
+            'max_page_size': max_page_size,
+            'max_page_number': max_page_number,
+            'policy': policy,
+            'keyset': keyset,
+            'array_binding': array_binding,
+            'cache': cache,
+            'detect_contradictions': detect_contradictions,
+            'push_down_negations': push_down_negations,
+            'optimize': optimize,
+        }
+        columns, columns_mapping = cls._prepare_table(table=table, select=True, **options)
+        select = cls._build_select(table=table, columns=columns)
+
+        prepared = cls._prepare_criteria(criteria=criteria, **options)
+        if prepared is None:
+            return f'{select} WHERE 1 = 0;', {}
+
+        if cache is None:
+            return cls._build_query(
+                criteria=prepared,
+                select=select,
+                columns_mapping=columns_mapping,
+                keyset=keyset,
+                array_binding=array_binding,
+            )
+
+        key = (
+            prepared.shape_fingerprint(),
+            table,
+            tuple(columns),
+            tuple(sorted(columns_mapping.items())),
+            None if keyset is None else len(keyset),
+            array_binding,
+        )
+        compiled = cache.get(key=key)
+        if compiled is None:
+            query, parameters = cls._build_query(
+                criteria=prepared,
+                select=select,
+                columns_mapping=columns_mapping,
+                keyset=keyset,
+                array_binding=array_binding,
+            )
+            cache.set(key=key, value=(query, tuple(parameters)))
 
-        if check_table_injection:
-            cls._validate_table(table=table, valid_tables=valid_tables)
+            return query, parameters
 
-        if check_column_injection:
-            cls._validate_columns(columns=columns, columns_mapping=columns_mapping, valid_columns=valid_columns)
+        query, parameters_names = compiled
+        parameters_values = cls._process_parameters(criteria=prepared, keyset=keyset, array_binding=array_binding)
 
-        if check_criteria_injection:
-            cls._validate_criteria(criteria=criteria, valid_columns=valid_columns)
+        return query, dict(zip(parameters_names, parameters_values, strict=True))
 
-        if check_operator_injection:
-            cls._validate_operators(criteria=criteria, valid_operators=valid_operators)
+    @classmethod
+    def convert_numeric(
+        cls,
+        criteria: Criteria,
+        table: str,
+        **options: Unpack[PostgresqlQueryOptions],
+    ) -> tuple[str, list[Any]]:
+        """
+        Convert the Criteria object to a Postgresql query with numeric placeholders ($1, $2, ...) and a list of
+        parameters, as used by the server-side prepared statements and the extended query protocol, e.g. asyncpg or
+        psycopg with server-side binding. As the query is not interpolated by the client, the LIKE wildcards are not
+        escaped.
 
-        if check_direction_injection:
-            cls._validate_directions(criteria=criteria, valid_directions=valid_directions)
+        Args:
+            criteria (Criteria): Criteria to convert.
+            table (str): Name of the table to query.
+            **options (Unpack[PostgresqlQueryOptions]): Options of the conversion, e.g. the columns, the injection checks or
+            the policy, with the same meaning and defaults as the `convert` arguments.
 
-        if check_pagination_bounds:
-            cls._validate_pagination_bounds(
-                criteria=criteria,
-                max_page_size=max_page_size,
-                max_page_number=max_page_number,
-            )
+        Raises:
+            InvalidTableError: If the table is not in the list of valid tables (only if check_table_injection=True).
+            InvalidColumnError: If the column is not in the list of valid columns (only if check_column_injection=True).
+            InvalidOperatorError: If the operator is not in the list of valid operators (only if check_operator_injection=True).
+            InvalidDirectionError: If the direction is not in the list of valid directions (only if check_direction_injection=True).
+            PaginationBoundsError: If pagination parameters exceed maximum bounds (only if check_pagination_bounds=True).
+            InvalidTableError: If the table is not in the policy valid tables (only if policy is given).
+            InvalidColumnError: If a column or criteria field is not in the policy valid columns (only if policy is given).
+            InvalidOperatorError: If an operator is not in the policy valid operators (only if policy is given).
+            InvalidDirectionError: If a direction is not in the policy valid directions (only if policy is given).
+            PaginationBoundsError: If pagination parameters exceed the policy bounds (only if policy is given).
+            IntegrityError: If the keyset values do not match the criteria orders (only if keyset is given).
+
+        Returns:
+            tuple[str, list[Any]]: The Postgresql query string and the query parameters, the parameter of $n is at
+            index n - 1.
+
+        Example:
+        ```python
+        from criteria_pattern import Criteria, Filter, Operator
+        from criteria_pattern.converters import CriteriaToPostgresqlConverter
+
+        is_adult = Criteria(filters=[Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18)])
+        email_is_gmail = Criteria(filters=[Filter(field='email', operator=Operator.ENDS_WITH, value='@gmail.com')])
+
+        query, parameters = CriteriaToPostgresqlConverter.convert_numeric(criteria=is_adult & email_is_gmail, table='user')
+        print(query)
+        print(parameters)
+        # >>> SELECT * FROM "user" WHERE ("age" >= $1 AND "email" LIKE '%' || $2);
+        # >>> [18, '@gmail.com']
+        ```
+        """  # noqa: E501  # fmt: skip
+        validate_options(
+            method='convert_numeric',
+            options=options,
+            valid_options=PostgresqlQueryOptions.__optional_keys__,
+        )
+        query, parameters = cls.convert(criteria=criteria, table=table, **options)
+
+        return _numeric_query(query), list(parameters.values())
+
+    @classmethod
+    def convert_prepared(
+        cls,
+        criteria: Criteria,
+        table: str,
+        **options: Unpack[PostgresqlQueryOptions],
+    ) -> PreparedStatement:
+        """
+        Convert the Criteria object to a named Postgresql prepared statement. The statement is prepared with numeric
+        placeholders and executed with the query parameters, and its name is derived from the statement text, so a
+        connection can prepare each criteria shape once and execute it many times, e.g. tracking it with a
+        `PreparedStatementRegistry`. Use `array_binding` so the IN lists lengths do not change the statement.
+
+        Args:
+            criteria (Criteria): Criteria to convert.
+            table (str): Name of the table to query.
+            **options (Unpack[PostgresqlQueryOptions]): Options of the conversion, e.g. the columns, the injection checks or
+            the policy, with the same meaning and defaults as the `convert` arguments.
+
+        Raises:
+            InvalidTableError: If the table is not in the list of valid tables (only if check_table_injection=True).
+            InvalidColumnError: If the column is not in the list of valid columns (only if check_column_injection=True).
+            InvalidOperatorError: If the operator is not in the list of valid operators (only if check_operator_injection=True).
+            InvalidDirectionError: If the direction is not in the list of valid directions (only if check_direction_injection=True).
+            PaginationBoundsError: If pagination parameters exceed maximum bounds (only if check_pagination_bounds=True).
+            InvalidTableError: If the table is not in the policy valid tables (only if policy is given).
+            InvalidColumnError: If a column or criteria field is not in the policy valid columns (only if policy is given).
+            InvalidOperatorError: If an operator is not in the policy valid operators (only if policy is given).
+            InvalidDirectionError: If a direction is not in the policy valid directions (only if policy is given).
+            PaginationBoundsError: If pagination parameters exceed the policy bounds (only if policy is given).
+            IntegrityError: If the keyset values do not match the criteria orders (only if keyset is given).
+
+        Returns:
+            PreparedStatement: Prepared statement with its PREPARE, EXECUTE and DEALLOCATE statements.
+
+        Example:
+        ```python
+        from criteria_pattern import Criteria, Filter, Operator
+        from criteria_pattern.converters import CriteriaToPostgresqlConverter
+
+        criteria = Criteria(filters=[Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18)])
+
+        statement = CriteriaToPostgresqlConverter.convert_prepared(criteria=criteria, table='user')
+        print(statement.prepare)
+        print(statement.execute)
+        # >>> PREPARE criteria_4cac8eb06cb309d0 AS SELECT * FROM "user" WHERE "age" >= $1;
+        # >>> [('EXECUTE criteria_4cac8eb06cb309d0 (%(parameter_0)s);', {'parameter_0': 18})]
+        ```
+        """  # noqa: E501  # fmt: skip
+        validate_options(
+            method='convert_prepared',
+            options=options,
+            valid_options=PostgresqlQueryOptions.__optional_keys__,
+        )
+        query, parameters = cls.convert(criteria=criteria, table=table, **options)
+
+        name = PreparedStatement.name_of(statement=_numeric_query(query))
+        arguments = f' ({", ".join(f"%({parameter})s" for parameter in parameters)})' if parameters else ''
+
+        return PreparedStatement(
+            name=name,
+            prepare=f'PREPARE {name} AS {_numeric_query(query)}',
+            execute=[(f'EXECUTE {name}{arguments};', parameters)],
+            deallocate=f'DEALLOCATE {name};',
+        )
+
+    @classmethod
+    def convert_count(
+        cls,
+        criteria: Criteria,
+        table: str,
+        **options: Unpack[PostgresqlFilterOptions],
+    ) -> tuple[str, dict[str, Any]]:
+        """
+        Convert the Criteria object to a Postgresql query that counts the rows matching its filters, e.g. the total of a
+        paginated listing. The orders, the pagination and the selected columns are ignored, and the criteria is not
+        modified.
+
+        Args:
+            criteria (Criteria): Criteria to convert.
+            table (str): Name of the table to query.
+            **options (Unpack[PostgresqlFilterOptions]): Options of the conversion, e.g. the injection checks or the policy,
+            with the same meaning and defaults as the `convert` arguments.
+
+        Raises:
+            InvalidTableError: If the table is not in the list of valid tables (only if check_table_injection=True).
+            InvalidColumnError: If the column is not in the list of valid columns (only if check_criteria_injection=True).
+            InvalidOperatorError: If the operator is not in the list of valid operators (only if check_operator_injection=True).
+            InvalidTableError: If the table is not in the policy valid tables (only if policy is given).
+            InvalidColumnError: If a criteria field is not in the policy valid columns (only if policy is given).
+            InvalidOperatorError: If an operator is not in the policy valid operators (only if policy is given).
+            InvalidDirectionError: If a direction is not in the policy valid directions (only if policy is given).
+            PaginationBoundsError: If pagination parameters exceed the policy bounds (only if policy is given).
+
+        Returns:
+            tuple[str, dict[str, Any]]: The Postgresql query string and the query parameters.
+
+        Example:
+        ```python
+        from criteria_pattern import Criteria, Filter, Operator
+        from criteria_pattern.converters import CriteriaToPostgresqlConverter
+
+        criteria = Criteria(filters=[Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18)], page_size=20, page_number=2)
+
+        query, parameters = CriteriaToPostgresqlConverter.convert_count(criteria=criteria, table='user')
+        print(query)
+        print(parameters)
+        # >>> SELECT COUNT(*) FROM "user" WHERE "age" >= %(parameter_0)s;
+        # >>> {'parameter_0': 18}
+        ```
+        """  # noqa: E501  # fmt: skip
+        validate_options(
+            method='convert_count',
+            options=options,
+            valid_options=PostgresqlFilterOptions.__optional_keys__,
+        )
+        _, columns_mapping = cls._prepare_table(table=table, select=False, **options)
+        prepared = cls._prepare_criteria(criteria=criteria, **options)
+        if prepared is None:
+            return f'SELECT COUNT(*) FROM {cls._quote_table(table=table)} WHERE 1 = 0;', {}  # noqa: S608  # nosec
+
+        parameters: dict[str, Any] = {}
+        where_clause = cls._build_where(
+            criteria=prepared,
+            columns_mapping=columns_mapping,
+            parameters=parameters,
+            array_binding=options.get('array_binding', False),
+        )
+
+        return f'SELECT COUNT(*) FROM {cls._quote_table(table=table)}{where_clause};', parameters  # noqa: S608  # nosec
+
+    @classmethod
+    def convert_exists(
+        cls,
+        criteria: Criteria,
+        table: str,
+        **options: Unpack[PostgresqlFilterOptions],
+    ) -> tuple[str, dict[str, Any]]:
+        """
+        Convert the Criteria object to a Postgresql query that returns a single row if any row matches its filters, so the
+        database can stop at the first match. The orders, the pagination and the selected columns are ignored, and the
+        criteria is not modified.
+
+        Args:
+            criteria (Criteria): Criteria to convert.
+            table (str): Name of the table to query.
+            **options (Unpack[PostgresqlFilterOptions]): Options of the conversion, e.g. the injection checks or the policy,
+            with the same meaning and defaults as the `convert` arguments.
+
+        Raises:
+            InvalidTableError: If the table is not in the list of valid tables (only if check_table_injection=True).
+            InvalidColumnError: If the column is not in the list of valid columns (only if check_criteria_injection=True).
+            InvalidOperatorError: If the operator is not in the list of valid operators (only if check_operator_injection=True).
+            InvalidTableError: If the table is not in the policy valid tables (only if policy is given).
+            InvalidColumnError: If a criteria field is not in the policy valid columns (only if policy is given).
+            InvalidOperatorError: If an operator is not in the policy valid operators (only if policy is given).
+            InvalidDirectionError: If a direction is not in the policy valid directions (only if policy is given).
+            PaginationBoundsError: If pagination parameters exceed the policy bounds (only if policy is given).
+
+        Returns:
+            tuple[str, dict[str, Any]]: The Postgresql query string and the query parameters.
+
+        Example:
+        ```python
+        from criteria_pattern import Criteria, Filter, Operator
+        from criteria_pattern.converters import CriteriaToPostgresqlConverter
+
+        criteria = Criteria(filters=[Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18)])
+
+        query, parameters = CriteriaToPostgresqlConverter.convert_exists(criteria=criteria, table='user')
+        print(query)
+        print(parameters)
+        # >>> SELECT 1 FROM "user" WHERE "age" >= %(parameter_0)s LIMIT 1;
+        # >>> {'parameter_0': 18}
+        ```
+        """  # noqa: E501  # fmt: skip
+        validate_options(
+            method='convert_exists',
+            options=options,
+            valid_options=PostgresqlFilterOptions.__optional_keys__,
+        )
+        _, columns_mapping = cls._prepare_table(table=table, select=False, **options)
+        prepared = cls._prepare_criteria(criteria=criteria, **options)
+        if prepared is None:
+            return f'SELECT 1 FROM {cls._quote_table(table=table)} WHERE 1 = 0 LIMIT 1;', {}  # noqa: S608  # nosec
+
+        parameters: dict[str, Any] = {}
+        where_clause = cls._build_where(
+            criteria=prepared,
+            columns_mapping=columns_mapping,
+            parameters=parameters,
+            array_binding=options.get('array_binding', False),
+        )
+
+        return f'SELECT 1 FROM {cls._quote_table(table=table)}{where_clause} LIMIT 1;', parameters  # noqa: S608  # nosec
+
+    @classmethod
+    def convert_page_with_total(
+        cls,
+        criteria: Criteria,
+        table: str,
+        **options: Unpack[PostgresqlPageOptions],
+    ) -> tuple[tuple[str, dict[str, Any]], tuple[str, dict[str, Any]]]:
+        """
+        Convert the Criteria object to a Postgresql page query and the Postgresql query that counts the total rows of every
+        page. The WHERE clause is compiled once and shared by both queries, the count query has no ORDER BY, keyset nor
+        pagination, and the criteria is not modified.
+
+        Args:
+            criteria (Criteria): Criteria to convert.
+            table (str): Name of the table to query.
+            **options (Unpack[PostgresqlPageOptions]): Options of the conversion, e.g. the columns, the injection checks or
+            the policy, with the same meaning and defaults as the `convert` arguments.
+
+        Raises:
+            InvalidTableError: If the table is not in the list of valid tables (only if check_table_injection=True).
+            InvalidColumnError: If the column is not in the list of valid columns (only if check_column_injection=True).
+            InvalidOperatorError: If the operator is not in the list of valid operators (only if check_operator_injection=True).
+            InvalidDirectionError: If the direction is not in the list of valid directions (only if check_direction_injection=True).
+            PaginationBoundsError: If pagination parameters exceed maximum bounds (only if check_pagination_bounds=True).
+            InvalidTableError: If the table is not in the policy valid tables (only if policy is given).
+            InvalidColumnError: If a column or criteria field is not in the policy valid columns (only if policy is given).
+            InvalidOperatorError: If an operator is not in the policy valid operators (only if policy is given).
+            InvalidDirectionError: If a direction is not in the policy valid directions (only if policy is given).
+            PaginationBoundsError: If pagination parameters exceed the policy bounds (only if policy is given).
+            IntegrityError: If the keyset values do not match the criteria orders (only if keyset is given).
+
+        Returns:
+            tuple[tuple[str, dict[str, Any]], tuple[str, dict[str, Any]]]: The page query string and parameters, and the count
+            query string and parameters.
+
+        Example:
+        ```python
+        from criteria_pattern import Criteria, Direction, Filter, Operator, Order
+        from criteria_pattern.converters import CriteriaToPostgresqlConverter
+
+        criteria = Criteria(
+            filters=[Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18)],
+            orders=[Order(field='age', direction=Direction.ASC)],
+            page_size=20,
+            page_number=2,
+        )
+
+        (query, parameters), (count_query, count_parameters) = CriteriaToPostgresqlConverter.convert_page_with_total(criteria=criteria, table='user')
+        print(query)
+        print(parameters)
+        print(count_query)
+        print(count_parameters)
+        # >>> SELECT * FROM "user" WHERE "age" >= %(parameter_0)s ORDER BY "age" ASC LIMIT %(limit_1)s OFFSET %(offset_2)s;
+        # >>> {'parameter_0': 18, 'limit_1': 20, 'offset_2': 20}
+        # >>> SELECT COUNT(*) FROM "user" WHERE "age" >= %(parameter_0)s;
+        # >>> {'parameter_0': 18}
+        ```
+        """  # noqa: E501  # fmt: skip
+        validate_options(
+            method='convert_page_with_total',
+            options=options,
+            valid_options=PostgresqlPageOptions.__optional_keys__,
+        )
+        columns, columns_mapping = cls._prepare_table(table=table, select=True, **options)
+        select = cls._build_select(table=table, columns=columns)
+
+        prepared = cls._prepare_criteria(criteria=criteria, **options)
+        if prepared is None:
+            page: tuple[str, dict[str, Any]] = (f'{select} WHERE 1 = 0;', {})
+            return page, (f'SELECT COUNT(*) FROM {cls._quote_table(table=table)} WHERE 1 = 0;', {})  # noqa: S608  # nosec
+
+        parameters: dict[str, Any] = {}
+        where_clause = cls._build_where(
+            criteria=prepared,
+            columns_mapping=columns_mapping,
+            parameters=parameters,
+            array_binding=options.get('array_binding', False),
+        )
+        count_query = f'SELECT COUNT(*) FROM {cls._quote_table(table=table)}{where_clause};'  # noqa: S608  # nosec
+        count_parameters = dict(parameters)
+
+        page = cls._build_page(
+            criteria=prepared,
+            query=f'{select}{where_clause}',
+            parameters=parameters,
+            columns_mapping=columns_mapping,
+            keyset=options.get('keyset'),
+        )
+
+        return page, (count_query, count_parameters)
+
+    @classmethod
+    def convert_many(
+        cls,
+        criteria: Iterable[Criteria],
+        table: str,
+        **options: Unpack[PostgresqlSelectOptions],
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """
+        Convert the Criteria objects to Postgresql queries lazily, yielding each query as it is built. The defaults are
+        normalized, the table and columns are validated and quoted only once, so it is faster than calling `convert`
+        for each criteria and the memory stays flat for any number of criteria. Keyset pagination is not supported, as
+        the keyset belongs to a single page.
+
+        Args:
+            criteria (Iterable[Criteria]): Criteria objects to convert.
+            table (str): Name of the table to query.
+            **options (Unpack[PostgresqlSelectOptions]): Options of the conversion, e.g. the columns, the injection checks or
+            the policy, with the same meaning and defaults as the `convert` arguments.
+
+        Raises:
+            InvalidTableError: If the table is not in the list of valid tables (only if check_table_injection=True).
+            InvalidColumnError: If the column is not in the list of valid columns (only if check_column_injection=True).
+            InvalidOperatorError: If the operator is not in the list of valid operators (only if check_operator_injection=True).
+            InvalidDirectionError: If the direction is not in the list of valid directions (only if check_direction_injection=True).
+            PaginationBoundsError: If pagination parameters exceed maximum bounds (only if check_pagination_bounds=True).
+            InvalidTableError: If the table is not in the policy valid tables (only if policy is given).
+            InvalidColumnError: If a column or criteria field is not in the policy valid columns (only if policy is given).
+            InvalidOperatorError: If an operator is not in the policy valid operators (only if policy is given).
+            InvalidDirectionError: If a direction is not in the policy valid directions (only if policy is given).
+            PaginationBoundsError: If pagination parameters exceed the policy bounds (only if policy is given).
+
+        Yields:
+            tuple[str, dict[str, Any]]: The Postgresql query string and the query parameters of each criteria, in order.
 
+        Example:
+        ```python
+        from criteria_pattern import Criteria, Filter, Operator
+        from criteria_pattern.converters import CriteriaToPostgresqlConverter
+
+        criteria = (Criteria(filters=[Filter(field='age', operator=Operator.EQUAL, value=age)]) for age in range(18, 20))
+
+        for query, parameters in CriteriaToPostgresqlConverter.convert_many(criteria=criteria, table='user'):
+            print(query, parameters)
+        # >>> SELECT * FROM "user" WHERE "age" = %(parameter_0)s; {'parameter_0': 18}
+        # >>> SELECT * FROM "user" WHERE "age" = %(parameter_0)s; {'parameter_0': 19}
+        ```
+        """  # noqa: E501  # fmt: skip
+        validate_options(
+            method='convert_many',
+            options=options,
+            valid_options=PostgresqlSelectOptions.__optional_keys__,
+        )
+        columns, columns_mapping = cls._prepare_table(table=table, select=True, **options)
+        select = cls._build_select(table=table, columns=columns)
+
+        array_binding = options.get('array_binding', False)
+        cache = options.get('cache')
+        key_options = (table, tuple(columns), tuple(sorted(columns_mapping.items())), None, array_binding)
+
+        for single_criteria in criteria:
+            prepared = cls._prepare_criteria(criteria=single_criteria, **options)
+            if prepared is None:
+                yield f'{select} WHERE 1 = 0;', {}
+                continue
+
+            if cache is None:
+                yield cls._build_query(
+                    criteria=prepared,
+                    select=select,
+                    columns_mapping=columns_mapping,
+                    keyset=None,
+                    array_binding=array_binding,
+                )
+                continue
+
+            key = (prepared.shape_fingerprint(), *key_options)
+            compiled = cache.get(key=key)
+            if compiled is None:
+                query, parameters = cls._build_query(
+                    criteria=prepared,
+                    select=select,
+                    columns_mapping=columns_mapping,
+                    keyset=None,
+                    array_binding=array_binding,
+                )
+                cache.set(key=key, value=(query, tuple(parameters)))
+                yield query, parameters
+                continue
+
+            query, parameters_names = compiled
+            parameters_values = cls._process_parameters(criteria=prepared, keyset=None, array_binding=array_binding)
+            yield query, dict(zip(parameters_names, parameters_values, strict=True))
+
+    @classmethod
+    def _build_select(cls, *, table: str, columns: Sequence[str]) -> str:
+        """
+        Build the SELECT clause of the Postgresql query, quoting the table and the columns.
+
+        Args:
+            table (str): Name of the table to query.
+            columns (Sequence[str]): Columns of the table to select.
+
+        Returns:
+            str: The SELECT clause.
+        """
         quoted_columns = ['*' if column == '*' else f'"{column}"' for column in columns]
-        quoted_table = '.'.join(f'"{part}"' for part in table.split('.'))
-        query = f'SELECT {", ".join(quoted_columns)} FROM {quoted_table}'  # noqa: S608  # nosec
+
+        return f'SELECT {", ".join(quoted_columns)} FROM {cls._quote_table(table=table)}'  # noqa: S608  # nosec
+
+    @classmethod
+    def _quote_table(cls, *, table: str) -> str:
+        """
+        Quote the table name of the Postgresql query, including its schema if any.
+
+        Args:
+            table (str): Name of the table to query.
+
+        Returns:
+            str: The quoted table name.
+        """
+        return '.'.join(f'"{part}"' for part in table.split('.'))
+
+    @classmethod
+    def _build_query(
+        cls,
+        *,
+        criteria: Criteria,
+        select: str,
+        columns_mapping: Mapping[str, str],
+        keyset: Sequence[Any] | None,
+        array_binding: bool,
+    ) -> tuple[str, dict[str, Any]]:
+        """
+        Build the Postgresql query for the Criteria object.
+
+        Args:
+            criteria (Criteria): Criteria to convert.
+            select (str): SELECT clause of the query.
+            columns_mapping (Mapping[str, str]): Mapping of column names to aliases.
+            keyset (Sequence[Any] | None): Last seen values of the criteria order fields, or None for offset pagination.
+            array_binding (bool): Bind the IN and NOT IN values as a single array parameter.
+        Returns:
+            tuple[str, dict[str, Any]]: The Postgresql query string and the query parameters.
+        """
         parameters: dict[str, Any] = {}
-        parameters_counter = 0
+        where_clause = cls._build_where(
+            criteria=criteria,
+            columns_mapping=columns_mapping,
+            parameters=parameters,
+            array_binding=array_binding,
+        )
+
+        return cls._build_page(
+            criteria=criteria,
+            query=f'{select}{where_clause}',
+            parameters=parameters,
+            columns_mapping=columns_mapping,
+            keyset=keyset,
+        )
 
-        if criteria.has_filters():
-            where_clause, parameters = cls._process_filters(criteria=criteria, columns_mapping=columns_mapping)
-            query += f' WHERE {where_clause}'
-            parameters_counter = len(parameters)
+    @classmethod
+    def _build_where(
+        cls,
+        *,
+        criteria: Criteria,
+        columns_mapping: Mapping[str, str],
+        parameters: dict[str, Any],
+        array_binding: bool,
+    ) -> str:
+        """
+        Build the WHERE clause of the Postgresql query for the Criteria object filters, adding their values to the
+        parameters.
+
+        Args:
+            criteria (Criteria): Criteria to convert.
+            columns_mapping (Mapping[str, str]): Mapping of column names to aliases.
+            parameters (dict[str, Any]): Query parameters.
+            array_binding (bool): Bind the IN and NOT IN values as a single array parameter.
+        Returns:
+            str: The WHERE clause with a leading space, or an empty string if the criteria has no filters.
+        """
+        if not criteria.has_filters():
+            return ''
+
+        where_clause = cls._process_filters(
+            criteria=criteria,
+            columns_mapping=columns_mapping,
+            parameters=parameters,
+            array_binding=array_binding,
+        )
+
+        return f' WHERE {where_clause}'
+
+    @classmethod
+    def _build_page(
+        cls,
+        *,
+        criteria: Criteria,
+        query: str,
+        parameters: dict[str, Any],
+        columns_mapping: Mapping[str, str],
+        keyset: Sequence[Any] | None,
+    ) -> tuple[str, dict[str, Any]]:
+        """
+        Complete the Postgresql query of the Criteria object with its keyset predicate, ORDER BY and pagination.
+
+        Args:
+            criteria (Criteria): Criteria to convert.
+            query (str): SELECT and WHERE clauses of the query.
+            parameters (dict[str, Any]): Parameters of the WHERE clause.
+            columns_mapping (Mapping[str, str]): Mapping of column names to aliases.
+            keyset (Sequence[Any] | None): Last seen values of the criteria order fields, or None for offset pagination.
+
+        Returns:
+            tuple[str, dict[str, Any]]: The Postgresql query string and the query parameters.
+        """
+        if keyset is not None:
+            keyset_clause = cls._process_keyset(
+                criteria=criteria,
+                keyset=keyset,
+                columns_mapping=columns_mapping,
+                parameters=parameters,
+            )
+            query += f' AND {keyset_clause}' if criteria.has_filters() else f' WHERE {keyset_clause}'
 
         if criteria.has_orders():
             order_clause = cls._process_orders(criteria=criteria, columns_mapping=columns_mapping)
             query += f' ORDER BY {order_clause}'
 
         if criteria.has_page_size():
-            limit_parameter = f'limit_{parameters_counter}'
+            limit_parameter = f'limit_{len(parameters)}'
             parameters[limit_parameter] = criteria.page_size
             query += f' LIMIT %({limit_parameter})s'
-            parameters_counter += 1
 
-        if criteria.has_pagination():
-            offset_parameter = f'offset_{parameters_counter}'
+        if criteria.has_pagination() and keyset is None:
+            offset_parameter = f'offset_{len(parameters)}'
             offset_value = criteria.page_size * (criteria.page_number - 1)  # type: ignore[operator]
             parameters[offset_parameter] = offset_value
             query += f' OFFSET %({offset_parameter})s'
-            parameters_counter += 1
 
         return f'{query};', parameters
 
+    @classmethod
+    def _prepare_table(
+        cls,
+        *,
+        table: str,
+        select: bool,
+        **options: Unpack[PostgresqlQueryOptions],
+    ) -> tuple[Sequence[str], Mapping[str, str]]:
+        """
+        Normalize the columns defaults and validate the table and the columns of a query, shared by every conversion
+        method.
+
+        Args:
+            table (str): Name of the table to query.
+            select (bool): Whether the query selects the columns, otherwise only the table is validated.
+            **options (Unpack[PostgresqlQueryOptions]): Options of the conversion.
+
+        Raises:
+            InvalidTableError: If the table is not in the list of valid tables (only if check_table_injection=True).
+            InvalidColumnError: If the column is not in the list of valid columns (only if check_column_injection=True).
+            InvalidTableError: If the table is not in the policy valid tables (only if policy is given).
+            InvalidColumnError: If a column is not in the policy valid columns (only if policy is given).
+
+        Returns:
+            tuple[Sequence[str], Mapping[str, str]]: The columns to select and the mapping of column names to aliases.
+        """  # noqa: E501  # fmt: skip
+        columns = options.get('columns') or ['*']
+        columns_mapping = options.get('columns_mapping') or {}
+        policy = options.get('policy')
+
+        if options.get('check_table_injection', False):
+            cls._validate_table(table=table, valid_tables=options.get('valid_tables') or [])
+
+        if select and options.get('check_column_injection', False):
+            cls._validate_columns(
+                columns=columns,
+                columns_mapping=columns_mapping,
+                valid_columns=options.get('valid_columns') or [],
+            )
+
+        if policy is not None:
+            policy.validate_table(table=table)
+            if select:
+                policy.validate_columns(columns=columns, columns_mapping=columns_mapping)
+
+        return columns, columns_mapping
+
+    @classmethod
+    def _prepare_criteria(cls, *, criteria: Criteria, **options: Unpack[PostgresqlQueryOptions]) -> Criteria | None:
+        """
+        Validate the Criteria object and apply the optimizations of the options, shared by every conversion method.
+
+        Args:
+            criteria (Criteria): Criteria to convert.
+            **options (Unpack[PostgresqlQueryOptions]): Options of the conversion.
+
+        Raises:
+            InvalidColumnError: If the column is not in the list of valid columns (only if check_criteria_injection=True).
+            InvalidOperatorError: If the operator is not in the list of valid operators (only if check_operator_injection=True).
+            InvalidDirectionError: If the direction is not in the list of valid directions (only if check_direction_injection=True).
+            PaginationBoundsError: If pagination parameters exceed maximum bounds (only if check_pagination_bounds=True).
+            InvalidColumnError: If a criteria field is not in the policy valid columns (only if policy is given).
+            InvalidOperatorError: If an operator is not in the policy valid operators (only if policy is given).
+            InvalidDirectionError: If a direction is not in the policy valid directions (only if policy is given).
+            PaginationBoundsError: If pagination parameters exceed the policy bounds (only if policy is given).
+            IntegrityError: If the keyset values do not match the criteria orders (only if keyset is given).
+
+        Returns:
+            Criteria | None: The criteria to convert, or None if it is provably unsatisfiable.
+        """  # noqa: E501  # fmt: skip
+        policy = options.get('policy')
+        keyset = options.get('keyset')
+
+        if options.get('check_criteria_injection', False):
+            cls._validate_criteria(criteria=criteria, valid_columns=options.get('valid_columns') or [])
+
+        if options.get('check_operator_injection', False):
+            cls._validate_operators(criteria=criteria, valid_operators=options.get('valid_operators') or [])
+
+        if options.get('check_direction_injection', False):
+            cls._validate_directions(criteria=criteria, valid_directions=options.get('valid_directions') or [])
+
+        if options.get('check_pagination_bounds', False):
+            cls._validate_pagination_bounds(
+                criteria=criteria,
+                max_page_size=options.get('max_page_size', 10000),
+                max_page_number=options.get('max_page_number', 1000000),
+            )
+
+        if policy is not None:
+            policy.validate_criteria(criteria=criteria)
+
+        if keyset is not None:
+            cls._validate_keyset(criteria=criteria, keyset=keyset)
+
+        if options.get('push_down_negations', False):
+            criteria = CriteriaOptimizer.push_down_negations(criteria=criteria)
+
+        if options.get('optimize', False):
+            criteria = CriteriaOptimizer.optimize(criteria=criteria)
+
+        if options.get('detect_contradictions', False) and CriteriaOptimizer.is_unsatisfiable(criteria=criteria):
+            return None
+
+        return criteria
+
     @classmethod
     def _validate_table(cls, *, table: str, valid_tables: Sequence[str]) -> None:
         """
@@ -286,237 +1092,375 @@ class CriteriaToPostgresqlConverter:
             raise PaginationBoundsError(parameter='page_number', value=criteria.page_number, max_value=max_page_number)
 
     @classmethod
-    def _process_filters(cls, *, criteria: Criteria, columns_mapping: Mapping[str, str]) -> tuple[str, dict[str, Any]]:
+    def _validate_keyset(cls, *, criteria: Criteria, keyset: Sequence[Any]) -> None:
         """
-        Process the Criteria object to return an SQL WHERE clause.
+        Validate the keyset values against the Criteria object orders.
+
+        Args:
+            criteria (Criteria): Criteria to validate.
+            keyset (Sequence[Any]): Last seen values of the criteria order fields.
+
+        Raises:
+            IntegrityError: If the criteria has no orders or the keyset length does not match the number of orders.
+        """
+        if not criteria.has_orders():
+            raise IntegrityError(message='Keyset pagination requires the criteria to have orders.')
+
+        if len(keyset) != len(criteria.orders):
+            raise IntegrityError(message=f'Keyset <<<{list(keyset)}>>> must have one value for each criteria order <<<{len(criteria.orders)}>>>.')  # noqa: E501  # fmt: skip
+
+    @classmethod
+    def _process_parameters(
+        cls,
+        *,
+        criteria: Criteria,
+        keyset: Sequence[Any] | None,
+        array_binding: bool,
+    ) -> list[Any]:
+        """
+        Process the Criteria object to return the query parameter values in the same order as they are bound by the
+        query, without building the query.
 
         Args:
             criteria (Criteria): Criteria to process.
-            columns_mapping (Mapping[str, str]): Mapping of column names to aliases.
+            keyset (Sequence[Any] | None): Last seen values of the criteria order fields, or None for offset pagination.
+            array_binding (bool): Bind the IN and NOT IN values as a single array parameter.
 
         Returns:
-            tuple[str, dict[str, Any]]: Processed filter string for SQL WHERE clause and parameters for the SQL query.
+            list[Any]: Parameter values of the query.
         """
-        return cls._process_filters_recursive(criteria=criteria, columns_mapping=columns_mapping)
+        parameters: list[Any] = []
+
+        for filter in criteria.filters:
+            match filter.operator:
+                case Operator.IS_NULL | Operator.IS_NOT_NULL:
+                    continue
+
+                case Operator.BETWEEN | Operator.NOT_BETWEEN:
+                    parameters.append(filter.value[0])
+                    parameters.append(filter.value[1])
+
+                case Operator.IN | Operator.NOT_IN if array_binding:
+                    parameters.append(list(filter.value))
+
+                case Operator.IN | Operator.NOT_IN:
+                    parameters.extend(filter.value)
+
+                case _:
+                    parameters.append(filter.value)
+
+        if keyset is not None:
+            parameters.extend(cls._process_keyset_values(criteria=criteria, keyset=keyset))
+
+        if criteria.has_page_size():
+            parameters.append(criteria.page_size)
+
+        if criteria.has_pagination() and keyset is None:
+            parameters.append(criteria.page_size * (criteria.page_number - 1))  # type: ignore[operator]
+
+        return parameters
 
     @classmethod
-    def _process_filters_recursive(  # noqa: C901
+    def _process_filters(
         cls,
         *,
         criteria: Criteria,
         columns_mapping: Mapping[str, str],
-        parameters_counter: int = 0,
-    ) -> tuple[str, dict[str, Any]]:
+        parameters: dict[str, Any],
+        array_binding: bool = False,
+    ) -> str:
         """
-        Process the Criteria object to return an SQL WHERE clause.
+        Process the Criteria object to return an SQL WHERE clause. The logical tree is walked with an explicit stack,
+        so the depth of the criteria is not limited by the recursion limit, the conditions are appended to a single
+        buffer and the values to the given parameters.
 
         Args:
             criteria (Criteria): Criteria to process.
             columns_mapping (Mapping[str, str]): Mapping of column names to aliases.
-            parameters_counter (int): Counter for parameter names to ensure uniqueness.
+            parameters (dict[str, Any]): Parameters for the SQL query, filled with the filter values.
+            array_binding (bool, optional): Bind the IN and NOT IN values as a single array parameter. Default to False.
 
         Returns:
-            tuple[str, dict[str, Any]]: Processed filter string for SQL WHERE clause and parameters for the SQL query.
+            str: Processed filter string for SQL WHERE clause.
         """
-        filters = ''
-        parameters: dict[str, Any] = {}
+        non_empty_nodes = cls._process_non_empty_nodes(criteria=criteria)
+        buffer: list[str] = []
+        stack: list[Criteria | str] = [criteria]
+
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                buffer.append(item)
+                continue
+
+            if isinstance(item, AndCriteria | OrCriteria):
+                separator = ' AND ' if isinstance(item, AndCriteria) else ' OR '
+                children = [child for child in item.children if id(child) in non_empty_nodes]
+                if len(children) == 1:
+                    stack.append(children[0])
+                    continue
+
+                stack.append(')')
+                for child in reversed(children[1:]):
+                    stack.append(child)
+                    stack.append(separator)
+
+                stack.append(children[0])
+                stack.append('(')
+                continue
+
+            if isinstance(item, NotCriteria):
+                stack.append(')')
+                stack.append(item.criteria)
+                stack.append('NOT (')
+                continue
+
+            for index, filter in enumerate(item.filters):
+                if index > 0:
+                    buffer.append(' AND ')
+
+                condition = cls._process_filter(
+                    filter=filter,
+                    columns_mapping=columns_mapping,
+                    parameters=parameters,
+                    array_binding=array_binding,
+                )
+                buffer.append(condition)
 
-        if isinstance(criteria, AndCriteria):
-            left_conditions, left_parameters = cls._process_filters_recursive(
-                criteria=criteria.left,
-                columns_mapping=columns_mapping,
-                parameters_counter=parameters_counter,
-            )
-            parameters_counter += len(left_parameters)
-            parameters.update(left_parameters)
+        return ''.join(buffer)
 
-            right_conditions, right_parameters = cls._process_filters_recursive(
-                criteria=criteria.right,
-                columns_mapping=columns_mapping,
-                parameters_counter=parameters_counter,
-            )
-            parameters_counter += len(right_parameters)
-            parameters.update(right_parameters)
+    @classmethod
+    def _process_non_empty_nodes(cls, *, criteria: Criteria) -> set[int]:
+        """
+        Process the Criteria object to return the identifiers of the nodes of the logical tree that have filters, the
+        nodes without filters are skipped when building the SQL WHERE clause.
 
-            if left_conditions and right_conditions:
-                filters += f'({left_conditions} AND {right_conditions})'
+        Args:
+            criteria (Criteria): Criteria to process.
 
-            elif left_conditions:
-                filters += left_conditions
+        Returns:
+            set[int]: Identifiers of the nodes with filters.
+        """
+        nodes: list[Criteria] = []
+        stack: list[Criteria] = [criteria]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
 
-            elif right_conditions:
-                filters += right_conditions
+            if isinstance(node, AndCriteria | OrCriteria):
+                stack.extend(node.children)
 
-            return filters, parameters
+            elif isinstance(node, NotCriteria):
+                stack.append(node.criteria)
 
-        if isinstance(criteria, OrCriteria):
-            left_conditions, left_parameters = cls._process_filters_recursive(
-                criteria=criteria.left,
-                columns_mapping=columns_mapping,
-                parameters_counter=parameters_counter,
-            )
-            parameters_counter += len(left_parameters)
-            parameters.update(left_parameters)
+        non_empty_nodes: set[int] = set()
+        for node in reversed(nodes):  # children are always visited before their parents
+            if isinstance(node, AndCriteria | OrCriteria):
+                has_filters = any(id(child) in non_empty_nodes for child in node.children)
 
-            right_conditions, right_parameters = cls._process_filters_recursive(
-                criteria=criteria.right,
-                columns_mapping=columns_mapping,
-                parameters_counter=parameters_counter,
-            )
-            parameters_counter += len(right_parameters)
-            parameters.update(right_parameters)
+            elif isinstance(node, NotCriteria):
+                has_filters = id(node.criteria) in non_empty_nodes
+
+            else:
+                has_filters = bool(node.filters)
 
-            if left_conditions and right_conditions:
-                filters += f'({left_conditions} OR {right_conditions})'
+            if has_filters:
+                non_empty_nodes.add(id(node))
 
-            elif left_conditions:
-                filters += left_conditions
+        return non_empty_nodes
 
-            elif right_conditions:
-                filters += right_conditions
+    @classmethod
+    def _process_filter(  # noqa: C901
+        cls,
+        *,
+        filter: Filter[Any],
+        columns_mapping: Mapping[str, str],
+        parameters: dict[str, Any],
+        array_binding: bool = False,
+    ) -> str:
+        """
+        Process a Filter object to return an SQL condition.
 
-            return filters, parameters
+        Args:
+            filter (Filter[Any]): Filter to process.
+            columns_mapping (Mapping[str, str]): Mapping of column names to aliases.
+            parameters (dict[str, Any]): Parameters for the SQL query, filled with the filter values.
+            array_binding (bool, optional): Bind the IN and NOT IN values as a single array parameter. Default to False.
 
-        if isinstance(criteria, NotCriteria):
-            not_conditions, not_parameters = cls._process_filters_recursive(
-                criteria=criteria.criteria,
-                columns_mapping=columns_mapping,
-                parameters_counter=parameters_counter,
-            )
-            parameters_counter += len(not_parameters)
-            parameters.update(not_parameters)
+        Returns:
+            str: Processed SQL condition.
+        """
+        filter_field = columns_mapping.get(filter.field, filter.field)
 
-            if not_conditions:
-                filters += f'NOT ({not_conditions})'
+        operator = Operator(value=filter.operator)
+        match operator:
+            case Operator.EQUAL:
+                return f'"{filter_field}" = {cls._add_parameter(value=filter.value, parameters=parameters)}'
 
-            return filters, parameters
+            case Operator.NOT_EQUAL:
+                return f'"{filter_field}" != {cls._add_parameter(value=filter.value, parameters=parameters)}'
 
-        filter_conditions = []
-        for filter in criteria.filters:
-            filter_field = columns_mapping.get(filter.field, filter.field)
-            parameter_name = f'parameter_{parameters_counter}'
-            parameters[parameter_name] = filter.value
-            placeholder = f'%({parameter_name})s'
-            parameters_counter += 1
+            case Operator.GREATER:
+                return f'"{filter_field}" > {cls._add_parameter(value=filter.value, parameters=parameters)}'
+
+            case Operator.GREATER_OR_EQUAL:
+                return f'"{filter_field}" >= {cls._add_parameter(value=filter.value, parameters=parameters)}'
 
-            operator = Operator(value=filter.operator)
-            match operator:
-                case Operator.EQUAL:
-                    filter_conditions.append(f'"{filter_field}" = {placeholder}')
+            case Operator.LESS:
+                return f'"{filter_field}" < {cls._add_parameter(value=filter.value, parameters=parameters)}'
 
-                case Operator.NOT_EQUAL:
-                    filter_conditions.append(f'"{filter_field}" != {placeholder}')
+            case Operator.LESS_OR_EQUAL:
+                return f'"{filter_field}" <= {cls._add_parameter(value=filter.value, parameters=parameters)}'
 
-                case Operator.GREATER:
-                    filter_conditions.append(f'"{filter_field}" > {placeholder}')
+            case Operator.LIKE:
+                return f'"{filter_field}" LIKE {cls._add_parameter(value=filter.value, parameters=parameters)}'
 
-                case Operator.GREATER_OR_EQUAL:
-                    filter_conditions.append(f'"{filter_field}" >= {placeholder}')
+            case Operator.NOT_LIKE:
+                return f'"{filter_field}" NOT LIKE {cls._add_parameter(value=filter.value, parameters=parameters)}'
 
-                case Operator.LESS:
-                    filter_conditions.append(f'"{filter_field}" < {placeholder}')
+            case Operator.CONTAINS:
+                placeholder = cls._add_parameter(value=filter.value, parameters=parameters)
+                return f"\"{filter_field}\" LIKE '%%' || {placeholder} || '%%'"
 
-                case Operator.LESS_OR_EQUAL:
-                    filter_conditions.append(f'"{filter_field}" <= {placeholder}')
+            case Operator.NOT_CONTAINS:
+                placeholder = cls._add_parameter(value=filter.value, parameters=parameters)
+                return f"\"{filter_field}\" NOT LIKE '%%' || {placeholder} || '%%'"
 
-                case Operator.LIKE:
-                    filter_conditions.append(f'"{filter_field}" LIKE {placeholder}')
+            case Operator.STARTS_WITH:
+                placeholder = cls._add_parameter(value=filter.value, parameters=parameters)
+                return f'"{filter_field}" LIKE {placeholder} || \'%%\''
 
-                case Operator.NOT_LIKE:
-                    filter_conditions.append(f'"{filter_field}" NOT LIKE {placeholder}')
+            case Operator.NOT_STARTS_WITH:
+                placeholder = cls._add_parameter(value=filter.value, parameters=parameters)
+                return f'"{filter_field}" NOT LIKE {placeholder} || \'%%\''
 
-                case Operator.CONTAINS:
-                    filter_conditions.append(f"\"{filter_field}\" LIKE '%%' || {placeholder} || '%%'")
+            case Operator.ENDS_WITH:
+                placeholder = cls._add_parameter(value=filter.value, parameters=parameters)
+                return f'"{filter_field}" LIKE \'%%\' || {placeholder}'
 
-                case Operator.NOT_CONTAINS:
-                    filter_conditions.append(f"\"{filter_field}\" NOT LIKE '%%' || {placeholder} || '%%'")
+            case Operator.NOT_ENDS_WITH:
+                placeholder = cls._add_parameter(value=filter.value, parameters=parameters)
+                return f'"{filter_field}" NOT LIKE \'%%\' || {placeholder}'
 
-                case Operator.STARTS_WITH:
-                    filter_conditions.append(f'"{filter_field}" LIKE {placeholder} || \'%%\'')
+            case Operator.BETWEEN:
+                start_placeholder = cls._add_parameter(value=filter.value[0], parameters=parameters)
+                end_placeholder = cls._add_parameter(value=filter.value[1], parameters=parameters)
+                return f'"{filter_field}" BETWEEN {start_placeholder} AND {end_placeholder}'
 
-                case Operator.NOT_STARTS_WITH:
-                    filter_conditions.append(f'"{filter_field}" NOT LIKE {placeholder} || \'%%\'')
+            case Operator.NOT_BETWEEN:
+                start_placeholder = cls._add_parameter(value=filter.value[0], parameters=parameters)
+                end_placeholder = cls._add_parameter(value=filter.value[1], parameters=parameters)
+                return f'"{filter_field}" NOT BETWEEN {start_placeholder} AND {end_placeholder}'
 
-                case Operator.ENDS_WITH:
-                    filter_conditions.append(f'"{filter_field}" LIKE \'%%\' || {placeholder}')
+            case Operator.IS_NULL:
+                return f'"{filter_field}" IS NULL'
 
-                case Operator.NOT_ENDS_WITH:
-                    filter_conditions.append(f'"{filter_field}" NOT LIKE \'%%\' || {placeholder}')
+            case Operator.IS_NOT_NULL:
+                return f'"{filter_field}" IS NOT NULL'
 
-                case Operator.BETWEEN:
-                    parameters.pop(parameter_name)
-                    parameters_counter -= 1
+            case Operator.IN if array_binding:
+                return f'"{filter_field}" = ANY({cls._add_parameter(value=list(filter.value), parameters=parameters)})'
 
-                    start_parameter_name = f'parameter_{parameters_counter}'
-                    end_parameter_name = f'parameter_{parameters_counter + 1}'
-                    parameters[start_parameter_name] = filter.value[0]
-                    parameters[end_parameter_name] = filter.value[1]
-                    start_placeholder = f'%({start_parameter_name})s'
-                    end_placeholder = f'%({end_parameter_name})s'
-                    parameters_counter += 2
+            case Operator.NOT_IN if array_binding:
+                return f'"{filter_field}" <> ALL({cls._add_parameter(value=list(filter.value), parameters=parameters)})'
 
-                    filter_conditions.append(f'"{filter_field}" BETWEEN {start_placeholder} AND {end_placeholder}')
+            case Operator.IN:
+                placeholders = [cls._add_parameter(value=value, parameters=parameters) for value in filter.value]
+                return f'"{filter_field}" IN ({", ".join(placeholders)})'
 
-                case Operator.NOT_BETWEEN:
-                    parameters.pop(parameter_name)
-                    parameters_counter -= 1
+            case Operator.NOT_IN:
+                placeholders = [cls._add_parameter(value=value, parameters=parameters) for value in filter.value]
+                return f'"{filter_field}" NOT IN ({", ".join(placeholders)})'
 
-                    start_parameter_name = f'parameter_{parameters_counter}'
-                    end_parameter_name = f'parameter_{parameters_counter + 1}'
-                    parameters[start_parameter_name] = filter.value[0]
-                    parameters[end_parameter_name] = filter.value[1]
-                    start_placeholder = f'%({start_parameter_name})s'
-                    end_placeholder = f'%({end_parameter_name})s'
-                    parameters_counter += 2
+            case _:  # pragma: no cover
+                assert_never(operator)
 
-                    filter_conditions.append(f'"{filter_field}" NOT BETWEEN {start_placeholder} AND {end_placeholder}')
+    @classmethod
+    def _add_parameter(cls, *, value: Any, parameters: dict[str, Any]) -> str:
+        """
+        Add a value to the query parameters.
+
+        Args:
+            value (Any): Value to add.
+            parameters (dict[str, Any]): Parameters for the SQL query.
+
+        Returns:
+            str: Placeholder of the parameter.
+        """
+        parameter_name = f'parameter_{len(parameters)}'
+        parameters[parameter_name] = value
 
-                case Operator.IS_NULL:
-                    parameters.pop(parameter_name)
-                    parameters_counter -= 1
+        return f'%({parameter_name})s'
+
+    @classmethod
+    def _process_keyset(
+        cls,
+        *,
+        criteria: Criteria,
+        keyset: Sequence[Any],
+        columns_mapping: Mapping[str, str],
+        parameters: dict[str, Any],
+    ) -> str:
+        """
+        Process the keyset values to return an SQL condition that selects the rows after them in the ORDER BY order.
+        When all the orders share a direction a single row value comparison is used, otherwise it is expanded into
+        one comparison for each order column.
 
-                    filter_conditions.append(f'"{filter_field}" IS NULL')
+        Args:
+            criteria (Criteria): Criteria to process.
+            keyset (Sequence[Any]): Last seen values of the criteria order fields.
+            columns_mapping (Mapping[str, str]): Mapping of column names to aliases.
+            parameters (dict[str, Any]): Parameters for the SQL query, filled with the keyset values.
 
-                case Operator.IS_NOT_NULL:
-                    parameters.pop(parameter_name)
-                    parameters_counter -= 1
+        Returns:
+            str: Processed keyset condition.
+        """
+        fields = [f'"{columns_mapping.get(order.field, order.field)}"' for order in criteria.orders]
+        comparators = ['>' if Direction(value=order.direction) == Direction.ASC else '<' for order in criteria.orders]
+        values = cls._process_keyset_values(criteria=criteria, keyset=keyset)
 
-                    filter_conditions.append(f'"{filter_field}" IS NOT NULL')
+        placeholders: list[str] = []
+        for value in values:
+            parameter_name = f'keyset_{len(parameters)}'
+            parameters[parameter_name] = value
+            placeholders.append(f'%({parameter_name})s')
 
-                case Operator.IN:
-                    parameters.pop(parameter_name)
-                    parameters_counter -= 1
+        if len(set(comparators)) == 1:
+            if len(fields) == 1:
+                return f'{fields[0]} {comparators[0]} {placeholders[0]}'
 
-                    values = filter.value
-                    placeholders = []
-                    for i, value in enumerate(values):
-                        param_name = f'parameter_{parameters_counter + i}'
-                        parameters[param_name] = value
-                        placeholders.append(f'%({param_name})s')
-                    parameters_counter += len(values)
+            return f'({", ".join(fields)}) {comparators[0]} ({", ".join(placeholders)})'
 
-                    filter_conditions.append(f'"{filter_field}" IN ({", ".join(placeholders)})')
+        conditions: list[str] = []
+        offset = 0
+        for index, comparator in enumerate(comparators):
+            equalities = [f'{fields[column]} = {placeholders[offset + column]}' for column in range(index)]
+            comparison = f'{fields[index]} {comparator} {placeholders[offset + index]}'
+            conditions.append(f'({" AND ".join([*equalities, comparison])})' if equalities else comparison)
+            offset += index + 1
 
-                case Operator.NOT_IN:
-                    parameters.pop(parameter_name)
-                    parameters_counter -= 1
+        return f'({" OR ".join(conditions)})'
 
-                    values = filter.value
-                    placeholders = []
-                    for i, value in enumerate(values):
-                        param_name = f'parameter_{parameters_counter + i}'
-                        parameters[param_name] = value
-                        placeholders.append(f'%({param_name})s')
-                    parameters_counter += len(values)
+    @classmethod
+    def _process_keyset_values(cls, *, criteria: Criteria, keyset: Sequence[Any]) -> list[Any]:
+        """
+        Process the keyset values to return them in the same order as they are bound by the keyset condition.
 
-                    filter_conditions.append(f'"{filter_field}" NOT IN ({", ".join(placeholders)})')
+        Args:
+            criteria (Criteria): Criteria to process.
+            keyset (Sequence[Any]): Last seen values of the criteria order fields.
 
-                case _:  # pragma: no cover
-                    assert_never(operator)
+        Returns:
+            list[Any]: Keyset values of the query.
+        """
+        if len({order.direction for order in criteria.orders}) == 1:
+            return list(keyset)
 
-        filters = ' AND '.join(filter_conditions)
+        values: list[Any] = []
+        for index in range(len(keyset)):
+            values.extend(keyset[: index + 1])
 
-        return filters, parameters
+        return values
 
     @classmethod
     def _process_orders(cls, *, criteria: Criteria, columns_mapping: Mapping[str, str]) -> str:
@@ -0,0 +1,498 @@
+"""
+Criteria to Python converter module.
+"""
+
+from collections.abc import Callable, Iterable, Mapping
+from itertools import islice
+from operator import attrgetter, methodcaller
+from re import DOTALL, Pattern, compile as re_compile, escape
+from typing import Any, assert_never
+
+from criteria_pattern import Criteria, Direction, Filter, Operator
+from criteria_pattern.models.criteria import AndCriteria, NotCriteria, OrCriteria
+
+from .converter_policy import ConverterPolicy
+
+Predicate = Callable[[Any], bool]
+Getter = Callable[[Any], Any]
+
+
+class CriteriaToPythonConverter:
+    """
+    Criteria to Python converter. It compiles the criteria once into Python closures that filter, sort and paginate
+    in-memory rows, either mappings or objects, so evaluating the rows does not walk the criteria tree or dispatch on
+    the operators.
+
+    Comparisons with a null field never match, like in SQL, but NOT negates the inner condition, so rows with a null
+    field match a negated comparison. Null fields are sorted last in ascending orders and first in descending orders.
+
+    Example:
+    ```python
+    from criteria_pattern import Criteria, Filter, Operator
+    from criteria_pattern.converters import CriteriaToPythonConverter
+
+    is_adult = Criteria(filters=[Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18)])
+    email_is_gmail = Criteria(filters=[Filter(field='email', operator=Operator.ENDS_WITH, value='@gmail.com')])
+
+    query = CriteriaToPythonConverter.convert(criteria=is_adult & email_is_gmail)
+    print(query([{'age': 20, 'email': 'john@gmail.com'}, {'age': 17, 'email': 'jane@gmail.com'}]))
+    # >>> [{'age': 20, 'email': 'john@gmail.com'}]
+    ```
+    """
+
+    @classmethod
+    def convert(
+        cls,
+        *,
+        criteria: Criteria,
+        columns_mapping: Mapping[str, str] | None = None,
+        attributes: bool = False,
+        policy: ConverterPolicy | None = None,
+    ) -> Callable[[Iterable[Any]], list[Any]]:
+        """
+        Convert the Criteria object to a Python callable that filters, sorts and paginates rows.
+
+        Args:
+            criteria (Criteria): Criteria to convert.
+            columns_mapping (Mapping[str, str], optional): Mapping of field names to row keys. Default to empty dict.
+            attributes (bool, optional): Read the fields as attributes of the rows instead of mapping keys. Default to
+            False.
+            policy (ConverterPolicy | None, optional): Precompiled policy to validate the criteria against. Default to
+            None (no policy).
+
+        Raises:
+            InvalidColumnError: If a field is not in the policy valid columns (only if policy is given).
+            InvalidOperatorError: If an operator is not in the policy valid operators (only if policy is given).
+            InvalidDirectionError: If a direction is not in the policy valid directions (only if policy is given).
+            PaginationBoundsError: If pagination parameters exceed the policy bounds (only if policy is given).
+
+        Returns:
+            Callable[[Iterable[Any]], list[Any]]: Callable that returns the matching rows, sorted and paginated.
+
+        Example:
+        ```python
+        from criteria_pattern import Criteria, Direction, Order
+        from criteria_pattern.converters import CriteriaToPythonConverter
+
+        criteria = Criteria(orders=[Order(field='age', direction=Direction.DESC)], page_size=1, page_number=2)
+
+        query = CriteriaToPythonConverter.convert(criteria=criteria)
+        print(query([{'age': 20}, {'age': 40}, {'age': 30}]))
+        # >>> [{'age': 30}]
+        ```
+        """
+        columns_mapping = columns_mapping or {}
+
+        if policy is not None:
+            policy.validate_criteria(criteria=criteria)
+
+        predicate = cls._process_filters(criteria=criteria, columns_mapping=columns_mapping, attributes=attributes)
+        orders = cls._process_orders(criteria=criteria, columns_mapping=columns_mapping, attributes=attributes)
+
+        start = 0
+        stop = None
+        if criteria.has_page_size():
+            start = criteria.page_size * (criteria.page_number - 1) if criteria.has_pagination() else 0  # type: ignore[operator]  # noqa: E501
+            stop = start + criteria.page_size  # type: ignore[operator]
+
+        def query(rows: Iterable[Any]) -> list[Any]:
+            matches = rows if predicate is None else filter(predicate, rows)
+            if not orders:
+                return list(islice(matches, start, stop))
+
+            result = list(matches)
+            for key, reverse in orders:
+                result.sort(key=key, reverse=reverse)
+
+            return result[start:stop]
+
+        return query
+
+    @classmethod
+    def convert_predicate(
+        cls,
+        *,
+        criteria: Criteria,
+        columns_mapping: Mapping[str, str] | None = None,
+        attributes: bool = False,
+    ) -> Predicate:
+        """
+        Convert the Criteria object filters to a Python predicate that tells if a single row matches, the orders and
+        pagination are ignored.
+
+        Args:
+            criteria (Criteria): Criteria to convert.
+            columns_mapping (Mapping[str, str], optional): Mapping of field names to row keys. Default to empty dict.
+            attributes (bool, optional): Read the fields as attributes of the rows instead of mapping keys. Default to
+            False.
+
+        Returns:
+            Callable[[Any], bool]: Predicate that returns True if the row matches the criteria filters.
+
+        Example:
+        ```python
+        from criteria_pattern import Criteria, Filter, Operator
+        from criteria_pattern.converters import CriteriaToPythonConverter
+
+        criteria = Criteria(filters=[Filter(field='name', operator=Operator.LIKE, value='J%n')])
+
+        matches = CriteriaToPythonConverter.convert_predicate(criteria=criteria)
+        print(matches({'name': 'John'}))
+        # >>> True
+        ```
+        """
+        predicate = cls._process_filters(
+            criteria=criteria,
+            columns_mapping=columns_mapping or {},
+            attributes=attributes,
+        )
+
+        return _always_true if predicate is None else predicate
+
+    @classmethod
+    def _process_filters(  # noqa: C901
+        cls,
+        *,
+        criteria: Criteria,
+        columns_mapping: Mapping[str, str],
+        attributes: bool,
+    ) -> Predicate | None:
+        """
+        Process the Criteria object to return a predicate closure. The logical tree is compiled bottom-up with an
+        explicit stack and nested nodes of the same kind are merged, so neither the compilation nor the evaluation of a
+        deep chain of AND or OR nodes is limited by the recursion limit.
+
+        Args:
+            criteria (Criteria): Criteria to process.
+            columns_mapping (Mapping[str, str]): Mapping of field names to row keys.
+            attributes (bool): Read the fields as attributes of the rows instead of mapping keys.
+
+        Returns:
+            Callable[[Any], bool] | None: Predicate closure, or None if the criteria has no filters.
+        """
+        compiled: dict[int, tuple[bool, list[Predicate]]] = {}  # node id -> (is disjunction, predicates)
+        stack: list[tuple[Criteria, bool]] = [(criteria, False)]
+
+        while stack:
+            node, visited = stack.pop()
+            if isinstance(node, AndCriteria | OrCriteria):
+                if not visited:
+                    stack.append((node, True))
+                    stack.extend((child, False) for child in node.children)
+                    continue
+
+                is_disjunction = isinstance(node, OrCriteria)
+                predicates: list[Predicate] = []
+                for child in node.children:
+                    child_is_disjunction, child_predicates = compiled[id(child)]
+                    if child_is_disjunction == is_disjunction or len(child_predicates) == 1:
+                        predicates.extend(child_predicates)
+
+                    elif child_predicates:
+                        predicates.append(_combine(is_disjunction=child_is_disjunction, predicates=child_predicates))
+
+                compiled[id(node)] = (is_disjunction, predicates)
+                continue
+
+            if isinstance(node, NotCriteria):
+                if not visited:
+                    stack.append((node, True))
+                    stack.append((node.criteria, False))
+                    continue
+
+                inner_is_disjunction, inner_predicates = compiled[id(node.criteria)]
+                if inner_predicates:
+                    inner = _combine(is_disjunction=inner_is_disjunction, predicates=inner_predicates)
+                    compiled[id(node)] = (False, [_not(predicate=inner)])
+
+                else:
+                    compiled[id(node)] = (False, [])
+
+                continue
+
+            compiled[id(node)] = (
+                False,
+                [
+                    cls._process_filter(filter=filter, columns_mapping=columns_mapping, attributes=attributes)
+                    for filter in node.filters
+                ],
+            )
+
+        is_disjunction, predicates = compiled[id(criteria)]
+        if not predicates:
+            return None
+
+        return _combine(is_disjunction=is_disjunction, predicates=predicates)
+
+    @classmethod
+    def _process_filter(  # noqa: C901
+        cls,
+        *,
+        filter: Filter[Any],
+        columns_mapping: Mapping[str, str],
+        attributes: bool,
+    ) -> Predicate:
+        """
+        Process a Filter object to return a predicate closure specialized for its operator and value.
+
+        Args:
+            filter (Filter[Any]): Filter to process.
+            columns_mapping (Mapping[str, str]): Mapping of field names to row keys.
+            attributes (bool): Read the fields as attributes of the rows instead of mapping keys.
+
+        Returns:
+            Callable[[Any], bool]: Predicate closure.
+        """
+        get = cls._process_getter(
+            field=columns_mapping.get(filter.field, filter.field),
+            attributes=attributes,
+        )
+        value = filter.value
+
+        operator = Operator(value=filter.operator)
+        match operator:
+            case Operator.EQUAL:
+                return lambda row: (current := get(row)) is not None and current == value
+
+            case Operator.NOT_EQUAL:
+                return lambda row: (current := get(row)) is not None and current != value
+
+            case Operator.GREATER:
+                return lambda row: (current := get(row)) is not None and current > value
+
+            case Operator.GREATER_OR_EQUAL:
+                return lambda row: (current := get(row)) is not None and current >= value
+
+            case Operator.LESS:
+                return lambda row: (current := get(row)) is not None and current < value
+
+            case Operator.LESS_OR_EQUAL:
+                return lambda row: (current := get(row)) is not None and current <= value
+
+            case Operator.LIKE:
+                pattern = _like_pattern(value=value)
+                return lambda row: isinstance(current := get(row), str) and pattern.fullmatch(current) is not None
+
+            case Operator.NOT_LIKE:
+                pattern = _like_pattern(value=value)
+                return lambda row: isinstance(current := get(row), str) and pattern.fullmatch(current) is None
+
+            case Operator.CONTAINS:
+                return lambda row: isinstance(current := get(row), str) and value in current
+
+            case Operator.NOT_CONTAINS:
+                return lambda row: isinstance(current := get(row), str) and value not in current
+
+            case Operator.STARTS_WITH:
+                return lambda row: isinstance(current := get(row), str) and current.startswith(value)
+
+            case Operator.NOT_STARTS_WITH:
+                return lambda row: isinstance(current := get(row), str) and not current.startswith(value)
+
+            case Operator.ENDS_WITH:
+                return lambda row: isinstance(current := get(row), str) and current.endswith(value)
+
+            case Operator.NOT_ENDS_WITH:
+                return lambda row: isinstance(current := get(row), str) and not current.endswith(value)
+
+            case Operator.BETWEEN:
+                start, end = value[0], value[1]
+                return lambda row: (current := get(row)) is not None and start <= current <= end
+
+            case Operator.NOT_BETWEEN:
+                start, end = value[0], value[1]
+                return lambda row: (current := get(row)) is not None and not start <= current <= end
+
+            case Operator.IS_NULL:
+                return lambda row: get(row) is None
+
+            case Operator.IS_NOT_NULL:
+                return lambda row: get(row) is not None
+
+            case Operator.IN:
+                values = _membership(values=value)
+                return lambda row: (current := get(row)) is not None and current in values
+
+            case Operator.NOT_IN:
+                values = _membership(values=value)
+                return lambda row: (current := get(row)) is not None and current not in values
+
+            case _:  # pragma: no cover
+                assert_never(operator)
+
+    @classmethod
+    def _process_orders(
+        cls,
+        *,
+        criteria: Criteria,
+        columns_mapping: Mapping[str, str],
+        attributes: bool,
+    ) -> list[tuple[Getter, bool]]:
+        """
+        Process the Criteria object orders to return the sort passes, from the least to the most significant order,
+        so applying them with a stable sort results in the criteria order.
+
+        Args:
+            criteria (Criteria): Criteria to process.
+            columns_mapping (Mapping[str, str]): Mapping of field names to row keys.
+            attributes (bool): Read the fields as attributes of the rows instead of mapping keys.
+
+        Returns:
+            list[tuple[Callable[[Any], Any], bool]]: Sort key and reverse flag of each sort pass.
+        """
+        orders: list[tuple[Getter, bool]] = []
+
+        for order in reversed(criteria.orders):
+            get = cls._process_getter(field=columns_mapping.get(order.field, order.field), attributes=attributes)
+
+            direction = Direction(value=order.direction)
+            match direction:
+                case Direction.ASC:
+                    orders.append((_sort_key(get=get), False))
+
+                case Direction.DESC:
+                    orders.append((_sort_key(get=get), True))
+
+                case _:  # pragma: no cover
+                    assert_never(direction)
+
+        return orders
+
+    @classmethod
+    def _process_getter(cls, *, field: str, attributes: bool) -> Getter:
+        """
+        Process a field to return a getter of its value in a row, missing keys or attributes are read as None.
+
+        Args:
+            field (str): Name of the field.
+            attributes (bool): Read the field as an attribute of the rows instead of a mapping key.
+
+        Returns:
+            Callable[[Any], Any]: Getter of the field value.
+        """
+        if not attributes:
+            return methodcaller('get', field)
+
+        get_attribute = attrgetter(field)
+
+        def get(row: Any) -> Any:
+            try:
+                return get_attribute(row)
+
+            except AttributeError:
+                return None
+
+        return get
+
+
+def _always_true(row: Any) -> bool:
+    """
+    Predicate that matches every row.
+
+    Args:
+        row (Any): Row to check.
+
+    Returns:
+        bool: Always True.
+    """
+    return True
+
+
+def _combine(*, is_disjunction: bool, predicates: list[Predicate]) -> Predicate:
+    """
+    Combine predicates with AND or OR.
+
+    Args:
+        is_disjunction (bool): Combine the predicates with OR instead of AND.
+        predicates (list[Callable[[Any], bool]]): Predicates to combine.
+
+    Returns:
+        Callable[[Any], bool]: Combined predicate.
+    """
+    if len(predicates) == 1:
+        return predicates[0]
+
+    conditions = tuple(predicates)
+    if is_disjunction:
+
+        def any_of(row: Any) -> bool:
+            for condition in conditions:  # noqa: SIM110
+                if condition(row):
+                    return True
+
+            return False
+
+        return any_of
+
+    def all_of(row: Any) -> bool:
+        for condition in conditions:  # noqa: SIM110
+            if not condition(row):
+                return False
+
+        return True
+
+    return all_of
+
+
+def _not(*, predicate: Predicate) -> Predicate:
+    """
+    Negate a predicate.
+
+    Args:
+        predicate (Callable[[Any], bool]): Predicate to negate.
+
+    Returns:
+        Callable[[Any], bool]: Negated predicate.
+    """
+    return lambda row: not predicate(row)
+
+
+def _sort_key(*, get: Getter) -> Getter:
+    """
+    Build a sort key that places null values after the rest.
+
+    Args:
+        get (Callable[[Any], Any]): Getter of the field value.
+
+    Returns:
+        Callable[[Any], Any]: Sort key.
+    """
+
+    def key(row: Any) -> tuple[bool, Any]:
+        value = get(row)
+        return (True, 0) if value is None else (False, value)
+
+    return key
+
+
+def _like_pattern(*, value: str) -> Pattern[str]:
+    """
+    Compile an SQL LIKE pattern, where % matches any sequence of characters and _ matches one character.
+
+    Args:
+        value (str): SQL LIKE pattern.
+
+    Returns:
+        Pattern[str]: Compiled regular expression.
+    """
+    translated = ''.join('.*' if character == '%' else '.' if character == '_' else escape(character) for character in value)  # noqa: E501  # fmt: skip
+
+    return re_compile(pattern=translated, flags=DOTALL)
+
+
+def _membership(*, values: Iterable[Any]) -> frozenset[Any] | tuple[Any, ...]:
+    """
+    Build the fastest container for membership tests of the values, a frozenset if all of them are hashable.
+
+    Args:
+        values (Iterable[Any]): Values to test against.
+
+    Returns:
+        frozenset[Any] | tuple[Any, ...]: Container of the values.
+    """
+    values = tuple(values)
+    try:
+        return frozenset(values)
+
+    except TypeError:
+        return values
@@ -0,0 +1,237 @@
+"""
+Prepared statement module.
+"""
+
+from collections.abc import Hashable
+from hashlib import blake2b
+from sys import version_info
+from threading import Lock
+from typing import Any
+
+if version_info >= (3, 12):
+    from typing import override  # pragma: no cover
+else:
+    from typing_extensions import override  # pragma: no cover
+
+
+class PreparedStatement:
+    """
+    Named server-side prepared statement of a converted criteria. Its name is derived from the statement text, so every
+    criteria with the same shape, converted with the same options, gets the same name and a connection can prepare it
+    once and execute it many times.
+
+    Example:
+    ```python
+    from criteria_pattern import Criteria, Filter, Operator
+    from criteria_pattern.converters import CriteriaToPostgresqlConverter
+
+    criteria = Criteria(filters=[Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18)])
+
+    statement = CriteriaToPostgresqlConverter.convert_prepared(criteria=criteria, table='user')
+    print(statement.prepare)
+    print(statement.execute)
+    # >>> PREPARE criteria_4cac8eb06cb309d0 AS SELECT * FROM "user" WHERE "age" >= $1;
+    # >>> [('EXECUTE criteria_4cac8eb06cb309d0 (%(parameter_0)s);', {'parameter_0': 18})]
+    ```
+    """
+
+    _name: str
+    _prepare: str
+    _execute: list[tuple[str, Any]]
+    _deallocate: str
+
+    def __init__(self, *, name: str, prepare: str, execute: list[tuple[str, Any]], deallocate: str) -> None:
+        """
+        PreparedStatement constructor.
+
+        Args:
+            name (str): Name of the prepared statement.
+            prepare (str): Statement that prepares the query on the connection.
+            execute (list[tuple[str, Any]]): Statements and their parameters that execute the prepared query, in order.
+            deallocate (str): Statement that deallocates the prepared query from the connection.
+        """
+        self._name = name
+        self._prepare = prepare
+        self._execute = execute
+        self._deallocate = deallocate
+
+    @classmethod
+    def name_of(cls, *, statement: str) -> str:
+        """
+        Get the deterministic name of a prepared statement from its text.
+
+        Args:
+            statement (str): Text of the statement to prepare.
+
+        Returns:
+            str: Name of the prepared statement, a valid identifier of 25 characters.
+        """
+        return f'criteria_{blake2b(statement.encode(), digest_size=8).hexdigest()}'
+
+    @override
+    def __repr__(self) -> str:
+        """
+        Get string representation of PreparedStatement.
+
+        Returns:
+            str: String representation of PreparedStatement.
+        """
+        return f'{self.__class__.__name__}(name={self._name!r}, prepare={self._prepare!r})'
+
+    @property
+    def name(self) -> str:
+        """
+        Get the name of the prepared statement.
+
+        Returns:
+            str: Name of the prepared statement.
+        """
+        return self._name
+
+    @property
+    def prepare(self) -> str:
+        """
+        Get the statement that prepares the query on the connection, it has no parameters.
+
+        Returns:
+            str: Prepare statement.
+        """
+        return self._prepare
+
+    @property
+    def execute(self) -> list[tuple[str, Any]]:
+        """
+        Get the statements that execute the prepared query with the criteria values, with the parameters to run each
+        of them with, in order. The last one returns the rows.
+
+        Returns:
+            list[tuple[str, Any]]: Execute statements and their parameters.
+        """
+        return self._execute
+
+    @property
+    def deallocate(self) -> str:
+        """
+        Get the statement that deallocates the prepared query from the connection, it has no parameters.
+
+        Returns:
+            str: Deallocate statement.
+        """
+        return self._deallocate
+
+
+class PreparedStatementRegistry:
+    """
+    In-process registry of the statements prepared on each connection, so each statement is only prepared once per
+    connection. Connections are identified by any hashable key, e.g. the connection object or its backend process id,
+    and they must be forgotten when they are closed, as their prepared statements are gone.
+
+    Example:
+    ```python
+    from criteria_pattern import Criteria, Filter, Operator
+    from criteria_pattern.converters import CriteriaToPostgresqlConverter, PreparedStatementRegistry
+
+    registry = PreparedStatementRegistry()
+    criteria = Criteria(filters=[Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18)])
+
+    statement = CriteriaToPostgresqlConverter.convert_prepared(criteria=criteria, table='user')
+    print(registry.register(connection='connection', statement=statement))
+    print(registry.register(connection='connection', statement=statement))
+    # >>> True
+    # >>> False
+    ```
+    """
+
+    _statements: dict[Hashable, set[str]]
+    _lock: Lock
+
+    def __init__(self) -> None:
+        """
+        PreparedStatementRegistry constructor.
+        """
+        self._statements = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        """
+        Get the number of connections with prepared statements.
+
+        Returns:
+            int: Number of connections.
+        """
+        return len(self._statements)
+
+    def register(self, *, connection: Hashable, statement: PreparedStatement) -> bool:
+        """
+        Register a statement as prepared on a connection.
+
+        Args:
+            connection (Hashable): Key of the connection.
+            statement (PreparedStatement): Prepared statement.
+
+        Returns:
+            bool: True if the statement was not prepared on the connection, so its prepare statement must be run, False
+            otherwise.
+        """
+        with self._lock:
+            statements = self._statements.setdefault(connection, set())
+            if statement.name in statements:
+                return False
+
+            statements.add(statement.name)
+
+            return True
+
+    def is_prepared(self, *, connection: Hashable, statement: PreparedStatement) -> bool:
+        """
+        Check whether a statement is prepared on a connection.
+
+        Args:
+            connection (Hashable): Key of the connection.
+            statement (PreparedStatement): Prepared statement.
+
+        Returns:
+            bool: True if the statement is prepared on the connection, False otherwise.
+        """
+        with self._lock:
+            return statement.name in self._statements.get(connection, ())
+
+    def prepared(self, *, connection: Hashable) -> frozenset[str]:
+        """
+        Get the names of the statements prepared on a connection.
+
+        Args:
+            connection (Hashable): Key of the connection.
+
+        Returns:
+            frozenset[str]: Names of the prepared statements.
+        """
+        with self._lock:
+            return frozenset(self._statements.get(connection, ()))
+
+    def discard(self, *, connection: Hashable, statement: PreparedStatement) -> None:
+        """
+        Remove a statement from a connection, e.g. if preparing it failed or it was deallocated.
+
+        Args:
+            connection (Hashable): Key of the connection.
+            statement (PreparedStatement): Prepared statement.
+        """
+        with self._lock:
+            statements = self._statements.get(connection)
+            if statements is None:
+                return
+
+            statements.discard(statement.name)
+            if not statements:
+                del self._statements[connection]
+
+    def forget(self, *, connection: Hashable) -> None:
+        """
+        Remove every statement of a connection, e.g. when it is closed.
+
+        Args:
+            connection (Hashable): Key of the connection.
+        """
+        with self._lock:
+            self._statements.pop(connection, None)
@@ -0,0 +1,169 @@
+"""
+Query cache module.
+"""
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from threading import Lock
+from typing import Any
+
+from criteria_pattern.errors import IntegrityError
+
+
+class QueryCache:
+    """
+    Bounded least recently used cache for compiled queries. When the cache is full, the least recently used entry is
+    evicted. Hits, misses and evictions are counted so the cache can be sized.
+
+    Example:
+    ```python
+    from criteria_pattern import Criteria, Filter, Operator
+    from criteria_pattern.converters import CriteriaToPostgresqlConverter, QueryCache
+
+    cache = QueryCache(max_size=512)
+    criteria = Criteria(filters=[Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18)])
+
+    query, parameters = CriteriaToPostgresqlConverter.convert(criteria=criteria, table='user', cache=cache)
+    query, parameters = CriteriaToPostgresqlConverter.convert(criteria=criteria, table='user', cache=cache)
+    print(cache.hits, cache.misses, cache.evictions)
+    # >>> 1 1 0
+    ```
+    """
+
+    _max_size: int
+    _entries: OrderedDict[Hashable, Any]
+    _lock: Lock
+    _hits: int
+    _misses: int
+    _evictions: int
+
+    def __init__(self, *, max_size: int = 1024) -> None:
+        """
+        QueryCache constructor.
+
+        Args:
+            max_size (int, optional): Maximum number of entries kept in the cache, must be >= 1. Default to 1024.
+
+        Raises:
+            IntegrityError: If `max_size` is not a positive integer.
+
+        Example:
+        ```python
+        from criteria_pattern.converters import QueryCache
+
+        cache = QueryCache(max_size=512)
+        print(cache.max_size)
+        # >>> 512
+        ```
+        """
+        if type(max_size) is not int or max_size < 1:
+            raise IntegrityError(message=f'QueryCache max_size <<<{max_size}>>> must be a positive integer.')
+
+        self._max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        """
+        Get the number of entries in the cache.
+
+        Returns:
+            int: Number of entries in the cache.
+        """
+        return len(self._entries)
+
+    def get(self, *, key: Hashable) -> Any | None:
+        """
+        Get an entry from the cache and mark it as the most recently used one.
+
+        Args:
+            key (Hashable): Key of the entry.
+
+        Returns:
+            Any | None: The cached entry, or None if the key is not in the cache.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+
+            return entry
+
+    def set(self, *, key: Hashable, value: Any) -> None:
+        """
+        Store an entry in the cache, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key (Hashable): Key of the entry.
+            value (Any): Entry to store, must not be None.
+
+        Raises:
+            IntegrityError: If `value` is None, as None is returned by `get` for the keys not in the cache.
+        """
+        if value is None:
+            raise IntegrityError(message=f'QueryCache value for key <<<{key}>>> must not be None.')
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+
+            if len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """
+        Remove all the entries from the cache and reset the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    @property
+    def max_size(self) -> int:
+        """
+        Get the maximum number of entries kept in the cache.
+
+        Returns:
+            int: Maximum number of entries.
+        """
+        return self._max_size
+
+    @property
+    def hits(self) -> int:
+        """
+        Get the number of lookups that found an entry.
+
+        Returns:
+            int: Number of cache hits.
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Get the number of lookups that did not find an entry.
+
+        Returns:
+            int: Number of cache misses.
+        """
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """
+        Get the number of entries evicted because the cache was full.
+
+        Returns:
+            int: Number of cache evictions.
+        """
+        return self._evictions
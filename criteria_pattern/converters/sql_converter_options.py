@@ -0,0 +1,71 @@
+"""
+SQL converter options module.
+"""
+
+from collections.abc import Mapping, Sequence
+from typing import Any, TypedDict
+
+from criteria_pattern import Direction, Operator
+
+from .converter_policy import ConverterPolicy
+
+
+class SqlFilterOptions(TypedDict, total=False):
+    """
+    Keyword arguments shared by the SQL converters methods that only use the criteria filters, e.g. `convert_count`.
+    They have the same meaning and defaults as the arguments of the converter `convert` method.
+    """
+
+    columns_mapping: Mapping[str, str] | None
+    check_table_injection: bool
+    check_criteria_injection: bool
+    check_operator_injection: bool
+    valid_tables: Sequence[str] | None
+    valid_columns: Sequence[str] | None
+    valid_operators: Sequence[Operator] | None
+    policy: ConverterPolicy | None
+    detect_contradictions: bool
+    push_down_negations: bool
+    optimize: bool
+
+
+class SqlSelectOptions(SqlFilterOptions, total=False):
+    """
+    Keyword arguments shared by the SQL converters methods that select columns and paginate, e.g. `convert_many`. They
+    have the same meaning and defaults as the arguments of the converter `convert` method.
+    """
+
+    columns: Sequence[str] | None
+    check_column_injection: bool
+    check_direction_injection: bool
+    check_pagination_bounds: bool
+    valid_directions: Sequence[Direction] | None
+    max_page_size: int
+    max_page_number: int
+
+
+class SqlQueryOptions(SqlSelectOptions, total=False):
+    """
+    Keyword arguments shared by the SQL converters methods that convert a single page, e.g. `convert_page_with_total`.
+    They have the same meaning and defaults as the arguments of the converter `convert` method.
+    """
+
+    keyset: Sequence[Any] | None
+
+
+def validate_options(*, method: str, options: Mapping[str, Any], valid_options: frozenset[str]) -> None:
+    """
+    Validate the keyword arguments of a SQL converter method, so a misspelled option, e.g. a check flag, is not
+    silently ignored.
+
+    Args:
+        method (str): Name of the converter method.
+        options (Mapping[str, Any]): Keyword arguments of the method.
+        valid_options (frozenset[str]): Names of the options supported by the method.
+
+    Raises:
+        TypeError: If an option is not supported by the method.
+    """
+    for option in options:
+        if option not in valid_options:
+            raise TypeError(f'{method}() got an unexpected keyword argument {option!r}')
@@ -2,10 +2,11 @@
 Url to criteria converter.
 """
 
-from collections.abc import Mapping, Sequence
+from collections.abc import Hashable, Mapping, Sequence
+from copy import copy
 from re import Pattern, compile as re_compile
 from typing import Any, ClassVar
-from urllib.parse import parse_qs, unquote_plus, urlparse
+from urllib.parse import unquote_plus
 
 from criteria_pattern import Criteria, Direction, Filter, Operator, Order
 from criteria_pattern.errors import (
@@ -16,6 +17,9 @@ from criteria_pattern.errors import (
     PaginationBoundsError,
 )
 
+from .converter_policy import ConverterPolicy
+from .query_cache import QueryCache
+
 
 class UrlToCriteriaConverter:
     """
@@ -61,8 +65,8 @@ class UrlToCriteriaConverter:
     }
 
     _MAX_FIELDS: ClassVar[int] = 100
-    _FILTERS_REGEX: ClassVar[Pattern[str]] = re_compile(pattern=r'^filters\[(\w+)]\[(\w+)]$')
-    _ORDERS_REGEX: ClassVar[Pattern[str]] = re_compile(pattern=r'^orders\[(\w+)]\[(\w+)]$')
+    _MAX_URL_LENGTH: ClassVar[int] = 65536
+    _PARAMETER_REGEX: ClassVar[Pattern[str]] = re_compile(pattern=r'(filters|orders)\[(\w+)]\[(\w+)]')
 
     @classmethod
     def convert(
@@ -79,6 +83,8 @@ class UrlToCriteriaConverter:
         valid_directions: Sequence[Direction] | None = None,
         max_page_size: int = 10000,
         max_page_number: int = 1000000,
+        policy: ConverterPolicy | None = None,
+        cache: QueryCache | None = None,
     ) -> Criteria:
         """
         Converts an URL query string into a Criteria object.
@@ -95,8 +101,15 @@ class UrlToCriteriaConverter:
             valid_directions (Sequence[Direction], optional): A list of valid directions. Default to empty list.
             max_page_size (int, optional): Maximum allowed page_size to prevent integer overflow. Default to 10000.
             max_page_number (int, optional): Maximum allowed page_number to prevent integer overflow. Default to 1000000.
+            policy (ConverterPolicy | None, optional): Precompiled policy to validate the criteria against,
+            independently of the check flags. Default to None (no policy).
+            cache (QueryCache | None, optional): Cache of converted criteria keyed by the query string and the
+            conversion options. On a hit a copy of the cached criteria is returned without parsing or validating it
+            again, so the callers can modify it, e.g. `clean_pagination`, without affecting the cache. Only valid
+            criteria are cached. Default to None (no cache).
 
         Raises:
+            IntegrityError: If the url exceeds the maximum length.
             IntegrityError: If the filter index is not an integer.
             IntegrityError: If the filter has missing field.
             IntegrityError: If the filter has missing operator.
@@ -111,6 +124,10 @@ class UrlToCriteriaConverter:
             InvalidOperatorError: If an invalid operator is found in filters.
             InvalidDirectionError: If an invalid direction is found in orders.
             PaginationBoundsError: If pagination parameters exceed maximum bounds.
+            InvalidColumnError: If a field is not in the policy valid columns (only if policy is given).
+            InvalidOperatorError: If an operator is not in the policy valid operators (only if policy is given).
+            InvalidDirectionError: If a direction is not in the policy valid directions (only if policy is given).
+            PaginationBoundsError: If pagination parameters exceed the policy bounds (only if policy is given).
 
         Example:
         ```python
@@ -127,12 +144,32 @@ class UrlToCriteriaConverter:
         valid_operators = valid_operators or []
         valid_directions = valid_directions or []
 
-        query_params = parse_qs(qs=urlparse(url=url).query, keep_blank_values=True)
+        query = cls._query_string(url=url)
+        key: Hashable = None
+        if cache is not None:
+            key = (
+                query,
+                tuple(sorted(fields_mapping.items())),
+                check_field_injection,
+                check_operator_injection,
+                check_direction_injection,
+                check_pagination_bounds,
+                tuple(valid_fields) if check_field_injection else None,
+                tuple(valid_operators) if check_operator_injection else None,
+                tuple(valid_directions) if check_direction_injection else None,
+                (max_page_size, max_page_number) if check_pagination_bounds else None,
+                policy,
+            )
+            cached: Criteria | None = cache.get(key=key)
+            if cached is not None:
+                return copy(cached)
+
+        filters_bucket, orders_bucket, raw_page_size, raw_page_number = cls._tokenize(query=query)
 
-        filters = cls._parse_filters(query_parameters=query_params, fields_mapping=fields_mapping)
-        orders = cls._parse_orders(query_parameters=query_params, fields_mapping=fields_mapping)
-        page_size = cls._parse_page_size(query_parameters=query_params)
-        page_number = cls._parse_page_number(query_parameters=query_params)
+        filters = cls._parse_filters(bucket=filters_bucket, fields_mapping=fields_mapping)
+        orders = cls._parse_orders(bucket=orders_bucket, fields_mapping=fields_mapping)
+        page_size = cls._parse_page_parameter(raw_value=raw_page_size)
+        page_number = cls._parse_page_parameter(raw_value=raw_page_number)
 
         criteria = Criteria(
             filters=filters or None,
@@ -157,24 +194,132 @@ class UrlToCriteriaConverter:
                 max_page_number=max_page_number,
             )
 
+        if policy is not None:
+            policy.validate_criteria(criteria=criteria)
+
+        if cache is not None:
+            cache.set(key=key, value=copy(criteria))
+
         return criteria
 
     @classmethod
-    def _parse_filters(  # noqa: C901
+    def _query_string(cls, *, url: str) -> str:
+        """
+        Get the query string of the URL, without its fragment. As with `urllib.parse.urlparse`, tabs and newlines are
+        removed.
+
+        Args:
+            url (str): The URL containing the query string.
+
+        Raises:
+            IntegrityError: If the url exceeds the maximum length.
+
+        Returns:
+            str: The query string.
+        """
+        if len(url) > cls._MAX_URL_LENGTH:
+            raise IntegrityError(message=f'UrlToCriteriaConverter url length <<<{len(url)}>>> exceeds maximum limit of <<<{cls._MAX_URL_LENGTH}>>>.')  # noqa: E501  # fmt: skip
+
+        if '\t' in url or '\r' in url or '\n' in url:
+            url = url.replace('\t', '').replace('\r', '').replace('\n', '')
+
+        return url.partition('#')[0].partition('?')[2]
+
+    @classmethod
+    def _tokenize(
+        cls,
+        *,
+        query: str,
+    ) -> tuple[dict[tuple[str, str], str], dict[tuple[str, str], str], str | None, str | None]:
+        """
+        Tokenize the query string in a single scan. Every `filters[index][key]` and `orders[index][key]`
+        parameter is stored in its bucket keyed by its raw index and key, and the `page_size` and `page_number`
+        parameters are returned raw. As with `urllib.parse.parse_qs`, names and values are decoded (only if they
+        contain escapes), the first occurrence of a parameter wins and unknown parameters are ignored.
+
+        Args:
+            query (str): The query string.
+
+        Returns:
+            tuple[dict[tuple[str, str], str], dict[tuple[str, str], str], str | None, str | None]: The filters bucket,
+            the orders bucket, the raw page size and the raw page number.
+        """
+        filters: dict[tuple[str, str], str] = {}
+        orders: dict[tuple[str, str], str] = {}
+        page_size: str | None = None
+        page_number: str | None = None
+
+        for parameter in query.split('&'):
+            name, _, value = parameter.partition('=')
+            if '%' in name or '+' in name:
+                name = unquote_plus(string=name)
+
+            if '%' in value or '+' in value:
+                value = unquote_plus(string=value)
+
+            match = cls._PARAMETER_REGEX.fullmatch(string=name)
+            if match is None:
+                if name == 'page_size' and page_size is None:
+                    page_size = value
+
+                elif name == 'page_number' and page_number is None:
+                    page_number = value
+
+                continue
+
+            kind, index_string, key = match.groups()
+            (filters if kind == 'filters' else orders).setdefault((index_string, key), value)
+
+        return filters, orders, page_size, page_number
+
+    @classmethod
+    def _index_bucket(cls, *, bucket: Mapping[tuple[str, str], str], kind: str) -> dict[int, dict[str, str]]:
+        """
+        Group a tokenized bucket by integer index, raw indexes with the same value, e.g. '0' and '00', are merged.
+
+        Args:
+            bucket (Mapping[tuple[str, str], str]): The query parameters, keyed by raw index and key.
+            kind (str): The kind of the parameters, 'filter' or 'order'.
+
+        Raises:
+            IntegrityError: If an index is not an integer.
+            IntegrityError: If an index exceeds the maximum number of fields.
+
+        Returns:
+            dict[int, dict[str, str]]: The query parameters, keyed by index and key.
+        """
+        indexed: dict[int, dict[str, str]] = {}
+        for (index_string, key), value in bucket.items():
+            try:
+                index = int(index_string)
+
+            except ValueError as exception:
+                raise IntegrityError(message=f'UrlToCriteriaConverter {kind} <<<{kind}s[{index_string}]>>> must be an integer.') from exception  # noqa: E501  # fmt: skip
+
+            if index >= cls._MAX_FIELDS:
+                raise IntegrityError(message=f'UrlToCriteriaConverter {kind} <<<{kind}s[{index}]>>> exceeds maximum limit of <<<{cls._MAX_FIELDS}>>>.')  # noqa: E501  # fmt: skip
+
+            indexed.setdefault(index, {})[key] = value
+
+        return indexed
+
+    @classmethod
+    def _parse_filters(
         cls,
         *,
-        query_parameters: Mapping[str, Sequence[str]],
+        bucket: Mapping[tuple[str, str], str],
         fields_mapping: Mapping[str, str],
     ) -> list[Filter[Any]]:
         """
         Parse the 'filters' query parameters.
 
         Args:
-            query_parameters (Mapping[str, Sequence[str]]): The query parameters from the URL.
+            bucket (Mapping[tuple[str, str], str]): The filters query parameters, keyed by raw index and key.
             fields_mapping (Mapping[str, str]): The mapping of external to internal field names.
 
         Raises:
             IntegrityError: If the filter index is not an integer.
+            IntegrityError: If the filter index exceeds the maximum number of fields.
             IntegrityError: If the filter has missing field.
             IntegrityError: If the filter has missing operator.
             IntegrityError: If the filter has unsupported operator.
@@ -184,35 +329,18 @@ class UrlToCriteriaConverter:
             list[Filter]: The parsed list of filter criteria.
         """
         filters: list[Filter[Any]] = []
-        bucket: dict[int, dict[str, str]] = {}
-
-        for name, values in query_parameters.items():
-            match = cls._FILTERS_REGEX.match(string=name)
-            if not match or not values:
-                continue
+        indexed = cls._index_bucket(bucket=bucket, kind='filter')
 
-            index_string, key = match.groups()
-            try:
-                index = int(index_string)
-
-            except ValueError as exception:
-                raise IntegrityError(message=f'UrlToCriteriaConverter filter <<<filters[{index_string}]>>> must be an integer.') from exception  # noqa: E501  # fmt: skip
-
-            if index >= cls._MAX_FIELDS:
-                raise IntegrityError(message=f'UrlToCriteriaConverter filter <<<filters[{index}]>>> exceeds maximum limit of <<<{cls._MAX_FIELDS}>>>.')  # noqa: E501  # fmt: skip
-
-            bucket.setdefault(index, {})[key] = values[0]
-
-        for idx in sorted(bucket):
-            field_name = bucket[idx].get('field')
+        for idx in sorted(indexed):
+            field_name = indexed[idx].get('field')
             if field_name is None:
                 raise IntegrityError(message=f'UrlToCriteriaConverter filter <<<filters[{idx}]>>> has missing field.')
 
-            operator_raw = bucket[idx].get('operator')
+            operator_raw = indexed[idx].get('operator')
             if operator_raw is None:
                 raise IntegrityError(message=f'UrlToCriteriaConverter filter <<<filters[{idx}]>>> has missing operator.')  # noqa: E501  # fmt: skip
 
-            value_raw = bucket[idx].get('value')
+            value_raw = indexed[idx].get('value')
             if value_raw is None:
                 raise IntegrityError(message=f'UrlToCriteriaConverter filter <<<filters[{idx}]>>> has missing value.')
 
@@ -254,7 +382,9 @@ class UrlToCriteriaConverter:
         if raw_value is None:
             raise IntegrityError(message='UrlToCriteriaConverter filter has missing value.')  # pragma: no cover
 
-        raw_value = unquote_plus(string=raw_value)
+        if '%' in raw_value or '+' in raw_value:
+            raw_value = unquote_plus(string=raw_value)
+
         if operator in (Operator.BETWEEN, Operator.NOT_BETWEEN):
             parts = [part.strip() for part in raw_value.split(',')]
             if len(parts) != 2:
@@ -310,18 +440,19 @@ class UrlToCriteriaConverter:
     def _parse_orders(
         cls,
         *,
-        query_parameters: Mapping[str, Sequence[str]],
+        bucket: Mapping[tuple[str, str], str],
         fields_mapping: Mapping[str, str],
     ) -> list[Order]:
         """
         Parse the 'orders' query parameters.
 
         Args:
-            query_parameters (Mapping[str, Sequence[str]]): The query parameters from the URL.
+            bucket (Mapping[tuple[str, str], str]): The orders query parameters, keyed by raw index and key.
             fields_mapping (Mapping[str, str]): The mapping of external to internal field names.
 
         Raises:
             IntegrityError: If the order index is not an integer.
+            IntegrityError: If the order index exceeds the maximum number of fields.
             IntegrityError: If the order has missing field.
             IntegrityError: If the order has missing direction.
             IntegrityError: If the order has unsupported direction.
@@ -330,31 +461,14 @@ class UrlToCriteriaConverter:
             list[Order]: The parsed list of order criteria.
         """
         orders: list[Order] = []
-        bucket: dict[int, dict[str, str]] = {}
-
-        for name, values in query_parameters.items():
-            match = cls._ORDERS_REGEX.match(string=name)
-            if not match or not values:
-                continue
-
-            index_string, key = match.groups()
-            try:
-                index = int(index_string)
-
-            except ValueError as exception:
-                raise IntegrityError(message=f'UrlToCriteriaConverter order <<<orders[{index_string}]>>> must be an integer.') from exception  # noqa: E501  # fmt: skip
-
-            if index >= cls._MAX_FIELDS:
-                raise IntegrityError(message=f'UrlToCriteriaConverter order <<<orders[{index}]>>> exceeds maximum limit of <<<{cls._MAX_FIELDS}>>>.')  # noqa: E501  # fmt: skip
-
-            bucket.setdefault(index, {})[key] = values[0]
+        indexed = cls._index_bucket(bucket=bucket, kind='order')
 
-        for idx in sorted(bucket):
-            field_name = bucket[idx].get('field')
+        for idx in sorted(indexed):
+            field_name = indexed[idx].get('field')
             if field_name is None:
                 raise IntegrityError(message=f'UrlToCriteriaConverter order <<<orders[{idx}]>>> has missing field.')
 
-            direction_raw = bucket[idx].get('direction')
+            direction_raw = indexed[idx].get('direction')
             if direction_raw is None:
                 raise IntegrityError(message=f'UrlToCriteriaConverter order <<<orders[{idx}]>>> has missing direction.')
 
@@ -368,47 +482,25 @@ class UrlToCriteriaConverter:
 
         return orders
 
-    @classmethod
-    def _parse_page_number(cls, *, query_parameters: Mapping[str, Sequence[str]]) -> int | None:
-        """
-        Parse the 'page_number' query parameter.
-
-        Args:
-            query_parameters (Mapping[str, Sequence[str]]): The query parameters from the URL.
-
-        Returns:
-            int | None: The parsed page number or None if not present.
-        """
-        values = query_parameters.get('page_number')
-        if not values:
-            return None
-
-        try:
-            return int(values[0])
-
-        except ValueError:
-            return values[0]  # type: ignore[return-value]
-
-    @classmethod
-    def _parse_page_size(cls, *, query_parameters: Mapping[str, Sequence[str]]) -> int | None:
+    @staticmethod
+    def _parse_page_parameter(*, raw_value: str | None) -> int | None:
         """
-        Parse the 'page_size' query parameter.
+        Parse the 'page_size' or 'page_number' query parameter.
 
         Args:
-            query_parameters (Mapping[str, Sequence[str]]): The query parameters from the URL.
+            raw_value (str | None): The raw value from the query parameter.
 
         Returns:
-            int | None: The parsed page size or None if not present.
+            int | None: The parsed value or None if not present.
         """
-        values = query_parameters.get('page_size')
-        if not values:
+        if raw_value is None:
             return None
 
         try:
-            return int(values[0])
+            return int(raw_value)
 
         except ValueError:
-            return values[0]  # type: ignore[return-value]
+            return raw_value  # type: ignore[return-value]
 
     @classmethod
     def _validate_fields(cls, *, criteria: Criteria, valid_fields: Sequence[str]) -> None:
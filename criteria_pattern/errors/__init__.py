@@ -1,9 +1,22 @@
-from .integrity_error import IntegrityError
-from .invalid_column_error import InvalidColumnError
-from .invalid_direction_error import InvalidDirectionError
-from .invalid_operator_error import InvalidOperatorError
-from .invalid_table_error import InvalidTableError
-from .pagination_bounds_error import PaginationBoundsError
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .integrity_error import IntegrityError
+    from .invalid_column_error import InvalidColumnError
+    from .invalid_direction_error import InvalidDirectionError
+    from .invalid_operator_error import InvalidOperatorError
+    from .invalid_table_error import InvalidTableError
+    from .pagination_bounds_error import PaginationBoundsError
+
+_LAZY_ATTRIBUTES = {
+    'IntegrityError': '.integrity_error',
+    'InvalidColumnError': '.invalid_column_error',
+    'InvalidDirectionError': '.invalid_direction_error',
+    'InvalidOperatorError': '.invalid_operator_error',
+    'InvalidTableError': '.invalid_table_error',
+    'PaginationBoundsError': '.pagination_bounds_error',
+}
 
 __all__ = (
     'IntegrityError',
@@ -13,3 +26,37 @@ __all__ = (
     'InvalidTableError',
     'PaginationBoundsError',
 )
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the errors on first access, so importing the package does not import the models, that some errors
+    depend on, when only the integrity error is used.
+
+    Args:
+        name (str): Attribute name.
+
+    Raises:
+        AttributeError: If the attribute does not exist.
+
+    Returns:
+        Any: Attribute value.
+    """
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    """
+    List the package attributes, including the ones not imported yet.
+
+    Returns:
+        list[str]: Attribute names.
+    """
+    return sorted({*globals(), *__all__})
@@ -2,6 +2,18 @@
 Criteria pattern base error.
 """
 
+from __future__ import annotations
+
+from sys import version_info
+
+if version_info >= (3, 12):
+    from typing import override  # pragma: no cover
+else:
+    from typing_extensions import override  # pragma: no cover
+
+from collections.abc import Callable
+from typing import Any
+
 
 class CriteriaPatternBaseError(Exception):
     """
@@ -21,6 +33,18 @@ class CriteriaPatternBaseError(Exception):
 
         super().__init__(message)
 
+    @override
+    def __reduce__(self) -> tuple[Callable[..., CriteriaPatternBaseError], tuple[Any, ...]]:
+        """
+        Pickle the error as its attributes, as the constructors only take keyword arguments, so errors raised in other
+        processes can be re-raised.
+
+        Returns:
+            tuple[Callable[..., CriteriaPatternBaseError], tuple[Any, ...]]: Function that restores the error and its
+            arguments.
+        """
+        return _restore_error, (self.__class__, self.__dict__)
+
     @property
     def message(self) -> str:
         """
@@ -30,3 +54,21 @@ class CriteriaPatternBaseError(Exception):
             str: Exception message.
         """
         return self._message  # pragma: no cover
+
+
+def _restore_error(cls: type[CriteriaPatternBaseError], attributes: dict[str, Any]) -> CriteriaPatternBaseError:
+    """
+    Restore a pickled error without calling its constructor.
+
+    Args:
+        cls (type[CriteriaPatternBaseError]): Error class.
+        attributes (dict[str, Any]): Attributes of the error.
+
+    Returns:
+        CriteriaPatternBaseError: Restored error.
+    """
+    error = cls.__new__(cls)
+    error.__dict__.update(attributes)
+    error.args = (error._message,)
+
+    return error
@@ -0,0 +1,38 @@
+"""
+Canonical value module.
+"""
+
+from typing import Any
+
+
+def canonical_value(*, value: Any) -> Any:
+    """
+    Get a representation of a filter value that does not depend on the process, so it can be fingerprinted and
+    compared. Values of different types never have the same representation, e.g. `1`, `1.0` and `True`, and the items
+    of sets and dictionaries are sorted.
+
+    Args:
+        value (Any): Filter value.
+
+    Returns:
+        Any: Canonical representation of the value.
+
+    Example:
+    ```python
+    from criteria_pattern.models.canonical import canonical_value
+
+    print(canonical_value(value=[1, 'a']))
+    # >>> ('list', (('int', 1), ('str', 'a')))
+    ```
+    """
+    if isinstance(value, list | tuple):
+        return (type(value).__name__, tuple(canonical_value(value=item) for item in value))
+
+    if isinstance(value, set | frozenset):
+        return (type(value).__name__, tuple(sorted((canonical_value(value=item) for item in value), key=repr)))
+
+    if isinstance(value, dict):
+        items = ((canonical_value(value=key), canonical_value(value=item)) for key, item in value.items())
+        return (type(value).__name__, tuple(sorted(items, key=repr)))
+
+    return (type(value).__name__, value)
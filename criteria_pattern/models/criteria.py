@@ -11,18 +11,24 @@ if version_info >= (3, 12):
 else:
     from typing_extensions import override  # pragma: no cover
 
-from typing import Any
+from collections.abc import Callable, Iterator, Sequence
+from hashlib import blake2b
+from typing import Any, ClassVar, NoReturn, TypeVar, cast
 
 from value_object_pattern.models import BaseModel
 
 from criteria_pattern.errors import IntegrityError
 
-from .filter import Filter
+from .canonical import canonical_value
+from .filter import Filter, Operator
 from .filters import Filters
 from .order import Order
 from .orders import Orders
 from .page_number import PageNumber
 from .page_size import PageSize
+from .trusted import trusted_value_object
+
+T = TypeVar('T')
 
 
 class Criteria(BaseModel):
@@ -39,10 +45,26 @@ class Criteria(BaseModel):
     ```
     """  # noqa: E501
 
+    __slots__ = (
+        '_cached_filters',
+        '_cached_leaves',
+        '_cached_orders',
+        '_fingerprint',
+        '_fingerprints_generation',
+        '_shape_fingerprint',
+    )
+
     _filters: Filters
     _orders: Orders
     _page_size: PageSize | None
     _page_number: PageNumber | None
+    _cached_filters: _ReadOnlyList[Filter[Any]] | None
+    _cached_orders: _ReadOnlyList[Order] | None
+    _cached_leaves: tuple[Criteria, ...] | None
+    _shape_fingerprint: str | None
+    _fingerprint: str | None
+    _fingerprints_generation: int
+    _generation: ClassVar[int] = 0
 
     def __init__(
         self,
@@ -80,6 +102,89 @@ class Criteria(BaseModel):
         self._orders = Orders(value=orders if orders is not None else [], title='Criteria', parameter='orders')
         self._page_size = PageSize(value=page_size, title='Criteria', parameter='page_size') if page_size is not None else None  # noqa: E501  # fmt: skip
         self._page_number = PageNumber(value=page_number, title='Criteria', parameter='page_number') if page_number is not None else None  # noqa: E501  # fmt: skip
+        self._init_caches()
+
+    @classmethod
+    def from_trusted(
+        cls,
+        *,
+        filters: list[Filter[Any]] | None = None,
+        orders: list[Order] | None = None,
+        page_size: int | None = None,
+        page_number: int | None = None,
+    ) -> Criteria:
+        """
+        Create a Criteria from already validated data, e.g. internal configuration, skipping the filters, orders and
+        pagination validation chains. Combined with `Filter.trusted` and `Order.trusted`, no value object is validated
+        at all. The resulting Criteria is fully compatible with (and equal to) one created through the constructor, but
+        no error is raised if the data is invalid, so never use it with untrusted input.
+
+        Args:
+            filters (list[Filter[Any]] | None, optional): List of filters. Defaults to [].
+            orders (list[Order] | None, optional): List of orders. Defaults to [].
+            page_size (int | None, optional): Page size for pagination, must be >= 1. Defaults to None.
+            page_number (int | None, optional): Page number for pagination, must be >= 1. Defaults to None.
+
+        Returns:
+            Criteria: Criteria created without validation.
+
+        Example:
+        ```python
+        from criteria_pattern import Criteria, Filter, Operator
+
+        criteria = Criteria.from_trusted(filters=[Filter.trusted(field='name', operator=Operator.EQUAL, value='John')])
+        print(criteria == Criteria(filters=[Filter(field='name', operator=Operator.EQUAL, value='John')]))
+        # >>> True
+        ```
+        """
+        criteria = cls.__new__(cls)
+        criteria._filters = trusted_value_object(cls=Filters, value=filters if filters is not None else [], title='Criteria', parameter='filters')  # noqa: E501  # fmt: skip
+        criteria._orders = trusted_value_object(cls=Orders, value=orders if orders is not None else [], title='Criteria', parameter='orders')  # noqa: E501  # fmt: skip
+        criteria._page_size = trusted_value_object(cls=PageSize, value=page_size, title='Criteria', parameter='page_size') if page_size is not None else None  # noqa: E501  # fmt: skip
+        criteria._page_number = trusted_value_object(cls=PageNumber, value=page_number, title='Criteria', parameter='page_number') if page_number is not None else None  # noqa: E501  # fmt: skip
+        criteria._init_caches()
+
+        return criteria
+
+    @override
+    def __reduce__(self) -> tuple[Callable[..., Criteria], tuple[Any, ...]]:
+        """
+        Pickle the criteria as its filters, orders and pagination instead of its value objects, so it is smaller and
+        faster to pickle, and the cached fingerprints are not pickled.
+
+        Returns:
+            tuple[Callable[..., Criteria], tuple[Any, ...]]: Function that restores the criteria and its arguments.
+        """
+        return _restore_criteria, (self.__class__, self.filters, self.orders, self.page_size, self.page_number)
+
+    @override
+    def __copy__(self) -> Criteria:
+        """
+        Return a shallow clone of the criteria, the cached views and fingerprints are not copied.
+
+        Returns:
+            Criteria: A shallow clone of the criteria.
+        """
+        clone = cast('Criteria', super().__copy__())
+        clone._init_caches()
+
+        return clone
+
+    @override
+    def __deepcopy__(self, memo: dict[int, Any]) -> Criteria:
+        """
+        Return a deep clone of the criteria, the cached views and fingerprints are not copied.
+
+        Args:
+            memo (dict[int, Any]): Dictionary of id's to already copied objects to avoid infinite recursion.
+
+        Returns:
+            Criteria: A deep clone of the criteria.
+        """
+        clone = cast('Criteria', super().__deepcopy__(memo))
+        clone._init_caches()
+
+        return clone
 
     def __and__(self, criteria: Criteria) -> AndCriteria:
         """
@@ -243,6 +348,82 @@ class Criteria(BaseModel):
         """  # noqa: E501
         return ~self
 
+    @classmethod
+    def all_of(cls, *, criteria: Sequence[Criteria]) -> Criteria:
+        """
+        Combine any number of criteria with AND operator into a single n-ary AndCriteria. Unlike chaining the `&`
+        operator, nested AndCriteria are flattened into one node, so the tree does not grow in depth.
+
+        Args:
+            criteria (Sequence[Criteria]): Criteria to combine.
+
+        Raises:
+            IntegrityError: If no criteria is provided.
+
+        Returns:
+            Criteria: Combined criteria, or the criteria itself if only one is provided.
+
+        Example:
+        ```python
+        from criteria_pattern import Criteria, Filter, Operator
+
+        criteria = Criteria.all_of(
+            criteria=[
+                Criteria(filters=[Filter(field='name', operator=Operator.EQUAL, value='John')]),
+                Criteria(filters=[Filter(field='age', operator=Operator.GREATER, value=18)]),
+                Criteria(filters=[Filter(field='email', operator=Operator.ENDS_WITH, value='@gmail.com')]),
+            ]
+        )
+        print(type(criteria).__name__, len(criteria.filters))
+        # >>> AndCriteria 3
+        ```
+        """
+        if not criteria:
+            raise IntegrityError(message='Criteria all_of requires at least one criteria.')
+
+        if len(criteria) == 1:
+            return criteria[0]
+
+        return AndCriteria._from_children(children=criteria)
+
+    @classmethod
+    def any_of(cls, *, criteria: Sequence[Criteria]) -> Criteria:
+        """
+        Combine any number of criteria with OR operator into a single n-ary OrCriteria. Unlike chaining the `|`
+        operator, nested OrCriteria are flattened into one node, so the tree does not grow in depth.
+
+        Args:
+            criteria (Sequence[Criteria]): Criteria to combine.
+
+        Raises:
+            IntegrityError: If no criteria is provided.
+
+        Returns:
+            Criteria: Combined criteria, or the criteria itself if only one is provided.
+
+        Example:
+        ```python
+        from criteria_pattern import Criteria, Filter, Operator
+
+        criteria = Criteria.any_of(
+            criteria=[
+                Criteria(filters=[Filter(field='email', operator=Operator.ENDS_WITH, value='@gmail.com')]),
+                Criteria(filters=[Filter(field='email', operator=Operator.ENDS_WITH, value='@yahoo.com')]),
+                Criteria(filters=[Filter(field='email', operator=Operator.ENDS_WITH, value='@outlook.com')]),
+            ]
+        )
+        print(type(criteria).__name__, len(criteria.filters))
+        # >>> OrCriteria 3
+        ```
+        """
+        if not criteria:
+            raise IntegrityError(message='Criteria any_of requires at least one criteria.')
+
+        if len(criteria) == 1:
+            return criteria[0]
+
+        return OrCriteria._from_children(children=criteria)
+
     @property
     def filters(self) -> list[Filter[Any]]:
         """
@@ -413,19 +594,177 @@ class Criteria(BaseModel):
         """
         self._page_size = None
         self._page_number = None
+        Criteria._generation += 1
 
         return self
 
+    def shape_fingerprint(self) -> str:
+        """
+        Get the shape fingerprint of the criteria. The shape fingerprint identifies the structure of the criteria
+        (logical tree, filter fields and operators, IN-list lengths, orders and pagination presence) regardless of the
+        filter and pagination values. It is stable across processes and cached on the instance.
+
+        Returns:
+            str: Hexadecimal shape fingerprint.
+
+        Example:
+        ```python
+        from criteria_pattern import Criteria, Filter, Operator
+
+        criteria1 = Criteria(filters=[Filter(field='name', operator=Operator.EQUAL, value='John')])
+        criteria2 = Criteria(filters=[Filter(field='name', operator=Operator.EQUAL, value='Jane')])
+        print(criteria1.shape_fingerprint() == criteria2.shape_fingerprint())
+        # >>> True
+        ```
+        """
+        self._check_fingerprints_generation()
+        fingerprint = self._shape_fingerprint
+        if fingerprint is None:
+            fingerprint = self._compute_fingerprint(include_values=False)
+            self._shape_fingerprint = fingerprint
+
+        return fingerprint
+
+    def fingerprint(self) -> str:
+        """
+        Get the fingerprint of the criteria. Unlike the shape fingerprint, it also identifies the filter and pagination
+        values. It is stable across processes and cached on the instance.
+
+        Returns:
+            str: Hexadecimal fingerprint.
+
+        Example:
+        ```python
+        from criteria_pattern import Criteria, Filter, Operator
+
+        criteria1 = Criteria(filters=[Filter(field='name', operator=Operator.EQUAL, value='John')])
+        criteria2 = Criteria(filters=[Filter(field='name', operator=Operator.EQUAL, value='Jane')])
+        print(criteria1.fingerprint() == criteria2.fingerprint())
+        # >>> False
+        ```
+        """
+        self._check_fingerprints_generation()
+        fingerprint = self._fingerprint
+        if fingerprint is None:
+            fingerprint = self._compute_fingerprint(include_values=True)
+            self._fingerprint = fingerprint
+
+        return fingerprint
+
+    def _compute_fingerprint(self, *, include_values: bool) -> str:
+        """
+        Compute the fingerprint of the criteria walking the logical tree.
+
+        Args:
+            include_values (bool): Whether the filter and pagination values are part of the fingerprint.
+
+        Returns:
+            str: Hexadecimal fingerprint.
+        """
+        tokens: list[tuple[Any, ...]] = []
+        stack: list[Criteria] = [self]
+
+        while stack:
+            criteria = stack.pop()
+            if isinstance(criteria, AndCriteria | OrCriteria):
+                tokens.append((criteria.__class__.__name__, len(criteria.children)))
+                stack.extend(reversed(criteria.children))
+                continue
+
+            if isinstance(criteria, NotCriteria):
+                tokens.append((criteria.__class__.__name__, 1))
+                stack.append(criteria.criteria)
+                continue
+
+            page_size = criteria.page_size if include_values else criteria.page_size is not None
+            page_number = criteria.page_number if include_values else criteria.page_number is not None
+            tokens.append((criteria.__class__.__name__, len(criteria.filters), len(criteria.orders), page_size, page_number))  # noqa: E501  # fmt: skip
+            for filter in criteria.filters:
+                if include_values:
+                    tokens.append((filter.field, filter.operator, canonical_value(value=filter.value)))
+
+                elif filter.operator in (Operator.IN, Operator.NOT_IN):
+                    tokens.append((filter.field, filter.operator, len(filter.value)))
+
+                else:
+                    tokens.append((filter.field, filter.operator))
+
+            tokens.extend((order.field, order.direction) for order in criteria.orders)
+
+        return blake2b(repr(tokens).encode(), digest_size=16).hexdigest()
+
+    def _nodes(self) -> Iterator[Criteria]:
+        """
+        Iterate over all the nodes of the logical tree in depth-first order, without recursion.
+
+        Returns:
+            Iterator[Criteria]: Nodes of the logical tree, starting with this criteria.
+        """
+        stack: list[Criteria] = [self]
+        while stack:
+            criteria = stack.pop()
+            yield criteria
+
+            if isinstance(criteria, AndCriteria | OrCriteria):
+                stack.extend(reversed(criteria.children))
+
+            elif isinstance(criteria, NotCriteria):
+                stack.append(criteria.criteria)
+
+    def _leaves(self) -> tuple[Criteria, ...]:
+        """
+        Get the plain criteria at the leaves of the logical tree in depth-first order, they are computed once and
+        cached.
+
+        Returns:
+            tuple[Criteria, ...]: Leaves of the logical tree.
+        """
+        leaves = self._cached_leaves
+        if leaves is None:
+            leaves = tuple(node for node in self._nodes() if not isinstance(node, AndCriteria | OrCriteria | NotCriteria))  # noqa: E501  # fmt: skip
+            self._cached_leaves = leaves
+
+        return leaves
+
+    def _clean_tree_pagination(self) -> None:
+        """
+        Remove pagination from all the leaves of the logical tree.
+        """
+        for node in self._leaves():
+            node.clean_pagination()
+
+    def _init_caches(self) -> None:
+        """
+        Initialise the cached views and fingerprints, they are computed on first use.
+        """
+        self._cached_filters = None
+        self._cached_orders = None
+        self._cached_leaves = None
+        self._shape_fingerprint = None
+        self._fingerprint = None
+        self._fingerprints_generation = Criteria._generation
+
+    def _check_fingerprints_generation(self) -> None:
+        """
+        Remove the cached fingerprints if any criteria has been modified since they were computed. A modified leaf can
+        be shared by any number of logical trees, so every criteria modification invalidates all the cached
+        fingerprints instead of only those of its ancestors.
+        """
+        if self._fingerprints_generation != Criteria._generation:
+            self._shape_fingerprint = None
+            self._fingerprint = None
+            self._fingerprints_generation = Criteria._generation
+
 
 class AndCriteria(Criteria):
     """
     AndCriteria class to handle AND logic.
 
-    ***This class is not intended to be used directly. Use the `&` operator on Criteria objects instead.***
+    ***This class is not intended to be used directly. Use the `&` operator or `Criteria.all_of` on Criteria objects
+    instead.***
     """
 
-    _left: Criteria
-    _right: Criteria
+    _children: tuple[Criteria, ...]
 
     def __init__(self, *, left: Criteria, right: Criteria) -> None:
         """
@@ -435,8 +774,45 @@ class AndCriteria(Criteria):
             left (Criteria): Left criteria.
             right (Criteria): Right criteria.
         """
-        self._left = left
-        self._right = right
+        self._children = (left, right)
+        self._init_caches()
+
+    @classmethod
+    def _from_children(cls, *, children: Sequence[Criteria]) -> AndCriteria:
+        """
+        Create an n-ary AndCriteria, children that are AndCriteria themselves are flattened into it.
+
+        Args:
+            children (Sequence[Criteria]): Children criteria, at least two.
+
+        Returns:
+            AndCriteria: Combined criteria.
+        """
+        flattened: list[Criteria] = []
+        stack = list(reversed(children))
+        while stack:
+            child = stack.pop()
+            if type(child) is cls:
+                stack.extend(reversed(child.children))
+                continue
+
+            flattened.append(child)
+
+        criteria = cls.__new__(cls)
+        criteria._children = tuple(flattened)
+        criteria._init_caches()
+
+        return criteria
+
+    @override
+    def __reduce__(self) -> tuple[Callable[..., Criteria], tuple[Any, ...]]:
+        """
+        Pickle the AndCriteria as its children.
+
+        Returns:
+            tuple[Callable[..., Criteria], tuple[Any, ...]]: Function that restores the AndCriteria and its arguments.
+        """
+        return _restore_composite_criteria, (self.__class__, self._children)
 
     @override
     def __repr__(self) -> str:
@@ -446,7 +822,10 @@ class AndCriteria(Criteria):
         Returns:
             str: String representation of AndCriteria.
         """
-        return f'{self.__class__.__name__}(left={self._left!r}, right={self._right!r})'
+        if len(self._children) == 2:
+            return f'{self.__class__.__name__}(left={self.left!r}, right={self.right!r})'
+
+        return f'{self.__class__.__name__}(children={list(self._children)!r})'
 
     @override
     def __str__(self) -> str:
@@ -456,57 +835,111 @@ class AndCriteria(Criteria):
         Returns:
             str: String representation of AndCriteria.
         """
-        return f'{self.__class__.__name__}(left={self._left}, right={self._right})'
+        if len(self._children) == 2:
+            return f'{self.__class__.__name__}(left={self.left}, right={self.right})'
+
+        return f'{self.__class__.__name__}(children=[{", ".join(str(child) for child in self._children)}])'
+
+    @override
+    def _to_dict(self, *, ignore_private: bool = True) -> dict[str, Any]:
+        """
+        Get the AndCriteria as a dictionary of its left and right criteria, or of its children if it has more than two,
+        used by the equality and `to_primitives`.
+
+        Args:
+            ignore_private (bool, optional): Whether to ignore private attributes. Defaults to True.
+
+        Returns:
+            dict[str, Any]: Dictionary representation of the AndCriteria.
+        """
+        if len(self._children) == 2:
+            return {'left': self._children[0], 'right': self._children[1]}
+
+        return {'children': list(self._children)}
 
     @property
     @override
     def filters(self) -> list[Filter[Any]]:
         """
-        Get filters.
+        Get filters of all the children, they are computed once and cached as a read-only list.
 
         Returns:
-            list[Filter[Any]]: List of filters.
+            list[Filter[Any]]: Read-only list of filters.
         """
-        return self.left.filters + self.right.filters
+        filters = self._cached_filters
+        if filters is None:
+            filters = _ReadOnlyList(filter for leaf in self._leaves() for filter in leaf.filters)
+            self._cached_filters = filters
+
+        return filters
 
     @property
     @override
     def orders(self) -> list[Order]:
         """
-        Get orders, only left criteria orders are returned.
+        Get orders of all the children, they are computed once and cached as a read-only list.
 
         Returns:
-            list[Order]: List of orders.
+            list[Order]: Read-only list of orders.
         """
-        return self.left.orders + self.right.orders
+        orders = self._cached_orders
+        if orders is None:
+            orders = _ReadOnlyList(order for leaf in self._leaves() for order in leaf.orders)
+            self._cached_orders = orders
+
+        return orders
+
+    @override
+    def has_filters(self) -> bool:
+        """
+        Check if any child has filters, without building the list of filters.
+
+        Returns:
+            bool: True if any child has filters, False otherwise.
+        """
+        return any(leaf.has_filters() for leaf in self._leaves())
+
+    @override
+    def has_orders(self) -> bool:
+        """
+        Check if any child has orders, without building the list of orders.
+
+        Returns:
+            bool: True if any child has orders, False otherwise.
+        """
+        return any(leaf.has_orders() for leaf in self._leaves())
 
     @property
     @override
     def page_size(self) -> int | None:
         """
-        Get page size from left criteria (pagination is taken from left side).
+        Get page size from the first child that has it (pagination is taken from left side).
 
         Returns:
             int | None: Page size for pagination, or None if not set.
         """
-        if self.left.page_size is None:
-            return self.right.page_size
-
-        return self.left.page_size
+        return next((leaf.page_size for leaf in self._leaves() if leaf.page_size is not None), None)
 
     @property
     @override
     def page_number(self) -> int | None:
         """
-        Get page number from left criteria (pagination is taken from left side).
+        Get page number from the first child that has it (pagination is taken from left side).
 
         Returns:
             int | None: Page number for pagination, or None if not set.
         """
-        if self.left.page_number is None:
-            return self.right.page_number
+        return next((leaf.page_number for leaf in self._leaves() if leaf.page_number is not None), None)
 
-        return self.left.page_number
+    @property
+    def children(self) -> tuple[Criteria, ...]:
+        """
+        Get children criteria.
+
+        Returns:
+            tuple[Criteria, ...]: Children criteria.
+        """
+        return self._children
 
     @property
     def left(self) -> Criteria:
@@ -516,28 +949,30 @@ class AndCriteria(Criteria):
         Returns:
             Criteria: Left criteria.
         """
-        return self._left
+        return self._children[0]
 
     @property
     def right(self) -> Criteria:
         """
-        Get right criteria.
+        Get right criteria, for n-ary criteria it combines all the children but the first one.
 
         Returns:
             Criteria: Right criteria.
         """
-        return self._right
+        if len(self._children) == 2:
+            return self._children[1]
+
+        return self._from_children(children=self._children[1:])
 
     @override
     def clean_pagination(self) -> Criteria:
         """
-        Remove pagination from both sides of the AND criteria.
+        Remove pagination from all the children of the AND criteria.
 
         Returns:
             Criteria: The same AndCriteria instance with pagination cleared from children.
         """
-        self.left.clean_pagination()
-        self.right.clean_pagination()
+        self._clean_tree_pagination()
 
         return self
 
@@ -546,11 +981,11 @@ class OrCriteria(Criteria):
     """
     OrCriteria class to handle OR logic.
 
-    ***This class is not intended to be used directly. Use the `|` operator on Criteria objects instead.***
+    ***This class is not intended to be used directly. Use the `|` operator or `Criteria.any_of` on Criteria objects
+    instead.***
     """
 
-    _left: Criteria
-    _right: Criteria
+    _children: tuple[Criteria, ...]
 
     def __init__(self, *, left: Criteria, right: Criteria) -> None:
         """
@@ -560,8 +995,45 @@ class OrCriteria(Criteria):
             left (Criteria): Left criteria.
             right (Criteria): Right criteria.
         """
-        self._left = left
-        self._right = right
+        self._children = (left, right)
+        self._init_caches()
+
+    @classmethod
+    def _from_children(cls, *, children: Sequence[Criteria]) -> OrCriteria:
+        """
+        Create an n-ary OrCriteria, children that are OrCriteria themselves are flattened into it.
+
+        Args:
+            children (Sequence[Criteria]): Children criteria, at least two.
+
+        Returns:
+            OrCriteria: Combined criteria.
+        """
+        flattened: list[Criteria] = []
+        stack = list(reversed(children))
+        while stack:
+            child = stack.pop()
+            if type(child) is cls:
+                stack.extend(reversed(child.children))
+                continue
+
+            flattened.append(child)
+
+        criteria = cls.__new__(cls)
+        criteria._children = tuple(flattened)
+        criteria._init_caches()
+
+        return criteria
+
+    @override
+    def __reduce__(self) -> tuple[Callable[..., Criteria], tuple[Any, ...]]:
+        """
+        Pickle the OrCriteria as its children.
+
+        Returns:
+            tuple[Callable[..., Criteria], tuple[Any, ...]]: Function that restores the OrCriteria and its arguments.
+        """
+        return _restore_composite_criteria, (self.__class__, self._children)
 
     @override
     def __repr__(self) -> str:
@@ -571,7 +1043,10 @@ class OrCriteria(Criteria):
         Returns:
             str: String representation of OrCriteria.
         """
-        return f'{self.__class__.__name__}(left={self._left!r}, right={self._right!r})'
+        if len(self._children) == 2:
+            return f'{self.__class__.__name__}(left={self.left!r}, right={self.right!r})'
+
+        return f'{self.__class__.__name__}(children={list(self._children)!r})'
 
     @override
     def __str__(self) -> str:
@@ -581,57 +1056,111 @@ class OrCriteria(Criteria):
         Returns:
             str: String representation of OrCriteria.
         """
-        return f'{self.__class__.__name__}(left={self._left}, right={self._right})'
+        if len(self._children) == 2:
+            return f'{self.__class__.__name__}(left={self.left}, right={self.right})'
+
+        return f'{self.__class__.__name__}(children=[{", ".join(str(child) for child in self._children)}])'
+
+    @override
+    def _to_dict(self, *, ignore_private: bool = True) -> dict[str, Any]:
+        """
+        Get the OrCriteria as a dictionary of its left and right criteria, or of its children if it has more than two,
+        used by the equality and `to_primitives`.
+
+        Args:
+            ignore_private (bool, optional): Whether to ignore private attributes. Defaults to True.
+
+        Returns:
+            dict[str, Any]: Dictionary representation of the OrCriteria.
+        """
+        if len(self._children) == 2:
+            return {'left': self._children[0], 'right': self._children[1]}
+
+        return {'children': list(self._children)}
 
     @property
     @override
     def filters(self) -> list[Filter[Any]]:
         """
-        Get filters.
+        Get filters of all the children, they are computed once and cached as a read-only list.
 
         Returns:
-            list[Filter[Any]]: List of filters.
+            list[Filter[Any]]: Read-only list of filters.
         """
-        return self.left.filters + self.right.filters
+        filters = self._cached_filters
+        if filters is None:
+            filters = _ReadOnlyList(filter for leaf in self._leaves() for filter in leaf.filters)
+            self._cached_filters = filters
+
+        return filters
 
     @property
     @override
     def orders(self) -> list[Order]:
         """
-        Get orders, only left criteria orders are returned.
+        Get orders of all the children, they are computed once and cached as a read-only list.
 
         Returns:
-            list[Order]: List of orders.
+            list[Order]: Read-only list of orders.
+        """
+        orders = self._cached_orders
+        if orders is None:
+            orders = _ReadOnlyList(order for leaf in self._leaves() for order in leaf.orders)
+            self._cached_orders = orders
+
+        return orders
+
+    @override
+    def has_filters(self) -> bool:
+        """
+        Check if any child has filters, without building the list of filters.
+
+        Returns:
+            bool: True if any child has filters, False otherwise.
+        """
+        return any(leaf.has_filters() for leaf in self._leaves())
+
+    @override
+    def has_orders(self) -> bool:
         """
-        return self.left.orders + self.right.orders
+        Check if any child has orders, without building the list of orders.
+
+        Returns:
+            bool: True if any child has orders, False otherwise.
+        """
+        return any(leaf.has_orders() for leaf in self._leaves())
 
     @property
     @override
     def page_size(self) -> int | None:
         """
-        Get page size from left criteria (pagination is taken from left side).
+        Get page size from the first child that has it (pagination is taken from left side).
 
         Returns:
             int | None: Page size for pagination, or None if not set.
         """
-        if self.left.page_size is None:
-            return self.right.page_size
-
-        return self.left.page_size
+        return next((leaf.page_size for leaf in self._leaves() if leaf.page_size is not None), None)
 
     @property
     @override
     def page_number(self) -> int | None:
         """
-        Get page number from left criteria (pagination is taken from left side).
+        Get page number from the first child that has it (pagination is taken from left side).
 
         Returns:
             int | None: Page number for pagination, or None if not set.
         """
-        if self.left.page_number is None:
-            return self.right.page_number
+        return next((leaf.page_number for leaf in self._leaves() if leaf.page_number is not None), None)
 
-        return self.left.page_number
+    @property
+    def children(self) -> tuple[Criteria, ...]:
+        """
+        Get children criteria.
+
+        Returns:
+            tuple[Criteria, ...]: Children criteria.
+        """
+        return self._children
 
     @property
     def left(self) -> Criteria:
@@ -641,28 +1170,30 @@ class OrCriteria(Criteria):
         Returns:
             Criteria: Left criteria.
         """
-        return self._left
+        return self._children[0]
 
     @property
     def right(self) -> Criteria:
         """
-        Get right criteria.
+        Get right criteria, for n-ary criteria it combines all the children but the first one.
 
         Returns:
             Criteria: Right criteria.
         """
-        return self._right
+        if len(self._children) == 2:
+            return self._children[1]
+
+        return self._from_children(children=self._children[1:])
 
     @override
     def clean_pagination(self) -> Criteria:
         """
-        Remove pagination from both sides of the OR criteria.
+        Remove pagination from all the children of the OR criteria.
 
         Returns:
             Criteria: The same OrCriteria instance with pagination cleared from children.
         """
-        self.left.clean_pagination()
-        self.right.clean_pagination()
+        self._clean_tree_pagination()
 
         return self
 
@@ -684,6 +1215,17 @@ class NotCriteria(Criteria):
             criteria (Criteria): Criteria to negate.
         """
         self._criteria = criteria
+        self._init_caches()
+
+    @override
+    def __reduce__(self) -> tuple[Callable[..., Criteria], tuple[Any, ...]]:
+        """
+        Pickle the NotCriteria as its negated criteria.
+
+        Returns:
+            tuple[Callable[..., Criteria], tuple[Any, ...]]: Function that restores the NotCriteria and its arguments.
+        """
+        return _restore_not_criteria, (self.__class__, self._criteria)
 
     @override
     def __repr__(self) -> str:
@@ -767,6 +1309,103 @@ class NotCriteria(Criteria):
         Returns:
             Criteria: The same NotCriteria instance with pagination cleared from the wrapped criteria.
         """
-        self.criteria.clean_pagination()
+        self._clean_tree_pagination()
 
         return self
+
+
+def _restore_criteria(
+    cls: type[Criteria],
+    filters: list[Filter[Any]],
+    orders: list[Order],
+    page_size: int | None,
+    page_number: int | None,
+) -> Criteria:
+    """
+    Restore a pickled criteria, its data was validated when the criteria was created so it is not validated again.
+
+    Args:
+        cls (type[Criteria]): Criteria class.
+        filters (list[Filter[Any]]): List of filters.
+        orders (list[Order]): List of orders.
+        page_size (int | None): Page size for pagination.
+        page_number (int | None): Page number for pagination.
+
+    Returns:
+        Criteria: Restored criteria.
+    """
+    return cls.from_trusted(filters=filters, orders=orders, page_size=page_size, page_number=page_number)
+
+
+def _restore_composite_criteria(
+    cls: type[AndCriteria | OrCriteria],
+    children: tuple[Criteria, ...],
+) -> AndCriteria | OrCriteria:
+    """
+    Restore a pickled AndCriteria or OrCriteria, keeping its children as they were.
+
+    Args:
+        cls (type[AndCriteria | OrCriteria]): AndCriteria or OrCriteria class.
+        children (tuple[Criteria, ...]): Children criteria.
+
+    Returns:
+        AndCriteria | OrCriteria: Restored criteria.
+    """
+    criteria = cls.__new__(cls)
+    criteria._children = children
+    criteria._init_caches()
+
+    return criteria
+
+
+def _restore_not_criteria(cls: type[NotCriteria], criteria: Criteria) -> NotCriteria:
+    """
+    Restore a pickled NotCriteria.
+
+    Args:
+        cls (type[NotCriteria]): NotCriteria class.
+        criteria (Criteria): Negated criteria.
+
+    Returns:
+        NotCriteria: Restored criteria.
+    """
+    negation = cls.__new__(cls)
+    negation._criteria = criteria
+    negation._init_caches()
+
+    return negation
+
+
+class _ReadOnlyList(list[T]):
+    """
+    List that cannot be modified, used to share the cached filters and orders of the logical trees without copying
+    them. Its copies and slices are regular lists.
+    """
+
+    __slots__ = ()
+
+    def _raise_read_only(self, *args: Any, **kwargs: Any) -> NoReturn:
+        """
+        Raise an error for any modification of the list.
+
+        Args:
+            *args (Any): Ignored positional arguments.
+            **kwargs (Any): Ignored keyword arguments.
+
+        Raises:
+            TypeError: Always, the list is read-only.
+        """
+        raise TypeError(f'{self.__class__.__name__} object does not support modification.')
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _raise_read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _raise_read_only
+
+    @override
+    def __reduce__(self) -> tuple[type[list[T]], tuple[list[T]]]:
+        """
+        Pickle and copy the read-only list as a regular list.
+
+        Returns:
+            tuple[type[list[T]], tuple[list[T]]]: List class and its items.
+        """
+        return list, (list(self),)
@@ -2,16 +2,87 @@
 This module contains the Filter class.
 """
 
-from typing import Generic, TypeVar
+from __future__ import annotations
+
+from sys import version_info
+
+if version_info >= (3, 12):
+    from typing import override  # pragma: no cover
+else:
+    from typing_extensions import override  # pragma: no cover
+
+from collections.abc import Callable
+from functools import cache, lru_cache
+from typing import Any, Generic, TypeVar
 
 from value_object_pattern import BaseModel
 
+from criteria_pattern.models.trusted import trusted_value_object
+
 from .filter_field import FilterField
 from .filter_operator import FilterOperator
 from .filter_value import FilterValue
+from .operator import Operator
 
 T = TypeVar('T')
 
+FIELDS_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=FIELDS_CACHE_SIZE)
+def _shared_field(field: str) -> FilterField:
+    """
+    Get the FilterField shared by every filter on `field`, it is only validated the first time it is seen.
+
+    Args:
+        field (str): Field name that will be filtered.
+
+    Raises:
+        IntegrityError: If the provided `field` is not valid, invalid fields are never cached.
+
+    Returns:
+        FilterField: Shared filter field.
+    """
+    return FilterField(value=field, title='Filter', parameter='field')
+
+
+@cache
+def _shared_operator(operator: str) -> FilterOperator:
+    """
+    Get the FilterOperator shared by every filter using `operator`, there is at most one per Operator member.
+
+    Args:
+        operator (str): Operator that will be used to filter the field.
+
+    Raises:
+        IntegrityError: If the provided `operator` is not an Operator, invalid operators are never cached.
+
+    Returns:
+        FilterOperator: Shared filter operator.
+    """
+    return FilterOperator(value=operator, title='Filter', parameter='operator')
+
+
+def _restore_filter(cls: type[Filter[Any]], field: str, operator: str, value: Any) -> Filter[Any]:
+    """
+    Restore a pickled filter, its field and operator are shared and its value is not validated again.
+
+    Args:
+        cls (type[Filter[Any]]): Filter class.
+        field (str): Field name that will be filtered.
+        operator (str): Operator that will be used to filter the field.
+        value (Any): Value that will be used to filter the field.
+
+    Returns:
+        Filter[Any]: Restored filter.
+    """
+    filter = cls.__new__(cls)
+    filter._field = _shared_field(field)
+    filter._operator = _shared_operator(operator)
+    filter._value = trusted_value_object(cls=FilterValue, value=value, title='Filter', parameter='value')
+
+    return filter
+
 
 class Filter(BaseModel, Generic[T]):  # noqa: UP046
     """
@@ -57,10 +128,54 @@ class Filter(BaseModel, Generic[T]):  # noqa: UP046
         # >>> Filter(field=name, operator=EQUAL, value=John)
         ```
         """
-        self._field = FilterField(value=field, title='Filter', parameter='field')
-        self._operator = FilterOperator(value=operator, title='Filter', parameter='operator')
+        self._field = _shared_field(field) if type(field) is str else FilterField(value=field, title='Filter', parameter='field')  # noqa: E501  # fmt: skip
+        self._operator = _shared_operator(str(operator)) if type(operator) is Operator or type(operator) is str else FilterOperator(value=operator, title='Filter', parameter='operator')  # noqa: E501  # fmt: skip
         self._value = FilterValue(value=value, title='Filter', parameter='value')
 
+    @classmethod
+    def trusted(cls, *, field: str, operator: Operator | str, value: T) -> Filter[T]:
+        """
+        Create a Filter from already validated data, e.g. internal configuration, skipping the field, operator and value
+        validation chains. The field is shared with the other filters on it, so it is only validated the first time it
+        is seen. The resulting Filter is fully compatible with (and equal to) one created through the constructor, but
+        invalid data is not always rejected, so never use it with untrusted input.
+
+        Args:
+            field (str): Field name that will be filtered.
+            operator (Operator | str): Operator that will be used to filter the field.
+            value (T): Value that will be used to filter the field.
+
+        Returns:
+            Filter[T]: Filter created without validation.
+
+        Example:
+        ```python
+        from criteria_pattern import Filter, Operator
+
+        filter = Filter.trusted(field='name', operator=Operator.EQUAL, value='John')
+        print(filter == Filter(field='name', operator=Operator.EQUAL, value='John'))
+        # >>> True
+        ```
+        """
+        filter = cls.__new__(cls)
+        filter._field = _shared_field(field)
+        filter._operator = _shared_operator(Operator(operator).value)
+        filter._value = trusted_value_object(cls=FilterValue, value=value, title='Filter', parameter='value')
+
+        return filter
+
+    @override
+    def __reduce__(self) -> tuple[Callable[..., Filter[Any]], tuple[type[Filter[Any]], str, str, T]]:
+        """
+        Pickle the filter as its field, operator and value instead of its value objects, so it is smaller and faster
+        to pickle, and it can be unpickled although value objects are immutable.
+
+        Returns:
+            tuple[Callable[..., Filter[Any]], tuple[type[Filter[Any]], str, str, T]]: Function that restores the filter
+            and its arguments.
+        """
+        return _restore_filter, (self.__class__, self.field, self.operator, self.value)
+
     @property
     def field(self) -> str:
         """
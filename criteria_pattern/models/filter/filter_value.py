@@ -22,3 +22,5 @@ class FilterValue(ValueObject[T]):
     # >>> John
     ```
     """
+
+    __slots__ = ()
@@ -2,11 +2,79 @@
 This module contains the Order class.
 """
 
+from __future__ import annotations
+
+from sys import version_info
+
+if version_info >= (3, 12):
+    from typing import override  # pragma: no cover
+else:
+    from typing_extensions import override  # pragma: no cover
+
+from collections.abc import Callable
+from functools import cache, lru_cache
+
 from value_object_pattern import BaseModel
 
+from .direction import Direction
 from .order_direction import OrderDirection
 from .order_field import OrderField
 
+FIELDS_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=FIELDS_CACHE_SIZE)
+def _shared_field(field: str) -> OrderField:
+    """
+    Get the OrderField shared by every order on `field`, it is only validated the first time it is seen.
+
+    Args:
+        field (str): Field name that will be ordered.
+
+    Raises:
+        IntegrityError: If the provided `field` is not valid, invalid fields are never cached.
+
+    Returns:
+        OrderField: Shared order field.
+    """
+    return OrderField(value=field, title='Order', parameter='field')
+
+
+@cache
+def _shared_direction(direction: str) -> OrderDirection:
+    """
+    Get the OrderDirection shared by every order using `direction`, there is at most one per Direction member.
+
+    Args:
+        direction (str): Order direction that will be used to order the field.
+
+    Raises:
+        IntegrityError: If the provided `direction` is not a Direction, invalid directions are never cached.
+
+    Returns:
+        OrderDirection: Shared order direction.
+    """
+    return OrderDirection(value=direction, title='Order', parameter='direction')
+
+
+def _restore_order(cls: type[Order], field: str, direction: str) -> Order:
+    """
+    Restore a pickled order, its field and direction are shared.
+
+    Args:
+        cls (type[Order]): Order class.
+        field (str): Field name that will be ordered.
+        direction (str): Order direction that will be used to order the field.
+
+    Returns:
+        Order: Restored order.
+    """
+    order = cls.__new__(cls)
+    order._field = _shared_field(field)
+    order._direction = _shared_direction(direction)
+
+    return order
+
 
 class Order(BaseModel):
     """
@@ -49,8 +117,50 @@ class Order(BaseModel):
         # >>> Order(direction=ASC, field=name)
         ```
         """
-        self._field = OrderField(value=field, title='Order', parameter='field')
-        self._direction = OrderDirection(value=direction, title='Order', parameter='direction')
+        self._field = _shared_field(field) if type(field) is str else OrderField(value=field, title='Order', parameter='field')  # noqa: E501  # fmt: skip
+        self._direction = _shared_direction(str(direction)) if type(direction) is Direction or type(direction) is str else OrderDirection(value=direction, title='Order', parameter='direction')  # noqa: E501  # fmt: skip
+
+    @classmethod
+    def trusted(cls, *, field: str, direction: Direction | str) -> Order:
+        """
+        Create an Order from already validated data, e.g. internal configuration, skipping the field and direction
+        validation chains. The field is shared with the other orders on it, so it is only validated the first time it
+        is seen. The resulting Order is fully compatible with (and equal to) one created through the constructor, but
+        invalid data is not always rejected, so never use it with untrusted input.
+
+        Args:
+            field (str): Field name that will be ordered.
+            direction (Direction | str): Order direction that will be used to order the field.
+
+        Returns:
+            Order: Order created without validation.
+
+        Example:
+        ```python
+        from criteria_pattern import Direction, Order
+
+        order = Order.trusted(field='name', direction=Direction.ASC)
+        print(order == Order(field='name', direction=Direction.ASC))
+        # >>> True
+        ```
+        """
+        order = cls.__new__(cls)
+        order._field = _shared_field(field)
+        order._direction = _shared_direction(Direction(direction).value)
+
+        return order
+
+    @override
+    def __reduce__(self) -> tuple[Callable[..., Order], tuple[type[Order], str, str]]:
+        """
+        Pickle the order as its field and direction instead of its value objects, so it is smaller and faster to
+        pickle, and it can be unpickled although value objects are immutable.
+
+        Returns:
+            tuple[Callable[..., Order], tuple[type[Order], str, str]]: Function that restores the order and its
+            arguments.
+        """
+        return _restore_order, (self.__class__, self.field, self.direction)
 
     @property
     def field(self) -> str:
@@ -0,0 +1,35 @@
+"""
+Trusted construction module.
+"""
+
+from typing import Any, TypeVar
+
+from value_object_pattern import ValueObject
+
+V = TypeVar('V', bound=ValueObject[Any])
+
+
+def trusted_value_object(*, cls: type[V], value: Any, title: str, parameter: str) -> V:  # noqa: UP047
+    """
+    Create a value object from an already validated and processed value, skipping its validation and process chains.
+    The resulting object is indistinguishable from one created through the constructor with the same value.
+
+    ***This function is not intended to be used directly. Use `Filter.trusted`, `Order.trusted` or
+    `Criteria.from_trusted` instead.***
+
+    Args:
+        cls (type[V]): Value object class to create.
+        value (Any): Already validated and processed value.
+        title (str): Name used in the value object errors.
+        parameter (str): Parameter name used in the value object errors.
+
+    Returns:
+        V: Value object holding `value`.
+    """
+    value_object = cls.__new__(cls)
+    object.__setattr__(value_object, '_title', title)
+    object.__setattr__(value_object, '_parameter', parameter)
+    object.__setattr__(value_object, '_early_processed', None)
+    object.__setattr__(value_object, '_value', value)
+
+    return value_object
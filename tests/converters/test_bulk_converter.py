@@ -0,0 +1,138 @@
+"""
+Test BulkConverter class.
+"""
+
+from pytest import mark, raises as assert_raises
+
+from criteria_pattern import Criteria, Direction, Filter, Operator, Order
+from criteria_pattern.converters import (
+    BulkConversionStats,
+    BulkConverter,
+    CriteriaToMysqlConverter,
+    CriteriaToPostgresqlConverter,
+    QueryCache,
+)
+from criteria_pattern.errors import IntegrityError, InvalidColumnError
+from criteria_pattern.models.testing.mothers import CriteriaMother
+
+
+@mark.unit_testing
+def test_bulk_converter_happy_path() -> None:
+    """
+    Test BulkConverter class yields the same queries as convert_many in the same order as the criteria.
+    """
+    criteria = [
+        Criteria(
+            filters=[Filter(field='id', operator=Operator.IN, value=[value, value + 1])],
+            orders=[Order(field='name', direction=Direction.ASC)],
+            page_size=10,
+            page_number=value + 1,
+        )
+        for value in range(50)
+    ]
+    criteria.extend(CriteriaMother.create() & CriteriaMother.create() for _ in range(10))
+    stats = BulkConversionStats()
+
+    queries = list(
+        BulkConverter.convert(
+            criteria=iter(criteria),
+            converter=CriteriaToPostgresqlConverter,
+            table='user',
+            chunk_size=7,
+            max_workers=2,
+            stats=stats,
+            columns=['id', 'name'],
+        )
+    )
+
+    assert queries == list(
+        CriteriaToPostgresqlConverter.convert_many(criteria=criteria, table='user', columns=['id', 'name'])
+    )
+    assert stats.criteria == 60
+    assert stats.chunks == 9
+    assert stats.elapsed > 0
+    assert stats.criteria_per_second > 0
+
+
+@mark.unit_testing
+def test_bulk_converter_with_empty_criteria() -> None:
+    """
+    Test BulkConverter class with no criteria.
+    """
+    stats = BulkConversionStats()
+
+    queries = list(
+        BulkConverter.convert(criteria=[], converter=CriteriaToMysqlConverter, table='user', max_workers=1, stats=stats)
+    )
+
+    assert queries == []
+    assert stats.chunks == 0
+    assert stats.criteria_per_second == 0.0
+
+
+@mark.unit_testing
+def test_bulk_converter_raises_worker_error() -> None:
+    """
+    Test BulkConverter class raises the error of an invalid criteria converted in a worker process.
+    """
+    criteria = [
+        Criteria(filters=[Filter(field='id', operator=Operator.EQUAL, value=1)]),
+        Criteria(filters=[Filter(field='email', operator=Operator.EQUAL, value='john@example.com')]),
+    ]
+
+    with assert_raises(
+        expected_exception=InvalidColumnError,
+        match='Invalid column specified <<<email>>>. Valid columns are <<<id>>>.',
+    ):
+        list(
+            BulkConverter.convert(
+                criteria=criteria,
+                converter=CriteriaToMysqlConverter,
+                table='user',
+                chunk_size=1,
+                max_workers=1,
+                check_criteria_injection=True,
+                valid_columns=['id'],
+            )
+        )
+
+
+@mark.unit_testing
+def test_bulk_converter_invalid_chunk_size() -> None:
+    """
+    Test BulkConverter class raises an IntegrityError when the chunk size is not a positive integer.
+    """
+    with assert_raises(
+        expected_exception=IntegrityError,
+        match='BulkConverter chunk_size <<<0>>> must be a positive integer.',
+    ):
+        BulkConverter.convert(criteria=[], converter=CriteriaToMysqlConverter, table='user', chunk_size=0)
+
+
+@mark.unit_testing
+def test_bulk_converter_invalid_max_workers() -> None:
+    """
+    Test BulkConverter class raises an IntegrityError when the maximum number of workers is not a positive integer.
+    """
+    with assert_raises(
+        expected_exception=IntegrityError,
+        match='BulkConverter max_workers <<<0>>> must be a positive integer.',
+    ):
+        BulkConverter.convert(criteria=[], converter=CriteriaToMysqlConverter, table='user', max_workers=0)
+
+
+@mark.unit_testing
+def test_bulk_converter_with_cache() -> None:
+    """
+    Test BulkConverter class raises an IntegrityError when a cache is given.
+    """
+    with assert_raises(
+        expected_exception=IntegrityError,
+        match='BulkConverter does not support a cache, it cannot be shared between worker processes.',
+    ):
+        BulkConverter.convert(
+            criteria=[],
+            converter=CriteriaToPostgresqlConverter,
+            table='user',
+            cache=QueryCache(),
+        )
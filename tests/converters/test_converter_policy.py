@@ -0,0 +1,174 @@
+"""
+Test ConverterPolicy class.
+"""
+
+from pytest import mark, raises as assert_raises
+
+from criteria_pattern import Criteria, Direction, Filter, Operator, Order
+from criteria_pattern.converters import ConverterPolicy
+from criteria_pattern.errors import (
+    IntegrityError,
+    InvalidColumnError,
+    InvalidDirectionError,
+    InvalidOperatorError,
+    InvalidTableError,
+    PaginationBoundsError,
+)
+
+
+@mark.unit_testing
+def test_converter_policy_happy_path() -> None:
+    """
+    Test ConverterPolicy accepts a criteria that satisfies every allow-list and bound.
+    """
+    policy = ConverterPolicy(
+        valid_tables=['user'],
+        valid_columns=['id', 'name'],
+        valid_operators=[Operator.EQUAL],
+        valid_directions=[Direction.ASC],
+        max_page_size=10,
+        max_page_number=10,
+    )
+    criteria = Criteria(
+        filters=[Filter(field='name', operator=Operator.EQUAL, value='John')],
+        orders=[Order(field='id', direction=Direction.ASC)],
+        page_size=10,
+        page_number=10,
+    )
+
+    policy.validate_table(table='user')
+    policy.validate_columns(columns=['id', 'name'], columns_mapping={'full_name': 'name'})
+    policy.validate_criteria(criteria=criteria)
+
+    assert policy.valid_tables == frozenset({'user'})
+    assert policy.valid_columns == frozenset({'id', 'name'})
+    assert policy.valid_operators == frozenset({Operator.EQUAL})
+    assert policy.valid_directions == frozenset({Direction.ASC})
+    assert policy.max_page_size == 10
+    assert policy.max_page_number == 10
+
+
+@mark.unit_testing
+def test_converter_policy_without_allow_lists() -> None:
+    """
+    Test ConverterPolicy does not check anything when no allow-list or bound is given.
+    """
+    policy = ConverterPolicy()
+    criteria = Criteria(
+        filters=[Filter(field='id; DROP TABLE user;', operator=Operator.EQUAL, value=1)],
+        orders=[Order(field='id', direction=Direction.DESC)],
+        page_size=1000000,
+        page_number=1000000,
+    )
+
+    policy.validate_table(table='user; DROP TABLE user;')
+    policy.validate_columns(columns=['*'], columns_mapping={})
+    policy.validate_criteria(criteria=criteria)
+
+    assert policy.valid_tables is None
+    assert policy.valid_columns is None
+
+
+@mark.unit_testing
+def test_converter_policy_invalid_table() -> None:
+    """
+    Test ConverterPolicy raises an error when the table is not valid.
+    """
+    policy = ConverterPolicy(valid_tables=['user', 'account'])
+
+    with assert_raises(
+        expected_exception=InvalidTableError,
+        match='Invalid table specified <<<orders>>>. Valid tables are <<<user, account>>>.',
+    ):
+        policy.validate_table(table='orders')
+
+
+@mark.unit_testing
+def test_converter_policy_invalid_column() -> None:
+    """
+    Test ConverterPolicy raises an error when a selected column is not valid.
+    """
+    policy = ConverterPolicy(valid_columns=['id', 'name'])
+
+    with assert_raises(
+        expected_exception=InvalidColumnError,
+        match='Invalid column specified <<<email>>>. Valid columns are <<<id, name>>>.',
+    ):
+        policy.validate_columns(columns=['id', 'email'], columns_mapping={})
+
+
+@mark.unit_testing
+def test_converter_policy_invalid_criteria_field() -> None:
+    """
+    Test ConverterPolicy raises an error when a criteria field is not valid.
+    """
+    policy = ConverterPolicy(valid_columns=['id', 'name'])
+    criteria = Criteria(orders=[Order(field='email', direction=Direction.ASC)])
+
+    with assert_raises(
+        expected_exception=InvalidColumnError,
+        match='Invalid column specified <<<email>>>. Valid columns are <<<id, name>>>.',
+    ):
+        policy.validate_criteria(criteria=criteria)
+
+
+@mark.unit_testing
+def test_converter_policy_invalid_operator() -> None:
+    """
+    Test ConverterPolicy raises an error when a criteria operator is not valid.
+    """
+    policy = ConverterPolicy(valid_operators=[Operator.EQUAL, Operator.IN])
+    criteria = Criteria(filters=[Filter(field='id', operator=Operator.NOT_EQUAL, value=1)])
+
+    with assert_raises(
+        expected_exception=InvalidOperatorError,
+        match='Invalid operator specified <<<NOT_EQUAL>>>. Valid operators are <<<EQUAL, IN>>>.',
+    ):
+        policy.validate_criteria(criteria=criteria)
+
+
+@mark.unit_testing
+def test_converter_policy_invalid_direction() -> None:
+    """
+    Test ConverterPolicy raises an error when a criteria direction is not valid.
+    """
+    policy = ConverterPolicy(valid_directions=[Direction.ASC])
+    criteria = Criteria(orders=[Order(field='id', direction=Direction.DESC)])
+
+    with assert_raises(
+        expected_exception=InvalidDirectionError,
+        match='Invalid direction specified <<<DESC>>>. Valid directions are <<<ASC>>>.',
+    ):
+        policy.validate_criteria(criteria=criteria)
+
+
+@mark.unit_testing
+def test_converter_policy_pagination_bounds() -> None:
+    """
+    Test ConverterPolicy raises an error when the pagination exceeds the bounds.
+    """
+    policy = ConverterPolicy(max_page_size=100, max_page_number=10)
+
+    with assert_raises(
+        expected_exception=PaginationBoundsError,
+        match='Pagination <<<page_size>>> <<<101>>> exceeds maximum allowed value <<<100>>>.',
+    ):
+        policy.validate_criteria(criteria=Criteria(page_size=101, page_number=1))
+
+    with assert_raises(
+        expected_exception=PaginationBoundsError,
+        match='Pagination <<<page_number>>> <<<11>>> exceeds maximum allowed value <<<10>>>.',
+    ):
+        policy.validate_criteria(criteria=Criteria(page_size=100, page_number=11))
+
+
+@mark.unit_testing
+def test_converter_policy_invalid_max_page_size() -> None:
+    """
+    Test ConverterPolicy raises an error when max_page_size is not a positive integer.
+    """
+    with assert_raises(
+        expected_exception=IntegrityError,
+        match='ConverterPolicy max_page_size <<<0>>> must be a positive integer.',
+    ):
+        ConverterPolicy(max_page_size=0)
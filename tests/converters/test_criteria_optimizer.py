@@ -0,0 +1,453 @@
+"""
+Test CriteriaOptimizer class.
+"""
+
+from decimal import Decimal
+from sqlite3 import connect
+from typing import Any
+
+from object_mother_pattern import IntegerMother
+from pytest import mark
+
+from criteria_pattern import Criteria, Direction, Filter, Operator, Order
+from criteria_pattern.converters import CriteriaOptimizer, CriteriaToPostgresqlConverter, CriteriaToSqliteConverter
+from criteria_pattern.models.criteria import AndCriteria, NotCriteria, OrCriteria
+
+VALUES = (None, 0, 1, 2, 3, 4)
+OPERATORS = (
+    Operator.EQUAL,
+    Operator.NOT_EQUAL,
+    Operator.GREATER,
+    Operator.GREATER_OR_EQUAL,
+    Operator.LESS,
+    Operator.LESS_OR_EQUAL,
+    Operator.BETWEEN,
+    Operator.IN,
+    Operator.IS_NULL,
+)
+
+
+def leaf(*filters: tuple[str, Operator, Any]) -> Criteria:
+    """
+    Helper function to build a plain criteria.
+
+    Args:
+        *filters (tuple[str, Operator, Any]): Field, operator and value of each filter.
+
+    Returns:
+        Criteria: Built criteria.
+    """
+    return Criteria(filters=[Filter(field=field, operator=operator, value=value) for field, operator, value in filters])
+
+
+def random_filter() -> Filter[Any]:
+    """
+    Helper function to build a random filter over the fields a and b with small integer values.
+
+    Returns:
+        Filter[Any]: Built filter.
+    """
+    field = 'ab'[IntegerMother.create(min=0, max=1)]
+    operator = OPERATORS[IntegerMother.create(min=0, max=len(OPERATORS) - 1)]
+    match operator:
+        case Operator.BETWEEN:
+            start = IntegerMother.create(min=0, max=4)
+            return Filter(field=field, operator=operator, value=[start, IntegerMother.create(min=start - 1, max=4)])
+
+        case Operator.IN:
+            return Filter(field=field, operator=operator, value=[IntegerMother.create(min=0, max=4) for _ in range(2)])
+
+        case Operator.IS_NULL:
+            return Filter(field=field, operator=operator, value=None)
+
+        case _:
+            return Filter(field=field, operator=operator, value=IntegerMother.create(min=0, max=4))
+
+
+def random_criteria(*, depth: int) -> Criteria:
+    """
+    Helper function to build a random logical tree with repeated filters, ranges, negations and empty children.
+
+    Args:
+        depth (int): Maximum depth of the tree.
+
+    Returns:
+        Criteria: Built criteria.
+    """
+    kind = IntegerMother.create(min=0, max=3 if depth > 0 else 0)
+    match kind:
+        case 0:
+            return Criteria(filters=[random_filter() for _ in range(IntegerMother.create(min=0, max=3))])
+
+        case 1:
+            children = [random_criteria(depth=depth - 1) for _ in range(IntegerMother.create(min=2, max=3))]
+            return Criteria.all_of(criteria=children)
+
+        case 2:
+            children = [random_criteria(depth=depth - 1) for _ in range(IntegerMother.create(min=2, max=3))]
+            return Criteria.any_of(criteria=children)
+
+        case _:
+            return ~random_criteria(depth=depth - 1)
+
+
+def matching_ids(*, criteria: Criteria) -> list[int]:
+    """
+    Helper function to return the identifiers of the rows of an in-memory SQLite table that match the criteria. The
+    table has every combination of the VALUES in the columns a and b, so the null semantics of SQL are covered.
+
+    Args:
+        criteria (Criteria): Criteria to match.
+
+    Returns:
+        list[int]: Identifiers of the matching rows.
+    """
+    query, parameters = CriteriaToSqliteConverter.convert(criteria=criteria, table='row')
+    with connect(':memory:') as connection:
+        connection.execute('CREATE TABLE row (id INTEGER, a INTEGER, b INTEGER)')
+        connection.executemany(
+            'INSERT INTO row VALUES (?, ?, ?)',
+            [(index, a, b) for index, (a, b) in enumerate((a, b) for a in VALUES for b in VALUES)],
+        )
+        return sorted(row[0] for row in connection.execute(query, parameters))
+
+
+@mark.unit_testing
+def test_criteria_optimizer_merges_ranges() -> None:
+    """
+    Test CriteriaOptimizer class keeps the tightest bounds of a field and merges inclusive ones into a BETWEEN.
+    """
+    criteria = leaf(
+        ('age', Operator.GREATER, 5),
+        ('name', Operator.EQUAL, 'John'),
+        ('age', Operator.GREATER, 10),
+        ('age', Operator.LESS, 65),
+        ('age', Operator.LESS_OR_EQUAL, 65),
+    )
+    inclusive = leaf(('age', Operator.GREATER_OR_EQUAL, 18), ('age', Operator.BETWEEN, [10, 65]))
+
+    assert CriteriaOptimizer.optimize(criteria=criteria) == leaf(
+        ('age', Operator.GREATER, 10),
+        ('age', Operator.LESS, 65),
+        ('name', Operator.EQUAL, 'John'),
+    )
+    assert CriteriaOptimizer.optimize(criteria=inclusive) == leaf(('age', Operator.BETWEEN, [18, 65]))
+
+
+@mark.unit_testing
+def test_criteria_optimizer_does_not_merge_unordered_ranges() -> None:
+    """
+    Test CriteriaOptimizer class does not merge the ranges of strings, whose order depends on the database collation.
+    """
+    criteria = leaf(('name', Operator.GREATER, 'a'), ('name', Operator.GREATER, 'B'))
+
+    assert CriteriaOptimizer.optimize(criteria=criteria) == criteria
+
+
+@mark.unit_testing
+def test_criteria_optimizer_does_not_merge_ranges_of_different_types() -> None:
+    """
+    Test CriteriaOptimizer class does not merge the ranges of a field whose values have different types, as the
+    database may compare them with other semantics than Python.
+    """
+    mixed = leaf(('price', Operator.GREATER, 1), ('price', Operator.GREATER, Decimal('1.5')), ('price', Operator.LESS, 10))  # noqa: E501  # fmt: skip
+    decimals = leaf(('price', Operator.GREATER, Decimal('1')), ('price', Operator.GREATER, Decimal('1.5')))
+
+    assert CriteriaOptimizer.optimize(criteria=mixed) == mixed
+    assert CriteriaOptimizer.optimize(criteria=decimals) == leaf(('price', Operator.GREATER, Decimal('1.5')))
+
+
+@mark.unit_testing
+def test_criteria_optimizer_removes_repeated_filters_and_children() -> None:
+    """
+    Test CriteriaOptimizer class removes repeated filters and children, and values of different types are not repeated.
+    """
+    is_active = leaf(('status', Operator.EQUAL, 'active'))
+    is_admin = leaf(('role', Operator.EQUAL, 'admin'))
+    is_one = leaf(('flag', Operator.EQUAL, 1), ('flag', Operator.EQUAL, True), ('flag', Operator.EQUAL, 1))
+
+    optimized = CriteriaOptimizer.optimize(criteria=(is_active & ~is_admin) & (is_active & ~is_admin))
+
+    assert optimized == is_active & ~is_admin
+    assert CriteriaOptimizer.optimize(criteria=is_one).filters == leaf(('flag', Operator.EQUAL, 1), ('flag', Operator.EQUAL, True)).filters  # noqa: E501  # fmt: skip
+
+
+@mark.unit_testing
+def test_criteria_optimizer_removes_double_negations() -> None:
+    """
+    Test CriteriaOptimizer class removes double negations and keeps single ones.
+    """
+    is_active = leaf(('status', Operator.EQUAL, 'active'))
+
+    assert CriteriaOptimizer.optimize(criteria=~~is_active) == is_active
+    assert CriteriaOptimizer.optimize(criteria=~~~is_active) == ~is_active
+
+
+@mark.unit_testing
+def test_criteria_optimizer_folds_equal_children_into_in() -> None:
+    """
+    Test CriteriaOptimizer class folds the EQUAL and IN children of an OR node on the same field into an IN filter.
+    """
+    criteria = Criteria.any_of(
+        criteria=[
+            leaf(('country', Operator.EQUAL, 'ES')),
+            leaf(('age', Operator.GREATER, 65)),
+            leaf(('country', Operator.IN, ['FR', 'ES'])),
+            leaf(('country', Operator.EQUAL, 'IT')),
+            leaf(('country', Operator.EQUAL, None)),
+        ]
+    )
+
+    query, parameters = CriteriaToPostgresqlConverter.convert(
+        criteria=CriteriaOptimizer.optimize(criteria=criteria),
+        table='user',
+    )
+
+    assert query == 'SELECT * FROM "user" WHERE ("country" IN (%(parameter_0)s, %(parameter_1)s, %(parameter_2)s) OR "age" > %(parameter_3)s OR "country" = %(parameter_4)s);'  # noqa: E501  # fmt: skip
+    assert parameters == {'parameter_0': 'ES', 'parameter_1': 'FR', 'parameter_2': 'IT', 'parameter_3': 65, 'parameter_4': None}  # noqa: E501  # fmt: skip
+
+
+@mark.unit_testing
+def test_criteria_optimizer_drops_empty_children() -> None:
+    """
+    Test CriteriaOptimizer class drops the empty children and collapses the nodes left with a single child.
+    """
+    is_active = leaf(('status', Operator.EQUAL, 'active'))
+
+    assert CriteriaOptimizer.optimize(criteria=Criteria() & ~Criteria() & (is_active | Criteria())) == is_active
+    assert CriteriaOptimizer.optimize(criteria=Criteria() | ~Criteria()) == Criteria()
+
+
+@mark.unit_testing
+def test_criteria_optimizer_keeps_orders_and_pagination() -> None:
+    """
+    Test CriteriaOptimizer class keeps the orders and the pagination, and does not modify the criteria.
+    """
+    is_active = leaf(('status', Operator.EQUAL, 'active'))
+    is_admin = leaf(('role', Operator.EQUAL, 'admin'))
+    page = Criteria(orders=[Order(field='name', direction=Direction.ASC)], page_size=20, page_number=2)
+    criteria = ~~(is_active | ~is_admin) & page
+    fingerprint = criteria.fingerprint()
+
+    optimized = CriteriaOptimizer.optimize(criteria=criteria)
+
+    assert optimized.orders == criteria.orders
+    assert optimized.page_size == 20
+    assert optimized.page_number == 2
+    assert isinstance(optimized, AndCriteria)
+    assert isinstance(optimized.left, OrCriteria)
+    assert isinstance(optimized.left.children[1], NotCriteria)
+    assert criteria.fingerprint() == fingerprint
+    assert CriteriaOptimizer.optimize(criteria=page) == page
+
+
+@mark.unit_testing
+def test_criteria_optimizer_deep_criteria() -> None:
+    """
+    Test CriteriaOptimizer class optimizes criteria deeper than the recursion limit.
+    """
+    criteria = leaf(('id', Operator.GREATER, 0))
+    for value in range(1, 5000):
+        criteria = criteria & leaf(('id', Operator.GREATER, value))
+
+    assert CriteriaOptimizer.optimize(criteria=criteria) == leaf(('id', Operator.GREATER, 4999))
+
+
+@mark.unit_testing
+def test_criteria_optimizer_matches_the_same_rows() -> None:
+    """
+    Test CriteriaOptimizer class optimized criteria match the same SQLite rows as the original ones, including the
+    rows with null values, and the optimization is idempotent.
+    """
+    for _ in range(300):
+        criteria = random_criteria(depth=3)
+
+        optimized = CriteriaOptimizer.optimize(criteria=criteria)
+
+        assert matching_ids(criteria=optimized) == matching_ids(criteria=criteria)
+        assert CriteriaOptimizer.optimize(criteria=optimized).fingerprint() == optimized.fingerprint()
+
+
+@mark.unit_testing
+def test_criteria_optimizer_detects_unsatisfiable_criteria() -> None:
+    """
+    Test CriteriaOptimizer class detects the contradictory filters of a field combined with AND.
+    """
+    assert CriteriaOptimizer.is_unsatisfiable(criteria=leaf(('age', Operator.GREATER, 30), ('age', Operator.LESS, 10)))
+    assert CriteriaOptimizer.is_unsatisfiable(criteria=leaf(('age', Operator.GREATER, 30), ('age', Operator.LESS_OR_EQUAL, 30)))  # noqa: E501  # fmt: skip
+    assert CriteriaOptimizer.is_unsatisfiable(criteria=leaf(('age', Operator.BETWEEN, [30, 10])))
+    assert CriteriaOptimizer.is_unsatisfiable(criteria=leaf(('status', Operator.IN, [])))
+    assert CriteriaOptimizer.is_unsatisfiable(criteria=leaf(('status', Operator.IN, [None])))
+    assert CriteriaOptimizer.is_unsatisfiable(criteria=leaf(('x', Operator.IS_NULL, None), ('x', Operator.EQUAL, 5)))
+    assert CriteriaOptimizer.is_unsatisfiable(criteria=leaf(('x', Operator.IS_NULL, None), ('x', Operator.IS_NOT_NULL, None)))  # noqa: E501  # fmt: skip
+    assert CriteriaOptimizer.is_unsatisfiable(criteria=leaf(('x', Operator.EQUAL, None)))
+    assert CriteriaOptimizer.is_unsatisfiable(criteria=leaf(('x', Operator.EQUAL, 1), ('x', Operator.EQUAL, 2)))
+    assert CriteriaOptimizer.is_unsatisfiable(criteria=leaf(('x', Operator.IN, [1, 2]), ('x', Operator.IN, [3, 4])))
+    assert CriteriaOptimizer.is_unsatisfiable(criteria=leaf(('x', Operator.IN, [1, 2]), ('x', Operator.NOT_IN, [1, 2])))  # noqa: E501  # fmt: skip
+    assert CriteriaOptimizer.is_unsatisfiable(criteria=leaf(('x', Operator.IN, [1, 5]), ('x', Operator.GREATER, 1), ('x', Operator.LESS, 5)))  # noqa: E501  # fmt: skip
+    assert CriteriaOptimizer.is_unsatisfiable(criteria=leaf(('x', Operator.BETWEEN, [1, 1]), ('x', Operator.NOT_EQUAL, 1)))  # noqa: E501  # fmt: skip
+    assert CriteriaOptimizer.is_unsatisfiable(criteria=leaf(('name', Operator.EQUAL, 'a'), ('name', Operator.NOT_EQUAL, 'a')))  # noqa: E501  # fmt: skip
+
+
+@mark.unit_testing
+def test_criteria_optimizer_does_not_detect_satisfiable_criteria() -> None:
+    """
+    Test CriteriaOptimizer class does not flag the criteria that may match rows, nor the contradictions that depend on
+    the database collation or types.
+    """
+    assert not CriteriaOptimizer.is_unsatisfiable(criteria=Criteria())
+    assert not CriteriaOptimizer.is_unsatisfiable(criteria=leaf(('age', Operator.GREATER_OR_EQUAL, 30), ('age', Operator.LESS_OR_EQUAL, 30)))  # noqa: E501  # fmt: skip
+    assert not CriteriaOptimizer.is_unsatisfiable(criteria=leaf(('age', Operator.GREATER, 30), ('height', Operator.LESS, 10)))  # noqa: E501  # fmt: skip
+    assert not CriteriaOptimizer.is_unsatisfiable(criteria=leaf(('x', Operator.IN, [1, None]), ('x', Operator.NOT_EQUAL, 2)))  # noqa: E501  # fmt: skip
+    assert not CriteriaOptimizer.is_unsatisfiable(criteria=leaf(('x', Operator.IS_NOT_NULL, None), ('x', Operator.EQUAL, 5)))  # noqa: E501  # fmt: skip
+    assert not CriteriaOptimizer.is_unsatisfiable(criteria=leaf(('name', Operator.GREATER, 'b'), ('name', Operator.LESS, 'B')))  # noqa: E501  # fmt: skip
+    assert not CriteriaOptimizer.is_unsatisfiable(criteria=leaf(('name', Operator.EQUAL, 'a'), ('name', Operator.EQUAL, 'A')))  # noqa: E501  # fmt: skip
+    assert not CriteriaOptimizer.is_unsatisfiable(criteria=leaf(('flag', Operator.EQUAL, 1), ('flag', Operator.NOT_EQUAL, True)))  # noqa: E501  # fmt: skip
+
+
+@mark.unit_testing
+def test_criteria_optimizer_does_not_compare_values_of_different_types() -> None:
+    """
+    Test CriteriaOptimizer class does not compare the values of a field that have different types, as the database
+    may compare them with other semantics than Python.
+    """
+    is_float = leaf(('price', Operator.EQUAL, 0.1))
+    is_decimal = leaf(('price', Operator.EQUAL, Decimal('0.1')))
+
+    assert not CriteriaOptimizer.is_unsatisfiable(criteria=is_float & is_decimal)
+    assert not CriteriaOptimizer.is_unsatisfiable(criteria=leaf(('price', Operator.GREATER, 1), ('price', Operator.LESS, Decimal('0.5'))))  # noqa: E501  # fmt: skip
+    assert not CriteriaOptimizer.is_unsatisfiable(criteria=leaf(('price', Operator.IN, [0.1]), ('price', Operator.IN, [Decimal('0.1')])))  # noqa: E501  # fmt: skip
+
+    query, parameters = CriteriaToPostgresqlConverter.convert(
+        criteria=is_float & is_decimal,
+        table='product',
+        detect_contradictions=True,
+    )
+
+    assert query == 'SELECT * FROM "product" WHERE ("price" = %(parameter_0)s AND "price" = %(parameter_1)s);'
+    assert parameters == {'parameter_0': 0.1, 'parameter_1': Decimal('0.1')}
+
+
+@mark.unit_testing
+def test_criteria_optimizer_detects_unsatisfiable_trees() -> None:
+    """
+    Test CriteriaOptimizer class combines the filters of the AND children, and an OR node is unsatisfiable only if all
+    its non-empty children are.
+    """
+    is_old = leaf(('age', Operator.GREATER, 30))
+    is_young = leaf(('age', Operator.LESS, 10))
+    is_nothing = leaf(('status', Operator.IN, []))
+    is_active = leaf(('status', Operator.EQUAL, 'active'))
+
+    assert CriteriaOptimizer.is_unsatisfiable(criteria=is_old & (is_active & is_young))
+    assert CriteriaOptimizer.is_unsatisfiable(criteria=is_active & (is_nothing | (is_old & is_young)) & Criteria())
+    assert CriteriaOptimizer.is_unsatisfiable(criteria=(is_nothing | Criteria() | ~Criteria()) & Criteria(page_size=10, page_number=1))  # noqa: E501  # fmt: skip
+    assert not CriteriaOptimizer.is_unsatisfiable(criteria=is_old & (is_active | is_young))
+    assert not CriteriaOptimizer.is_unsatisfiable(criteria=is_nothing | is_active)
+    assert not CriteriaOptimizer.is_unsatisfiable(criteria=~is_nothing)
+    assert not CriteriaOptimizer.is_unsatisfiable(criteria=Criteria() | ~Criteria())
+
+
+@mark.unit_testing
+def test_criteria_optimizer_unsatisfiable_criteria_match_no_rows() -> None:
+    """
+    Test CriteriaOptimizer class unsatisfiable criteria do not match any SQLite row, including the rows with null
+    values.
+    """
+    for _ in range(300):
+        criteria = random_criteria(depth=3)
+
+        if CriteriaOptimizer.is_unsatisfiable(criteria=criteria):
+            assert matching_ids(criteria=criteria) == []
+
+
+@mark.unit_testing
+def test_criteria_optimizer_push_down_negations() -> None:
+    """
+    Test CriteriaOptimizer class pushes the negations down to the filters following De Morgan's laws.
+    """
+    is_adult = leaf(('age', Operator.GREATER_OR_EQUAL, 18))
+    is_spanish = leaf(('country', Operator.EQUAL, 'ES'), ('city', Operator.IN, ['Madrid', 'Barcelona']))
+    is_admin = leaf(('role', Operator.IS_NULL, None))
+
+    query, parameters = CriteriaToPostgresqlConverter.convert(
+        criteria=CriteriaOptimizer.push_down_negations(criteria=~(is_adult & (is_spanish | ~is_admin))),
+        table='user',
+    )
+
+    assert query == 'SELECT * FROM "user" WHERE ("age" < %(parameter_0)s OR (("country" != %(parameter_1)s OR "city" NOT IN (%(parameter_2)s, %(parameter_3)s)) AND "role" IS NULL));'  # noqa: E501  # fmt: skip
+    assert parameters == {'parameter_0': 18, 'parameter_1': 'ES', 'parameter_2': 'Madrid', 'parameter_3': 'Barcelona'}
+
+
+@mark.unit_testing
+def test_criteria_optimizer_push_down_negations_complements() -> None:
+    """
+    Test CriteriaOptimizer class replaces each negated filter by the filter with the complementary operator.
+    """
+    complements = (
+        (Operator.EQUAL, Operator.NOT_EQUAL, 1),
+        (Operator.GREATER, Operator.LESS_OR_EQUAL, 1),
+        (Operator.GREATER_OR_EQUAL, Operator.LESS, 1),
+        (Operator.LIKE, Operator.NOT_LIKE, 'a%'),
+        (Operator.CONTAINS, Operator.NOT_CONTAINS, 'a'),
+        (Operator.STARTS_WITH, Operator.NOT_STARTS_WITH, 'a'),
+        (Operator.ENDS_WITH, Operator.NOT_ENDS_WITH, 'a'),
+        (Operator.BETWEEN, Operator.NOT_BETWEEN, [1, 2]),
+        (Operator.IS_NULL, Operator.IS_NOT_NULL, None),
+        (Operator.IN, Operator.NOT_IN, [1, 2]),
+    )
+
+    for operator, complement, value in complements:
+        assert CriteriaOptimizer.push_down_negations(criteria=~leaf(('x', operator, value))) == leaf(('x', complement, value))  # noqa: E501  # fmt: skip
+        assert CriteriaOptimizer.push_down_negations(criteria=~leaf(('x', complement, value))) == leaf(('x', operator, value))  # noqa: E501  # fmt: skip
+
+
+@mark.unit_testing
+def test_criteria_optimizer_push_down_negations_keeps_orders_and_pagination() -> None:
+    """
+    Test CriteriaOptimizer class keeps the orders and the pagination and drops the empty children when pushing the
+    negations down.
+    """
+    is_active = leaf(('status', Operator.EQUAL, 'active'))
+    page = Criteria(orders=[Order(field='name', direction=Direction.ASC)], page_size=20, page_number=2)
+
+    pushed = CriteriaOptimizer.push_down_negations(criteria=~(is_active & ~Criteria()) & page)
+
+    assert pushed == Criteria(
+        filters=[Filter(field='status', operator=Operator.NOT_EQUAL, value='active')],
+        orders=[Order(field='name', direction=Direction.ASC)],
+        page_size=20,
+        page_number=2,
+    )
+    assert CriteriaOptimizer.push_down_negations(criteria=~Criteria()) == Criteria()
+
+
+@mark.unit_testing
+def test_criteria_optimizer_push_down_negations_deep_criteria() -> None:
+    """
+    Test CriteriaOptimizer class pushes the negations of criteria deeper than the recursion limit.
+    """
+    criteria: Criteria = ~leaf(('id', Operator.GREATER, 0))
+    for value in range(1, 5000):
+        criteria = criteria & ~leaf(('id', Operator.GREATER, value))
+
+    pushed = CriteriaOptimizer.push_down_negations(criteria=criteria)
+
+    assert pushed.filters == [Filter(field='id', operator=Operator.LESS_OR_EQUAL, value=value) for value in range(5000)]
+    assert isinstance(pushed, AndCriteria)
+    assert not any(isinstance(child, NotCriteria) for child in pushed.children)
+
+
+@mark.unit_testing
+def test_criteria_optimizer_push_down_negations_matches_the_same_rows() -> None:
+    """
+    Test CriteriaOptimizer class criteria with the negations pushed down match the same SQLite rows as the original
+    ones, including the rows with null values, and do not have NOT nodes.
+    """
+    for _ in range(300):
+        criteria = random_criteria(depth=3)
+
+        pushed = CriteriaOptimizer.push_down_negations(criteria=criteria)
+
+        assert matching_ids(criteria=pushed) == matching_ids(criteria=criteria)
+        assert 'NOT (' not in CriteriaToSqliteConverter.convert(criteria=pushed, table='row')[0]
@@ -9,8 +9,9 @@ from pytest import mark, raises as assert_raises
 from sqlglot import parse_one
 
 from criteria_pattern import Criteria, Direction, Filter, Operator, Order
-from criteria_pattern.converters import CriteriaToMysqlConverter
+from criteria_pattern.converters import ConverterPolicy, CriteriaToMysqlConverter, PreparedStatement
 from criteria_pattern.errors import (
+    IntegrityError,
     InvalidColumnError,
     InvalidDirectionError,
     InvalidOperatorError,
@@ -1817,3 +1818,544 @@ def test_criteria_to_mysql_converter_with_none_pagination_bounds_check() -> None
         max_page_size=IntegerMother.positive(),
         max_page_number=IntegerMother.positive(),
     )
+
+
+@mark.unit_testing
+def test_criteria_to_mysql_converter_with_n_ary_criteria() -> None:
+    """
+    Test CriteriaToMysqlConverter class with n-ary AND and OR criteria.
+    """
+    criteria = [Criteria(filters=[Filter(field='id', operator=Operator.EQUAL, value=value)]) for value in range(1, 5)]
+
+    query, parameters = CriteriaToMysqlConverter.convert(
+        criteria=Criteria.all_of(
+            criteria=[criteria[0], Criteria.any_of(criteria=criteria[1:]), CriteriaMother.empty()]
+        ),
+        table='user',
+    )
+
+    assert query == 'SELECT * FROM user WHERE (id = %s AND (id = %s OR id = %s OR id = %s));'
+    assert parameters == [1, 2, 3, 4]
+    assert_valid_mysql_syntax(query=query, parameters=parameters)
+
+
+@mark.unit_testing
+def test_criteria_to_mysql_converter_with_deeply_nested_criteria() -> None:
+    """
+    Test CriteriaToMysqlConverter class with a deeply nested criteria does not exceed the recursion limit.
+    """
+    criteria = Criteria(filters=[Filter(field='id', operator=Operator.EQUAL, value=0)])
+    for value in range(1, 5000):
+        criteria |= Criteria(filters=[Filter(field='id', operator=Operator.EQUAL, value=value)])
+
+    query, parameters = CriteriaToMysqlConverter.convert(criteria=criteria, table='user')
+
+    assert query.startswith('SELECT * FROM user WHERE ' + '(' * 4999 + 'id = %s OR id = %s)')
+    assert query.count(' OR ') == 4999
+    assert parameters == list(range(5000))
+
+
+@mark.unit_testing
+def test_criteria_to_mysql_converter_with_keyset_pagination() -> None:
+    """
+    Test CriteriaToMysqlConverter class with keyset pagination uses a row value predicate instead of an offset.
+    """
+    criteria = Criteria(
+        filters=[Filter(field='age', operator=Operator.GREATER, value=18)],
+        orders=[Order(field='created_at', direction=Direction.ASC), Order(field='id', direction=Direction.ASC)],
+        page_size=20,
+        page_number=3,
+    )
+
+    query, parameters = CriteriaToMysqlConverter.convert(criteria=criteria, table='user', keyset=['2024-01-01', 7])
+
+    assert query == 'SELECT * FROM user WHERE age > %s AND (created_at, id) > (%s, %s) ORDER BY created_at ASC, id ASC LIMIT %s;'  # noqa: E501  # fmt: skip
+    assert parameters == [18, '2024-01-01', 7, 20]
+    assert_valid_mysql_syntax(query=query, parameters=parameters)
+
+
+@mark.unit_testing
+def test_criteria_to_mysql_converter_with_keyset_pagination_mixed_directions() -> None:
+    """
+    Test CriteriaToMysqlConverter class with keyset pagination expands the predicate for mixed directions.
+    """
+    criteria = Criteria(
+        orders=[Order(field='created_at', direction=Direction.DESC), Order(field='id', direction=Direction.ASC)],
+        page_size=20,
+    )
+
+    query, parameters = CriteriaToMysqlConverter.convert(criteria=criteria, table='user', keyset=['2024-01-01', 7])
+
+    assert query == 'SELECT * FROM user WHERE (created_at < %s OR (created_at = %s AND id > %s)) ORDER BY created_at DESC, id ASC LIMIT %s;'  # noqa: E501  # fmt: skip
+    assert parameters == ['2024-01-01', '2024-01-01', 7, 20]
+    assert_valid_mysql_syntax(query=query, parameters=parameters)
+
+
+@mark.unit_testing
+def test_criteria_to_mysql_converter_with_keyset_pagination_without_orders() -> None:
+    """
+    Test CriteriaToMysqlConverter class with keyset pagination raises an error when the criteria has no orders.
+    """
+    with assert_raises(
+        expected_exception=IntegrityError,
+        match='Keyset pagination requires the criteria to have orders.',
+    ):
+        CriteriaToMysqlConverter.convert(criteria=CriteriaMother.empty(), table='user', keyset=[1])
+
+
+@mark.unit_testing
+def test_criteria_to_mysql_converter_with_keyset_pagination_length_mismatch() -> None:
+    """
+    Test CriteriaToMysqlConverter class with keyset pagination raises an error on a keyset length mismatch.
+    """
+    criteria = Criteria(orders=[Order(field='id', direction=Direction.ASC)])
+
+    with assert_raises(
+        expected_exception=IntegrityError,
+        match='Keyset <<<\\[1, 2\\]>>> must have one value for each criteria order <<<1>>>.',
+    ):
+        CriteriaToMysqlConverter.convert(criteria=criteria, table='user', keyset=[1, 2])
+
+
+@mark.unit_testing
+def test_criteria_to_mysql_converter_with_in_operator_and_in_list_bucketing() -> None:
+    """
+    Test CriteriaToMysqlConverter class with IN operator and IN-list bucketing pads the values to a power of two.
+    """
+    criteria = Criteria(filters=[Filter(field='id', operator=Operator.IN, value=[1, 2, 3])])
+
+    query, parameters = CriteriaToMysqlConverter.convert(criteria=criteria, table='user', in_list_bucketing=True)
+
+    assert query == 'SELECT * FROM user WHERE id IN (%s, %s, %s, %s);'
+    assert parameters == [1, 2, 3, 3]
+    assert_valid_mysql_syntax(query=query, parameters=parameters)
+
+
+@mark.unit_testing
+def test_criteria_to_mysql_converter_with_not_in_operator_and_in_list_bucketing() -> None:
+    """
+    Test CriteriaToMysqlConverter class with NOT IN operator and IN-list bucketing pads the values to a power of two.
+    """
+    criteria = Criteria(filters=[Filter(field='id', operator=Operator.NOT_IN, value=[1, 2, 3])])
+
+    query, parameters = CriteriaToMysqlConverter.convert(criteria=criteria, table='user', in_list_bucketing=True)
+
+    assert query == 'SELECT * FROM user WHERE id NOT IN (%s, %s, %s, %s);'
+    assert parameters == [1, 2, 3, 3]
+    assert_valid_mysql_syntax(query=query, parameters=parameters)
+
+
+@mark.unit_testing
+def test_criteria_to_mysql_converter_with_in_list_bucketing_bounded_queries() -> None:
+    """
+    Test CriteriaToMysqlConverter class with IN-list bucketing returns one query for each power of two bucket.
+    """
+    queries = {
+        CriteriaToMysqlConverter.convert(
+            criteria=Criteria(filters=[Filter(field='id', operator=Operator.IN, value=list(range(1, length + 1)))]),
+            table='user',
+            in_list_bucketing=True,
+        )[0]
+        for length in range(1, 65)
+    }
+
+    assert len(queries) == 7
+
+
+@mark.unit_testing
+def test_criteria_to_mysql_converter_with_policy() -> None:
+    """
+    Test CriteriaToMysqlConverter class validates the table and criteria against the policy.
+    """
+    policy = ConverterPolicy(valid_tables=['user'], valid_columns=['id'])
+    criteria = Criteria(filters=[Filter(field='email', operator=Operator.EQUAL, value='john@example.com')])
+
+    with assert_raises(
+        expected_exception=InvalidTableError,
+        match='Invalid table specified <<<orders>>>. Valid tables are <<<user>>>.',
+    ):
+        CriteriaToMysqlConverter.convert(criteria=CriteriaMother.empty(), table='orders', columns=['id'], policy=policy)
+
+    with assert_raises(
+        expected_exception=InvalidColumnError,
+        match='Invalid column specified <<<email>>>. Valid columns are <<<id>>>.',
+    ):
+        CriteriaToMysqlConverter.convert(criteria=criteria, table='user', columns=['id'], policy=policy)
+
+
+@mark.unit_testing
+def test_criteria_to_mysql_converter_convert_many() -> None:
+    """
+    Test CriteriaToMysqlConverter class convert_many yields the same queries as convert for each criteria.
+    """
+    criteria = [
+        CriteriaMother.empty(),
+        Criteria(filters=[Filter(field='id', operator=Operator.IN, value=[1, 2, 3])], page_size=10, page_number=2),
+        Criteria(
+            filters=[Filter(field='name', operator=Operator.EQUAL, value='John')],
+            orders=[Order(field='email', direction=Direction.DESC)],
+        ),
+        *(CriteriaMother.create() for _ in range(5)),
+    ]
+
+    queries = list(
+        CriteriaToMysqlConverter.convert_many(
+            criteria=criteria,
+            table='user',
+            columns=['id', 'name'],
+            columns_mapping={'name': 'full_name'},
+        )
+    )
+
+    assert queries == [
+        CriteriaToMysqlConverter.convert(
+            criteria=single_criteria,
+            table='user',
+            columns=['id', 'name'],
+            columns_mapping={'name': 'full_name'},
+        )
+        for single_criteria in criteria
+    ]
+
+
+@mark.unit_testing
+def test_criteria_to_mysql_converter_convert_many_is_lazy() -> None:
+    """
+    Test CriteriaToMysqlConverter class convert_many validates and converts each criteria only when it is consumed.
+    """
+    criteria = iter(
+        [
+            Criteria(filters=[Filter(field='id', operator=Operator.EQUAL, value=1)]),
+            Criteria(filters=[Filter(field='email', operator=Operator.EQUAL, value='john@example.com')]),
+        ]
+    )
+    queries = CriteriaToMysqlConverter.convert_many(
+        criteria=criteria,
+        table='user',
+        check_criteria_injection=True,
+        valid_columns=['id'],
+    )
+
+    assert next(queries) is not None
+
+    with assert_raises(
+        expected_exception=InvalidColumnError,
+        match='Invalid column specified <<<email>>>. Valid columns are <<<id>>>.',
+    ):
+        next(queries)
+
+    with assert_raises(
+        expected_exception=InvalidTableError,
+        match='Invalid table specified <<<orders>>>. Valid tables are <<<user>>>.',
+    ):
+        next(
+            CriteriaToMysqlConverter.convert_many(
+                criteria=[], table='orders', check_table_injection=True, valid_tables=['user']
+            ),
+            None,
+        )
+
+
+@mark.unit_testing
+def test_criteria_to_mysql_converter_convert_prepared() -> None:
+    """
+    Test CriteriaToMysqlConverter class convert_prepared with user variables bound to the parameters.
+    """
+    criteria = Criteria(
+        filters=[
+            Filter(field='name', operator=Operator.EQUAL, value='John'),
+            Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18),
+        ],
+    )
+
+    statement = CriteriaToMysqlConverter.convert_prepared(criteria=criteria, table='user')
+
+    assert statement.name == PreparedStatement.name_of(statement='SELECT * FROM user WHERE name = ? AND age >= ?')
+    assert statement.prepare == f"PREPARE {statement.name} FROM 'SELECT * FROM user WHERE name = ? AND age >= ?';"  # noqa: S608
+    assert statement.execute == [
+        ('SET @parameter_0 = %s, @parameter_1 = %s;', ['John', 18]),
+        (f'EXECUTE {statement.name} USING @parameter_0, @parameter_1;', []),
+    ]
+    assert statement.deallocate == f'DEALLOCATE PREPARE {statement.name};'
+
+
+@mark.unit_testing
+def test_criteria_to_mysql_converter_convert_prepared_escapes_literal() -> None:
+    """
+    Test CriteriaToMysqlConverter class convert_prepared escapes the quotes of the prepared statement literal.
+    """
+    criteria = Criteria(filters=[Filter(field='name', operator=Operator.CONTAINS, value="O'Brien")])
+
+    statement = CriteriaToMysqlConverter.convert_prepared(criteria=criteria, table='user')
+
+    assert statement.prepare == f"PREPARE {statement.name} FROM 'SELECT * FROM user WHERE name LIKE CONCAT(''%'', ?, ''%'')';"  # noqa: E501, S608  # fmt: skip
+    assert statement.execute[0] == ('SET @parameter_0 = %s;', ["O'Brien"])
+
+
+@mark.unit_testing
+def test_criteria_to_mysql_converter_convert_prepared_without_parameters() -> None:
+    """
+    Test CriteriaToMysqlConverter class convert_prepared without parameters executes without variables.
+    """
+    statement = CriteriaToMysqlConverter.convert_prepared(criteria=Criteria(), table='user')
+
+    assert statement.prepare == f"PREPARE {statement.name} FROM 'SELECT * FROM user';"  # noqa: S608
+    assert statement.execute == [(f'EXECUTE {statement.name};', [])]
+
+
+def build_page_criteria() -> Criteria:
+    """
+    Helper function to build a filtered, ordered and paginated criteria.
+
+    Returns:
+        Criteria: Built criteria.
+    """
+    return Criteria(
+        filters=[
+            Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18),
+            Filter(field='status', operator=Operator.EQUAL, value='active'),
+        ],
+        orders=[Order(field='age', direction=Direction.DESC)],
+        page_size=20,
+        page_number=3,
+    )
+
+
+@mark.unit_testing
+def test_criteria_to_mysql_converter_convert_count() -> None:
+    """
+    Test CriteriaToMysqlConverter class convert_count ignores the orders and pagination and keeps the criteria.
+    """
+    criteria = build_page_criteria()
+
+    query, parameters = CriteriaToMysqlConverter.convert_count(criteria=criteria, table='user')
+
+    assert query == 'SELECT COUNT(*) FROM user WHERE age >= %s AND status = %s;'  # noqa: E501, S608  # fmt: skip
+    assert parameters == [18, 'active']
+    assert criteria.page_size == 20
+    assert criteria.page_number == 3
+    assert criteria.has_orders()
+    assert_valid_mysql_syntax(query=query, parameters=parameters)
+
+
+@mark.unit_testing
+def test_criteria_to_mysql_converter_convert_count_without_filters() -> None:
+    """
+    Test CriteriaToMysqlConverter class convert_count without filters counts every row.
+    """
+    query, parameters = CriteriaToMysqlConverter.convert_count(criteria=Criteria(page_size=10), table='user')
+
+    assert query == 'SELECT COUNT(*) FROM user;'  # noqa: S608
+    assert not parameters
+
+
+@mark.unit_testing
+def test_criteria_to_mysql_converter_convert_count_with_unexpected_option() -> None:
+    """
+    Test CriteriaToMysqlConverter class convert_count raises an error with a misspelled option instead of ignoring it.
+    """
+    with assert_raises(
+        expected_exception=TypeError,
+        match=r"convert_count\(\) got an unexpected keyword argument 'check_table_injecton'",
+    ):
+        CriteriaToMysqlConverter.convert_count(criteria=Criteria(), table='user', check_table_injecton=True)  # type: ignore[call-arg]
+
+
+@mark.unit_testing
+def test_criteria_to_mysql_converter_convert_exists() -> None:
+    """
+    Test CriteriaToMysqlConverter class convert_exists stops at the first matching row.
+    """
+    query, parameters = CriteriaToMysqlConverter.convert_exists(criteria=build_page_criteria(), table='user')
+
+    assert query == 'SELECT 1 FROM user WHERE age >= %s AND status = %s LIMIT 1;'  # noqa: E501, S608  # fmt: skip
+    assert parameters == [18, 'active']
+    assert_valid_mysql_syntax(query=query, parameters=parameters)
+
+
+@mark.unit_testing
+def test_criteria_to_mysql_converter_convert_exists_with_validation() -> None:
+    """
+    Test CriteriaToMysqlConverter class convert_exists validates the table and the criteria.
+    """
+    with assert_raises(
+        expected_exception=InvalidColumnError,
+        match='Invalid column specified <<<status>>>. Valid columns are <<<age>>>.',
+    ):
+        CriteriaToMysqlConverter.convert_exists(
+            criteria=build_page_criteria(),
+            table='user',
+            check_criteria_injection=True,
+            valid_columns=['age'],
+        )
+
+    with assert_raises(
+        expected_exception=InvalidTableError,
+        match='Invalid table specified <<<user>>>. Valid tables are <<<orders>>>.',
+    ):
+        CriteriaToMysqlConverter.convert_exists(criteria=build_page_criteria(), table='user', policy=ConverterPolicy(valid_tables=['orders']))  # noqa: E501, S608  # fmt: skip
+
+
+@mark.unit_testing
+def test_criteria_to_mysql_converter_convert_page_with_total() -> None:
+    """
+    Test CriteriaToMysqlConverter class convert_page_with_total matches convert and convert_count.
+    """
+    for _ in range(20):
+        criteria = CriteriaMother.create() & ~(CriteriaMother.create() | CriteriaMother.create())
+
+        page, count = CriteriaToMysqlConverter.convert_page_with_total(criteria=criteria, table='user')
+
+        assert page == CriteriaToMysqlConverter.convert(criteria=criteria, table='user')
+        assert count == CriteriaToMysqlConverter.convert_count(criteria=criteria, table='user')
+
+
+@mark.unit_testing
+def test_criteria_to_mysql_converter_convert_page_with_total_with_keyset() -> None:
+    """
+    Test CriteriaToMysqlConverter class convert_page_with_total leaves the keyset out of the count query.
+    """
+    criteria = build_page_criteria()
+
+    (query, parameters), (count_query, count_parameters) = CriteriaToMysqlConverter.convert_page_with_total(
+        criteria=criteria,
+        table='user',
+        keyset=[30],
+    )
+
+    assert (query, parameters) == CriteriaToMysqlConverter.convert(criteria=criteria, table='user', keyset=[30])
+    assert count_query == 'SELECT COUNT(*) FROM user WHERE age >= %s AND status = %s;'  # noqa: E501, S608  # fmt: skip
+    assert count_parameters == [18, 'active']
+
+
+@mark.unit_testing
+def test_criteria_to_mysql_converter_with_detect_contradictions() -> None:
+    """
+    Test CriteriaToMysqlConverter class returns a parameterless constant-false query for an unsatisfiable criteria.
+    """
+    is_old = Criteria(filters=[Filter(field='age', operator=Operator.GREATER, value=30)])
+    is_young = Criteria(filters=[Filter(field='age', operator=Operator.LESS, value=10)])
+
+    query, parameters = CriteriaToMysqlConverter.convert(
+        criteria=is_old & is_young,
+        table='user',
+        columns=['id', 'name'],
+        detect_contradictions=True,
+    )
+
+    assert query == 'SELECT id, name FROM user WHERE 1 = 0;'
+    assert parameters == []
+
+
+@mark.unit_testing
+def test_criteria_to_mysql_converter_with_detect_contradictions_satisfiable_criteria() -> None:
+    """
+    Test CriteriaToMysqlConverter class converts a satisfiable criteria as usual when detecting contradictions.
+    """
+    is_adult = Criteria(filters=[Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18)])
+    is_not_retired = Criteria(filters=[Filter(field='age', operator=Operator.LESS_OR_EQUAL, value=65)])
+
+    query, parameters = CriteriaToMysqlConverter.convert(
+        criteria=is_adult & is_not_retired,
+        table='user',
+        detect_contradictions=True,
+    )
+
+    assert (query, parameters) == CriteriaToMysqlConverter.convert(
+        criteria=is_adult & is_not_retired,
+        table='user',
+    )
+
+
+@mark.unit_testing
+def test_criteria_to_mysql_converter_entry_points_with_detect_contradictions() -> None:
+    """
+    Test CriteriaToMysqlConverter class returns parameterless constant-false queries from every entry point for an
+    unsatisfiable criteria.
+    """
+    is_old = Criteria(filters=[Filter(field='age', operator=Operator.GREATER, value=30)])
+    is_young = Criteria(filters=[Filter(field='age', operator=Operator.LESS, value=10)])
+    criteria = is_old & is_young
+
+    count = CriteriaToMysqlConverter.convert_count(criteria=criteria, table='user', detect_contradictions=True)
+    exists = CriteriaToMysqlConverter.convert_exists(criteria=criteria, table='user', detect_contradictions=True)
+    page, total = CriteriaToMysqlConverter.convert_page_with_total(
+        criteria=criteria,
+        table='user',
+        columns=['id'],
+        detect_contradictions=True,
+    )
+    queries = list(
+        CriteriaToMysqlConverter.convert_many(criteria=[criteria, is_old], table='user', detect_contradictions=True)
+    )
+    statement = CriteriaToMysqlConverter.convert_prepared(criteria=criteria, table='user', detect_contradictions=True)
+
+    assert count == ('SELECT COUNT(*) FROM user WHERE 1 = 0;', [])
+    assert exists == ('SELECT 1 FROM user WHERE 1 = 0 LIMIT 1;', [])
+    assert page == ('SELECT id FROM user WHERE 1 = 0;', [])
+    assert total == ('SELECT COUNT(*) FROM user WHERE 1 = 0;', [])
+    assert queries == [('SELECT * FROM user WHERE 1 = 0;', []), ('SELECT * FROM user WHERE age > %s;', [30])]
+    assert statement.prepare == f"PREPARE {statement.name} FROM 'SELECT * FROM user WHERE 1 = 0';"  # noqa: S608
+
+
+@mark.unit_testing
+def test_criteria_to_mysql_converter_with_push_down_negations() -> None:
+    """
+    Test CriteriaToMysqlConverter class pushes the negations down to the filters using their complements.
+    """
+    is_adult = Criteria(filters=[Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18)])
+    is_open = Criteria(filters=[Filter(field='status', operator=Operator.IN, value=['active', 'pending'])])
+
+    query, parameters = CriteriaToMysqlConverter.convert(
+        criteria=~(is_adult & is_open),
+        table='user',
+        push_down_negations=True,
+    )
+
+    assert query == 'SELECT * FROM user WHERE (age < %s OR status NOT IN (%s, %s));'  # noqa: E501  # fmt: skip
+    assert parameters == [18, 'active', 'pending']  # noqa: E501  # fmt: skip
+
+
+@mark.unit_testing
+def test_criteria_to_mysql_converter_entry_points_with_push_down_negations() -> None:
+    """
+    Test CriteriaToMysqlConverter class pushes the negations down to the filters from every entry point.
+    """
+    criteria = ~Criteria(filters=[Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18)])
+
+    count = CriteriaToMysqlConverter.convert_count(criteria=criteria, table='user', push_down_negations=True)
+    exists = CriteriaToMysqlConverter.convert_exists(criteria=criteria, table='user', push_down_negations=True)
+    page, total = CriteriaToMysqlConverter.convert_page_with_total(
+        criteria=criteria,
+        table='user',
+        columns=['id'],
+        push_down_negations=True,
+    )
+    queries = list(CriteriaToMysqlConverter.convert_many(criteria=[criteria], table='user', push_down_negations=True))
+    statement = CriteriaToMysqlConverter.convert_prepared(criteria=criteria, table='user', push_down_negations=True)
+
+    assert count == ('SELECT COUNT(*) FROM user WHERE age < %s;', [18])
+    assert exists == ('SELECT 1 FROM user WHERE age < %s LIMIT 1;', [18])
+    assert page == ('SELECT id FROM user WHERE age < %s;', [18])
+    assert total == ('SELECT COUNT(*) FROM user WHERE age < %s;', [18])
+    assert queries == [('SELECT * FROM user WHERE age < %s;', [18])]
+    assert statement.prepare == f"PREPARE {statement.name} FROM 'SELECT * FROM user WHERE age < ?';"  # noqa: S608
+
+
+@mark.unit_testing
+def test_criteria_to_mysql_converter_with_optimize() -> None:
+    """
+    Test CriteriaToMysqlConverter class optimizes the criteria before it is converted from every entry point.
+    """
+    is_adult = Criteria(filters=[Filter(field='age', operator=Operator.GREATER, value=5), Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18)])  # noqa: E501  # fmt: skip
+    is_not_retired = Criteria(filters=[Filter(field='age', operator=Operator.LESS_OR_EQUAL, value=65)])
+
+    query = CriteriaToMysqlConverter.convert(criteria=is_adult & is_not_retired, table='user', optimize=True)
+    count = CriteriaToMysqlConverter.convert_count(criteria=is_adult & is_not_retired, table='user', optimize=True)
+    queries = list(
+        CriteriaToMysqlConverter.convert_many(criteria=[is_adult & is_not_retired], table='user', optimize=True)
+    )
+
+    assert query == ('SELECT * FROM user WHERE age BETWEEN %s AND %s;', [18, 65])  # noqa: E501  # fmt: skip
+    assert count == ('SELECT COUNT(*) FROM user WHERE age BETWEEN %s AND %s;', [18, 65])  # noqa: E501  # fmt: skip
+    assert queries == [('SELECT * FROM user WHERE age BETWEEN %s AND %s;', [18, 65])]  # noqa: E501  # fmt: skip
@@ -0,0 +1,201 @@
+"""
+Test CriteriaToNumpyConverter class.
+"""
+
+from typing import Any
+
+from pytest import importorskip, mark, raises as assert_raises
+
+from criteria_pattern import Criteria, Direction, Filter, Operator, Order
+from criteria_pattern.converters import CriteriaToNumpyConverter
+from criteria_pattern.errors import InvalidColumnError
+
+numpy = importorskip('numpy')
+
+COLUMNS: dict[str, Any] = {
+    'id': numpy.array([1, 2, 3, 4]),
+    'name': numpy.array(['John', 'Jane', 'Joan', 'Mark']),
+    'email': numpy.array(['john@gmail.com', 'jane@yahoo.com', None, 'mark@gmail.com'], dtype=object),
+    'age': numpy.array([30.0, 17.0, 45.0, numpy.nan]),
+}
+
+
+def matching_ids(*, operator: Operator, field: str, value: Any = None) -> list[int]:
+    """
+    Helper function to return the identifiers of the rows that match a single filter.
+
+    Args:
+        operator (Operator): Filter operator.
+        field (str): Filter field.
+        value (Any, optional): Filter value. Default to None.
+
+    Returns:
+        list[int]: Identifiers of the matching rows.
+    """
+    criteria = Criteria(filters=[Filter(field=field, operator=operator, value=value)])
+    indices = CriteriaToNumpyConverter.convert(criteria=criteria, columns=COLUMNS)
+
+    return COLUMNS['id'][indices].tolist()  # type: ignore[no-any-return]
+
+
+@mark.unit_testing
+def test_criteria_to_numpy_converter_with_empty_criteria() -> None:
+    """
+    Test CriteriaToNumpyConverter class with an empty criteria returns every row.
+    """
+    indices = CriteriaToNumpyConverter.convert(criteria=Criteria(), columns=COLUMNS)
+
+    assert indices.tolist() == [0, 1, 2, 3]
+
+
+@mark.unit_testing
+def test_criteria_to_numpy_converter_with_comparison_operators() -> None:
+    """
+    Test CriteriaToNumpyConverter class with the comparison operators, null values never match.
+    """
+    assert matching_ids(operator=Operator.EQUAL, field='age', value=30) == [1]
+    assert matching_ids(operator=Operator.NOT_EQUAL, field='age', value=30) == [2, 3]
+    assert matching_ids(operator=Operator.GREATER, field='age', value=30) == [3]
+    assert matching_ids(operator=Operator.GREATER_OR_EQUAL, field='age', value=30) == [1, 3]
+    assert matching_ids(operator=Operator.LESS, field='age', value=30) == [2]
+    assert matching_ids(operator=Operator.LESS_OR_EQUAL, field='age', value=30) == [1, 2]
+    assert matching_ids(operator=Operator.BETWEEN, field='age', value=[17, 30]) == [1, 2]
+    assert matching_ids(operator=Operator.NOT_BETWEEN, field='age', value=[17, 30]) == [3]
+
+
+@mark.unit_testing
+def test_criteria_to_numpy_converter_with_string_operators() -> None:
+    """
+    Test CriteriaToNumpyConverter class with the string operators, null values never match.
+    """
+    assert matching_ids(operator=Operator.LIKE, field='email', value='%@gmail.com') == [1, 4]
+    assert matching_ids(operator=Operator.NOT_LIKE, field='email', value='j_hn@%') == [2, 4]
+    assert matching_ids(operator=Operator.CONTAINS, field='email', value='yahoo') == [2]
+    assert matching_ids(operator=Operator.NOT_CONTAINS, field='email', value='yahoo') == [1, 4]
+    assert matching_ids(operator=Operator.STARTS_WITH, field='name', value='Jo') == [1, 3]
+    assert matching_ids(operator=Operator.NOT_STARTS_WITH, field='name', value='Jo') == [2, 4]
+    assert matching_ids(operator=Operator.ENDS_WITH, field='name', value='n') == [1, 3]
+    assert matching_ids(operator=Operator.NOT_ENDS_WITH, field='name', value='n') == [2, 4]
+
+
+@mark.unit_testing
+def test_criteria_to_numpy_converter_with_null_and_membership_operators() -> None:
+    """
+    Test CriteriaToNumpyConverter class with the null and membership operators.
+    """
+    assert matching_ids(operator=Operator.IS_NULL, field='email') == [3]
+    assert matching_ids(operator=Operator.IS_NOT_NULL, field='email') == [1, 2, 4]
+    assert matching_ids(operator=Operator.IS_NULL, field='age') == [4]
+    assert matching_ids(operator=Operator.IS_NULL, field='id') == []
+    assert matching_ids(operator=Operator.IN, field='name', value=['John', 'Mark']) == [1, 4]
+    assert matching_ids(operator=Operator.NOT_IN, field='name', value=['John', 'Mark']) == [2, 3]
+
+
+@mark.unit_testing
+def test_criteria_to_numpy_converter_with_logical_criteria() -> None:
+    """
+    Test CriteriaToNumpyConverter class with AND, OR and NOT criteria.
+    """
+    is_adult = Criteria(filters=[Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18)])
+    is_gmail = Criteria(filters=[Filter(field='email', operator=Operator.ENDS_WITH, value='@gmail.com')])
+    is_joan = Criteria(filters=[Filter(field='name', operator=Operator.EQUAL, value='Joan')])
+
+    mask = CriteriaToNumpyConverter.convert_mask(
+        criteria=(is_adult & is_gmail) | ~(is_adult | is_joan) | (is_joan & is_joan),
+        columns=COLUMNS,
+    )
+
+    not_adult_mask = CriteriaToNumpyConverter.convert_mask(criteria=~is_adult, columns=COLUMNS)
+
+    assert mask.tolist() == [True, True, True, True]
+    assert not_adult_mask.tolist() == [False, True, False, True]
+
+
+@mark.unit_testing
+def test_criteria_to_numpy_converter_with_orders() -> None:
+    """
+    Test CriteriaToNumpyConverter class with several orders, null values are sorted last in ascending order.
+    """
+    columns = {
+        'id': numpy.array([1, 2, 3, 4, 5]),
+        'name': numpy.array(['John', 'Jane', 'Joan', 'Mark', 'John']),
+        'age': numpy.array([30.0, 17.0, 45.0, numpy.nan, 20.0]),
+    }
+    criteria = Criteria(
+        orders=[Order(field='name', direction=Direction.DESC), Order(field='age', direction=Direction.ASC)],
+    )
+    age_criteria = Criteria(orders=[Order(field='age', direction=Direction.ASC)])
+
+    indices = CriteriaToNumpyConverter.convert(criteria=criteria, columns=columns)
+    age_indices = CriteriaToNumpyConverter.convert(criteria=age_criteria, columns=columns)
+
+    assert columns['id'][indices].tolist() == [4, 5, 1, 3, 2]
+    assert columns['id'][age_indices].tolist() == [2, 5, 1, 3, 4]
+
+
+@mark.unit_testing
+def test_criteria_to_numpy_converter_with_pagination() -> None:
+    """
+    Test CriteriaToNumpyConverter class with page size and page number, with and without orders.
+    """
+    ordered_criteria = Criteria(orders=[Order(field='id', direction=Direction.DESC)], page_size=2, page_number=2)
+    unordered_criteria = Criteria(page_size=3)
+
+    ordered_indices = CriteriaToNumpyConverter.convert(criteria=ordered_criteria, columns=COLUMNS)
+    unordered_indices = CriteriaToNumpyConverter.convert(criteria=unordered_criteria, columns=COLUMNS)
+
+    assert COLUMNS['id'][ordered_indices].tolist() == [2, 1]
+    assert COLUMNS['id'][unordered_indices].tolist() == [1, 2, 3]
+
+
+@mark.unit_testing
+def test_criteria_to_numpy_converter_with_partial_sort_keeps_ties_stable() -> None:
+    """
+    Test CriteriaToNumpyConverter class with a page smaller than the rows keeps the ties in their original order.
+    """
+    columns = {'group': numpy.array([2, 1, 2, 1, 1, 2])}
+    criteria = Criteria(orders=[Order(field='group', direction=Direction.ASC)], page_size=4)
+
+    indices = CriteriaToNumpyConverter.convert(criteria=criteria, columns=columns)
+
+    assert indices.tolist() == [1, 3, 4, 0]
+
+
+@mark.unit_testing
+def test_criteria_to_numpy_converter_with_columns_mapping() -> None:
+    """
+    Test CriteriaToNumpyConverter class with a columns mapping.
+    """
+    criteria = Criteria(filters=[Filter(field='identifier', operator=Operator.EQUAL, value=2)])
+
+    indices = CriteriaToNumpyConverter.convert(criteria=criteria, columns=COLUMNS, columns_mapping={'identifier': 'id'})
+
+    assert indices.tolist() == [1]
+
+
+@mark.unit_testing
+def test_criteria_to_numpy_converter_with_unknown_column() -> None:
+    """
+    Test CriteriaToNumpyConverter class raises an error when a field is not one of the columns.
+    """
+    criteria = Criteria(filters=[Filter(field='country', operator=Operator.EQUAL, value='ES')])
+
+    with assert_raises(
+        expected_exception=InvalidColumnError,
+        match='Invalid column specified <<<country>>>. Valid columns are <<<id, name, email, age>>>.',
+    ):
+        CriteriaToNumpyConverter.convert(criteria=criteria, columns=COLUMNS)
+
+
+@mark.unit_testing
+def test_criteria_to_numpy_converter_with_deeply_nested_criteria() -> None:
+    """
+    Test CriteriaToNumpyConverter class with a deeply nested criteria does not exceed the recursion limit.
+    """
+    criteria = Criteria(filters=[Filter(field='id', operator=Operator.EQUAL, value=0)])
+    for value in range(1, 5000):
+        criteria |= Criteria(filters=[Filter(field='id', operator=Operator.EQUAL, value=value)])
+
+    indices = CriteriaToNumpyConverter.convert(criteria=criteria, columns=COLUMNS)
+
+    assert indices.tolist() == [0, 1, 2, 3]
@@ -2,6 +2,7 @@
 Test CriteriaToPostgresqlConverter class.
 """
 
+from re import sub as re_sub
 from typing import Any
 
 from object_mother_pattern import IntegerMother
@@ -9,8 +10,9 @@ from pytest import mark, raises as assert_raises
 from sqlglot import parse_one
 
 from criteria_pattern import Criteria, Direction, Filter, Operator, Order
-from criteria_pattern.converters import CriteriaToPostgresqlConverter
+from criteria_pattern.converters import ConverterPolicy, CriteriaToPostgresqlConverter, PreparedStatement, QueryCache
 from criteria_pattern.errors import (
+    IntegrityError,
     InvalidColumnError,
     InvalidDirectionError,
     InvalidOperatorError,
@@ -1818,3 +1820,818 @@ def test_criteria_to_postgresql_converter_with_none_pagination_bounds_check() ->
         max_page_size=IntegerMother.positive(),
         max_page_number=IntegerMother.positive(),
     )
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_with_cache_returns_same_query_as_without_cache() -> None:
+    """
+    Test CriteriaToPostgresqlConverter with a cache returns the same query and parameters as without it.
+    """
+    cache = QueryCache()
+    criteria = CriteriaMother.with_filters(
+        filters=[
+            FilterMother.create(field='age', operator=Operator.BETWEEN, value=[18, 65]),
+            FilterMother.create(field='status', operator=Operator.IN, value=['active', 'pending']),
+            FilterMother.create(field='deleted_at', operator=Operator.IS_NULL),
+        ],
+    )
+    criteria = ~criteria | Criteria(
+        filters=[Filter(field='name', operator=Operator.EQUAL, value='John')],
+        orders=[Order(field='name', direction=Direction.ASC)],
+        page_size=10,
+        page_number=3,
+    )
+
+    expected = CriteriaToPostgresqlConverter.convert(criteria=criteria, table='user')
+    first = CriteriaToPostgresqlConverter.convert(criteria=criteria, table='user', cache=cache)
+    second = CriteriaToPostgresqlConverter.convert(criteria=criteria, table='user', cache=cache)
+
+    assert first == expected
+    assert second == expected
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_with_cache_hit_uses_new_values() -> None:
+    """
+    Test CriteriaToPostgresqlConverter with a cache hit binds the values of the converted criteria.
+    """
+    cache = QueryCache()
+    criteria1 = Criteria(
+        filters=[Filter(field='age', operator=Operator.GREATER, value=18)],
+        page_size=10,
+        page_number=1,
+    )
+    criteria2 = Criteria(
+        filters=[Filter(field='age', operator=Operator.GREATER, value=30)],
+        page_size=20,
+        page_number=2,
+    )
+
+    CriteriaToPostgresqlConverter.convert(criteria=criteria1, table='user', cache=cache)
+    query, parameters = CriteriaToPostgresqlConverter.convert(criteria=criteria2, table='user', cache=cache)
+
+    assert query == 'SELECT * FROM "user" WHERE "age" > %(parameter_0)s LIMIT %(limit_1)s OFFSET %(offset_2)s;'
+    assert parameters == {'parameter_0': 30, 'limit_1': 20, 'offset_2': 20}
+    assert cache.hits == 1
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_with_cache_misses_on_different_shape() -> None:
+    """
+    Test CriteriaToPostgresqlConverter with a cache does not reuse queries of criteria with a different shape.
+    """
+    cache = QueryCache()
+    criteria1 = Criteria(filters=[Filter(field='id', operator=Operator.IN, value=[1, 2])])
+    criteria2 = Criteria(filters=[Filter(field='id', operator=Operator.IN, value=[1, 2, 3])])
+
+    CriteriaToPostgresqlConverter.convert(criteria=criteria1, table='user', cache=cache)
+    CriteriaToPostgresqlConverter.convert(criteria=criteria1, table='user', columns=['id'], cache=cache)
+    query, parameters = CriteriaToPostgresqlConverter.convert(criteria=criteria2, table='user', cache=cache)
+
+    assert query == 'SELECT * FROM "user" WHERE "id" IN (%(parameter_0)s, %(parameter_1)s, %(parameter_2)s);'
+    assert parameters == {'parameter_0': 1, 'parameter_1': 2, 'parameter_2': 3}
+    assert cache.hits == 0
+    assert cache.misses == 3
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_with_n_ary_criteria() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class with n-ary AND and OR criteria.
+    """
+    criteria = [Criteria(filters=[Filter(field='id', operator=Operator.EQUAL, value=value)]) for value in range(1, 5)]
+
+    query, parameters = CriteriaToPostgresqlConverter.convert(
+        criteria=Criteria.all_of(
+            criteria=[criteria[0], Criteria.any_of(criteria=criteria[1:]), CriteriaMother.empty()]
+        ),
+        table='user',
+    )
+
+    assert query == 'SELECT * FROM "user" WHERE ("id" = %(parameter_0)s AND ("id" = %(parameter_1)s OR "id" = %(parameter_2)s OR "id" = %(parameter_3)s));'  # noqa: E501  # fmt: skip
+    assert parameters == {'parameter_0': 1, 'parameter_1': 2, 'parameter_2': 3, 'parameter_3': 4}
+    assert_valid_postgresql_syntax(query=query)
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_with_deeply_nested_criteria() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class with a deeply nested criteria does not exceed the recursion limit.
+    """
+    criteria = Criteria(filters=[Filter(field='id', operator=Operator.EQUAL, value=0)])
+    for value in range(1, 5000):
+        criteria |= Criteria(filters=[Filter(field='id', operator=Operator.EQUAL, value=value)])
+
+    query, parameters = CriteriaToPostgresqlConverter.convert(criteria=criteria, table='user')
+
+    assert query.startswith(
+        'SELECT * FROM "user" WHERE ' + '(' * 4999 + '"id" = %(parameter_0)s OR "id" = %(parameter_1)s)'
+    )
+    assert query.count(' OR ') == 4999
+    assert parameters == {f'parameter_{value}': value for value in range(5000)}
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_with_keyset_pagination() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class with keyset pagination uses a row value predicate instead of an offset.
+    """
+    criteria = Criteria(
+        filters=[Filter(field='age', operator=Operator.GREATER, value=18)],
+        orders=[Order(field='created_at', direction=Direction.ASC), Order(field='id', direction=Direction.ASC)],
+        page_size=20,
+        page_number=3,
+    )
+
+    query, parameters = CriteriaToPostgresqlConverter.convert(criteria=criteria, table='user', keyset=['2024-01-01', 7])
+
+    assert query == 'SELECT * FROM "user" WHERE "age" > %(parameter_0)s AND ("created_at", "id") > (%(keyset_1)s, %(keyset_2)s) ORDER BY "created_at" ASC, "id" ASC LIMIT %(limit_3)s;'  # noqa: E501  # fmt: skip
+    assert parameters == {'parameter_0': 18, 'keyset_1': '2024-01-01', 'keyset_2': 7, 'limit_3': 20}
+    assert_valid_postgresql_syntax(query=query)
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_with_keyset_pagination_mixed_directions() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class with keyset pagination expands the predicate for mixed directions.
+    """
+    criteria = Criteria(
+        orders=[Order(field='created_at', direction=Direction.DESC), Order(field='id', direction=Direction.ASC)],
+        page_size=20,
+    )
+
+    query, parameters = CriteriaToPostgresqlConverter.convert(criteria=criteria, table='user', keyset=['2024-01-01', 7])
+
+    assert query == 'SELECT * FROM "user" WHERE ("created_at" < %(keyset_0)s OR ("created_at" = %(keyset_1)s AND "id" > %(keyset_2)s)) ORDER BY "created_at" DESC, "id" ASC LIMIT %(limit_3)s;'  # noqa: E501  # fmt: skip
+    assert parameters == {'keyset_0': '2024-01-01', 'keyset_1': '2024-01-01', 'keyset_2': 7, 'limit_3': 20}
+    assert_valid_postgresql_syntax(query=query)
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_with_keyset_pagination_without_orders() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class with keyset pagination raises an error when the criteria has no orders.
+    """
+    with assert_raises(
+        expected_exception=IntegrityError,
+        match='Keyset pagination requires the criteria to have orders.',
+    ):
+        CriteriaToPostgresqlConverter.convert(criteria=CriteriaMother.empty(), table='user', keyset=[1])
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_with_keyset_pagination_length_mismatch() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class with keyset pagination raises an error on a keyset length mismatch.
+    """
+    criteria = Criteria(orders=[Order(field='id', direction=Direction.ASC)])
+
+    with assert_raises(
+        expected_exception=IntegrityError,
+        match='Keyset <<<\\[1, 2\\]>>> must have one value for each criteria order <<<1>>>.',
+    ):
+        CriteriaToPostgresqlConverter.convert(criteria=criteria, table='user', keyset=[1, 2])
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_with_keyset_pagination_cache() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class with keyset pagination binds the new keyset on a cache hit.
+    """
+    cache = QueryCache()
+    criteria = Criteria(orders=[Order(field='id', direction=Direction.ASC)], page_size=10, page_number=2)
+
+    first_query, first_parameters = CriteriaToPostgresqlConverter.convert(
+        criteria=criteria,
+        table='user',
+        keyset=[10],
+        cache=cache,
+    )
+    second_query, second_parameters = CriteriaToPostgresqlConverter.convert(
+        criteria=criteria,
+        table='user',
+        keyset=[20],
+        cache=cache,
+    )
+
+    assert first_query == second_query == 'SELECT * FROM "user" WHERE "id" > %(keyset_0)s ORDER BY "id" ASC LIMIT %(limit_1)s;'  # noqa: E501  # fmt: skip
+    assert first_parameters == {'keyset_0': 10, 'limit_1': 10}
+    assert second_parameters == {'keyset_0': 20, 'limit_1': 10}
+    assert cache.hits == 1
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_with_in_operator_and_array_binding() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class with IN operator and array binding uses a single array parameter.
+    """
+    criteria = Criteria(filters=[Filter(field='id', operator=Operator.IN, value=[1, 2, 3])])
+
+    query, parameters = CriteriaToPostgresqlConverter.convert(criteria=criteria, table='user', array_binding=True)
+
+    assert query == 'SELECT * FROM "user" WHERE "id" = ANY(%(parameter_0)s);'
+    assert parameters == {'parameter_0': [1, 2, 3]}
+    assert_valid_postgresql_syntax(query=query)
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_with_not_in_operator_and_array_binding() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class with NOT IN operator and array binding uses a single array parameter.
+    """
+    criteria = Criteria(filters=[Filter(field='id', operator=Operator.NOT_IN, value=[1, 2, 3])])
+
+    query, parameters = CriteriaToPostgresqlConverter.convert(criteria=criteria, table='user', array_binding=True)
+
+    assert query == 'SELECT * FROM "user" WHERE "id" <> ALL(%(parameter_0)s);'
+    assert parameters == {'parameter_0': [1, 2, 3]}
+    assert_valid_postgresql_syntax(query=query)
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_with_array_binding_constant_query() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class with array binding returns the same query for any list length.
+    """
+    short_criteria = Criteria(filters=[Filter(field='id', operator=Operator.IN, value=[1])])
+    long_criteria = Criteria(filters=[Filter(field='id', operator=Operator.IN, value=list(range(100)))])
+
+    short_query, _ = CriteriaToPostgresqlConverter.convert(criteria=short_criteria, table='user', array_binding=True)
+    long_query, _ = CriteriaToPostgresqlConverter.convert(criteria=long_criteria, table='user', array_binding=True)
+
+    assert short_query == long_query
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_with_array_binding_cache() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class with array binding binds the new array on a cache hit.
+    """
+    cache = QueryCache()
+    criteria = Criteria(
+        filters=[
+            Filter(field='id', operator=Operator.IN, value=[1, 2]),
+            Filter(field='name', operator=Operator.EQUAL, value='John'),
+        ]
+    )
+    other_criteria = Criteria(
+        filters=[
+            Filter(field='id', operator=Operator.IN, value=[3, 4]),
+            Filter(field='name', operator=Operator.EQUAL, value='Jane'),
+        ]
+    )
+
+    CriteriaToPostgresqlConverter.convert(criteria=criteria, table='user', array_binding=True, cache=cache)
+    query, parameters = CriteriaToPostgresqlConverter.convert(
+        criteria=other_criteria,
+        table='user',
+        array_binding=True,
+        cache=cache,
+    )
+
+    assert query == 'SELECT * FROM "user" WHERE "id" = ANY(%(parameter_0)s) AND "name" = %(parameter_1)s;'
+    assert parameters == {'parameter_0': [3, 4], 'parameter_1': 'Jane'}
+    assert cache.hits == 1
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_with_policy() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class validates the table and criteria against the policy.
+    """
+    policy = ConverterPolicy(valid_tables=['user'], valid_columns=['id'])
+    criteria = Criteria(filters=[Filter(field='email', operator=Operator.EQUAL, value='john@example.com')])
+
+    with assert_raises(
+        expected_exception=InvalidTableError,
+        match='Invalid table specified <<<orders>>>. Valid tables are <<<user>>>.',
+    ):
+        CriteriaToPostgresqlConverter.convert(
+            criteria=CriteriaMother.empty(), table='orders', columns=['id'], policy=policy
+        )
+
+    with assert_raises(
+        expected_exception=InvalidColumnError,
+        match='Invalid column specified <<<email>>>. Valid columns are <<<id>>>.',
+    ):
+        CriteriaToPostgresqlConverter.convert(criteria=criteria, table='user', columns=['id'], policy=policy)
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_convert_many() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class convert_many yields the same queries as convert for each criteria.
+    """
+    criteria = [
+        CriteriaMother.empty(),
+        Criteria(filters=[Filter(field='id', operator=Operator.IN, value=[1, 2, 3])], page_size=10, page_number=2),
+        Criteria(
+            filters=[Filter(field='name', operator=Operator.EQUAL, value='John')],
+            orders=[Order(field='email', direction=Direction.DESC)],
+        ),
+        *(CriteriaMother.create() for _ in range(5)),
+    ]
+
+    queries = list(
+        CriteriaToPostgresqlConverter.convert_many(
+            criteria=criteria,
+            table='user',
+            columns=['id', 'name'],
+            columns_mapping={'name': 'full_name'},
+        )
+    )
+
+    assert queries == [
+        CriteriaToPostgresqlConverter.convert(
+            criteria=single_criteria,
+            table='user',
+            columns=['id', 'name'],
+            columns_mapping={'name': 'full_name'},
+        )
+        for single_criteria in criteria
+    ]
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_convert_many_is_lazy() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class convert_many validates and converts each criteria only when it is consumed.
+    """
+    criteria = iter(
+        [
+            Criteria(filters=[Filter(field='id', operator=Operator.EQUAL, value=1)]),
+            Criteria(filters=[Filter(field='email', operator=Operator.EQUAL, value='john@example.com')]),
+        ]
+    )
+    queries = CriteriaToPostgresqlConverter.convert_many(
+        criteria=criteria,
+        table='user',
+        check_criteria_injection=True,
+        valid_columns=['id'],
+    )
+
+    assert next(queries) is not None
+
+    with assert_raises(
+        expected_exception=InvalidColumnError,
+        match='Invalid column specified <<<email>>>. Valid columns are <<<id>>>.',
+    ):
+        next(queries)
+
+    with assert_raises(
+        expected_exception=InvalidTableError,
+        match='Invalid table specified <<<orders>>>. Valid tables are <<<user>>>.',
+    ):
+        next(
+            CriteriaToPostgresqlConverter.convert_many(
+                criteria=[], table='orders', check_table_injection=True, valid_tables=['user']
+            ),
+            None,
+        )
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_convert_many_with_cache() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class convert_many shares the compiled queries cache with convert.
+    """
+    cache = QueryCache()
+    criteria = [Criteria(filters=[Filter(field='id', operator=Operator.EQUAL, value=value)]) for value in range(3)]
+
+    CriteriaToPostgresqlConverter.convert(criteria=criteria[0], table='user', cache=cache)
+    queries = list(CriteriaToPostgresqlConverter.convert_many(criteria=criteria, table='user', cache=cache))
+
+    assert queries == [('SELECT * FROM "user" WHERE "id" = %(parameter_0)s;', {'parameter_0': value}) for value in range(3)]  # noqa: E501  # fmt: skip
+    assert cache.hits == 3
+    assert cache.misses == 1
+
+
+def render_pyformat_query(*, query: str, parameters: dict[str, Any]) -> str:
+    """
+    Helper function that stands in for a client-side pyformat driver, it interpolates the parameters as literals.
+
+    Args:
+        query (str): Query with pyformat placeholders.
+        parameters (dict[str, Any]): Query parameters.
+
+    Returns:
+        str: Query with the parameters interpolated.
+    """
+    return query % {name: repr(value) for name, value in parameters.items()}
+
+
+def render_numeric_query(*, query: str, parameters: list[Any]) -> str:
+    """
+    Helper function that stands in for a server-side prepared statement, it binds the parameters as literals.
+
+    Args:
+        query (str): Query with numeric placeholders.
+        parameters (list[Any]): Query parameters, the parameter of $n is at index n - 1.
+
+    Returns:
+        str: Query with the parameters bound.
+    """
+    return re_sub(pattern=r'\$(\d+)', repl=lambda match: repr(parameters[int(match[1]) - 1]), string=query)
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_convert_numeric() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class convert_numeric with numeric placeholders.
+    """
+    criteria = Criteria(
+        filters=[
+            Filter(field='name', operator=Operator.CONTAINS, value='John'),
+            Filter(field='age', operator=Operator.BETWEEN, value=[18, 65]),
+        ],
+        orders=[Order(field='age', direction=Direction.DESC)],
+        page_size=20,
+        page_number=3,
+    )
+
+    query, parameters = CriteriaToPostgresqlConverter.convert_numeric(criteria=criteria, table='user')
+
+    assert query == 'SELECT * FROM "user" WHERE "name" LIKE \'%\' || $1 || \'%\' AND "age" BETWEEN $2 AND $3 ORDER BY "age" DESC LIMIT $4 OFFSET $5;'  # noqa: E501  # fmt: skip
+    assert parameters == ['John', 18, 65, 20, 40]
+    assert_valid_postgresql_syntax(query=query)
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_convert_numeric_round_trip() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class convert_numeric binds the same values as convert.
+    """
+    for _ in range(50):
+        criteria = CriteriaMother.create() & ~(CriteriaMother.create() | CriteriaMother.create())
+
+        for array_binding in (False, True):
+            query, parameters = CriteriaToPostgresqlConverter.convert(
+                criteria=criteria,
+                table='user',
+                array_binding=array_binding,
+            )
+            numeric_query, numeric_parameters = CriteriaToPostgresqlConverter.convert_numeric(
+                criteria=criteria,
+                table='user',
+                array_binding=array_binding,
+            )
+
+            assert numeric_parameters == list(parameters.values())
+            assert render_numeric_query(query=numeric_query, parameters=numeric_parameters) == render_pyformat_query(query=query, parameters=parameters)  # noqa: E501  # fmt: skip
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_convert_numeric_with_keyset_and_cache() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class convert_numeric with keyset pagination shares the cache with convert.
+    """
+    cache = QueryCache()
+    criteria = Criteria(
+        filters=[Filter(field='status', operator=Operator.EQUAL, value='active')],
+        orders=[Order(field='created_at', direction=Direction.DESC), Order(field='id', direction=Direction.ASC)],
+        page_size=10,
+    )
+
+    CriteriaToPostgresqlConverter.convert(criteria=criteria, table='user', keyset=['2024-01-01', 7], cache=cache)
+    query, parameters = CriteriaToPostgresqlConverter.convert_numeric(
+        criteria=criteria,
+        table='user',
+        keyset=['2024-01-01', 7],
+        cache=cache,
+    )
+
+    assert query == 'SELECT * FROM "user" WHERE "status" = $1 AND ("created_at" < $2 OR ("created_at" = $3 AND "id" > $4)) ORDER BY "created_at" DESC, "id" ASC LIMIT $5;'  # noqa: E501  # fmt: skip
+    assert parameters == ['active', '2024-01-01', '2024-01-01', 7, 10]
+    assert cache.hits == 1
+    assert_valid_postgresql_syntax(query=query)
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_convert_prepared() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class convert_prepared with numeric placeholders and named parameters.
+    """
+    criteria = Criteria(
+        filters=[
+            Filter(field='name', operator=Operator.EQUAL, value='John'),
+            Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18),
+        ],
+    )
+
+    statement = CriteriaToPostgresqlConverter.convert_prepared(criteria=criteria, table='user')
+
+    assert statement.name == PreparedStatement.name_of(statement='SELECT * FROM "user" WHERE "name" = $1 AND "age" >= $2;')  # noqa: E501  # fmt: skip
+    assert statement.prepare == f'PREPARE {statement.name} AS SELECT * FROM "user" WHERE "name" = $1 AND "age" >= $2;'  # noqa: E501, S608  # fmt: skip
+    assert statement.execute == [(f'EXECUTE {statement.name} (%(parameter_0)s, %(parameter_1)s);', {'parameter_0': 'John', 'parameter_1': 18})]  # noqa: E501  # fmt: skip
+    assert statement.deallocate == f'DEALLOCATE {statement.name};'
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_convert_prepared_same_shape_same_name() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class convert_prepared names the criteria with the same shape the same way.
+    """
+    first = CriteriaToPostgresqlConverter.convert_prepared(
+        criteria=Criteria(filters=[Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18)]),
+        table='user',
+    )
+    second = CriteriaToPostgresqlConverter.convert_prepared(
+        criteria=Criteria(filters=[Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=65)]),
+        table='user',
+    )
+    third = CriteriaToPostgresqlConverter.convert_prepared(
+        criteria=Criteria(filters=[Filter(field='age', operator=Operator.GREATER, value=18)]),
+        table='user',
+    )
+
+    assert first.name == second.name
+    assert first.prepare == second.prepare
+    assert second.execute == [(f'EXECUTE {second.name} (%(parameter_0)s);', {'parameter_0': 65})]
+    assert first.name != third.name
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_convert_prepared_without_parameters() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class convert_prepared without parameters executes without arguments.
+    """
+    statement = CriteriaToPostgresqlConverter.convert_prepared(criteria=Criteria(), table='user')
+
+    assert statement.prepare == f'PREPARE {statement.name} AS SELECT * FROM "user";'  # noqa: S608
+    assert statement.execute == [(f'EXECUTE {statement.name};', {})]
+
+
+def build_page_criteria() -> Criteria:
+    """
+    Helper function to build a filtered, ordered and paginated criteria.
+
+    Returns:
+        Criteria: Built criteria.
+    """
+    return Criteria(
+        filters=[
+            Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18),
+            Filter(field='status', operator=Operator.EQUAL, value='active'),
+        ],
+        orders=[Order(field='age', direction=Direction.DESC)],
+        page_size=20,
+        page_number=3,
+    )
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_convert_count() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class convert_count ignores the orders and pagination and keeps the criteria.
+    """
+    criteria = build_page_criteria()
+
+    query, parameters = CriteriaToPostgresqlConverter.convert_count(criteria=criteria, table='user')
+
+    assert query == 'SELECT COUNT(*) FROM "user" WHERE "age" >= %(parameter_0)s AND "status" = %(parameter_1)s;'  # noqa: E501, S608  # fmt: skip
+    assert parameters == {'parameter_0': 18, 'parameter_1': 'active'}
+    assert criteria.page_size == 20
+    assert criteria.page_number == 3
+    assert criteria.has_orders()
+    assert_valid_postgresql_syntax(query=query)
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_convert_count_without_filters() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class convert_count without filters counts every row.
+    """
+    query, parameters = CriteriaToPostgresqlConverter.convert_count(criteria=Criteria(page_size=10), table='user')
+
+    assert query == 'SELECT COUNT(*) FROM "user";'  # noqa: S608
+    assert not parameters
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_convert_count_with_unexpected_option() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class convert_count raises an error with a misspelled option instead of
+    ignoring it.
+    """
+    with assert_raises(
+        expected_exception=TypeError,
+        match=r"convert_count\(\) got an unexpected keyword argument 'check_table_injecton'",
+    ):
+        CriteriaToPostgresqlConverter.convert_count(criteria=Criteria(), table='user', check_table_injecton=True)  # type: ignore[call-arg]
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_convert_exists() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class convert_exists stops at the first matching row.
+    """
+    query, parameters = CriteriaToPostgresqlConverter.convert_exists(criteria=build_page_criteria(), table='user')
+
+    assert query == 'SELECT 1 FROM "user" WHERE "age" >= %(parameter_0)s AND "status" = %(parameter_1)s LIMIT 1;'  # noqa: E501, S608  # fmt: skip
+    assert parameters == {'parameter_0': 18, 'parameter_1': 'active'}
+    assert_valid_postgresql_syntax(query=query)
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_convert_exists_with_validation() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class convert_exists validates the table and the criteria.
+    """
+    with assert_raises(
+        expected_exception=InvalidColumnError,
+        match='Invalid column specified <<<status>>>. Valid columns are <<<age>>>.',
+    ):
+        CriteriaToPostgresqlConverter.convert_exists(
+            criteria=build_page_criteria(),
+            table='user',
+            check_criteria_injection=True,
+            valid_columns=['age'],
+        )
+
+    with assert_raises(
+        expected_exception=InvalidTableError,
+        match='Invalid table specified <<<user>>>. Valid tables are <<<orders>>>.',
+    ):
+        CriteriaToPostgresqlConverter.convert_exists(criteria=build_page_criteria(), table='user', policy=ConverterPolicy(valid_tables=['orders']))  # noqa: E501, S608  # fmt: skip
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_convert_page_with_total() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class convert_page_with_total matches convert and convert_count.
+    """
+    for _ in range(20):
+        criteria = CriteriaMother.create() & ~(CriteriaMother.create() | CriteriaMother.create())
+
+        page, count = CriteriaToPostgresqlConverter.convert_page_with_total(criteria=criteria, table='user')
+
+        assert page == CriteriaToPostgresqlConverter.convert(criteria=criteria, table='user')
+        assert count == CriteriaToPostgresqlConverter.convert_count(criteria=criteria, table='user')
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_convert_page_with_total_with_keyset() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class convert_page_with_total leaves the keyset out of the count query.
+    """
+    criteria = build_page_criteria()
+
+    (query, parameters), (count_query, count_parameters) = CriteriaToPostgresqlConverter.convert_page_with_total(
+        criteria=criteria,
+        table='user',
+        keyset=[30],
+    )
+
+    assert (query, parameters) == CriteriaToPostgresqlConverter.convert(criteria=criteria, table='user', keyset=[30])
+    assert count_query == 'SELECT COUNT(*) FROM "user" WHERE "age" >= %(parameter_0)s AND "status" = %(parameter_1)s;'  # noqa: E501, S608  # fmt: skip
+    assert count_parameters == {'parameter_0': 18, 'parameter_1': 'active'}
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_with_detect_contradictions() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class returns a parameterless constant-false query for an unsatisfiable criteria.
+    """
+    is_old = Criteria(filters=[Filter(field='age', operator=Operator.GREATER, value=30)])
+    is_young = Criteria(filters=[Filter(field='age', operator=Operator.LESS, value=10)])
+
+    query, parameters = CriteriaToPostgresqlConverter.convert(
+        criteria=is_old & is_young,
+        table='user',
+        columns=['id', 'name'],
+        detect_contradictions=True,
+    )
+
+    assert query == 'SELECT "id", "name" FROM "user" WHERE 1 = 0;'
+    assert parameters == {}
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_with_detect_contradictions_satisfiable_criteria() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class converts a satisfiable criteria as usual when detecting contradictions.
+    """
+    is_adult = Criteria(filters=[Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18)])
+    is_not_retired = Criteria(filters=[Filter(field='age', operator=Operator.LESS_OR_EQUAL, value=65)])
+
+    query, parameters = CriteriaToPostgresqlConverter.convert(
+        criteria=is_adult & is_not_retired,
+        table='user',
+        detect_contradictions=True,
+    )
+
+    assert (query, parameters) == CriteriaToPostgresqlConverter.convert(
+        criteria=is_adult & is_not_retired,
+        table='user',
+    )
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_entry_points_with_detect_contradictions() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class returns parameterless constant-false queries from every entry point for an
+    unsatisfiable criteria.
+    """
+    is_old = Criteria(filters=[Filter(field='age', operator=Operator.GREATER, value=30)])
+    is_young = Criteria(filters=[Filter(field='age', operator=Operator.LESS, value=10)])
+    criteria = is_old & is_young
+
+    count = CriteriaToPostgresqlConverter.convert_count(criteria=criteria, table='user', detect_contradictions=True)
+    exists = CriteriaToPostgresqlConverter.convert_exists(criteria=criteria, table='user', detect_contradictions=True)
+    page, total = CriteriaToPostgresqlConverter.convert_page_with_total(
+        criteria=criteria,
+        table='user',
+        columns=['id'],
+        detect_contradictions=True,
+    )
+    queries = list(
+        CriteriaToPostgresqlConverter.convert_many(
+            criteria=[criteria, is_old], table='user', detect_contradictions=True
+        )
+    )
+    numeric = CriteriaToPostgresqlConverter.convert_numeric(criteria=criteria, table='user', detect_contradictions=True)
+    statement = CriteriaToPostgresqlConverter.convert_prepared(
+        criteria=criteria, table='user', detect_contradictions=True
+    )
+
+    assert count == ('SELECT COUNT(*) FROM "user" WHERE 1 = 0;', {})
+    assert exists == ('SELECT 1 FROM "user" WHERE 1 = 0 LIMIT 1;', {})
+    assert page == ('SELECT "id" FROM "user" WHERE 1 = 0;', {})
+    assert total == ('SELECT COUNT(*) FROM "user" WHERE 1 = 0;', {})
+    assert queries == [
+        ('SELECT * FROM "user" WHERE 1 = 0;', {}),
+        ('SELECT * FROM "user" WHERE "age" > %(parameter_0)s;', {'parameter_0': 30}),
+    ]
+    assert numeric == ('SELECT * FROM "user" WHERE 1 = 0;', [])
+    assert statement.prepare == f'PREPARE {statement.name} AS SELECT * FROM "user" WHERE 1 = 0;'  # noqa: S608
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_with_push_down_negations() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class pushes the negations down to the filters using their complements.
+    """
+    is_adult = Criteria(filters=[Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18)])
+    is_open = Criteria(filters=[Filter(field='status', operator=Operator.IN, value=['active', 'pending'])])
+
+    query, parameters = CriteriaToPostgresqlConverter.convert(
+        criteria=~(is_adult & is_open),
+        table='user',
+        push_down_negations=True,
+    )
+
+    assert query == 'SELECT * FROM "user" WHERE ("age" < %(parameter_0)s OR "status" NOT IN (%(parameter_1)s, %(parameter_2)s));'  # noqa: E501  # fmt: skip
+    assert parameters == {'parameter_0': 18, 'parameter_1': 'active', 'parameter_2': 'pending'}  # noqa: E501  # fmt: skip
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_entry_points_with_push_down_negations() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class pushes the negations down to the filters from every entry point.
+    """
+    criteria = ~Criteria(filters=[Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18)])
+
+    count = CriteriaToPostgresqlConverter.convert_count(criteria=criteria, table='user', push_down_negations=True)
+    exists = CriteriaToPostgresqlConverter.convert_exists(criteria=criteria, table='user', push_down_negations=True)
+    page, total = CriteriaToPostgresqlConverter.convert_page_with_total(
+        criteria=criteria,
+        table='user',
+        columns=['id'],
+        push_down_negations=True,
+    )
+    queries = list(
+        CriteriaToPostgresqlConverter.convert_many(criteria=[criteria], table='user', push_down_negations=True)
+    )
+    numeric = CriteriaToPostgresqlConverter.convert_numeric(criteria=criteria, table='user', push_down_negations=True)
+    statement = CriteriaToPostgresqlConverter.convert_prepared(
+        criteria=criteria, table='user', push_down_negations=True
+    )
+
+    assert count == ('SELECT COUNT(*) FROM "user" WHERE "age" < %(parameter_0)s;', {'parameter_0': 18})
+    assert exists == ('SELECT 1 FROM "user" WHERE "age" < %(parameter_0)s LIMIT 1;', {'parameter_0': 18})
+    assert page == ('SELECT "id" FROM "user" WHERE "age" < %(parameter_0)s;', {'parameter_0': 18})
+    assert total == ('SELECT COUNT(*) FROM "user" WHERE "age" < %(parameter_0)s;', {'parameter_0': 18})
+    assert queries == [('SELECT * FROM "user" WHERE "age" < %(parameter_0)s;', {'parameter_0': 18})]
+    assert numeric == ('SELECT * FROM "user" WHERE "age" < $1;', [18])
+    assert statement.prepare == f'PREPARE {statement.name} AS SELECT * FROM "user" WHERE "age" < $1;'  # noqa: S608
+
+
+@mark.unit_testing
+def test_criteria_to_postgresql_converter_with_optimize() -> None:
+    """
+    Test CriteriaToPostgresqlConverter class optimizes the criteria before it is converted from every entry point.
+    """
+    is_adult = Criteria(filters=[Filter(field='age', operator=Operator.GREATER, value=5), Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18)])  # noqa: E501  # fmt: skip
+    is_not_retired = Criteria(filters=[Filter(field='age', operator=Operator.LESS_OR_EQUAL, value=65)])
+
+    query = CriteriaToPostgresqlConverter.convert(criteria=is_adult & is_not_retired, table='user', optimize=True)
+    count = CriteriaToPostgresqlConverter.convert_count(criteria=is_adult & is_not_retired, table='user', optimize=True)
+    queries = list(
+        CriteriaToPostgresqlConverter.convert_many(criteria=[is_adult & is_not_retired], table='user', optimize=True)
+    )
+
+    assert query == ('SELECT * FROM "user" WHERE "age" BETWEEN %(parameter_0)s AND %(parameter_1)s;', {'parameter_0': 18, 'parameter_1': 65})  # noqa: E501  # fmt: skip
+    assert count == ('SELECT COUNT(*) FROM "user" WHERE "age" BETWEEN %(parameter_0)s AND %(parameter_1)s;', {'parameter_0': 18, 'parameter_1': 65})  # noqa: E501  # fmt: skip
+    assert queries == [('SELECT * FROM "user" WHERE "age" BETWEEN %(parameter_0)s AND %(parameter_1)s;', {'parameter_0': 18, 'parameter_1': 65})]  # noqa: E501  # fmt: skip
@@ -0,0 +1,212 @@
+"""
+Test CriteriaToPythonConverter class.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+from pytest import mark, raises as assert_raises
+
+from criteria_pattern import Criteria, Direction, Filter, Operator, Order
+from criteria_pattern.converters import ConverterPolicy, CriteriaToPythonConverter
+from criteria_pattern.errors import InvalidOperatorError
+
+ROWS: list[dict[str, Any]] = [
+    {'id': 1, 'name': 'John', 'email': 'john@gmail.com', 'age': 30},
+    {'id': 2, 'name': 'Jane', 'email': 'jane@yahoo.com', 'age': 17},
+    {'id': 3, 'name': 'Joan', 'email': None, 'age': 45},
+    {'id': 4, 'name': 'Mark', 'email': 'mark@gmail.com', 'age': None},
+]
+
+
+def matching_ids(*, operator: Operator, field: str, value: Any = None) -> list[int]:
+    """
+    Helper function to return the identifiers of the rows that match a single filter.
+
+    Args:
+        operator (Operator): Filter operator.
+        field (str): Filter field.
+        value (Any, optional): Filter value. Default to None.
+
+    Returns:
+        list[int]: Identifiers of the matching rows.
+    """
+    query = CriteriaToPythonConverter.convert(
+        criteria=Criteria(filters=[Filter(field=field, operator=operator, value=value)])
+    )
+
+    return [row['id'] for row in query(ROWS)]
+
+
+@mark.unit_testing
+def test_criteria_to_python_converter_with_empty_criteria() -> None:
+    """
+    Test CriteriaToPythonConverter class with an empty criteria returns every row.
+    """
+    query = CriteriaToPythonConverter.convert(criteria=Criteria())
+
+    assert query(ROWS) == ROWS
+
+
+@mark.unit_testing
+def test_criteria_to_python_converter_with_comparison_operators() -> None:
+    """
+    Test CriteriaToPythonConverter class with the comparison operators, null fields never match.
+    """
+    assert matching_ids(operator=Operator.EQUAL, field='age', value=30) == [1]
+    assert matching_ids(operator=Operator.NOT_EQUAL, field='age', value=30) == [2, 3]
+    assert matching_ids(operator=Operator.GREATER, field='age', value=30) == [3]
+    assert matching_ids(operator=Operator.GREATER_OR_EQUAL, field='age', value=30) == [1, 3]
+    assert matching_ids(operator=Operator.LESS, field='age', value=30) == [2]
+    assert matching_ids(operator=Operator.LESS_OR_EQUAL, field='age', value=30) == [1, 2]
+    assert matching_ids(operator=Operator.BETWEEN, field='age', value=[17, 30]) == [1, 2]
+    assert matching_ids(operator=Operator.NOT_BETWEEN, field='age', value=[17, 30]) == [3]
+
+
+@mark.unit_testing
+def test_criteria_to_python_converter_with_string_operators() -> None:
+    """
+    Test CriteriaToPythonConverter class with the string operators, null fields never match.
+    """
+    assert matching_ids(operator=Operator.LIKE, field='email', value='%@gmail.com') == [1, 4]
+    assert matching_ids(operator=Operator.NOT_LIKE, field='email', value='j_hn@%') == [2, 4]
+    assert matching_ids(operator=Operator.CONTAINS, field='email', value='yahoo') == [2]
+    assert matching_ids(operator=Operator.NOT_CONTAINS, field='email', value='yahoo') == [1, 4]
+    assert matching_ids(operator=Operator.STARTS_WITH, field='name', value='Jo') == [1, 3]
+    assert matching_ids(operator=Operator.NOT_STARTS_WITH, field='name', value='Jo') == [2, 4]
+    assert matching_ids(operator=Operator.ENDS_WITH, field='name', value='n') == [1, 3]
+    assert matching_ids(operator=Operator.NOT_ENDS_WITH, field='name', value='n') == [2, 4]
+
+
+@mark.unit_testing
+def test_criteria_to_python_converter_with_like_operator_special_characters() -> None:
+    """
+    Test CriteriaToPythonConverter class with LIKE operator treats regular expression characters literally.
+    """
+    query = CriteriaToPythonConverter.convert(
+        criteria=Criteria(filters=[Filter(field='name', operator=Operator.LIKE, value='a.c%')]),
+    )
+
+    assert query([{'name': 'a.cd'}, {'name': 'abcd'}]) == [{'name': 'a.cd'}]
+
+
+@mark.unit_testing
+def test_criteria_to_python_converter_with_null_and_membership_operators() -> None:
+    """
+    Test CriteriaToPythonConverter class with the null and membership operators.
+    """
+    assert matching_ids(operator=Operator.IS_NULL, field='email') == [3]
+    assert matching_ids(operator=Operator.IS_NOT_NULL, field='email') == [1, 2, 4]
+    assert matching_ids(operator=Operator.IN, field='name', value=['John', 'Mark']) == [1, 4]
+    assert matching_ids(operator=Operator.NOT_IN, field='name', value=['John', 'Mark']) == [2, 3]
+
+
+@mark.unit_testing
+def test_criteria_to_python_converter_with_logical_criteria() -> None:
+    """
+    Test CriteriaToPythonConverter class with AND, OR and NOT criteria.
+    """
+    is_adult = Criteria(filters=[Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18)])
+    is_gmail = Criteria(filters=[Filter(field='email', operator=Operator.ENDS_WITH, value='@gmail.com')])
+    is_joan = Criteria(filters=[Filter(field='name', operator=Operator.EQUAL, value='Joan')])
+
+    query = CriteriaToPythonConverter.convert(criteria=(is_adult & is_gmail) | ~(is_adult | is_joan))
+
+    assert [row['id'] for row in query(ROWS)] == [1, 2, 4]
+
+
+@mark.unit_testing
+def test_criteria_to_python_converter_with_orders() -> None:
+    """
+    Test CriteriaToPythonConverter class with several orders, null fields are sorted last in ascending order.
+    """
+    rows = [*ROWS, {'id': 5, 'name': 'John', 'email': None, 'age': 20}]
+    criteria = Criteria(
+        orders=[Order(field='name', direction=Direction.DESC), Order(field='age', direction=Direction.ASC)],
+    )
+
+    query = CriteriaToPythonConverter.convert(criteria=criteria)
+
+    age_query = CriteriaToPythonConverter.convert(
+        criteria=Criteria(orders=[Order(field='age', direction=Direction.ASC)])
+    )
+
+    assert [row['id'] for row in query(rows)] == [4, 5, 1, 3, 2]
+    assert [row['id'] for row in age_query(rows)] == [2, 5, 1, 3, 4]
+
+
+@mark.unit_testing
+def test_criteria_to_python_converter_with_pagination() -> None:
+    """
+    Test CriteriaToPythonConverter class with page size and page number.
+    """
+    criteria = Criteria(orders=[Order(field='id', direction=Direction.DESC)], page_size=2, page_number=2)
+
+    query = CriteriaToPythonConverter.convert(criteria=criteria)
+
+    first_page_query = CriteriaToPythonConverter.convert(criteria=Criteria(page_size=3))
+
+    assert [row['id'] for row in query(ROWS)] == [2, 1]
+    assert [row['id'] for row in first_page_query(iter(ROWS))] == [1, 2, 3]
+
+
+@mark.unit_testing
+def test_criteria_to_python_converter_with_attributes_and_columns_mapping() -> None:
+    """
+    Test CriteriaToPythonConverter class reading the fields as attributes with a columns mapping.
+    """
+
+    @dataclass
+    class User:
+        identifier: int
+        age: int
+
+    users = [User(identifier=1, age=30), User(identifier=2, age=17)]
+    criteria = Criteria(filters=[Filter(field='id', operator=Operator.EQUAL, value=2)])
+
+    query = CriteriaToPythonConverter.convert(criteria=criteria, columns_mapping={'id': 'identifier'}, attributes=True)
+
+    assert query(users) == [users[1]]
+
+
+@mark.unit_testing
+def test_criteria_to_python_converter_predicate() -> None:
+    """
+    Test CriteriaToPythonConverter class predicate tells if a single row matches.
+    """
+    criteria = Criteria(filters=[Filter(field='age', operator=Operator.GREATER, value=18)])
+
+    matches = CriteriaToPythonConverter.convert_predicate(criteria=criteria)
+
+    assert matches(ROWS[0])
+    assert not matches(ROWS[1])
+    assert CriteriaToPythonConverter.convert_predicate(criteria=Criteria())(ROWS[1])
+
+
+@mark.unit_testing
+def test_criteria_to_python_converter_with_deeply_nested_criteria() -> None:
+    """
+    Test CriteriaToPythonConverter class with a deeply nested criteria does not exceed the recursion limit.
+    """
+    criteria = Criteria(filters=[Filter(field='id', operator=Operator.EQUAL, value=0)])
+    for value in range(1, 5000):
+        criteria |= Criteria(filters=[Filter(field='id', operator=Operator.EQUAL, value=value)])
+
+    query = CriteriaToPythonConverter.convert(criteria=criteria)
+
+    assert [row['id'] for row in query(ROWS)] == [1, 2, 3, 4]
+
+
+@mark.unit_testing
+def test_criteria_to_python_converter_with_policy() -> None:
+    """
+    Test CriteriaToPythonConverter class validates the criteria against the policy.
+    """
+    policy = ConverterPolicy(valid_operators=[Operator.EQUAL])
+    criteria = Criteria(filters=[Filter(field='age', operator=Operator.GREATER, value=18)])
+
+    with assert_raises(
+        expected_exception=InvalidOperatorError,
+        match='Invalid operator specified <<<GREATER>>>. Valid operators are <<<EQUAL>>>.',
+    ):
+        CriteriaToPythonConverter.convert(criteria=criteria, policy=policy)
@@ -9,8 +9,9 @@ from pytest import mark, raises as assert_raises
 from sqlglot import parse_one
 
 from criteria_pattern import Criteria, Direction, Filter, Operator, Order
-from criteria_pattern.converters import CriteriaToSqliteConverter
+from criteria_pattern.converters import ConverterPolicy, CriteriaToSqliteConverter
 from criteria_pattern.errors import (
+    IntegrityError,
     InvalidColumnError,
     InvalidDirectionError,
     InvalidOperatorError,
@@ -1792,3 +1793,498 @@ def test_criteria_to_sqlite_converter_with_none_pagination_bounds_check() -> Non
         max_page_size=IntegerMother.positive(),
         max_page_number=IntegerMother.positive(),
     )
+
+
+@mark.unit_testing
+def test_criteria_to_sqlite_converter_with_n_ary_criteria() -> None:
+    """
+    Test CriteriaToSqliteConverter class with n-ary AND and OR criteria.
+    """
+    criteria = [Criteria(filters=[Filter(field='id', operator=Operator.EQUAL, value=value)]) for value in range(1, 5)]
+
+    query, parameters = CriteriaToSqliteConverter.convert(
+        criteria=Criteria.all_of(
+            criteria=[criteria[0], Criteria.any_of(criteria=criteria[1:]), CriteriaMother.empty()]
+        ),
+        table='user',
+    )
+
+    assert query == 'SELECT * FROM "user" WHERE ("id" = :parameter_0 AND ("id" = :parameter_1 OR "id" = :parameter_2 OR "id" = :parameter_3));'  # noqa: E501  # fmt: skip
+    assert parameters == {'parameter_0': 1, 'parameter_1': 2, 'parameter_2': 3, 'parameter_3': 4}
+    assert_valid_sqlite_syntax(query=query)
+
+
+@mark.unit_testing
+def test_criteria_to_sqlite_converter_with_deeply_nested_criteria() -> None:
+    """
+    Test CriteriaToSqliteConverter class with a deeply nested criteria does not exceed the recursion limit.
+    """
+    criteria = Criteria(filters=[Filter(field='id', operator=Operator.EQUAL, value=0)])
+    for value in range(1, 5000):
+        criteria |= Criteria(filters=[Filter(field='id', operator=Operator.EQUAL, value=value)])
+
+    query, parameters = CriteriaToSqliteConverter.convert(criteria=criteria, table='user')
+
+    assert query.startswith('SELECT * FROM "user" WHERE ' + '(' * 4999 + '"id" = :parameter_0 OR "id" = :parameter_1)')
+    assert query.count(' OR ') == 4999
+    assert parameters == {f'parameter_{value}': value for value in range(5000)}
+
+
+@mark.unit_testing
+def test_criteria_to_sqlite_converter_with_keyset_pagination() -> None:
+    """
+    Test CriteriaToSqliteConverter class with keyset pagination uses a row value predicate instead of an offset.
+    """
+    criteria = Criteria(
+        filters=[Filter(field='age', operator=Operator.GREATER, value=18)],
+        orders=[Order(field='created_at', direction=Direction.ASC), Order(field='id', direction=Direction.ASC)],
+        page_size=20,
+        page_number=3,
+    )
+
+    query, parameters = CriteriaToSqliteConverter.convert(criteria=criteria, table='user', keyset=['2024-01-01', 7])
+
+    assert query == 'SELECT * FROM "user" WHERE "age" > :parameter_0 AND ("created_at", "id") > (:keyset_1, :keyset_2) ORDER BY "created_at" ASC, "id" ASC LIMIT :limit_3;'  # noqa: E501  # fmt: skip
+    assert parameters == {'parameter_0': 18, 'keyset_1': '2024-01-01', 'keyset_2': 7, 'limit_3': 20}
+    assert_valid_sqlite_syntax(query=query)
+
+
+@mark.unit_testing
+def test_criteria_to_sqlite_converter_with_keyset_pagination_mixed_directions() -> None:
+    """
+    Test CriteriaToSqliteConverter class with keyset pagination expands the predicate for mixed directions.
+    """
+    criteria = Criteria(
+        orders=[Order(field='created_at', direction=Direction.DESC), Order(field='id', direction=Direction.ASC)],
+        page_size=20,
+    )
+
+    query, parameters = CriteriaToSqliteConverter.convert(criteria=criteria, table='user', keyset=['2024-01-01', 7])
+
+    assert query == 'SELECT * FROM "user" WHERE ("created_at" < :keyset_0 OR ("created_at" = :keyset_1 AND "id" > :keyset_2)) ORDER BY "created_at" DESC, "id" ASC LIMIT :limit_3;'  # noqa: E501  # fmt: skip
+    assert parameters == {'keyset_0': '2024-01-01', 'keyset_1': '2024-01-01', 'keyset_2': 7, 'limit_3': 20}
+    assert_valid_sqlite_syntax(query=query)
+
+
+@mark.unit_testing
+def test_criteria_to_sqlite_converter_with_keyset_pagination_without_orders() -> None:
+    """
+    Test CriteriaToSqliteConverter class with keyset pagination raises an error when the criteria has no orders.
+    """
+    with assert_raises(
+        expected_exception=IntegrityError,
+        match='Keyset pagination requires the criteria to have orders.',
+    ):
+        CriteriaToSqliteConverter.convert(criteria=CriteriaMother.empty(), table='user', keyset=[1])
+
+
+@mark.unit_testing
+def test_criteria_to_sqlite_converter_with_keyset_pagination_length_mismatch() -> None:
+    """
+    Test CriteriaToSqliteConverter class with keyset pagination raises an error on a keyset length mismatch.
+    """
+    criteria = Criteria(orders=[Order(field='id', direction=Direction.ASC)])
+
+    with assert_raises(
+        expected_exception=IntegrityError,
+        match='Keyset <<<\\[1, 2\\]>>> must have one value for each criteria order <<<1>>>.',
+    ):
+        CriteriaToSqliteConverter.convert(criteria=criteria, table='user', keyset=[1, 2])
+
+
+@mark.unit_testing
+def test_criteria_to_sqlite_converter_with_in_operator_and_in_list_bucketing() -> None:
+    """
+    Test CriteriaToSqliteConverter class with IN operator and IN-list bucketing pads the values to a power of two.
+    """
+    criteria = Criteria(filters=[Filter(field='id', operator=Operator.IN, value=[1, 2, 3])])
+
+    query, parameters = CriteriaToSqliteConverter.convert(criteria=criteria, table='user', in_list_bucketing=True)
+
+    assert query == 'SELECT * FROM "user" WHERE "id" IN (:parameter_0, :parameter_1, :parameter_2, :parameter_3);'
+    assert parameters == {'parameter_0': 1, 'parameter_1': 2, 'parameter_2': 3, 'parameter_3': 3}
+    assert_valid_sqlite_syntax(query=query)
+
+
+@mark.unit_testing
+def test_criteria_to_sqlite_converter_with_not_in_operator_and_in_list_bucketing() -> None:
+    """
+    Test CriteriaToSqliteConverter class with NOT IN operator and IN-list bucketing pads the values to a power of two.
+    """
+    criteria = Criteria(filters=[Filter(field='id', operator=Operator.NOT_IN, value=[1, 2, 3])])
+
+    query, parameters = CriteriaToSqliteConverter.convert(criteria=criteria, table='user', in_list_bucketing=True)
+
+    assert query == 'SELECT * FROM "user" WHERE "id" NOT IN (:parameter_0, :parameter_1, :parameter_2, :parameter_3);'
+    assert parameters == {'parameter_0': 1, 'parameter_1': 2, 'parameter_2': 3, 'parameter_3': 3}
+    assert_valid_sqlite_syntax(query=query)
+
+
+@mark.unit_testing
+def test_criteria_to_sqlite_converter_with_in_list_bucketing_bounded_queries() -> None:
+    """
+    Test CriteriaToSqliteConverter class with IN-list bucketing returns one query for each power of two bucket.
+    """
+    queries = {
+        CriteriaToSqliteConverter.convert(
+            criteria=Criteria(filters=[Filter(field='id', operator=Operator.IN, value=list(range(1, length + 1)))]),
+            table='user',
+            in_list_bucketing=True,
+        )[0]
+        for length in range(1, 65)
+    }
+
+    assert len(queries) == 7
+
+
+@mark.unit_testing
+def test_criteria_to_sqlite_converter_with_policy() -> None:
+    """
+    Test CriteriaToSqliteConverter class validates the table and criteria against the policy.
+    """
+    policy = ConverterPolicy(valid_tables=['user'], valid_columns=['id'])
+    criteria = Criteria(filters=[Filter(field='email', operator=Operator.EQUAL, value='john@example.com')])
+
+    with assert_raises(
+        expected_exception=InvalidTableError,
+        match='Invalid table specified <<<orders>>>. Valid tables are <<<user>>>.',
+    ):
+        CriteriaToSqliteConverter.convert(
+            criteria=CriteriaMother.empty(), table='orders', columns=['id'], policy=policy
+        )
+
+    with assert_raises(
+        expected_exception=InvalidColumnError,
+        match='Invalid column specified <<<email>>>. Valid columns are <<<id>>>.',
+    ):
+        CriteriaToSqliteConverter.convert(criteria=criteria, table='user', columns=['id'], policy=policy)
+
+
+@mark.unit_testing
+def test_criteria_to_sqlite_converter_convert_many() -> None:
+    """
+    Test CriteriaToSqliteConverter class convert_many yields the same queries as convert for each criteria.
+    """
+    criteria = [
+        CriteriaMother.empty(),
+        Criteria(filters=[Filter(field='id', operator=Operator.IN, value=[1, 2, 3])], page_size=10, page_number=2),
+        Criteria(
+            filters=[Filter(field='name', operator=Operator.EQUAL, value='John')],
+            orders=[Order(field='email', direction=Direction.DESC)],
+        ),
+        *(CriteriaMother.create() for _ in range(5)),
+    ]
+
+    queries = list(
+        CriteriaToSqliteConverter.convert_many(
+            criteria=criteria,
+            table='user',
+            columns=['id', 'name'],
+            columns_mapping={'name': 'full_name'},
+        )
+    )
+
+    assert queries == [
+        CriteriaToSqliteConverter.convert(
+            criteria=single_criteria,
+            table='user',
+            columns=['id', 'name'],
+            columns_mapping={'name': 'full_name'},
+        )
+        for single_criteria in criteria
+    ]
+
+
+@mark.unit_testing
+def test_criteria_to_sqlite_converter_convert_many_is_lazy() -> None:
+    """
+    Test CriteriaToSqliteConverter class convert_many validates and converts each criteria only when it is consumed.
+    """
+    criteria = iter(
+        [
+            Criteria(filters=[Filter(field='id', operator=Operator.EQUAL, value=1)]),
+            Criteria(filters=[Filter(field='email', operator=Operator.EQUAL, value='john@example.com')]),
+        ]
+    )
+    queries = CriteriaToSqliteConverter.convert_many(
+        criteria=criteria,
+        table='user',
+        check_criteria_injection=True,
+        valid_columns=['id'],
+    )
+
+    assert next(queries) is not None
+
+    with assert_raises(
+        expected_exception=InvalidColumnError,
+        match='Invalid column specified <<<email>>>. Valid columns are <<<id>>>.',
+    ):
+        next(queries)
+
+    with assert_raises(
+        expected_exception=InvalidTableError,
+        match='Invalid table specified <<<orders>>>. Valid tables are <<<user>>>.',
+    ):
+        next(
+            CriteriaToSqliteConverter.convert_many(
+                criteria=[], table='orders', check_table_injection=True, valid_tables=['user']
+            ),
+            None,
+        )
+
+
+def build_page_criteria() -> Criteria:
+    """
+    Helper function to build a filtered, ordered and paginated criteria.
+
+    Returns:
+        Criteria: Built criteria.
+    """
+    return Criteria(
+        filters=[
+            Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18),
+            Filter(field='status', operator=Operator.EQUAL, value='active'),
+        ],
+        orders=[Order(field='age', direction=Direction.DESC)],
+        page_size=20,
+        page_number=3,
+    )
+
+
+@mark.unit_testing
+def test_criteria_to_sqlite_converter_convert_count() -> None:
+    """
+    Test CriteriaToSqliteConverter class convert_count ignores the orders and pagination and keeps the criteria.
+    """
+    criteria = build_page_criteria()
+
+    query, parameters = CriteriaToSqliteConverter.convert_count(criteria=criteria, table='user')
+
+    assert query == 'SELECT COUNT(*) FROM "user" WHERE "age" >= :parameter_0 AND "status" = :parameter_1;'  # noqa: E501, S608  # fmt: skip
+    assert parameters == {'parameter_0': 18, 'parameter_1': 'active'}
+    assert criteria.page_size == 20
+    assert criteria.page_number == 3
+    assert criteria.has_orders()
+    assert_valid_sqlite_syntax(query=query)
+
+
+@mark.unit_testing
+def test_criteria_to_sqlite_converter_convert_count_without_filters() -> None:
+    """
+    Test CriteriaToSqliteConverter class convert_count without filters counts every row.
+    """
+    query, parameters = CriteriaToSqliteConverter.convert_count(criteria=Criteria(page_size=10), table='user')
+
+    assert query == 'SELECT COUNT(*) FROM "user";'  # noqa: S608
+    assert not parameters
+
+
+@mark.unit_testing
+def test_criteria_to_sqlite_converter_convert_count_with_unexpected_option() -> None:
+    """
+    Test CriteriaToSqliteConverter class convert_count raises an error with a misspelled option instead of ignoring it.
+    """
+    with assert_raises(
+        expected_exception=TypeError,
+        match=r"convert_count\(\) got an unexpected keyword argument 'check_table_injecton'",
+    ):
+        CriteriaToSqliteConverter.convert_count(criteria=Criteria(), table='user', check_table_injecton=True)  # type: ignore[call-arg]
+
+
+@mark.unit_testing
+def test_criteria_to_sqlite_converter_convert_exists() -> None:
+    """
+    Test CriteriaToSqliteConverter class convert_exists stops at the first matching row.
+    """
+    query, parameters = CriteriaToSqliteConverter.convert_exists(criteria=build_page_criteria(), table='user')
+
+    assert query == 'SELECT 1 FROM "user" WHERE "age" >= :parameter_0 AND "status" = :parameter_1 LIMIT 1;'  # noqa: E501, S608  # fmt: skip
+    assert parameters == {'parameter_0': 18, 'parameter_1': 'active'}
+    assert_valid_sqlite_syntax(query=query)
+
+
+@mark.unit_testing
+def test_criteria_to_sqlite_converter_convert_exists_with_validation() -> None:
+    """
+    Test CriteriaToSqliteConverter class convert_exists validates the table and the criteria.
+    """
+    with assert_raises(
+        expected_exception=InvalidColumnError,
+        match='Invalid column specified <<<status>>>. Valid columns are <<<age>>>.',
+    ):
+        CriteriaToSqliteConverter.convert_exists(
+            criteria=build_page_criteria(),
+            table='user',
+            check_criteria_injection=True,
+            valid_columns=['age'],
+        )
+
+    with assert_raises(
+        expected_exception=InvalidTableError,
+        match='Invalid table specified <<<user>>>. Valid tables are <<<orders>>>.',
+    ):
+        CriteriaToSqliteConverter.convert_exists(criteria=build_page_criteria(), table='user', policy=ConverterPolicy(valid_tables=['orders']))  # noqa: E501, S608  # fmt: skip
+
+
+@mark.unit_testing
+def test_criteria_to_sqlite_converter_convert_page_with_total() -> None:
+    """
+    Test CriteriaToSqliteConverter class convert_page_with_total matches convert and convert_count.
+    """
+    for _ in range(20):
+        criteria = CriteriaMother.create() & ~(CriteriaMother.create() | CriteriaMother.create())
+
+        page, count = CriteriaToSqliteConverter.convert_page_with_total(criteria=criteria, table='user')
+
+        assert page == CriteriaToSqliteConverter.convert(criteria=criteria, table='user')
+        assert count == CriteriaToSqliteConverter.convert_count(criteria=criteria, table='user')
+
+
+@mark.unit_testing
+def test_criteria_to_sqlite_converter_convert_page_with_total_with_keyset() -> None:
+    """
+    Test CriteriaToSqliteConverter class convert_page_with_total leaves the keyset out of the count query.
+    """
+    criteria = build_page_criteria()
+
+    (query, parameters), (count_query, count_parameters) = CriteriaToSqliteConverter.convert_page_with_total(
+        criteria=criteria,
+        table='user',
+        keyset=[30],
+    )
+
+    assert (query, parameters) == CriteriaToSqliteConverter.convert(criteria=criteria, table='user', keyset=[30])
+    assert count_query == 'SELECT COUNT(*) FROM "user" WHERE "age" >= :parameter_0 AND "status" = :parameter_1;'  # noqa: E501, S608  # fmt: skip
+    assert count_parameters == {'parameter_0': 18, 'parameter_1': 'active'}
+
+
+@mark.unit_testing
+def test_criteria_to_sqlite_converter_with_detect_contradictions() -> None:
+    """
+    Test CriteriaToSqliteConverter class returns a parameterless constant-false query for an unsatisfiable criteria.
+    """
+    is_old = Criteria(filters=[Filter(field='age', operator=Operator.GREATER, value=30)])
+    is_young = Criteria(filters=[Filter(field='age', operator=Operator.LESS, value=10)])
+
+    query, parameters = CriteriaToSqliteConverter.convert(
+        criteria=is_old & is_young,
+        table='user',
+        columns=['id', 'name'],
+        detect_contradictions=True,
+    )
+
+    assert query == 'SELECT "id", "name" FROM "user" WHERE 1 = 0;'
+    assert parameters == {}
+
+
+@mark.unit_testing
+def test_criteria_to_sqlite_converter_with_detect_contradictions_satisfiable_criteria() -> None:
+    """
+    Test CriteriaToSqliteConverter class converts a satisfiable criteria as usual when detecting contradictions.
+    """
+    is_adult = Criteria(filters=[Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18)])
+    is_not_retired = Criteria(filters=[Filter(field='age', operator=Operator.LESS_OR_EQUAL, value=65)])
+
+    query, parameters = CriteriaToSqliteConverter.convert(
+        criteria=is_adult & is_not_retired,
+        table='user',
+        detect_contradictions=True,
+    )
+
+    assert (query, parameters) == CriteriaToSqliteConverter.convert(
+        criteria=is_adult & is_not_retired,
+        table='user',
+    )
+
+
+@mark.unit_testing
+def test_criteria_to_sqlite_converter_entry_points_with_detect_contradictions() -> None:
+    """
+    Test CriteriaToSqliteConverter class returns parameterless constant-false queries from every entry point for an
+    unsatisfiable criteria.
+    """
+    is_old = Criteria(filters=[Filter(field='age', operator=Operator.GREATER, value=30)])
+    is_young = Criteria(filters=[Filter(field='age', operator=Operator.LESS, value=10)])
+    criteria = is_old & is_young
+
+    count = CriteriaToSqliteConverter.convert_count(criteria=criteria, table='user', detect_contradictions=True)
+    exists = CriteriaToSqliteConverter.convert_exists(criteria=criteria, table='user', detect_contradictions=True)
+    page, total = CriteriaToSqliteConverter.convert_page_with_total(
+        criteria=criteria,
+        table='user',
+        columns=['id'],
+        detect_contradictions=True,
+    )
+    queries = list(
+        CriteriaToSqliteConverter.convert_many(criteria=[criteria, is_old], table='user', detect_contradictions=True)
+    )
+
+    assert count == ('SELECT COUNT(*) FROM "user" WHERE 1 = 0;', {})
+    assert exists == ('SELECT 1 FROM "user" WHERE 1 = 0 LIMIT 1;', {})
+    assert page == ('SELECT "id" FROM "user" WHERE 1 = 0;', {})
+    assert total == ('SELECT COUNT(*) FROM "user" WHERE 1 = 0;', {})
+    assert queries == [
+        ('SELECT * FROM "user" WHERE 1 = 0;', {}),
+        ('SELECT * FROM "user" WHERE "age" > :parameter_0;', {'parameter_0': 30}),
+    ]
+
+
+@mark.unit_testing
+def test_criteria_to_sqlite_converter_with_push_down_negations() -> None:
+    """
+    Test CriteriaToSqliteConverter class pushes the negations down to the filters using their complements.
+    """
+    is_adult = Criteria(filters=[Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18)])
+    is_open = Criteria(filters=[Filter(field='status', operator=Operator.IN, value=['active', 'pending'])])
+
+    query, parameters = CriteriaToSqliteConverter.convert(
+        criteria=~(is_adult & is_open),
+        table='user',
+        push_down_negations=True,
+    )
+
+    assert query == 'SELECT * FROM "user" WHERE ("age" < :parameter_0 OR "status" NOT IN (:parameter_1, :parameter_2));'  # noqa: E501  # fmt: skip
+    assert parameters == {'parameter_0': 18, 'parameter_1': 'active', 'parameter_2': 'pending'}  # noqa: E501  # fmt: skip
+
+
+@mark.unit_testing
+def test_criteria_to_sqlite_converter_entry_points_with_push_down_negations() -> None:
+    """
+    Test CriteriaToSqliteConverter class pushes the negations down to the filters from every entry point.
+    """
+    criteria = ~Criteria(filters=[Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18)])
+
+    count = CriteriaToSqliteConverter.convert_count(criteria=criteria, table='user', push_down_negations=True)
+    exists = CriteriaToSqliteConverter.convert_exists(criteria=criteria, table='user', push_down_negations=True)
+    page, total = CriteriaToSqliteConverter.convert_page_with_total(
+        criteria=criteria,
+        table='user',
+        columns=['id'],
+        push_down_negations=True,
+    )
+    queries = list(CriteriaToSqliteConverter.convert_many(criteria=[criteria], table='user', push_down_negations=True))
+
+    assert count == ('SELECT COUNT(*) FROM "user" WHERE "age" < :parameter_0;', {'parameter_0': 18})
+    assert exists == ('SELECT 1 FROM "user" WHERE "age" < :parameter_0 LIMIT 1;', {'parameter_0': 18})
+    assert page == ('SELECT "id" FROM "user" WHERE "age" < :parameter_0;', {'parameter_0': 18})
+    assert total == ('SELECT COUNT(*) FROM "user" WHERE "age" < :parameter_0;', {'parameter_0': 18})
+    assert queries == [('SELECT * FROM "user" WHERE "age" < :parameter_0;', {'parameter_0': 18})]
+
+
+@mark.unit_testing
+def test_criteria_to_sqlite_converter_with_optimize() -> None:
+    """
+    Test CriteriaToSqliteConverter class optimizes the criteria before it is converted from every entry point.
+    """
+    is_adult = Criteria(filters=[Filter(field='age', operator=Operator.GREATER, value=5), Filter(field='age', operator=Operator.GREATER_OR_EQUAL, value=18)])  # noqa: E501  # fmt: skip
+    is_not_retired = Criteria(filters=[Filter(field='age', operator=Operator.LESS_OR_EQUAL, value=65)])
+
+    query = CriteriaToSqliteConverter.convert(criteria=is_adult & is_not_retired, table='user', optimize=True)
+    count = CriteriaToSqliteConverter.convert_count(criteria=is_adult & is_not_retired, table='user', optimize=True)
+    queries = list(
+        CriteriaToSqliteConverter.convert_many(criteria=[is_adult & is_not_retired], table='user', optimize=True)
+    )
+
+    assert query == ('SELECT * FROM "user" WHERE "age" BETWEEN :parameter_0 AND :parameter_1;', {'parameter_0': 18, 'parameter_1': 65})  # noqa: E501  # fmt: skip
+    assert count == ('SELECT COUNT(*) FROM "user" WHERE "age" BETWEEN :parameter_0 AND :parameter_1;', {'parameter_0': 18, 'parameter_1': 65})  # noqa: E501  # fmt: skip
+    assert queries == [('SELECT * FROM "user" WHERE "age" BETWEEN :parameter_0 AND :parameter_1;', {'parameter_0': 18, 'parameter_1': 65})]  # noqa: E501  # fmt: skip
@@ -0,0 +1,112 @@
+"""
+Test PreparedStatement and PreparedStatementRegistry classes.
+"""
+
+from pytest import mark
+
+from criteria_pattern.converters import PreparedStatement, PreparedStatementRegistry
+
+
+def build_statement(*, query: str) -> PreparedStatement:
+    """
+    Helper function to build a prepared statement of a query.
+
+    Args:
+        query (str): Query to prepare.
+
+    Returns:
+        PreparedStatement: Prepared statement.
+    """
+    name = PreparedStatement.name_of(statement=query)
+
+    return PreparedStatement(
+        name=name,
+        prepare=f'PREPARE {name} AS {query}',
+        execute=[(f'EXECUTE {name};', {})],
+        deallocate=f'DEALLOCATE {name};',
+    )
+
+
+@mark.unit_testing
+def test_prepared_statement_happy_path() -> None:
+    """
+    Test PreparedStatement stores its statements.
+    """
+    statement = build_statement(query='SELECT * FROM "user";')
+
+    assert statement.name.startswith('criteria_')
+    assert statement.prepare == f'PREPARE {statement.name} AS SELECT * FROM "user";'  # noqa: S608
+    assert statement.execute == [(f'EXECUTE {statement.name};', {})]
+    assert statement.deallocate == f'DEALLOCATE {statement.name};'
+    assert repr(statement) == f"PreparedStatement(name='{statement.name}', prepare='{statement.prepare}')"
+
+
+@mark.unit_testing
+def test_prepared_statement_name_of_is_deterministic() -> None:
+    """
+    Test PreparedStatement name_of gets the same identifier for the same statement and a different one otherwise.
+    """
+    name = PreparedStatement.name_of(statement='SELECT * FROM "user" WHERE "id" = $1;')
+
+    assert name == PreparedStatement.name_of(statement='SELECT * FROM "user" WHERE "id" = $1;')
+    assert name != PreparedStatement.name_of(statement='SELECT * FROM "user" WHERE "id" > $1;')
+    assert len(name) == 25
+    assert name.isidentifier()
+
+
+@mark.unit_testing
+def test_prepared_statement_registry_register() -> None:
+    """
+    Test PreparedStatementRegistry register only asks to prepare a statement once per connection.
+    """
+    registry = PreparedStatementRegistry()
+    statement = build_statement(query='SELECT * FROM "user";')
+
+    assert registry.register(connection='first', statement=statement) is True
+    assert registry.register(connection='first', statement=statement) is False
+    assert registry.register(connection='second', statement=statement) is True
+    assert registry.is_prepared(connection='first', statement=statement)
+    assert not registry.is_prepared(connection='third', statement=statement)
+    assert registry.prepared(connection='first') == frozenset({statement.name})
+    assert registry.prepared(connection='third') == frozenset()
+    assert len(registry) == 2
+
+
+@mark.unit_testing
+def test_prepared_statement_registry_discard() -> None:
+    """
+    Test PreparedStatementRegistry discard removes a statement and the connection once it has none.
+    """
+    registry = PreparedStatementRegistry()
+    first = build_statement(query='SELECT * FROM "user";')
+    second = build_statement(query='SELECT * FROM "order";')
+    registry.register(connection='connection', statement=first)
+    registry.register(connection='connection', statement=second)
+
+    registry.discard(connection='connection', statement=first)
+
+    assert registry.prepared(connection='connection') == frozenset({second.name})
+
+    registry.discard(connection='connection', statement=second)
+    registry.discard(connection='unknown', statement=second)
+
+    assert len(registry) == 0
+    assert registry.register(connection='connection', statement=first) is True
+
+
+@mark.unit_testing
+def test_prepared_statement_registry_forget() -> None:
+    """
+    Test PreparedStatementRegistry forget removes every statement of a connection.
+    """
+    registry = PreparedStatementRegistry()
+    statement = build_statement(query='SELECT * FROM "user";')
+    registry.register(connection='first', statement=statement)
+    registry.register(connection='second', statement=statement)
+
+    registry.forget(connection='first')
+    registry.forget(connection='unknown')
+
+    assert not registry.is_prepared(connection='first', statement=statement)
+    assert registry.is_prepared(connection='second', statement=statement)
+    assert len(registry) == 1
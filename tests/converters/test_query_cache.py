@@ -0,0 +1,101 @@
+"""
+Test QueryCache class.
+"""
+
+from object_mother_pattern import IntegerMother
+from pytest import mark, raises as assert_raises
+
+from criteria_pattern.converters import QueryCache
+from criteria_pattern.errors import IntegrityError
+
+
+@mark.unit_testing
+def test_query_cache_happy_path() -> None:
+    """
+    Test QueryCache stores and returns entries counting hits and misses.
+    """
+    cache = QueryCache(max_size=2)
+
+    assert cache.get(key='key') is None
+
+    cache.set(key='key', value='value')
+
+    assert cache.get(key='key') == 'value'
+    assert len(cache) == 1
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert cache.evictions == 0
+
+
+@mark.unit_testing
+def test_query_cache_evicts_least_recently_used_entry() -> None:
+    """
+    Test QueryCache evicts the least recently used entry when it is full.
+    """
+    cache = QueryCache(max_size=2)
+    cache.set(key='first', value=1)
+    cache.set(key='second', value=2)
+    cache.get(key='first')
+    cache.set(key='third', value=3)
+
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert cache.get(key='second') is None
+    assert cache.get(key='first') == 1
+    assert cache.get(key='third') == 3
+
+
+@mark.unit_testing
+def test_query_cache_clear() -> None:
+    """
+    Test QueryCache clear removes all the entries and resets the counters.
+    """
+    cache = QueryCache(max_size=1)
+    cache.set(key='first', value=1)
+    cache.set(key='second', value=2)
+    cache.get(key='second')
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.hits == 0
+    assert cache.misses == 0
+    assert cache.evictions == 0
+
+
+@mark.unit_testing
+def test_query_cache_max_size() -> None:
+    """
+    Test QueryCache max_size property returns the configured size.
+    """
+    max_size = IntegerMother.positive()
+    cache = QueryCache(max_size=max_size)
+
+    assert cache.max_size == max_size
+
+
+@mark.unit_testing
+def test_query_cache_invalid_max_size() -> None:
+    """
+    Test QueryCache raises IntegrityError when max_size is not a positive integer.
+    """
+    with assert_raises(
+        expected_exception=IntegrityError,
+        match=r'QueryCache max_size <<<.*>>> must be a positive integer.',
+    ):
+        QueryCache(max_size=IntegerMother.negative_or_zero())
+
+
+@mark.unit_testing
+def test_query_cache_none_value() -> None:
+    """
+    Test QueryCache raises IntegrityError when the stored value is None, which would be a permanent miss.
+    """
+    cache = QueryCache()
+
+    with assert_raises(
+        expected_exception=IntegrityError,
+        match=r'QueryCache value for key <<<.*>>> must not be None.',
+    ):
+        cache.set(key='key', value=None)
+
+    assert len(cache) == 0
@@ -8,7 +8,7 @@ from object_mother_pattern.mothers import IntegerMother, StringMother
 from pytest import mark, raises as assert_raises
 
 from criteria_pattern import Criteria, Direction, Filter, Operator, Order
-from criteria_pattern.converters import UrlToCriteriaConverter
+from criteria_pattern.converters import ConverterPolicy, QueryCache, UrlToCriteriaConverter
 from criteria_pattern.errors import (
     IntegrityError,
     InvalidColumnError,
@@ -1676,3 +1676,139 @@ def test_url_to_criteria_converter_with_pagination_bounds_both_exceeded() -> Non
             max_page_size=10000,
             max_page_number=1000000,
         )
+
+
+@mark.unit_testing
+def test_url_to_criteria_converter_with_policy() -> None:
+    """
+    Test UrlToCriteriaConverter class validates the criteria against the policy.
+    """
+    url = 'https://api.example.com/users?filters[0][field]=id; DROP TABLE user;&filters[0][operator]=EQUAL&filters[0][value]=1'  # noqa: E501  # fmt: skip
+    policy = ConverterPolicy(valid_columns=['id', 'name', 'email'])
+
+    with assert_raises(
+        expected_exception=InvalidColumnError,
+        match='Invalid column specified <<<id; DROP TABLE user;>>>. Valid columns are <<<id, name, email>>>.',
+    ):
+        UrlToCriteriaConverter.convert(url=url, policy=policy)
+
+
+@mark.unit_testing
+def test_url_to_criteria_converter_with_url_length_exceeded() -> None:
+    """
+    Test UrlToCriteriaConverter class rejects an oversize URL before parsing it.
+    """
+    url = 'https://api.example.com/users?filters[0][field]=name&filters[0][operator]=EQUAL&filters[0][value]=' + 'a' * 65536  # noqa: E501  # fmt: skip
+
+    with assert_raises(
+        expected_exception=IntegrityError,
+        match=f'UrlToCriteriaConverter url length <<<{len(url)}>>> exceeds maximum limit of <<<65536>>>.',
+    ):
+        UrlToCriteriaConverter.convert(url=url)
+
+
+@mark.unit_testing
+def test_url_to_criteria_converter_with_encoded_parameter_names() -> None:
+    """
+    Test UrlToCriteriaConverter class with percent-encoded parameter names.
+    """
+    url = 'https://api.example.com/users?filters%5B0%5D%5Bfield%5D=name&filters%5B0%5D%5Boperator%5D=EQUAL&filters%5B0%5D%5Bvalue%5D=John&page%5Fsize=10'  # noqa: E501  # fmt: skip
+    criteria = UrlToCriteriaConverter.convert(url=url)
+
+    expected_filter = Filter(field='name', operator=Operator.EQUAL, value='John')
+    expected = Criteria(filters=[expected_filter], orders=None, page_size=10, page_number=None)
+
+    assert criteria == expected
+
+
+@mark.unit_testing
+def test_url_to_criteria_converter_with_repeated_parameters() -> None:
+    """
+    Test UrlToCriteriaConverter class keeps the first occurrence of a repeated parameter.
+    """
+    url = 'https://api.example.com/users?filters[0][field]=name&filters[0][operator]=EQUAL&filters[0][value]=John&filters[0][value]=Jane&page_size=10&page_size=20'  # noqa: E501  # fmt: skip
+    criteria = UrlToCriteriaConverter.convert(url=url)
+
+    expected_filter = Filter(field='name', operator=Operator.EQUAL, value='John')
+    expected = Criteria(filters=[expected_filter], orders=None, page_size=10, page_number=None)
+
+    assert criteria == expected
+
+
+@mark.unit_testing
+def test_url_to_criteria_converter_with_cache() -> None:
+    """
+    Test UrlToCriteriaConverter class returns the cached criteria for the same query string.
+    """
+    cache = QueryCache(max_size=8)
+    url = 'https://api.example.com/users?filters[0][field]=name&filters[0][operator]=EQUAL&filters[0][value]=John&page_size=10'  # noqa: E501  # fmt: skip
+
+    criteria = UrlToCriteriaConverter.convert(url=url, cache=cache)
+    cached_criteria = UrlToCriteriaConverter.convert(url=url, cache=cache)
+    other_host_criteria = UrlToCriteriaConverter.convert(url=url.replace('api.example.com', 'example.com'), cache=cache)
+
+    expected_filter = Filter(field='name', operator=Operator.EQUAL, value='John')
+    expected = Criteria(filters=[expected_filter], orders=None, page_size=10, page_number=None)
+
+    assert criteria == expected
+    assert cached_criteria == criteria
+    assert other_host_criteria == criteria
+    assert cached_criteria is not criteria
+    assert cache.hits == 2
+    assert cache.misses == 1
+
+
+@mark.unit_testing
+def test_url_to_criteria_converter_with_cache_returns_copies() -> None:
+    """
+    Test UrlToCriteriaConverter class cached criteria are not modified when the returned criteria are modified.
+    """
+    cache = QueryCache(max_size=8)
+    url = 'https://api.example.com/users?filters[0][field]=name&filters[0][operator]=EQUAL&filters[0][value]=John&page_size=10&page_number=2'  # noqa: E501  # fmt: skip
+
+    UrlToCriteriaConverter.convert(url=url, cache=cache).clean_pagination()
+    UrlToCriteriaConverter.convert(url=url, cache=cache).clean_pagination()
+    criteria = UrlToCriteriaConverter.convert(url=url, cache=cache)
+
+    assert criteria.page_size == 10
+    assert criteria.page_number == 2
+    assert cache.hits == 2
+
+
+@mark.unit_testing
+def test_url_to_criteria_converter_with_cache_keys_on_options() -> None:
+    """
+    Test UrlToCriteriaConverter class does not share cached criteria between different conversion options.
+    """
+    cache = QueryCache(max_size=8)
+    url = 'https://api.example.com/users?filters[0][field]=full_name&filters[0][operator]=EQUAL&filters[0][value]=John'  # noqa: E501  # fmt: skip
+
+    criteria = UrlToCriteriaConverter.convert(url=url, cache=cache)
+    mapped_criteria = UrlToCriteriaConverter.convert(url=url, fields_mapping={'full_name': 'name'}, cache=cache)
+
+    assert criteria.filters[0].field == 'full_name'
+    assert mapped_criteria.filters[0].field == 'name'
+    assert cache.hits == 0
+    assert cache.misses == 2
+
+    with assert_raises(
+        expected_exception=InvalidColumnError,
+        match='Invalid column specified <<<full_name>>>. Valid columns are <<<name>>>.',
+    ):
+        UrlToCriteriaConverter.convert(url=url, check_field_injection=True, valid_fields=['name'], cache=cache)
+
+
+@mark.unit_testing
+def test_url_to_criteria_converter_with_cache_does_not_cache_invalid_urls() -> None:
+    """
+    Test UrlToCriteriaConverter class does not cache a query string that fails to convert.
+    """
+    cache = QueryCache(max_size=8)
+    url = 'https://api.example.com/users?filters[0][field]=name&filters[0][operator]=INVALID&filters[0][value]=John'  # noqa: E501  # fmt: skip
+
+    for _ in range(2):
+        with assert_raises(expected_exception=IntegrityError):
+            UrlToCriteriaConverter.convert(url=url, cache=cache)
+
+    assert len(cache) == 0
+    assert cache.misses == 2
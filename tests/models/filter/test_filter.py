@@ -2,6 +2,7 @@
 Test Filter model.
 """
 
+from pickle import dumps, loads  # nosec
 from typing import Any
 
 from object_mother_pattern import StringMother
@@ -9,7 +10,7 @@ from object_mother_pattern.models import BaseMother
 from pytest import mark, raises as assert_raises
 
 from criteria_pattern.errors import IntegrityError
-from criteria_pattern.models.filter import Filter, FilterField, FilterOperator, FilterValue
+from criteria_pattern.models.filter import Filter, FilterField, FilterOperator, FilterValue, Operator
 from criteria_pattern.models.testing.mothers import FilterMother
 from criteria_pattern.models.testing.mothers.filter import FilterFieldMother, FilterOperatorMother, FilterValueMother
 
@@ -29,6 +30,51 @@ def test_filter_model_happy_path() -> None:
     assert filter.value == filter_value.value
 
 
+@mark.unit_testing
+def test_filter_model_shares_field_and_operator() -> None:
+    """
+    Test Filter model shares the field and operator value objects between filters.
+    """
+    filter1 = Filter(field='name', operator='EQUAL', value='John')
+    filter2 = Filter(field='name', operator=Operator.EQUAL, value='Jane')
+    filter3 = Filter.trusted(field='name', operator='EQUAL', value='Mark')
+
+    assert filter1._field is filter2._field
+    assert filter1._field is filter3._field
+    assert filter1._operator is filter2._operator
+    assert filter1._operator is filter3._operator
+    assert filter1._value is not filter2._value
+
+
+@mark.unit_testing
+def test_filter_model_trusted_method_happy_path() -> None:
+    """
+    Test Filter model trusted method returns a filter equal to the validated one.
+    """
+    filter_value: Filter[Any] = FilterMother.create()
+    filter = Filter.trusted(field=filter_value.field, operator=filter_value.operator, value=filter_value.value)
+
+    assert type(filter) is Filter
+    assert type(filter.operator) is str
+    assert filter == filter_value
+    assert repr(filter) == repr(filter_value)
+    assert filter.to_primitives() == filter_value.to_primitives()
+
+
+@mark.unit_testing
+def test_filter_model_trusted_method_validates_new_fields() -> None:
+    """
+    Test Filter model trusted method validates a field the first time it is seen, as the field is shared with the
+    other filters, and never caches an invalid field.
+    """
+    for _ in range(2):
+        with assert_raises(
+            expected_exception=IntegrityError,
+            match=r'Filter field <<<.*>>> contains leading or trailing whitespaces. Only trimmed values are allowed.',
+        ):
+            Filter.trusted(field=' name ', operator='EQUAL', value='John')
+
+
 @mark.unit_testing
 def test_filter_model_repr_method_happy_path() -> None:
     """
@@ -195,3 +241,17 @@ def test_filter_model_operator_invalid_type() -> None:
             operator=StringMother.invalid_type(),
             value=FilterValueMother.create().value,
         )
+
+
+@mark.unit_testing
+def test_filter_model_pickle_happy_path() -> None:
+    """
+    Test Filter model can be pickled and unpickled, sharing the field and operator objects.
+    """
+    filter_value: Filter[Any] = FilterMother.create()
+    filter = loads(dumps(filter_value))  # noqa: S301  # nosec
+
+    assert type(filter) is Filter
+    assert filter == filter_value
+    assert filter._field is Filter(field=filter_value.field, operator=filter_value.operator, value=None)._field
+    assert filter._operator is filter_value._operator
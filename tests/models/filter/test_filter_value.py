@@ -20,3 +20,13 @@ def test_filter_value_object_happy_path() -> None:
 
     assert type(filter.value) is type(value)
     assert filter.value == value
+
+
+@mark.unit_testing
+def test_filter_value_object_has_no_instance_dict() -> None:
+    """
+    Test FilterValue object uses the slots of its value object base instead of a per-instance dictionary.
+    """
+    filter: FilterValue[Any] = FilterValue(value=FilterValueMother.create())
+
+    assert not hasattr(filter, '__dict__')
@@ -2,12 +2,14 @@
 Test Order model.
 """
 
+from pickle import dumps, loads  # nosec
+
 from object_mother_pattern import StringMother
 from object_mother_pattern.models import BaseMother
 from pytest import mark, raises as assert_raises
 
 from criteria_pattern.errors import IntegrityError
-from criteria_pattern.models.order import Order, OrderDirection, OrderField
+from criteria_pattern.models.order import Direction, Order, OrderDirection, OrderField
 from criteria_pattern.models.testing.mothers import OrderMother
 from criteria_pattern.models.testing.mothers.order import OrderDirectionMother, OrderFieldMother
 
@@ -26,6 +28,36 @@ def test_order_model_happy_path() -> None:
     assert order.direction == order_value.direction
 
 
+@mark.unit_testing
+def test_order_model_shares_field_and_direction() -> None:
+    """
+    Test Order model shares the field and direction value objects between orders.
+    """
+    order1 = Order(field='name', direction='ASC')
+    order2 = Order(field='name', direction=Direction.ASC)
+    order3 = Order.trusted(field='name', direction='ASC')
+
+    assert order1._field is order2._field
+    assert order1._field is order3._field
+    assert order1._direction is order2._direction
+    assert order1._direction is order3._direction
+
+
+@mark.unit_testing
+def test_order_model_trusted_method_happy_path() -> None:
+    """
+    Test Order model trusted method returns an order equal to the validated one.
+    """
+    order_value = OrderMother.create()
+    order = Order.trusted(field=order_value.field, direction=order_value.direction)
+
+    assert type(order) is Order
+    assert type(order.direction) is str
+    assert order == order_value
+    assert repr(order) == repr(order_value)
+    assert order.to_primitives() == order_value.to_primitives()
+
+
 @mark.unit_testing
 def test_order_model_repr_method_happy_path() -> None:
     """
@@ -170,3 +202,18 @@ def test_order_model_direction_invalid_type() -> None:
         match=r'Order direction <<<.*>>> must be from the enumeration <<<Direction>>>. Got <<<.*>>> type.',
     ):
         Order(field=OrderFieldMother.create().value, direction=StringMother.invalid_type())
+
+
+@mark.unit_testing
+def test_order_model_pickle_happy_path() -> None:
+    """
+    Test Order model can be pickled and unpickled, sharing the field and direction objects.
+    """
+    order_value = OrderMother.create()
+    order = loads(dumps(order_value))  # noqa: S301  # nosec
+
+    assert type(order) is Order
+    assert order == order_value
+    assert repr(order) == repr(order_value)
+    assert order._field is order_value._field
+    assert order._direction is order_value._direction
@@ -0,0 +1,29 @@
+"""
+Test canonical_value function.
+"""
+
+from pytest import mark
+
+from criteria_pattern.models.canonical import canonical_value
+
+
+@mark.unit_testing
+def test_canonical_value_distinguishes_types() -> None:
+    """
+    Test canonical_value function returns different representations for equal values of different types.
+    """
+    representations = {canonical_value(value=1), canonical_value(value=1.0), canonical_value(value=True)}
+
+    assert len(representations) == 3
+    assert canonical_value(value=[1, 2]) != canonical_value(value=(1, 2))
+
+
+@mark.unit_testing
+def test_canonical_value_sorts_unordered_collections() -> None:
+    """
+    Test canonical_value function returns the same representation for sets and dictionaries with the same items in
+    a different order.
+    """
+    assert canonical_value(value={3, 1, 2}) == canonical_value(value={2, 3, 1})
+    assert canonical_value(value={'a': 1, 'b': [2]}) == canonical_value(value={'b': [2], 'a': 1})
+    assert canonical_value(value=[1, 'a']) == ('list', (('int', 1), ('str', 'a')))
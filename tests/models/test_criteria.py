@@ -2,11 +2,14 @@
 Test Criteria model.
 """
 
+from copy import copy, deepcopy
+from pickle import dumps, loads  # nosec
+
 from object_mother_pattern import IntegerMother
 from object_mother_pattern.models import BaseMother
 from pytest import mark, raises as assert_raises
 
-from criteria_pattern import Criteria, Filter, Order, PageNumber, PageSize
+from criteria_pattern import Criteria, Direction, Filter, Operator, Order, PageNumber, PageSize
 from criteria_pattern.errors import IntegrityError
 from criteria_pattern.models.criteria import AndCriteria, NotCriteria, OrCriteria
 from criteria_pattern.models.filters import Filters
@@ -44,6 +47,40 @@ def test_criteria_model_happy_path() -> None:
     assert criteria.page_number == criteria_value.page_number
 
 
+@mark.unit_testing
+def test_criteria_model_from_trusted_method_happy_path() -> None:
+    """
+    Test Criteria model from_trusted method returns a criteria equal to the validated one.
+    """
+    criteria_value = CriteriaMother.create()
+    criteria = Criteria.from_trusted(
+        filters=[Filter.trusted(field=filter.field, operator=filter.operator, value=filter.value) for filter in criteria_value.filters],  # noqa: E501
+        orders=[Order.trusted(field=order.field, direction=order.direction) for order in criteria_value.orders],
+        page_size=criteria_value.page_size,
+        page_number=criteria_value.page_number,
+    )  # fmt: skip
+
+    assert type(criteria) is Criteria
+    assert criteria == criteria_value
+    assert repr(criteria) == repr(criteria_value)
+    assert criteria.fingerprint() == criteria_value.fingerprint()
+    assert criteria.to_primitives() == criteria_value.to_primitives()
+
+
+@mark.unit_testing
+def test_criteria_model_from_trusted_method_without_pagination() -> None:
+    """
+    Test Criteria model from_trusted method with the default arguments.
+    """
+    criteria = Criteria.from_trusted()
+
+    assert criteria == Criteria()
+    assert criteria.filters == []
+    assert criteria.orders == []
+    assert criteria.page_size is None
+    assert criteria.page_number is None
+
+
 @mark.unit_testing
 def test_criteria_model_repr_method_happy_path() -> None:
     """
@@ -666,3 +703,310 @@ def test_not_criteria_clean_pagination_propagates_to_wrapped() -> None:
     assert negated.page_number is None
     assert not negated.has_pagination()
     assert base.page_size is None and base.page_number is None
+
+
+@mark.unit_testing
+def test_criteria_model_shape_fingerprint_ignores_values() -> None:
+    """
+    Test Criteria shape fingerprint is the same for criteria that only differ in their values.
+    """
+    criteria1 = Criteria(
+        filters=[Filter(field='name', operator=Operator.EQUAL, value='John')],
+        page_size=10,
+        page_number=1,
+    )
+    criteria2 = Criteria(
+        filters=[Filter(field='name', operator=Operator.EQUAL, value='Jane')],
+        page_size=20,
+        page_number=5,
+    )
+
+    assert criteria1.shape_fingerprint() == criteria2.shape_fingerprint()
+    assert criteria1.fingerprint() != criteria2.fingerprint()
+
+
+@mark.unit_testing
+def test_criteria_model_shape_fingerprint_depends_on_structure() -> None:
+    """
+    Test Criteria shape fingerprint changes with the fields, operators, IN-list lengths, tree and pagination.
+    """
+    criteria = Criteria(filters=[Filter(field='id', operator=Operator.IN, value=[1, 2])])
+    fingerprints = {
+        criteria.shape_fingerprint(),
+        Criteria(filters=[Filter(field='id', operator=Operator.IN, value=[1, 2, 3])]).shape_fingerprint(),
+        Criteria(filters=[Filter(field='id', operator=Operator.NOT_IN, value=[1, 2])]).shape_fingerprint(),
+        Criteria(filters=[Filter(field='uuid', operator=Operator.IN, value=[1, 2])]).shape_fingerprint(),
+        Criteria(filters=[Filter(field='id', operator=Operator.IN, value=[1, 2])], page_size=1).shape_fingerprint(),
+        (criteria & criteria).shape_fingerprint(),
+        (criteria | criteria).shape_fingerprint(),
+        (~criteria).shape_fingerprint(),
+    }
+
+    assert len(fingerprints) == 8
+
+
+@mark.unit_testing
+def test_criteria_model_fingerprint_is_equal_for_equal_criteria() -> None:
+    """
+    Test Criteria fingerprint is the same for equal criteria and does not change equality.
+    """
+    criteria1 = Criteria(filters=[Filter(field='tags', operator=Operator.IN, value={'a', 'b', 'c'})])
+    criteria2 = Criteria(filters=[Filter(field='tags', operator=Operator.IN, value={'c', 'b', 'a'})])
+
+    criteria3 = Criteria(filters=[Filter(field='tags', operator=Operator.IN, value={'a', 'b', 'c'})])
+
+    assert criteria1.fingerprint() == criteria2.fingerprint()
+    assert criteria1 == criteria3
+    assert criteria1.to_primitives() == criteria3.to_primitives()
+
+
+@mark.unit_testing
+def test_criteria_model_clean_pagination_resets_fingerprints() -> None:
+    """
+    Test clean_pagination resets the cached fingerprints.
+    """
+    base = CriteriaMother.create(page_size=IntegerMother.positive(), page_number=IntegerMother.positive())
+    combined = ~(base & CriteriaMother.empty())
+    shape_fingerprint = combined.shape_fingerprint()
+    fingerprint = combined.fingerprint()
+
+    combined.clean_pagination()
+
+    assert combined.shape_fingerprint() != shape_fingerprint
+    assert combined.fingerprint() != fingerprint
+
+
+@mark.unit_testing
+def test_criteria_model_child_clean_pagination_resets_parent_fingerprints() -> None:
+    """
+    Test clean_pagination on a child resets the cached fingerprints of the logical trees that contain it.
+    """
+    base = CriteriaMother.create(page_size=IntegerMother.positive(), page_number=IntegerMother.positive())
+    other = CriteriaMother.create()
+    combined = base & other
+    combined.shape_fingerprint()
+    combined.fingerprint()
+
+    base.clean_pagination()
+
+    expected = Criteria(filters=base.filters, orders=base.orders) & other
+    assert combined.shape_fingerprint() == expected.shape_fingerprint()
+    assert combined.fingerprint() == expected.fingerprint()
+
+
+@mark.unit_testing
+def test_criteria_model_copy_keeps_fingerprints() -> None:
+    """
+    Test Criteria copies have the same fingerprints as the original criteria.
+    """
+    criteria = CriteriaMother.create() & ~CriteriaMother.create()
+    fingerprint = criteria.fingerprint()
+
+    assert copy(criteria).fingerprint() == fingerprint
+    assert deepcopy(criteria).fingerprint() == fingerprint
+    assert deepcopy(criteria) == criteria
+
+
+@mark.unit_testing
+def test_criteria_model_all_of_returns_flattened_and_criteria() -> None:
+    """
+    Test Criteria all_of returns an n-ary AndCriteria flattening nested AndCriteria.
+    """
+    criteria1 = CriteriaMother.create()
+    criteria2 = CriteriaMother.create()
+    criteria3 = CriteriaMother.create()
+
+    combined_criteria = Criteria.all_of(criteria=[criteria1 & criteria2, criteria3])
+
+    assert type(combined_criteria) is AndCriteria
+    assert combined_criteria.children == (criteria1, criteria2, criteria3)
+    assert combined_criteria.filters == criteria1.filters + criteria2.filters + criteria3.filters
+    assert combined_criteria.orders == criteria1.orders + criteria2.orders + criteria3.orders
+    assert combined_criteria.left == criteria1
+    assert combined_criteria.right == criteria2 & criteria3
+
+
+@mark.unit_testing
+def test_criteria_model_any_of_returns_flattened_or_criteria() -> None:
+    """
+    Test Criteria any_of returns an n-ary OrCriteria flattening nested OrCriteria but not other logical criteria.
+    """
+    criteria1 = CriteriaMother.create()
+    criteria2 = CriteriaMother.create()
+    criteria3 = CriteriaMother.create()
+
+    combined_criteria = Criteria.any_of(criteria=[criteria1 | criteria2, criteria2 & criteria3, ~criteria3])
+
+    assert type(combined_criteria) is OrCriteria
+    assert combined_criteria.children == (criteria1, criteria2, criteria2 & criteria3, ~criteria3)
+    assert combined_criteria.filters == criteria1.filters + criteria2.filters * 2 + criteria3.filters * 2
+    assert repr(combined_criteria) == f'OrCriteria(children={[criteria1, criteria2, criteria2 & criteria3, ~criteria3]!r})'  # noqa: E501  # fmt: skip
+
+
+@mark.unit_testing
+def test_criteria_model_all_of_and_any_of_with_one_criteria_returns_it() -> None:
+    """
+    Test Criteria all_of and any_of return the criteria itself when only one is provided.
+    """
+    criteria = CriteriaMother.create()
+
+    assert Criteria.all_of(criteria=[criteria]) is criteria
+    assert Criteria.any_of(criteria=[criteria]) is criteria
+
+
+@mark.unit_testing
+def test_criteria_model_all_of_and_any_of_without_criteria() -> None:
+    """
+    Test Criteria all_of and any_of raise IntegrityError when no criteria is provided.
+    """
+    with assert_raises(
+        expected_exception=IntegrityError,
+        match='Criteria all_of requires at least one criteria.',
+    ):
+        Criteria.all_of(criteria=[])
+
+    with assert_raises(
+        expected_exception=IntegrityError,
+        match='Criteria any_of requires at least one criteria.',
+    ):
+        Criteria.any_of(criteria=[])
+
+
+@mark.unit_testing
+def test_and_criteria_deep_chain_keeps_filters_order_and_pagination() -> None:
+    """
+    Test a deep chain of AndCriteria returns the filters in order and the first pagination without recursion.
+    """
+    page_size = IntegerMother.positive()
+    page_number = IntegerMother.positive()
+    criteria = [Criteria(filters=[Filter(field='id', operator=Operator.EQUAL, value=index)]) for index in range(3000)]
+    criteria[1500] = Criteria(page_size=page_size, page_number=page_number)
+
+    combined_criteria = criteria[0]
+    for item in criteria[1:]:
+        combined_criteria &= item
+
+    assert [filter.value for filter in combined_criteria.filters] == [*range(1500), *range(1501, 3000)]
+    assert combined_criteria.filters == combined_criteria.filters
+    assert combined_criteria.page_size == page_size
+    assert combined_criteria.page_number == page_number
+
+    combined_criteria.clean_pagination()
+
+    assert not combined_criteria.has_pagination()
+
+
+@mark.unit_testing
+def test_composite_criteria_cached_filters_and_orders_cannot_be_modified() -> None:
+    """
+    Test the filters and orders of AndCriteria and OrCriteria are cached read-only lists, so the cache cannot be
+    modified.
+    """
+    criteria1 = Criteria(
+        filters=[Filter(field='name', operator=Operator.EQUAL, value='John')],
+        orders=[Order(field='name', direction=Direction.ASC)],
+    )
+    criteria2 = Criteria(filters=[Filter(field='age', operator=Operator.GREATER, value=18)])
+
+    for combined_criteria in (criteria1 & criteria2, criteria1 | criteria2):
+        with assert_raises(expected_exception=TypeError, match=r'does not support modification'):
+            combined_criteria.filters.append(Filter(field='email', operator=Operator.IS_NULL, value=None))
+
+        with assert_raises(expected_exception=TypeError, match=r'does not support modification'):
+            combined_criteria.orders.clear()
+
+        assert combined_criteria.filters is combined_criteria.filters
+        assert combined_criteria.filters == [*criteria1.filters, *criteria2.filters]
+        assert combined_criteria.orders == criteria1.orders
+        assert combined_criteria.has_filters()
+        assert combined_criteria.has_orders()
+        assert type(copy(combined_criteria.filters)) is list
+        assert type(loads(dumps(combined_criteria.filters))) is list  # noqa: S301  # nosec
+
+
+@mark.unit_testing
+def test_composite_criteria_to_primitives_keeps_left_and_right() -> None:
+    """
+    Test AndCriteria and OrCriteria primitives have their left and right criteria, and n-ary criteria have their
+    children.
+    """
+    criteria1 = Criteria(filters=[Filter(field='name', operator=Operator.EQUAL, value='John')], page_size=10, page_number=1)  # noqa: E501  # fmt: skip
+    criteria2 = Criteria(orders=[Order(field='name', direction=Direction.ASC)])
+    criteria3 = Criteria(filters=[Filter(field='age', operator=Operator.IS_NULL, value=None)])
+    primitives1 = {
+        'filters': [{'field': 'name', 'operator': Operator.EQUAL, 'value': 'John'}],
+        'orders': [],
+        'page_size': 10,
+        'page_number': 1,
+    }
+    primitives2 = {'filters': [], 'orders': [{'field': 'name', 'direction': Direction.ASC}], 'page_size': None, 'page_number': None}  # noqa: E501  # fmt: skip
+    primitives3 = {'filters': [{'field': 'age', 'operator': Operator.IS_NULL, 'value': None}], 'orders': [], 'page_size': None, 'page_number': None}  # noqa: E501  # fmt: skip
+
+    assert ((criteria1 & criteria2) | ~criteria3).to_primitives() == {
+        'left': {'left': primitives1, 'right': primitives2},
+        'right': {'criteria': primitives3},
+    }
+    assert Criteria.any_of(criteria=[criteria1, criteria2, criteria3]).to_primitives() == {
+        'children': [primitives1, primitives2, primitives3],
+    }
+    assert Criteria.all_of(criteria=[criteria1, criteria2]) == criteria1 & criteria2
+    assert Criteria.all_of(criteria=[criteria1, criteria2, criteria3]) == Criteria.all_of(criteria=[criteria1, criteria2, criteria3])  # noqa: E501  # fmt: skip
+    assert Criteria.all_of(criteria=[criteria1, criteria2, criteria3]) != Criteria.any_of(criteria=[criteria1, criteria2, criteria3])  # noqa: E501  # fmt: skip
+    assert Criteria.all_of(criteria=[criteria1, criteria2, criteria3]) != Criteria.all_of(criteria=[criteria1, criteria3, criteria2])  # noqa: E501  # fmt: skip
+
+
+@mark.unit_testing
+def test_composite_criteria_with_thousands_of_children() -> None:
+    """
+    Test AndCriteria and OrCriteria with thousands of children can be compared, converted to primitives and pickled
+    without walking a nested tree.
+    """
+    leaves = [Criteria(filters=[Filter(field='id', operator=Operator.EQUAL, value=value)]) for value in range(5000)]
+
+    for combine in (Criteria.all_of, Criteria.any_of):
+        criteria = combine(criteria=leaves)
+        same_criteria = combine(criteria=list(leaves))
+
+        primitives = criteria.to_primitives()
+        restored = loads(dumps(criteria))  # noqa: S301  # nosec
+
+        assert criteria == same_criteria
+        assert criteria != combine(criteria=leaves[:-1])
+        assert len(primitives['children']) == 5000
+        assert primitives['children'][4999] == leaves[4999].to_primitives()
+        assert type(restored) is type(criteria)
+        assert restored == criteria
+        assert restored.filters == criteria.filters
+
+
+@mark.unit_testing
+def test_criteria_model_pickle_happy_path() -> None:
+    """
+    Test Criteria model can be pickled and unpickled.
+    """
+    criteria_value = CriteriaMother.create()
+    criteria = loads(dumps(criteria_value))  # noqa: S301  # nosec
+
+    assert type(criteria) is Criteria
+    assert criteria == criteria_value
+    assert criteria.fingerprint() == criteria_value.fingerprint()
+
+
+@mark.unit_testing
+def test_criteria_model_pickle_logical_tree() -> None:
+    """
+    Test Criteria model can be pickled and unpickled keeping the logical tree as it was.
+    """
+    criteria1 = CriteriaMother.create()
+    criteria2 = CriteriaMother.create()
+    criteria3 = CriteriaMother.create()
+    criteria_value = Criteria.all_of(criteria=[criteria1 | ~criteria2, criteria3]) & criteria1
+
+    criteria = loads(dumps(criteria_value))  # noqa: S301  # nosec
+
+    assert type(criteria) is AndCriteria
+    assert type(criteria.left) is AndCriteria
+    assert type(criteria.left.children[0]) is OrCriteria
+    assert type(criteria.left.children[0].right) is NotCriteria
+    assert criteria == criteria_value
+    assert criteria.fingerprint() == criteria_value.fingerprint()
@@ -0,0 +1,55 @@
+"""
+Test trusted_value_object function.
+"""
+
+from typing import Any
+
+from pytest import mark
+from value_object_pattern import ValueObject
+
+from criteria_pattern import Direction, Filter, Operator, Order
+from criteria_pattern.models.filter import FilterField, FilterValue
+from criteria_pattern.models.filters import Filters
+from criteria_pattern.models.order import OrderField
+from criteria_pattern.models.orders import Orders
+from criteria_pattern.models.page_number import PageNumber
+from criteria_pattern.models.page_size import PageSize
+from criteria_pattern.models.trusted import trusted_value_object
+
+
+@mark.unit_testing
+def test_trusted_value_object_value_object_slots() -> None:
+    """
+    Test the value objects store their state in the slots filled by trusted_value_object.
+    """
+    assert sorted(ValueObject.__slots__) == ['_early_processed', '_parameter', '_title', '_value']
+
+
+@mark.unit_testing
+def test_trusted_value_object_equals_constructed_value_object() -> None:
+    """
+    Test trusted_value_object creates value objects with the same state, equality, hash, value and representation as
+    the ones created through the constructor.
+    """
+    arguments: list[tuple[type[ValueObject[Any]], Any, str, str]] = [
+        (FilterField, 'name', 'Filter', 'field'),
+        (FilterValue, 'John', 'Filter', 'value'),
+        (OrderField, 'name', 'Order', 'field'),
+        (PageSize, 20, 'Criteria', 'page_size'),
+        (PageNumber, 2, 'Criteria', 'page_number'),
+        (Filters, [Filter(field='name', operator=Operator.EQUAL, value='John')], 'Criteria', 'filters'),
+        (Orders, [Order(field='name', direction=Direction.ASC)], 'Criteria', 'orders'),
+    ]
+
+    for cls, value, title, parameter in arguments:
+        trusted = trusted_value_object(cls=cls, value=value, title=title, parameter=parameter)
+        constructed = cls(value=value, title=title, parameter=parameter)
+
+        assert type(trusted) is cls
+        assert {slot: getattr(trusted, slot) for slot in ValueObject.__slots__} == {slot: getattr(constructed, slot) for slot in ValueObject.__slots__}  # noqa: E501  # fmt: skip
+        assert trusted == constructed
+        assert trusted.value == constructed.value
+        assert repr(trusted) == repr(constructed)
+        assert str(trusted) == str(constructed)
+        if not isinstance(value, list):
+            assert hash(trusted) == hash(constructed)
@@ -0,0 +1,100 @@
+"""
+Test the package lazy imports.
+"""
+
+import sys
+from subprocess import run
+
+from pytest import mark, raises as assert_raises
+
+import criteria_pattern
+from criteria_pattern import converters, errors
+
+
+def imported_modules(*, statement: str) -> set[str]:
+    """
+    Run a statement in a fresh interpreter and get the modules it imported.
+
+    Args:
+        statement (str): Python statement to run.
+
+    Returns:
+        set[str]: Imported modules.
+    """
+    process = run(  # noqa: S603
+        [sys.executable, '-c', f'import sys\n{statement}\nprint(*sys.modules, sep="\\n")'],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    return set(process.stdout.splitlines())
+
+
+@mark.unit_testing
+def test_lazy_imports_package_does_not_import_the_models() -> None:
+    """
+    Test importing criteria_pattern does not import the models nor value_object_pattern.
+    """
+    modules = imported_modules(statement='import criteria_pattern')
+
+    assert 'criteria_pattern.models' not in modules
+    assert 'value_object_pattern' not in modules
+
+
+@mark.unit_testing
+def test_lazy_imports_converters_package_does_not_import_the_converters() -> None:
+    """
+    Test importing criteria_pattern.converters does not import any converter.
+    """
+    modules = imported_modules(statement='import criteria_pattern.converters')
+
+    assert not any(module.startswith('criteria_pattern.converters.') for module in modules)
+    assert 'numpy' not in modules
+    assert 'urllib.parse' not in modules
+
+
+@mark.unit_testing
+def test_lazy_imports_converter_only_imports_its_module() -> None:
+    """
+    Test importing a converter does not import the other converters.
+    """
+    modules = imported_modules(statement='from criteria_pattern.converters import CriteriaToPostgresqlConverter')
+
+    assert 'criteria_pattern.converters.criteria_to_postgresql_converter' in modules
+    assert 'criteria_pattern.converters.criteria_to_mysql_converter' not in modules
+    assert 'criteria_pattern.converters.url_to_criteria_converter' not in modules
+    assert 'numpy' not in modules
+
+
+@mark.unit_testing
+def test_lazy_imports_errors_package_does_not_import_the_models() -> None:
+    """
+    Test importing the IntegrityError does not import the models.
+    """
+    modules = imported_modules(statement='from criteria_pattern.errors import IntegrityError')
+
+    assert 'criteria_pattern.models' not in modules
+
+
+@mark.unit_testing
+def test_lazy_imports_every_attribute_is_importable() -> None:
+    """
+    Test every attribute in the packages __all__ is importable and listed by dir.
+    """
+    for package in (criteria_pattern, converters, errors):
+        for name in package.__all__:
+            assert getattr(package, name).__name__ == name
+            assert name in dir(package)
+
+
+@mark.unit_testing
+def test_lazy_imports_unknown_attribute() -> None:
+    """
+    Test accessing an unknown package attribute raises AttributeError.
+    """
+    with assert_raises(
+        expected_exception=AttributeError,
+        match=r"module 'criteria_pattern.converters' has no attribute 'CriteriaToOracleConverter'",
+    ):
+        converters.CriteriaToOracleConverter  # noqa: B018